@@ -1,18 +1,41 @@
 """RTC Engine — FastAPI application entry point."""
 
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from .remote_agent import close_http_client
 from .routes import agents, sessions, init_manager
+from .scheduler import AutoTickScheduler
 from .session_manager import SessionManager
+from .session_store import SessionStore
+
+# Durable session store path (e.g. ./debug/sessions.sqlite3); unset or empty
+# keeps sessions in memory only
+_SESSION_DB = os.environ.get("RTC_SESSION_DB")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    scheduler.start()
+    yield
+    await scheduler.stop()
+    manager.flush()
+    # Release pooled runner connections
+    close_http_client()
+
 
 app = FastAPI(
     title="RTC Engine",
     description="Round Table Consensus Engine — REST API wrapping the consensus FSM",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Initialize session manager and wire into routes
-manager = SessionManager()
+manager = SessionManager(store=SessionStore(_SESSION_DB) if _SESSION_DB else None)
+scheduler = AutoTickScheduler(manager)
 init_manager(manager)
 sessions.init(manager)
 agents.init(manager)
@@ -0,0 +1,146 @@
+"""Session event stream — the O(delta) feed behind GET /sessions/{id}/stream.
+
+The execution ledger, credit events and proposal list only ever grow, so an
+EventStream remembers how far into each it has read and, on sync, appends just
+the new entries (plus a phase event whenever the phase changes) to one
+numbered event list. Event numbers are the SSE ids: a client resumes by
+passing the last id it saw as its cursor. A revision deactivates its parent,
+so the parent is streamed again (as a "proposal" update) ahead of it.
+
+Events only point into the session state, so checkpoints leave them out and
+keep just where each sync ended; rebuild() replays those marks after a load,
+giving the same events. (Only revisions change a streamed proposal, by
+deactivating it, so a rebuilt proposal event shows it active until the sync
+that streamed its revision.)
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+# (seq, kind, data); kind is "execution", "credit", "proposal" or "phase"
+Event = Tuple[int, str, Dict[str, Any]]
+
+
+def proposal_summary(proposal) -> Dict[str, Any]:
+    """API view of a proposal (also used by GET /proposals)."""
+    return {
+        "proposal_id": proposal.proposal_id,
+        "content": proposal.content,
+        "author": proposal.author,
+        "author_type": proposal.author_type,
+        "type": proposal.type,
+        "active": proposal.active,
+        "revision_number": proposal.revision_number,
+        "parent_id": proposal.parent_id,
+        "tick": proposal.tick,
+        "metadata": proposal.metadata,
+    }
+
+
+class EventStream:
+    """Numbered session events, appended as the session state grows."""
+
+    def __init__(self):
+        self.events: List[Event] = []
+        self._ledger_seen = 0
+        self._credit_seen = 0
+        self._proposals_seen = 0
+        self._phase: Optional[str] = None
+        # (phase event data or None, ledger end, credit end, proposals end) per
+        # sync that appended anything; enough to rebuild events from the state
+        self._marks: List[Tuple[Optional[Dict[str, Any]], int, int, int]] = []
+
+    @property
+    def marks(self) -> List[Tuple[Optional[Dict[str, Any]], int, int, int]]:
+        """Per-sync marks (append-only), as kept in checkpoints."""
+        return self._marks
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["events"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.events = []  # Filled by rebuild() once the session state is loaded
+
+    def sync(self, state):
+        """Append events for everything added to state since the last sync.
+
+        Called after every tick; a tick enters at most one new phase, and
+        consecutive phases always differ in type.
+        """
+        start = len(self.events)
+        phase = None
+        if state.current_phase is not None and state.current_phase != self._phase:
+            self._phase = state.current_phase
+            phase = {"tick": state.tick, "phase": state.current_phase}
+            self._append("phase", phase)
+
+        ledger = state.execution_ledger
+        for entry in ledger[self._ledger_seen:]:
+            self._append("execution", entry)
+        self._ledger_seen = len(ledger)
+
+        credits = state.credit_events
+        for entry in credits[self._credit_seen:]:
+            self._append("credit", entry)
+        self._credit_seen = len(credits)
+
+        if state.current_issue:
+            proposals = state.current_issue.proposals
+            self._append_proposals(proposals, self._proposals_seen, len(proposals))
+            self._proposals_seen = len(proposals)
+
+        if len(self.events) > start:
+            self._marks.append(
+                (phase, self._ledger_seen, self._credit_seen, self._proposals_seen)
+            )
+
+    def rebuild(self, state):
+        """Recreate the events of every earlier sync from the state they came from."""
+        self.events = []
+        ledger = credits = proposals = 0
+        issue_proposals = state.current_issue.proposals if state.current_issue else []
+        # parent proposal_id -> position of the revision that deactivated it
+        revised_at = {
+            proposal.parent_id: position
+            for position, proposal in enumerate(issue_proposals)
+            if proposal.parent_id is not None
+        }
+        for phase, ledger_end, credit_end, proposals_end in self._marks:
+            if phase is not None:
+                self._append("phase", phase)
+            for entry in state.execution_ledger[ledger:ledger_end]:
+                self._append("execution", entry)
+            for entry in state.credit_events[credits:credit_end]:
+                self._append("credit", entry)
+            if state.current_issue:
+                self._append_proposals(issue_proposals, proposals, proposals_end, revised_at)
+            ledger, credits, proposals = ledger_end, credit_end, proposals_end
+
+    def _append_proposals(self, proposals, start: int, end: int, revised_at=None):
+        """Events for proposals[start:end], each revision preceded by its deactivated parent.
+
+        revised_at (rebuild only) marks proposals whose revision came in a later
+        sync; they were still active when these events were first streamed.
+        """
+        for position in range(start, end):
+            proposal = proposals[position]
+            if proposal.parent_id is not None:
+                parent = next(
+                    (p for p in proposals[:position] if p.proposal_id == proposal.parent_id),
+                    None,
+                )
+                if parent is not None:
+                    self._append("proposal", proposal_summary(parent))
+            summary = proposal_summary(proposal)
+            if revised_at and revised_at.get(proposal.proposal_id, -1) >= end:
+                summary["active"] = True
+            self._append("proposal", summary)
+
+    def since(self, cursor: int) -> List[Event]:
+        """Events after the given event id (0 for all)."""
+        return self.events[cursor:]
+
+    def _append(self, kind: str, data: Dict[str, Any]):
+        self.events.append((len(self.events) + 1, kind, data))
@@ -1,10 +1,13 @@
 """Remote agent actor — dispatches signals to external HTTP runners.
 
 Overrides AgentActor.on_signal() to POST serializable payloads to a runner URL
-instead of calling automoton.handle_signal() in-process.
+instead of calling automoton.handle_signal() in-process. Remote agents are
+io_bound_signals, so each phase signals all of them at once, and every POST
+goes through one pooled keep-alive client shared by all sessions.
 """
 
 import secrets
+import threading
 from typing import Any, Dict, Optional
 
 import httpx
@@ -16,15 +19,46 @@ _sim_dir = str(Path(__file__).resolve().parent.parent / "simulator")
 if _sim_dir not in sys.path:
     sys.path.insert(0, _sim_dir)
 
-from models import ACTION_QUEUE, Action, AgentActor
+from models import Action, AgentActor, current_action_queue
 
 
 SIGNAL_TIMEOUT = 30.0  # seconds before giving up on a runner
+# Matches roundtable.MAX_IO_SIGNAL_WORKERS, the most signals in flight per tick
+MAX_RUNNER_CONNECTIONS = 64
+
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+
+def http_client() -> httpx.Client:
+    """Shared pooled client for runner signals (created on first use)."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = httpx.Client(
+                timeout=SIGNAL_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=MAX_RUNNER_CONNECTIONS,
+                    max_keepalive_connections=MAX_RUNNER_CONNECTIONS,
+                ),
+            )
+        return _http_client
+
+
+def close_http_client():
+    """Close the shared client (engine shutdown); the next signal opens a new one."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
 
 
 class RemoteAgentActor(AgentActor):
     """Agent that dispatches signals to an external HTTP runner."""
 
+    io_bound_signals = True
+
     runner_url: str = ""
     token: str = ""
     session_id: str = ""
@@ -33,7 +67,7 @@ class RemoteAgentActor(AgentActor):
         """Serialize payload and POST to runner. Queue signal_ready on timeout."""
         if not self.runner_url:
             # No runner registered — auto-ready (graceful degradation)
-            ACTION_QUEUE.submit(
+            current_action_queue().submit(
                 Action(
                     type="signal_ready",
                     agent_id=self.agent_id,
@@ -48,17 +82,16 @@ class RemoteAgentActor(AgentActor):
         signal["session_id"] = self.session_id
 
         try:
-            resp = httpx.post(
+            resp = http_client().post(
                 f"{self.runner_url}/signal",
                 json=signal,
                 headers={"Authorization": f"Bearer {self.token}"},
-                timeout=SIGNAL_TIMEOUT,
             )
             resp.raise_for_status()
             return resp.json()
-        except (httpx.TimeoutException, httpx.HTTPStatusError, httpx.ConnectError):
-            # Runner down or slow — default to signal_ready (ISC-21)
-            ACTION_QUEUE.submit(
+        except (httpx.TimeoutException, httpx.HTTPStatusError, httpx.TransportError):
+            # Runner down, slow or dropped the connection — default to signal_ready (ISC-21)
+            current_action_queue().submit(
                 Action(
                     type="signal_ready",
                     agent_id=self.agent_id,
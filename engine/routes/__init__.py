@@ -17,3 +17,11 @@ def get_session_or_404(session_id: str):
     if s is None:
         raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
     return s
+
+
+def pinned_session_or_404(session_id: str):
+    """Dependency for mutating routes: the session, kept resident until the request ends."""
+    with _manager.pinned(session_id) as s:
+        if s is None:
+            raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
+        yield s
@@ -7,7 +7,7 @@ import sys
 import time
 from pathlib import Path
 
-from fastapi import APIRouter, Header, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException
 from pydantic import ValidationError
 
 _DEBUG_DIR = os.environ.get("RTC_DEBUG_DIR", "")
@@ -36,7 +36,7 @@ _sim_dir = str(Path(__file__).resolve().parent.parent.parent / "simulator")
 if _sim_dir not in sys.path:
     sys.path.insert(0, _sim_dir)
 
-from models import ACTION_QUEUE, Action, Proposal
+from models import Action, Proposal
 
 from ..remote_agent import RemoteAgentActor, generate_agent_token
 from ..schemas import (
@@ -47,8 +47,8 @@ from ..schemas import (
     AgentRegistration,
     AgentUpdateRequest,
 )
-from ..session_manager import SessionManager
-from . import get_session_or_404
+from ..session_manager import Session, SessionManager
+from . import get_session_or_404, pinned_session_or_404
 
 router = APIRouter(prefix="/v1/sessions/{session_id}/agents", tags=["agents"])
 
@@ -82,9 +82,12 @@ def init(manager: SessionManager):
 
 
 @router.post("", response_model=AgentRegistration, status_code=201)
-def register_agent(session_id: str, req: AgentRegisterRequest):
+def register_agent(
+    session_id: str,
+    req: AgentRegisterRequest,
+    session: Session = Depends(pinned_session_or_404),
+):
     """Register an external agent with OCEAN profile and runner endpoint."""
-    session = get_session_or_404(session_id)
 
     if session.is_complete:
         raise HTTPException(status_code=409, detail="Session already complete")
@@ -134,6 +137,7 @@ def register_agent(session_id: str, req: AgentRegisterRequest):
     )
 
     session.register_agent_token(req.agent_id, token)
+    _manager.checkpoint(session)
 
     return AgentRegistration(
         agent_id=req.agent_id,
@@ -146,9 +150,13 @@ def register_agent(session_id: str, req: AgentRegisterRequest):
 
 
 @router.patch("/{agent_id}", response_model=AgentRegistration)
-def update_agent(session_id: str, agent_id: str, req: AgentUpdateRequest):
+def update_agent(
+    session_id: str,
+    agent_id: str,
+    req: AgentUpdateRequest,
+    session: Session = Depends(pinned_session_or_404),
+):
     """Update mutable fields on a registered agent (currently: runner_url)."""
-    session = get_session_or_404(session_id)
     config = session.config
     state = session.state
 
@@ -161,6 +169,7 @@ def update_agent(session_id: str, agent_id: str, req: AgentUpdateRequest):
 
     if req.runner_url is not None:
         agent.runner_url = req.runner_url
+        _manager.checkpoint(session)
 
     return AgentRegistration(
         agent_id=agent_id,
@@ -184,9 +193,9 @@ def submit_action(
     agent_id: str,
     req: ActionRequest,
     authorization: str = Header(default=""),
+    session: Session = Depends(pinned_session_or_404),
 ):
     """Accept an action from a runner and queue it for processing."""
-    session = get_session_or_404(session_id)
     state = session.state
     ctrl = session.controller
 
@@ -272,7 +281,7 @@ def submit_action(
         payload["author"] = agent_id
         payload["proposal_id"] = 0  # Controller assigns real ID
 
-    ACTION_QUEUE.submit(
+    ctrl.action_queue.submit(
         Action(type=internal_type, agent_id=agent_id, payload=payload)
     )
 
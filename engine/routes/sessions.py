@@ -1,10 +1,14 @@
 """Session CRUD, tick, and query endpoints."""
 
+import asyncio
+from bisect import bisect_right
+import json
 import os
 from pathlib import Path
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 
@@ -25,8 +29,13 @@ from ..schemas import (
     SessionStatus,
     TickResult,
 )
-from ..session_manager import SessionManager
-from . import get_session_or_404
+from ..event_stream import proposal_summary
+from ..session_manager import Session, SessionManager
+from . import get_session_or_404, pinned_session_or_404
+
+MAX_PAGE_SIZE = 1000  # upper bound for ?limit= on list endpoints
+STREAM_POLL_INTERVAL = 0.25  # seconds between checks for new stream events
+STREAM_KEEPALIVE = 15.0  # seconds of silence before an SSE comment line
 
 _CONFIG_FIELDS = {
     "assignment_award",
@@ -62,7 +71,7 @@ def create_session(req: SessionCreateRequest):
 @router.get("", response_model=list[SessionStatus])
 def list_sessions():
     """List all sessions."""
-    return [s.to_status() for s in _manager.list_sessions()]
+    return _manager.list_statuses()
 
 
 @router.get("/{session_id}", response_model=SessionDetail)
@@ -124,9 +133,8 @@ def load_session(req: LoadPathRequest):
 
 
 @router.post("/{session_id}/tick", response_model=TickResult)
-def tick_session(session_id: str):
+def tick_session(session_id: str, s: Session = Depends(pinned_session_or_404)):
     """Advance the session by one tick."""
-    s = get_session_or_404(session_id)
     if s.is_complete:
         raise HTTPException(status_code=409, detail="Session already complete")
 
@@ -146,27 +154,43 @@ def tick_session(session_id: str):
 # --- Query Endpoints (Phase 5) ---
 
 
+def _not_modified(s: Session, request: Request, response: Response) -> Optional[Response]:
+    """304 if If-None-Match matches the session's ETag; otherwise tag the response."""
+    etag = s.etag
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip() for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return None
+
+
 @router.get("/{session_id}/proposals")
-def get_proposals(session_id: str):
-    """Return all proposals with revision history."""
+def get_proposals(
+    session_id: str,
+    request: Request,
+    response: Response,
+    since_tick: Optional[int] = Query(default=None, description="Only proposals created at or after this tick"),
+    after_id: int = Query(default=0, ge=0, description="Only proposal_ids greater than this"),
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+):
+    """Return all proposals with revision history; X-Next-After-Id carries the cursor."""
     s = get_session_or_404(session_id)
+    if (not_modified := _not_modified(s, request, response)) is not None:
+        return not_modified
     if not s.state.current_issue:
         return []
-    return [
-        {
-            "proposal_id": p.proposal_id,
-            "content": p.content,
-            "author": p.author,
-            "author_type": p.author_type,
-            "type": p.type,
-            "active": p.active,
-            "revision_number": p.revision_number,
-            "parent_id": p.parent_id,
-            "tick": p.tick,
-            "metadata": p.metadata,
-        }
-        for p in s.state.current_issue.proposals
-    ]
+    proposals = s.state.current_issue.proposals
+    # Proposal ids come from a counter as proposals are appended, so they
+    # increase along the list and after_id maps to a list position
+    start = bisect_right(proposals, after_id, key=lambda p: p.proposal_id)
+    page, _ = s.proposal_index.query(
+        proposals, {}, since_tick=since_tick, after_id=start, limit=limit
+    )
+    response.headers["X-Next-After-Id"] = str(page[-1].proposal_id if page else after_id)
+    return [proposal_summary(p) for p in page]
 
 
 @router.get("/{session_id}/proposals/{proposal_id}/feedback")
@@ -184,15 +208,38 @@ def get_proposal_feedback(session_id: str, proposal_id: int):
 @router.get("/{session_id}/stakes")
 def get_stakes(
     session_id: str,
+    request: Request,
+    response: Response,
     agent_id: Optional[str] = Query(default=None, description="Filter by agent (blind staking: only own stakes)"),
+    since_tick: Optional[int] = Query(default=None, description="Only stakes placed at or after this tick"),
+    after_id: int = Query(
+        default=0, ge=0, description="Only stakes added or changed after this change number"
+    ),
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
 ):
-    """Return stake state. If agent_id provided, only that agent's stakes (blind staking)."""
-    s = get_session_or_404(session_id)
-    stakes = s.state.stake_ledger
+    """Return stake state. If agent_id provided, only that agent's stakes (blind staking).
 
-    if agent_id:
+    Stakes are listed in order of their latest change (placement, switch,
+    status or cp update), each once. X-Next-After-Id is the change number to
+    poll from next, so a client sees every later change without rescanning.
+    """
+    s = get_session_or_404(session_id)
+    if (not_modified := _not_modified(s, request, response)) is not None:
+        return not_modified
+    page = []
+    next_after_id = max(after_id, s.state.stake_change_seq)
+    for seq, st in s.state.stake_changes_after(after_id):
         # Blind staking: only return requesting agent's stakes
-        stakes = [st for st in stakes if st.agent_id == agent_id]
+        if agent_id and st.agent_id != agent_id:
+            continue
+        if since_tick is not None and st.initial_tick < since_tick:
+            continue
+        if limit is not None and len(page) >= limit:
+            next_after_id = page_end
+            break
+        page.append(st)
+        page_end = seq
+    response.headers["X-Next-After-Id"] = str(next_after_id)
 
     return [
         {
@@ -204,33 +251,106 @@ def get_stakes(
             "status": st.status,
             "mandatory": st.mandatory,
         }
-        for st in stakes
+        for st in page
     ]
 
 
 @router.get("/{session_id}/ledger")
-def get_ledger(session_id: str):
+def get_ledger(
+    session_id: str,
+    request: Request,
+    response: Response,
+    agent_id: Optional[str] = Query(default=None),
+    type: Optional[str] = Query(default=None, description="Credit event type, e.g. Credit, Burn"),
+    since_tick: Optional[int] = Query(default=None),
+    after_id: int = Query(default=0, ge=0, description="Entries after this position (1-based)"),
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+):
     """Return CP transaction history."""
     s = get_session_or_404(session_id)
-    return s.state.credit_events
+    if (not_modified := _not_modified(s, request, response)) is not None:
+        return not_modified
+    entries, next_after_id = s.credit_index.query(
+        s.state.credit_events,
+        {"agent_id": agent_id, "type": type},
+        since_tick=since_tick,
+        after_id=after_id,
+        limit=limit,
+    )
+    response.headers["X-Next-After-Id"] = str(next_after_id)
+    return entries
 
 
 @router.get("/{session_id}/events")
 def get_events(
     session_id: str,
+    request: Request,
+    response: Response,
     agent_id: Optional[str] = Query(default=None),
     phase: Optional[str] = Query(default=None),
     tick: Optional[int] = Query(default=None),
+    since_tick: Optional[int] = Query(default=None),
+    after_id: int = Query(default=0, ge=0, description="Entries after this position (1-based)"),
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
 ):
     """Return the execution ledger, filterable by agent, phase, tick."""
     s = get_session_or_404(session_id)
-    events = s.state.execution_ledger
+    if (not_modified := _not_modified(s, request, response)) is not None:
+        return not_modified
+    entries, next_after_id = s.ledger_index.query(
+        s.state.execution_ledger,
+        {"agent_id": agent_id, "phase": phase, "tick": tick},
+        since_tick=since_tick,
+        after_id=after_id,
+        limit=limit,
+    )
+    response.headers["X-Next-After-Id"] = str(next_after_id)
+    return entries
+
+
+@router.get("/{session_id}/stream")
+async def stream_events(
+    session_id: str,
+    request: Request,
+    cursor: Optional[int] = Query(default=None, ge=0, description="Resume after this event id"),
+    last_event_id: Optional[str] = Header(default=None),
+):
+    """Server-Sent Events feed of execution-ledger entries, credit events,
+    proposals and phase transitions as they happen.
+
+    Each event's SSE id is its position in the session's stream; reconnect with
+    ?cursor=<id> (or the Last-Event-ID header) to resume without gaps. The
+    stream sends a final "complete" event once the session has finished.
+    """
+    s = get_session_or_404(session_id)
+    if cursor is None:
+        cursor = int(last_event_id) if last_event_id and last_event_id.isdigit() else 0
+    return StreamingResponse(
+        _sse_events(s.session_id, cursor, request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
-    if agent_id is not None:
-        events = [e for e in events if e.get("agent_id") == agent_id]
-    if tick is not None:
-        events = [e for e in events if e.get("tick") == tick]
-    if phase is not None:
-        events = [e for e in events if e.get("phase") == phase]
 
-    return events
+async def _sse_events(session_id: str, cursor: int, request: Request):
+    # Pinned for the life of the stream, so eviction cannot leave it polling a stale copy
+    with _manager.pinned(session_id) as session:
+        if session is None:
+            return
+        idle = 0.0
+        while True:
+            events, complete = session.events_since(cursor)
+            for seq, kind, data in events:
+                yield f"id: {seq}\nevent: {kind}\ndata: {json.dumps(data, default=str)}\n\n"
+                cursor = seq
+            if complete:
+                yield f"id: {cursor}\nevent: complete\ndata: {{}}\n\n"
+                return
+            if await request.is_disconnected():
+                return
+
+            idle = 0.0 if events else idle + STREAM_POLL_INTERVAL
+            if idle >= STREAM_KEEPALIVE:
+                yield ": keepalive\n\n"
+                idle = 0.0
+            await asyncio.sleep(STREAM_POLL_INTERVAL)
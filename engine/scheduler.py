@@ -0,0 +1,90 @@
+"""Auto-tick scheduler — advances auto_tick sessions without client polling.
+
+An asyncio task on the engine's event loop polls every session and hands the
+ones whose tick is due (Session.auto_tick_due) to a worker pool, so many
+sessions tick concurrently. A session is skipped while its previous tick is in
+flight, and Session's tick lock serializes it against manual POST /tick calls.
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Set
+
+from .session_manager import Session, SessionManager
+
+from simlog import logger
+
+POLL_INTERVAL = 0.05  # seconds between due checks
+TICK_WORKERS = int(os.environ.get("RTC_TICK_WORKERS", "8"))
+
+
+class AutoTickScheduler:
+    """Ticks auto_tick sessions on a worker pool from the engine's event loop."""
+
+    def __init__(
+        self,
+        manager: SessionManager,
+        workers: int = TICK_WORKERS,
+        poll_interval: float = POLL_INTERVAL,
+    ):
+        self.manager = manager
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self._in_flight: Set[str] = set()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start polling on the running event loop."""
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="auto-tick"
+        )
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Stop polling and wait for in-flight ticks to finish."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._pool is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self._pool.shutdown)
+            self._pool = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            self._schedule_due(loop)
+            await asyncio.sleep(self.poll_interval)
+
+    def _schedule_due(self, loop: asyncio.AbstractEventLoop):
+        now = time.monotonic()
+        for session in self.manager.list_sessions():
+            session_id = session.session_id
+            if (
+                not session.auto_tick
+                or session_id in self._in_flight
+                or session.is_complete
+                or not session.auto_tick_due(now)
+            ):
+                continue
+            self._in_flight.add(session_id)
+            future = loop.run_in_executor(self._pool, self._tick, session)
+            future.add_done_callback(
+                lambda _, session_id=session_id: self._in_flight.discard(session_id)
+            )
+
+    def _tick(self, session: Session):
+        try:
+            self.manager.tick_session(session.session_id)
+        except Exception:
+            # Stop auto-ticking a broken session; manual ticks surface the error
+            session.auto_tick = False
+            logger.exception(f"Auto-tick failed for session {session.session_id}; disabled")
+            # Persist the flag, or a restart would resume auto-ticking it
+            self.manager.checkpoint(session)
@@ -1,8 +1,8 @@
 """Pydantic request/response schemas for the RTC Engine API."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PositiveFloat
 
 
 # --- Request schemas ---
@@ -32,6 +32,16 @@ class SessionCreateRequest(BaseModel):
         default_factory=lambda: {"MaxMultiplier": 2.0, "TargetFraction": 0.98}
     )
     llm_config: Dict[str, Any] = Field(default_factory=dict)
+    max_concurrent_agents: int = Field(default=1, ge=1, le=20)
+    agent_policy: Literal["llm", "rules"] = "llm"
+
+    # Server-side ticking: advance once every agent is ready, or when the
+    # phase's wall-clock deadline since the last tick passes
+    auto_tick: bool = False
+    tick_deadline_seconds: float = Field(default=10.0, gt=0)
+    phase_tick_deadlines: Dict[
+        Literal["PROPOSE", "FEEDBACK", "REVISE", "STAKE", "FINALIZE"], PositiveFloat
+    ] = Field(default_factory=dict, description="Per-phase overrides of tick_deadline_seconds")
 
 
 # --- Response schemas ---
@@ -161,6 +171,7 @@ class SessionStatus(BaseModel):
     is_complete: bool
     agent_count: int
     proposal_count: int
+    auto_tick: bool = False
 
 
 class SessionDetail(SessionStatus):
@@ -0,0 +1,101 @@
+"""Incremental indexes over a session's append-only lists.
+
+Read endpoints filter the execution ledger and credit events by agent, tick
+and phase, and proposals by tick. An EntryIndex maps each field value to the
+ascending positions of the entries carrying it, and catches up on new entries
+(O(delta)) before each query, so a filtered or paged read never rescans the
+whole history. Indexed fields must not change once an entry is appended.
+
+Positions double as cursors: an entry's id is its 1-based position, so
+after_id=N returns entries N+1 onwards.
+"""
+
+import threading
+from bisect import bisect_right
+from heapq import merge
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+class EntryIndex:
+    """Field-value → positions index over a growing list of entries.
+
+    Entries are dicts, or objects whose fields are attributes (attributes=True).
+    """
+
+    def __init__(self, fields: Sequence[str], attributes: bool = False):
+        self.fields = tuple(fields)
+        self.attributes = attributes
+        self._positions: Dict[str, Dict[Any, List[int]]] = {f: {} for f in self.fields}
+        self._seen = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # Positions are derived data; a loaded index re-syncs on its first query
+        return {"fields": self.fields, "attributes": self.attributes}
+
+    def __setstate__(self, state):
+        self.__init__(state["fields"], state.get("attributes", False))
+
+    def _value(self, entry: Any, field: str) -> Any:
+        if self.attributes:
+            return getattr(entry, field, None)
+        return entry.get(field)
+
+    def sync(self, entries: List[Any]):
+        """Index entries appended since the last sync."""
+        with self._lock:
+            end = len(entries)
+            for position in range(self._seen, end):
+                entry = entries[position]
+                for field in self.fields:
+                    value = self._value(entry, field)
+                    if value is not None:
+                        self._positions[field].setdefault(value, []).append(position)
+            self._seen = end
+
+    def query(
+        self,
+        entries: List[Any],
+        filters: Dict[str, Any],
+        since_tick: Optional[int] = None,
+        after_id: int = 0,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[Any], int]:
+        """Matching entries after after_id, and the id of the last one returned.
+
+        filters maps indexed fields to required values (None = no filter);
+        since_tick keeps entries with tick >= since_tick.
+        """
+        self.sync(entries)
+        active = {field: value for field, value in filters.items() if value is not None}
+        with self._lock:
+            if active:
+                # Walk the shortest matching position list; check the rest per entry
+                positions = min(
+                    (self._positions[field].get(value, []) for field, value in active.items()),
+                    key=len,
+                )
+            elif since_tick is not None:
+                by_tick = self._positions["tick"]
+                positions = list(merge(*(by_tick[t] for t in by_tick if t >= since_tick)))
+            else:
+                positions = range(self._seen)
+            positions = positions[bisect_right(positions, after_id - 1):]
+
+        def matches(entry: Any) -> bool:
+            tick = self._value(entry, "tick")
+            if since_tick is not None and (tick is None or tick < since_tick):
+                return False
+            return all(self._value(entry, field) == value for field, value in active.items())
+
+        page = []
+        last_id = after_id
+        for position in positions:
+            if limit is not None and len(page) >= limit:
+                break
+            entry = entries[position]
+            if not matches(entry):
+                continue
+            page.append(entry)
+            last_id = position + 1
+        return page, last_id
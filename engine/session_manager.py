@@ -4,11 +4,16 @@ Each session wraps the simulator's Controller, which manages the full lifecycle:
 Consensus FSM + CreditManager + action queue processing.
 """
 
+import os
 import random
 import sys
+import threading
+import time
 import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 # Add simulator to path so we can import its modules
 _sim_dir = str(Path(__file__).resolve().parent.parent / "simulator")
@@ -24,16 +29,73 @@ from models import (
     RunConfig,
 )
 
-from .schemas import SessionCreateRequest
+from .event_stream import Event, EventStream
+from .session_index import EntryIndex
+from .session_store import SessionStore
+from .schemas import SessionCreateRequest, SessionStatus
+
+# Sessions kept in memory when backed by a SessionStore (idle ones beyond this are evicted)
+MAX_RESIDENT_SESSIONS = int(os.environ.get("RTC_MAX_RESIDENT_SESSIONS", "256"))
+# Seconds between routine checkpoints of a ticking session (0 = after every tick;
+# most checkpoints are deltas, see SessionStore)
+CHECKPOINT_INTERVAL = float(os.environ.get("RTC_CHECKPOINT_INTERVAL", "0"))
 
 
 class Session:
     """A single consensus session wrapping a Controller."""
 
-    def __init__(self, session_id: str, controller: Controller):
+    def __init__(
+        self,
+        session_id: str,
+        controller: Controller,
+        auto_tick: bool = False,
+        tick_deadline: float = 10.0,
+        phase_tick_deadlines: Optional[Dict[str, float]] = None,
+    ):
         self.session_id = session_id
         self.controller = controller
         self._agent_tokens: Dict[str, str] = {}  # agent_id → token
+        # Serializes ticks of this session; other sessions tick independently
+        self._tick_lock = threading.Lock()
+        # Requests and streams using this object; the manager never evicts it while > 0
+        self._pins = 0
+        self._checkpointed_at = 0.0  # monotonic time of the last store checkpoint
+        # Auto-tick settings (see AutoTickScheduler)
+        self.auto_tick = auto_tick
+        self.tick_deadline = tick_deadline
+        self.phase_tick_deadlines = dict(phase_tick_deadlines or {})
+        self._last_tick_at = time.monotonic()
+        self.events = EventStream()
+        self._init_indexes()
+
+    def _init_indexes(self):
+        # Read-endpoint indexes, filled incrementally on query
+        self.ledger_index = EntryIndex(("agent_id", "tick", "phase"))
+        self.credit_index = EntryIndex(("agent_id", "tick", "type"))
+        self.proposal_index = EntryIndex(("tick",), attributes=True)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_tick_lock"]
+        del state["_pins"]
+        del state["_checkpointed_at"]
+        return state
+
+    def __setstate__(self, state):
+        # Saves from before auto-tick load as manually ticked sessions
+        state.setdefault("auto_tick", False)
+        state.setdefault("tick_deadline", 10.0)
+        state.setdefault("phase_tick_deadlines", {})
+        state.setdefault("events", EventStream())
+        self.__dict__.update(state)
+        self._tick_lock = threading.Lock()
+        self._pins = 0
+        if "proposal_index" not in state:
+            self._init_indexes()
+        self.events.rebuild(self.state)
+        # Monotonic clocks do not carry across processes
+        self._last_tick_at = time.monotonic()
+        self._checkpointed_at = self._last_tick_at
 
     @property
     def config(self):
@@ -70,6 +132,28 @@ class Session:
             return len(self.state.current_issue.proposals)
         return 0
 
+    @property
+    def etag(self) -> str:
+        """Weak ETag for read endpoints: changes whenever session data can.
+
+        State only changes on ticks, except agent registration (which adds
+        agents and credit events), so the tick counter plus those sizes is
+        enough to answer If-None-Match without building the response.
+        """
+        return (
+            f'W/"{self.session_id}.{self.tick}.{len(self.state.agent_balances)}'
+            f'.{len(self.state.credit_events)}"'
+        )
+
+    def history(self) -> Dict[str, list]:
+        """The session's append-only lists by name; SessionStore saves only their new entries."""
+        return {
+            "execution_ledger": self.state.execution_ledger,
+            "credit_events": self.state.credit_events,
+            "stake_changes": self.state.stake_changes,
+            "event_marks": self.events.marks,
+        }
+
     def get_agent_summaries(self) -> list[dict]:
         # Use agent_balances keys — includes dynamically registered agents
         return [
@@ -83,7 +167,6 @@ class Session:
 
     def to_status(self):
         """Build a SessionStatus dict for API responses."""
-        from .schemas import SessionStatus
         return SessionStatus(
             session_id=self.session_id,
             issue_id=self.config.issue_id,
@@ -93,6 +176,7 @@ class Session:
             is_complete=self.is_complete,
             agent_count=len(self.state.agent_balances),
             proposal_count=self.proposal_count,
+            auto_tick=self.auto_tick,
         )
 
     @property
@@ -112,37 +196,108 @@ class Session:
             if not ready
         ]
 
-    def do_tick(self):
-        """Advance by one tick using the Controller's full pipeline.
+    def checkpoint_lock(self) -> threading.Lock:
+        """The tick lock; hold it to snapshot the session between ticks."""
+        return self._tick_lock
 
-        The Controller.run() loop does: process_pending_actions → consensus.tick().
-        We replicate one iteration of that loop here for single-tick control.
-        """
-        if self.is_complete:
-            return
+    @property
+    def is_pinned(self) -> bool:
+        return self._pins > 0
 
-        consensus = self.controller.current_consensus
+    def auto_tick_due(self, now: float) -> bool:
+        """True when the auto-tick scheduler should advance this session.
 
-        # Intentional coupling: Controller._process_pending_actions() is private
-        # but is the only way to drain ACTION_QUEUE without running the full loop.
-        # If the simulator exposes a public step() method, switch to that.
-        self.controller._process_pending_actions()
+        Due before the first tick, once every remote agent is ready (counting
+        signal_ready actions still queued), or when the current phase's
+        deadline has passed since the last tick. In-process agents act during
+        the tick itself, so they never hold a tick back.
+        """
+        if not self._tick_lock.acquire(blocking=False):
+            return False  # Mid-tick (scheduled or a manual POST /tick)
+        try:
+            return self._auto_tick_due(now)
+        finally:
+            self._tick_lock.release()
+
+    def _auto_tick_due(self, now: float) -> bool:
+        if self.current_phase is None:
+            return True
+        deadline = self.phase_tick_deadlines.get(self.current_phase, self.tick_deadline)
+        if now - self._last_tick_at >= deadline:
+            return True
+        agents = self.config.selected_agents
+        waiting = [
+            agent_id
+            for agent_id in self.get_unready_agents()
+            if agent_id in agents and agents[agent_id].io_bound_signals
+        ]
+        if not waiting:
+            return True
+        queued = self.controller.action_queue.pending_agents("signal_ready")
+        return all(agent_id in queued for agent_id in waiting)
 
-        # Update agent proposal mappings
-        if self.state.current_issue:
-            self.state.agent_proposal_ids = dict(
-                self.state.current_issue.agent_to_proposal_id
-            )
+    def do_tick(self):
+        """Advance by one tick using the Controller's full pipeline.
 
-        # Tick the FSM
-        consensus.tick()
+        Controller.step() applies this session's queued actions and ticks the
+        FSM; actions land in the session's own queue, so sessions can be
+        ticked concurrently from different request threads.
+        """
+        with self._tick_lock:
+            if self.is_complete:
+                return
+            self.controller.step()
+            self._last_tick_at = time.monotonic()
+            self.events.sync(self.state)
+
+    def events_since(self, cursor: int) -> Tuple[List[Event], bool]:
+        """Stream events after cursor, and whether the session has finished.
+
+        Catches up on changes made outside ticks (e.g. agent registration)
+        unless a tick is running, in which case the tick syncs when it ends.
+        """
+        if not self._tick_lock.acquire(blocking=False):
+            return self.events.since(cursor), False
+        try:
+            self.events.sync(self.state)
+            return self.events.since(cursor), self.is_complete
+        finally:
+            self._tick_lock.release()
 
 
 class SessionManager:
-    """Manages multiple concurrent consensus sessions in memory."""
-
-    def __init__(self):
-        self._sessions: Dict[str, Session] = {}
+    """Manages multiple concurrent consensus sessions.
+
+    Without a store every session stays in memory. With a SessionStore,
+    sessions are checkpointed when created, loaded or changed by an agent,
+    when evicted, on shutdown (flush) and when they complete; while ticking
+    they are checkpointed at most every checkpoint_interval seconds (by
+    default after every tick). A crash can therefore lose up to that much of
+    a ticking session's progress (it resumes from its last checkpoint); a
+    clean shutdown loses nothing. At most
+    max_resident sessions stay in memory (the least recently used idle ones
+    are evicted) and evicted sessions are rehydrated on first access. Sessions still auto-ticking are never evicted,
+    and are rehydrated at startup so the scheduler picks them up again.
+
+    Anything that holds a Session across a store round trip (mutating requests,
+    event streams, ticks) must use pinned(): an evicted object is no longer the
+    session, so changes made to it would be lost.
+    """
+
+    def __init__(
+        self,
+        store: Optional[SessionStore] = None,
+        max_resident: int = MAX_RESIDENT_SESSIONS,
+        checkpoint_interval: float = CHECKPOINT_INTERVAL,
+    ):
+        self._sessions: "OrderedDict[str, Session]" = OrderedDict()
+        self._store = store
+        self.max_resident = max_resident
+        self.checkpoint_interval = checkpoint_interval
+        self._lock = threading.RLock()
+        if store is not None:
+            for session_id in store.auto_tick_session_ids():
+                self.get_session(session_id)
 
     def create_session(self, req: SessionCreateRequest) -> Session:
         """Create a new consensus session from request parameters."""
@@ -183,6 +338,8 @@ class SessionManager:
             stake_phase_ticks=req.stake_phase_ticks,
             finalize_phase_ticks=req.finalize_phase_ticks,
             llm_config=req.llm_config,
+            max_concurrent_agents=req.max_concurrent_agents,
+            agent_policy=req.agent_policy,
         )
 
         run_config = RunConfig(
@@ -206,30 +363,119 @@ class SessionManager:
         ctrl.register_issue(issue)
         ctrl.configure_consensus(global_config, run_config)
 
-        session = Session(session_id=session_id, controller=ctrl)
-        self._sessions[session_id] = session
+        session = Session(
+            session_id=session_id,
+            controller=ctrl,
+            auto_tick=req.auto_tick,
+            tick_deadline=req.tick_deadline_seconds,
+            phase_tick_deadlines=req.phase_tick_deadlines,
+        )
+        self._register(session)
         return session
 
     def get_session(self, session_id: str) -> Optional[Session]:
-        return self._sessions.get(session_id)
+        """A session by id, rehydrated from the store if it was evicted."""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                self._sessions.move_to_end(session_id)
+                return session
+            if self._store is None:
+                return None
+            session = self._store.load(session_id)
+            if session is not None:
+                self._sessions[session_id] = session
+                self._evict_idle()
+            return session
+
+    @contextmanager
+    def pinned(self, session_id: str) -> Iterator[Optional[Session]]:
+        """The session (or None), kept resident until the block exits."""
+        with self._lock:
+            session = self.get_session(session_id)
+            if session is not None:
+                session._pins += 1
+        try:
+            yield session
+        finally:
+            if session is not None:
+                with self._lock:
+                    session._pins -= 1
+                    if not session._pins:
+                        self._evict_idle()
 
     def list_sessions(self) -> list[Session]:
-        return list(self._sessions.values())
+        """Sessions currently in memory."""
+        with self._lock:
+            return list(self._sessions.values())
+
+    def list_statuses(self) -> list[SessionStatus]:
+        """Status of every session, from the store for evicted ones."""
+        with self._lock:
+            resident = {s.session_id: s.to_status() for s in self._sessions.values()}
+            stored = self._store.statuses() if self._store is not None else {}
+        return [
+            resident.get(session_id) or SessionStatus(**status)
+            for session_id, status in stored.items()
+        ] + [status for session_id, status in resident.items() if session_id not in stored]
 
     def session_count(self) -> int:
+        if self._store is not None:
+            return self._store.count()
         return len(self._sessions)
 
     def tick_session(self, session_id: str) -> Optional[Session]:
-        """Advance a session by one tick."""
-        session = self._sessions.get(session_id)
-        if session is not None:
-            session.do_tick()
+        """Advance a session by one tick, checkpointing it when the interval is up."""
+        with self.pinned(session_id) as session:
+            if session is not None:
+                session.do_tick()
+                due = time.monotonic() - session._checkpointed_at >= self.checkpoint_interval
+                if due or session.is_complete:
+                    self.checkpoint(session)
         return session
 
+    def checkpoint(self, session: Session):
+        """Persist a session's current state (no-op without a store)."""
+        if self._store is not None:
+            self._store.save(session)
+            session._checkpointed_at = time.monotonic()
+
+    def flush(self):
+        """Checkpoint every resident session (e.g. on shutdown, to keep queued actions)."""
+        for session in self.list_sessions():
+            self.checkpoint(session)
+
+    def _register(self, session: Session):
+        with self._lock:
+            self._sessions[session.session_id] = session
+            self._sessions.move_to_end(session.session_id)
+        self.checkpoint(session)
+        with self._lock:
+            self._evict_idle()
+
+    def _evict_idle(self):
+        """Drop least recently used idle sessions beyond max_resident (caller holds _lock)."""
+        if self._store is None:
+            return
+        excess = len(self._sessions) - self.max_resident
+        for session_id, session in list(self._sessions.items()):
+            if excess <= 0:
+                break
+            if (
+                session.is_pinned
+                or session.checkpoint_lock().locked()
+                or (session.auto_tick and not session.is_complete)
+            ):
+                continue  # In use, mid-tick or still auto-ticking
+            # Checkpoint first: recent ticks and queued actions live only in memory
+            self.checkpoint(session)
+            del self._sessions[session_id]
+            excess -= 1
+
     def save_session(self, session_id: str, path: str) -> str:
         """Pickle a session to disk. Debug tool — format is Python-specific."""
         import pickle
-        session = self._sessions.get(session_id)
+        session = self.get_session(session_id)
         if session is None:
             raise KeyError(session_id)
         with open(path, "wb") as f:
@@ -241,7 +487,7 @@ class SessionManager:
         import pickle
         with open(path, "rb") as f:
             session = pickle.load(f)
-        self._sessions[session.session_id] = session
+        self._register(session)
         return session
 
 
@@ -0,0 +1,319 @@
+"""Durable SQLite session store.
+
+Sessions are checkpointed (see SessionManager for when) as compressed pickles,
+alongside their status, so the SessionManager can evict idle sessions from
+memory, rehydrate them on first access and list every session without
+unpickling them. Derived data (the event stream's events, read-endpoint and
+stake indexes) is left out of the pickle and rebuilt on load. Rows survive
+engine restarts.
+
+A session's history (Session.history(): ledger entries, credit events, stake
+changes, event marks) and its stake ledger only grow, so most checkpoints are
+deltas: the entries and stakes added or changed since the previous checkpoint,
+plus the rest of the session pickled with those lists and stake records left
+as references. Every FULL_SNAPSHOT_EVERY checkpoints (and whenever the store
+has not written the session object it is given) the whole session is pickled
+instead and its deltas are dropped. Loading unpickles the snapshot, appends
+each delta's entries in order and unpickles the latest delta against them.
+"""
+
+import copyreg
+import io
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import weakref
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Checkpoints of a session between full snapshots (the others are deltas)
+FULL_SNAPSHOT_EVERY = int(os.environ.get("RTC_FULL_SNAPSHOT_EVERY", "50"))
+
+
+class _Written:
+    """What a store holds of one in-memory session, as of its last checkpoint."""
+
+    def __init__(self, session, deltas: int):
+        state = session.state
+        self.history = session.history()
+        self.lengths = {name: len(entries) for name, entries in self.history.items()}
+        self.stakes = state.stake_ledger
+        self.stake_count = len(self.stakes)
+        self.stake_seq = state.stake_change_seq
+        self.deltas = deltas
+
+    def extends(self, session) -> bool:
+        """True when the session's lists are the ones written, grown only by appends."""
+        history = session.history()
+        return (
+            session.state.stake_ledger is self.stakes
+            and len(self.stakes) >= self.stake_count
+            and history.keys() == self.history.keys()
+            and all(
+                history[name] is entries and len(entries) >= self.lengths[name]
+                for name, entries in self.history.items()
+            )
+        )
+
+
+class _HistoryRef:
+    """Stands in for one of a session's history lists inside a delta pickle."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __reduce__(self):
+        return (_history_ref, (self.name,))
+
+
+def _history_ref(name: str):
+    raise pickle.UnpicklingError("history reference outside a SessionStore delta")
+
+
+def _stake_ref(position: int):
+    raise pickle.UnpicklingError("stake reference outside a SessionStore delta")
+
+
+class _DeltaPickler(pickle.Pickler):
+    """Pickles a session with its history lists and ledger stakes as references.
+
+    The lists hang off the session state and event stream, so those two types
+    (and stake records) get reducers that swap in references; a persistent_id
+    hook would run for every object, down to each int of the agents' RNG states.
+    """
+
+    def __init__(self, file, session):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._state = state = session.state
+        self._refs = {id(entries): name for name, entries in session.history().items()}
+        self._refs[id(state.stake_ledger)] = "stakes"
+        self.dispatch_table = copyreg.dispatch_table.copy()
+        self.dispatch_table[type(state)] = self._reduce_owner
+        self.dispatch_table[type(session.events)] = self._reduce_owner
+        if state.stake_ledger:
+            self.dispatch_table[type(state.stake_ledger[0])] = self._reduce_stake
+
+    def _swap(self, mapping: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            key: _HistoryRef(self._refs[id(value)]) if id(value) in self._refs else value
+            for key, value in mapping.items()
+        }
+
+    def _reduce_owner(self, obj):
+        # Pydantic models nest their fields and private attributes one level down
+        func, args, state, *rest = obj.__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+        state = {
+            key: self._swap(value) if isinstance(value, dict) else value
+            for key, value in self._swap(state).items()
+        }
+        return (func, args, state, *rest)
+
+    def _reduce_stake(self, obj):
+        position = self._state.stake_position(obj.stake_id)
+        if position is not None and self._state.stake_ledger[position] is obj:
+            return (_stake_ref, (position,))
+        return obj.__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+
+
+class _DeltaUnpickler(pickle.Unpickler):
+    """Resolves _DeltaPickler references against the reassembled lists."""
+
+    def __init__(self, file, history: Dict[str, list], stakes: list):
+        super().__init__(file)
+        self._lists = {**history, "stakes": stakes}
+        self._stakes = stakes
+
+    def find_class(self, module: str, name: str) -> Any:
+        if module == __name__ and name == "_history_ref":
+            return self._lists.__getitem__
+        if module == __name__ and name == "_stake_ref":
+            return self._stakes.__getitem__
+        return super().find_class(module, name)
+
+
+class SessionStore:
+    """session_id → checkpointed Session, in a SQLite database."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(
+            str(self.path), timeout=30, check_same_thread=False
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        with self.connection:
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS sessions (
+                    session_id TEXT PRIMARY KEY,
+                    tick INTEGER NOT NULL,
+                    status TEXT NOT NULL,
+                    auto_tick_active INTEGER NOT NULL,
+                    state BLOB NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """
+            )
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS session_deltas (
+                    session_id TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    state BLOB NOT NULL,
+                    PRIMARY KEY (session_id, seq)
+                )
+            """
+            )
+        # Session object → _Written, for the sessions this store last saved or loaded
+        self._written: "weakref.WeakKeyDictionary[Any, _Written]" = weakref.WeakKeyDictionary()
+
+    def save(self, session):
+        """Checkpoint a session as a delta, or as a full snapshot when one is due.
+
+        Runs under the session's tick lock, so it sees the session between
+        ticks and saves of one session are serialized.
+        """
+        with session.checkpoint_lock():
+            status = session.to_status()
+            active = session.auto_tick and not status.is_complete
+            with self._lock:
+                written = self._written.get(session)
+            full = (
+                written is None
+                or written.deltas >= FULL_SNAPSHOT_EVERY
+                or not written.extends(session)
+            )
+            if full:
+                blob = zlib.compress(pickle.dumps(session, protocol=pickle.HIGHEST_PROTOCOL))
+            else:
+                blob = zlib.compress(self._delta(session, written), 1)
+            with self._lock, self.connection:
+                if full:
+                    self.connection.execute(
+                        "INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?, ?, ?)",
+                        (
+                            session.session_id,
+                            status.tick,
+                            status.model_dump_json(),
+                            int(active),
+                            blob,
+                            time.time(),
+                        ),
+                    )
+                    self.connection.execute(
+                        "DELETE FROM session_deltas WHERE session_id = ?",
+                        (session.session_id,),
+                    )
+                    self._forget(session.session_id)
+                else:
+                    self.connection.execute(
+                        """
+                        UPDATE sessions SET tick = ?, status = ?, auto_tick_active = ?,
+                            updated_at = ?
+                        WHERE session_id = ?
+                    """,
+                        (
+                            status.tick,
+                            status.model_dump_json(),
+                            int(active),
+                            time.time(),
+                            session.session_id,
+                        ),
+                    )
+                    self.connection.execute(
+                        "INSERT INTO session_deltas VALUES (?, ?, ?)",
+                        (session.session_id, written.deltas + 1, blob),
+                    )
+                self._written[session] = _Written(session, 0 if full else written.deltas + 1)
+
+    def _delta(self, session, written: _Written) -> bytes:
+        """What the session gained since written, plus the rest of it by reference."""
+        state = session.state
+        history = session.history()
+        entries = {
+            name: history[name][written.lengths[name]:] for name in history
+        }
+        stakes = state.stake_ledger
+        changed = {}
+        for stake in state.stakes_changed_since(written.stake_seq):
+            position = state.stake_position(stake.stake_id)
+            if position < written.stake_count:
+                changed[position] = stake
+        buffer = io.BytesIO()
+        _DeltaPickler(buffer, session).dump(session)
+        return pickle.dumps(
+            (entries, stakes[written.stake_count:], changed, buffer.getvalue()),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+
+    def load(self, session_id: str):
+        """Rehydrate a stored session (its snapshot plus any deltas), or None."""
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT state FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+            deltas = self.connection.execute(
+                "SELECT state FROM session_deltas WHERE session_id = ? ORDER BY seq",
+                (session_id,),
+            ).fetchall()
+        if row is None:
+            return None
+        session = pickle.loads(zlib.decompress(row[0]))
+        if deltas:
+            history = session.history()
+            stakes = session.state.stake_ledger
+            for (blob,) in deltas:
+                entries, new_stakes, changed, pickled = pickle.loads(zlib.decompress(blob))
+                for name, tail in entries.items():
+                    history[name].extend(tail)
+                for position, stake in changed.items():
+                    stakes[position] = stake
+                stakes.extend(new_stakes)
+            session = _DeltaUnpickler(io.BytesIO(pickled), history, stakes).load()
+        with self._lock:
+            self._forget(session_id)
+            self._written[session] = _Written(session, len(deltas))
+        return session
+
+    def _forget(self, session_id: str):
+        """Drop what was recorded for other objects of this session (caller holds _lock)."""
+        for other in [s for s in self._written if s.session_id == session_id]:
+            del self._written[other]
+
+    def statuses(self) -> Dict[str, dict]:
+        """session_id → last checkpointed SessionStatus fields."""
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT session_id, status FROM sessions ORDER BY updated_at"
+            ).fetchall()
+        return {session_id: json.loads(status) for session_id, status in rows}
+
+    def auto_tick_session_ids(self) -> List[str]:
+        """Sessions that were still auto-ticking when last checkpointed."""
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT session_id FROM sessions WHERE auto_tick_active"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def count(self) -> int:
+        with self._lock:
+            return self.connection.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+    def delete(self, session_id: str):
+        with self._lock, self.connection:
+            self.connection.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+            self.connection.execute(
+                "DELETE FROM session_deltas WHERE session_id = ?", (session_id,)
+            )
+            self._forget(session_id)
+
+    def close(self):
+        with self._lock:
+            self.connection.close()
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Import the engine as a package (run from the repository root or engine/)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
@@ -0,0 +1,131 @@
+import json
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient
+
+from engine.app import app
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def session_id(client):
+    response = client.post(
+        "/v1/sessions",
+        json={
+            "issue_id": "I",
+            "problem_statement": "p",
+            "agent_count": 6,
+            "agent_policy": "rules",
+            "stake_phase_ticks": 12,
+        },
+    )
+    return response.json()["session_id"]
+
+
+def _tick(client, session_id, ticks):
+    for _ in range(ticks):
+        client.post(f"/v1/sessions/{session_id}/tick")
+
+
+def _poll(client, url, after_id, **params):
+    response = client.get(url, params={"after_id": after_id, **params})
+    return response.json(), int(response.headers["X-Next-After-Id"])
+
+
+def test_unchanged_session_answers_304(client, session_id):
+    _tick(client, session_id, 3)
+    first = client.get(f"/v1/sessions/{session_id}/proposals")
+    etag = first.headers["ETag"]
+    again = client.get(f"/v1/sessions/{session_id}/proposals", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+
+    _tick(client, session_id, 1)
+    after_tick = client.get(
+        f"/v1/sessions/{session_id}/proposals", headers={"If-None-Match": etag}
+    )
+    assert after_tick.status_code == 200
+    assert after_tick.headers["ETag"] != etag
+
+
+def test_proposal_pages_follow_the_cursor(client, session_id):
+    _tick(client, session_id, 3)
+    url = f"/v1/sessions/{session_id}/proposals"
+    everything = client.get(url).json()
+    assert len(everything) > 2
+
+    paged, cursor = [], 0
+    while True:
+        page, cursor = _poll(client, url, cursor, limit=2)
+        if not page:
+            break
+        paged.extend(page)
+    assert paged == everything
+
+    since = everything[-1]["tick"]
+    page, _ = _poll(client, url, 0, since_tick=since)
+    assert page == [p for p in everything if p["tick"] >= since]
+
+
+def test_stake_cursor_sees_stake_changes(client, session_id):
+    url = f"/v1/sessions/{session_id}/stakes"
+    mirror, cursor, changed = {}, 0, 0
+    # Poll in small pages every tick and check the mirror against a full read
+    while client.get(f"/v1/sessions/{session_id}").json()["is_complete"] is False:
+        _tick(client, session_id, 1)
+        while True:
+            page, cursor = _poll(client, url, cursor, limit=3)
+            if not page:
+                break
+            for stake in page:
+                changed += mirror.get(stake["stake_id"], stake) != stake
+                mirror[stake["stake_id"]] = stake
+        assert mirror == {stake["stake_id"]: stake for stake in client.get(url).json()}
+
+    # Stakes already seen come back when they are switched or updated
+    assert changed
+
+    # Nothing left after the cursor once the session has settled
+    page, next_cursor = _poll(client, url, cursor)
+    assert page == [] and next_cursor == cursor
+
+
+def _stream(client, session_id, **kwargs):
+    """(id, event, data) for each event of a finished session's SSE stream."""
+    response = client.get(f"/v1/sessions/{session_id}/stream", **kwargs)
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = []
+    for block in response.text.split("\n\n"):
+        # Comment lines (keepalives) start with ":"
+        lines = [line for line in block.splitlines() if not line.startswith(":")]
+        fields = dict(line.split(": ", 1) for line in lines)
+        if fields:
+            events.append((int(fields["id"]), fields["event"], json.loads(fields["data"])))
+    return events
+
+
+def test_stream_resumes_after_the_last_event_id(client, session_id):
+    while client.get(f"/v1/sessions/{session_id}").json()["is_complete"] is False:
+        _tick(client, session_id, 1)
+
+    everything = _stream(client, session_id)
+    assert [seq for seq, _, _ in everything[:-1]] == list(range(1, len(everything)))
+    assert everything[-1][1] == "complete"
+    assert {"execution", "credit", "proposal", "phase"} <= {kind for _, kind, _ in everything}
+
+    for seen in (0, 1, len(everything) // 2, len(everything) - 1):
+        rest = everything[seen:]
+        assert _stream(client, session_id, params={"cursor": seen}) == rest
+        assert _stream(client, session_id, headers={"Last-Event-ID": str(seen)}) == rest
+    # The query cursor wins over the header
+    assert _stream(
+        client, session_id, params={"cursor": 1}, headers={"Last-Event-ID": "3"}
+    ) == everything[1:]
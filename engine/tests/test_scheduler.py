@@ -0,0 +1,49 @@
+import pytest
+from pydantic import ValidationError
+
+from engine.scheduler import AutoTickScheduler
+from engine.schemas import SessionCreateRequest
+from engine.session_manager import Session, SessionManager
+from engine.session_store import SessionStore
+
+REQUEST = dict(
+    issue_id="I",
+    problem_statement="p",
+    agent_count=4,
+    agent_policy="rules",
+    auto_tick=True,
+)
+
+
+@pytest.mark.parametrize("deadline", [0, -1.5])
+def test_phase_tick_deadlines_must_be_positive(deadline):
+    with pytest.raises(ValidationError):
+        SessionCreateRequest(**REQUEST, phase_tick_deadlines={"STAKE": deadline})
+
+
+def test_failed_auto_tick_disables_and_checkpoints_the_session(tmp_path, monkeypatch):
+    store_path = tmp_path / "sessions.sqlite3"
+    manager = SessionManager(store=SessionStore(store_path), checkpoint_interval=0)
+    session = manager.create_session(SessionCreateRequest(**REQUEST))
+    healthy = manager.create_session(SessionCreateRequest(**REQUEST))
+    manager.tick_session(session.session_id)
+
+    do_tick = Session.do_tick
+
+    def broken_tick(self):
+        if self is session:
+            raise RuntimeError("runner exploded")
+        do_tick(self)
+
+    # Patched on the class: the checkpoint pickles the session's own attributes
+    monkeypatch.setattr(Session, "do_tick", broken_tick)
+    AutoTickScheduler(manager)._tick(session)
+
+    assert session.auto_tick is False
+    assert session.tick == 1
+    # A restart resumes only the sessions that were still auto-ticking
+    store = SessionStore(store_path)
+    assert store.auto_tick_session_ids() == [healthy.session_id]
+    assert store.load(session.session_id).auto_tick is False
+    restarted = SessionManager(store=store)
+    assert [s.session_id for s in restarted.list_sessions()] == [healthy.session_id]
@@ -0,0 +1,74 @@
+import importlib
+
+import pytest
+
+import engine.session_store as session_store
+from engine.schemas import SessionCreateRequest
+from engine.session_manager import SessionManager
+from engine.session_store import SessionStore
+
+REQUEST = SessionCreateRequest(
+    issue_id="I",
+    problem_statement="p",
+    agent_count=6,
+    agent_policy="rules",
+    stake_phase_ticks=12,
+)
+
+
+def _fingerprint(session):
+    state = session.state
+    return (
+        state.tick,
+        state.current_phase,
+        state.agent_balances,
+        state.credit_events,
+        state.execution_ledger,
+        [stake.model_dump() for stake in state.stake_ledger],
+        state.stake_changes,
+        [stake.stake_id for stake in state.get_active_stakes_by_agent("agent-000")],
+        state.get_proposal_convictions("I", session.config.conviction_params),
+        session.events.events,
+    )
+
+
+@pytest.fixture
+def store_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(session_store, "FULL_SNAPSHOT_EVERY", 4)
+    return tmp_path / "sessions.sqlite3"
+
+
+def test_deltas_between_snapshots_rebuild_the_session(store_path):
+    store = SessionStore(store_path)
+    manager = SessionManager(store=store, checkpoint_interval=0)
+    session = manager.create_session(REQUEST)
+    for tick in range(1, 15):
+        manager.tick_session(session.session_id)
+        reopened = SessionStore(store_path)
+        assert _fingerprint(reopened.load(session.session_id)) == _fingerprint(session), tick
+        reopened.close()
+
+    (deltas,) = store.connection.execute("SELECT COUNT(*) FROM session_deltas").fetchone()
+    assert 0 < deltas <= session_store.FULL_SNAPSHOT_EVERY
+    store.close()
+
+
+def test_resumed_session_finishes_like_the_original(store_path):
+    manager = SessionManager(store=SessionStore(store_path), checkpoint_interval=0)
+    session = manager.create_session(REQUEST)
+    for _ in range(10):
+        manager.tick_session(session.session_id)
+
+    resumed = SessionStore(store_path).load(session.session_id)
+    for copy in (session, resumed):
+        while not copy.is_complete:
+            copy.do_tick()
+    assert _fingerprint(resumed) == _fingerprint(session)
+
+
+def test_store_is_opt_in(monkeypatch):
+    pytest.importorskip("fastapi")
+    monkeypatch.delenv("RTC_SESSION_DB", raising=False)
+    import engine.app as app
+
+    assert importlib.reload(app).manager._store is None
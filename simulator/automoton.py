@@ -3,7 +3,10 @@
 All decision-making is LLM-driven using OCEAN personality profiles.
 """
 
+import asyncio
+import zlib
 from pathlib import Path
+from typing import List, Tuple
 
 from context_builder import build_context_stake_preferences, build_context_stake_action, enhance_context_for_call
 from llm_provider import (
@@ -16,15 +19,26 @@ from llm_provider import (
     load_prompt,
     one_shot,
     one_shot_json,
+    one_shot_json_async,
 )
-from models import ACTION_QUEUE, Action, AgentActor, Proposal
+from models import Action, AgentActor, Proposal, current_action_queue
 from simlog import logger
 from text_delta import sentence_sequence_delta
 
+# Stake handlers signal ready every tick yet keep staking on the next signal,
+# so idle ticks of a phase must not be fast-forwarded (see Consensus.tick)
+QUIESCENT_WHEN_READY = False
+
 
 def agent_seed(agent: AgentActor) -> int:
     """Get deterministic seed for an agent's LLM calls."""
-    return agent.seed if hasattr(agent, "seed") else hash(agent.agent_id) % 2**31
+    return agent.seed if hasattr(agent, "seed") else _stable_hash(agent.agent_id) % 2**31
+
+
+def _stable_hash(text: str) -> int:
+    """Process-independent hash (str hash() is salted per process, which would
+    change seeds, and so miss the LLM response cache, on every run)."""
+    return zlib.crc32(text.encode("utf-8"))
 
 
 def get_debug_dir(config):
@@ -44,7 +58,7 @@ def get_debug_dir(config):
 
 def signal_ready_action(agent_id: str, issue_id: str) -> None:
     """Submit a signal_ready action to the queue."""
-    ACTION_QUEUE.submit(
+    current_action_queue().submit(
         Action(type="signal_ready", agent_id=agent_id, payload={"issue_id": issue_id})
     )
 
@@ -176,6 +190,9 @@ def handle_propose_llm(agent: AgentActor, payload: dict):
             model=model,
             seed=seed,
             context_window=context_window,
+            call_type="propose",
+            agent_id=agent.agent_id,
+            tick=tick,
         )
 
         logger.debug(
@@ -189,7 +206,7 @@ def handle_propose_llm(agent: AgentActor, payload: dict):
                 else "A technology issue requires collaborative solution"
             )
             content = generate_proposal_content(
-                agent, problem_statement, model, context_window
+                agent, problem_statement, model, context_window, tick=tick
             )
 
             proposal = Proposal(
@@ -202,7 +219,7 @@ def handle_propose_llm(agent: AgentActor, payload: dict):
                 author=agent.agent_id,
                 author_type="agent",
             )
-            ACTION_QUEUE.submit(
+            current_action_queue().submit(
                 Action(
                     type="submit_proposal",
                     agent_id=agent.agent_id,
@@ -318,6 +335,9 @@ def handle_feedback_llm(agent: AgentActor, payload: dict):
             model=model,
             seed=seed,
             context_window=context_window,
+            call_type="feedback",
+            agent_id=agent.agent_id,
+            tick=tick,
         )
 
         logger.info(
@@ -378,9 +398,10 @@ def handle_feedback_llm(agent: AgentActor, payload: dict):
                             all_proposal_contents[pid],
                             model,
                             context_window,
+                            tick=tick,
                         )
 
-                        ACTION_QUEUE.submit(
+                        current_action_queue().submit(
                             Action(
                                 type="feedback",
                                 agent_id=agent.agent_id,
@@ -501,6 +522,9 @@ def handle_revise_llm(agent: AgentActor, payload: dict):
             model=model,
             seed=seed,
             context_window=context_window,
+            call_type="revise",
+            agent_id=agent.agent_id,
+            tick=tick,
         )
 
         logger.debug(
@@ -534,6 +558,7 @@ def handle_revise_llm(agent: AgentActor, payload: dict):
                 original_content,
                 model,
                 context_window,
+                tick=tick,
             )
             new_content = new_content.strip()
 
@@ -575,7 +600,7 @@ def handle_revise_llm(agent: AgentActor, payload: dict):
                 )
                 return {"ack": True}
 
-            ACTION_QUEUE.submit(
+            current_action_queue().submit(
                 Action(
                     type="revise",
                     agent_id=agent.agent_id,
@@ -635,206 +660,185 @@ def handle_revise_llm(agent: AgentActor, payload: dict):
     return {"ack": True}
 
 
-def handle_stake_llm(agent: AgentActor, payload: dict):
-    """Handle STAKE phase using LLM decision making with two-prompt system."""
+def _stake_preferences_request(agent: AgentActor, payload: dict):
+    """one_shot_json kwargs for the agent's proposal ranking, or None if it
+    already ranked proposals this stake round."""
     state = payload.get("state")
     config = payload.get("config")
-    current_balance = payload.get("current_balance")
-
-    issue_id = config.issue_id
     tick = state.tick
     phase_tick = state.phase_tick
     round_number = payload.get("round_number", 1)
 
     memory = get_phase_memory(agent, "stake")
+    if f"round_{round_number}_preferences" in memory:
+        return None
+
+    logger.info(f"[STAKE-LLM] {agent.agent_id} getting proposal preferences for round {round_number}")
+
+    context_payload = {
+        "type": payload["type"],
+        "state": payload["state"],
+        "config": payload["config"],
+        "tick": tick,
+        "phase_tick": phase_tick,
+        "issue_id": config.issue_id,
+        "max_phase_ticks": payload["phase"].max_phase_ticks,
+        "current_balance": payload.get("current_balance"),
+    }
+
+    preference_context = enhance_context_for_call(
+        agent, context_payload, "stake_preferences"
+    )
 
     debug_dir = get_debug_dir(config)
+    if debug_dir:
+        filename = f"context_{agent.agent_id}_{tick}_{phase_tick}_stake_prefs.txt"
+        (debug_dir / filename).write_text(preference_context, encoding="utf-8")
+
+    return {
+        "system": load_agent_system_prompt(),
+        "context": preference_context,
+        "prompt": load_prompt("stake_preferences"),
+        "response_model": PreferenceRanking,
+        "model": config.llm_config.get("model", None),
+        "seed": agent_seed(agent),
+        "context_window": config.llm_config.get("context_window"),
+        "call_type": "stake_prefs",
+        "agent_id": agent.agent_id,
+        "tick": tick,
+    }
+
+
+def _record_stake_preferences(
+    agent: AgentActor, payload: dict, preferences: PreferenceRanking
+):
+    """Store the agent's proposal ranking for this stake round in memory."""
+    round_number = payload.get("round_number", 1)
+    memory = get_phase_memory(agent, "stake")
+    memory[f"round_{round_number}_preferences"] = {
+        "preferences": [p.model_dump() for p in preferences.preferences],
+        "self_proposal_id": preferences.self_proposal_id,
+        "strategy_summary": preferences.strategy_summary,
+    }
 
-    try:
-        # Phase 1: Get proposal preferences (once per stake phase)
-        preferences_key = f"round_{round_number}_preferences"
-        if preferences_key not in memory:
-            logger.info(f"[STAKE-LLM] {agent.agent_id} getting proposal preferences for round {round_number}")
-
-            context_payload = {
-                "type": payload["type"],
-                "state": payload["state"],
-                "config": payload["config"],
-                "tick": tick,
-                "phase_tick": phase_tick,
-                "issue_id": issue_id,
-                "max_phase_ticks": payload["phase"].max_phase_ticks,
-                "current_balance": current_balance,
-            }
-
-            preference_context = enhance_context_for_call(
-                agent, context_payload, "stake_preferences"
-            )
-
-            system_prompt = load_agent_system_prompt()
-            user_prompt = load_prompt("stake_preferences")
-            model = config.llm_config.get("model", None)
-
-            seed = agent_seed(agent)
-
-            if debug_dir:
-                filename = f"context_{agent.agent_id}_{tick}_{phase_tick}_stake_prefs.txt"
-                (debug_dir / filename).write_text(preference_context, encoding="utf-8")
-
-            context_window = config.llm_config.get("context_window")
-            preferences = one_shot_json(
-                system=system_prompt,
-                context=preference_context,
-                prompt=user_prompt,
-                response_model=PreferenceRanking,
-                model=model,
-                seed=seed,
-                context_window=context_window,
-            )
-
-            memory[preferences_key] = {
-                "preferences": [p.model_dump() for p in preferences.preferences],
-                "self_proposal_id": preferences.self_proposal_id,
-                "strategy_summary": preferences.strategy_summary,
-            }
-
-            sorted_prefs = sorted(preferences.preferences, key=lambda x: x.rank)
-            top_3_ids = [p.proposal_id for p in sorted_prefs[:3]]
-
-            logger.info(
-                f"[STAKE-LLM] {agent.agent_id} established preferences: {top_3_ids}... | Strategy: {preferences.strategy_summary[:50]}..."
-            )
-
-        # Phase 2: Get tactical stake action based on preferences + current state
-        stored_preferences = memory.get(preferences_key)
-        if not stored_preferences:
-            logger.error(f"[STAKE-LLM] {agent.agent_id} no preferences found for round {round_number}")
-            signal_ready_action(agent.agent_id, issue_id)
-            return {"ack": True}
-
-        context_payload = {
-            "type": payload["type"],
-            "state": payload["state"],
-            "config": payload["config"],
-            "tick": tick,
-            "phase_tick": phase_tick,
-            "issue_id": issue_id,
-            "max_phase_ticks": payload["phase"].max_phase_ticks,
-            "current_balance": payload.get("current_balance"),
-            "atomic_stakes": payload.get("atomic_stakes", []),
-            "stored_preferences": stored_preferences,
-        }
-        action_context = enhance_context_for_call(
-            agent, context_payload, "stake_action"
-        )
+    sorted_prefs = sorted(preferences.preferences, key=lambda x: x.rank)
+    top_3_ids = [p.proposal_id for p in sorted_prefs[:3]]
 
-        if debug_dir:
-            filename = f"context_{agent.agent_id}_{tick}_{phase_tick}_stake_action.txt"
-            (debug_dir / filename).write_text(action_context, encoding="utf-8")
+    logger.info(
+        f"[STAKE-LLM] {agent.agent_id} established preferences: {top_3_ids}... | Strategy: {preferences.strategy_summary[:50]}..."
+    )
 
-        system_prompt = load_agent_system_prompt()
-        user_prompt = load_prompt("stake_action")
-        model = config.llm_config.get("model", None)
 
-        seed = agent_seed(agent)
-        context_window = config.llm_config.get("context_window")
+def _stake_action_request(agent: AgentActor, payload: dict):
+    """one_shot_json kwargs for this tick's stake action, or None if the agent
+    has no preferences for the round."""
+    state = payload.get("state")
+    config = payload.get("config")
+    tick = state.tick
+    phase_tick = state.phase_tick
+    round_number = payload.get("round_number", 1)
 
-        action_decision = one_shot_json(
-            system=system_prompt,
-            context=action_context,
-            prompt=user_prompt,
-            response_model=StakeAction,
-            model=model,
-            seed=seed + tick,
-            context_window=context_window,
-        )
+    stored_preferences = get_phase_memory(agent, "stake").get(
+        f"round_{round_number}_preferences"
+    )
+    if not stored_preferences:
+        logger.error(f"[STAKE-LLM] {agent.agent_id} no preferences found for round {round_number}")
+        return None
+
+    context_payload = {
+        "type": payload["type"],
+        "state": payload["state"],
+        "config": payload["config"],
+        "tick": tick,
+        "phase_tick": phase_tick,
+        "issue_id": config.issue_id,
+        "max_phase_ticks": payload["phase"].max_phase_ticks,
+        "current_balance": payload.get("current_balance"),
+        "atomic_stakes": payload.get("atomic_stakes", []),
+        "proposal_convictions": payload.get("proposal_convictions"),
+        "stored_preferences": stored_preferences,
+    }
+    action_context = enhance_context_for_call(
+        agent, context_payload, "stake_action"
+    )
 
-        logger.debug(
-            f"[LLM_DECISION] {agent.agent_id} LLM decided: {action_decision.action} on P{action_decision.proposal_id} with {action_decision.cp_amount} CP | Reasoning: {action_decision.reasoning[:100]}..."
-        )
+    debug_dir = get_debug_dir(config)
+    if debug_dir:
+        filename = f"context_{agent.agent_id}_{tick}_{phase_tick}_stake_action.txt"
+        (debug_dir / filename).write_text(action_context, encoding="utf-8")
+
+    return {
+        "system": load_agent_system_prompt(),
+        "context": action_context,
+        "prompt": load_prompt("stake_action"),
+        "response_model": StakeAction,
+        "model": config.llm_config.get("model", None),
+        "seed": agent_seed(agent) + tick,
+        "context_window": config.llm_config.get("context_window"),
+        "call_type": "stake_action",
+        "agent_id": agent.agent_id,
+        "tick": tick,
+    }
+
+
+def _apply_stake_action(agent: AgentActor, payload: dict, action_decision: StakeAction):
+    """Queue the agent's stake action and record it in memory."""
+    current_balance = payload.get("current_balance")
+    issue_id = payload.get("config").issue_id
+    tick = payload.get("state").tick
+    round_number = payload.get("round_number", 1)
 
-        if action_decision.action == "stake":
-            stake_amount = min(action_decision.cp_amount, current_balance)
-            if stake_amount > 0:
-                ACTION_QUEUE.submit(
-                    Action(
-                        type="stake",
-                        agent_id=agent.agent_id,
-                        payload={
-                            "proposal_id": action_decision.proposal_id,
-                            "stake_amount": stake_amount,
-                            "round_number": round_number,
-                            "tick": tick,
-                            "issue_id": issue_id,
-                            "choice_reason": "llm_decision",
-                        },
-                    )
-                )
+    logger.debug(
+        f"[LLM_DECISION] {agent.agent_id} LLM decided: {action_decision.action} on P{action_decision.proposal_id} with {action_decision.cp_amount} CP | Reasoning: {action_decision.reasoning[:100]}..."
+    )
 
-                add_memory_action(
-                    agent,
-                    "stake",
-                    tick,
-                    f"LLM staked {stake_amount} CP on proposal {action_decision.proposal_id}: {action_decision.reasoning[:50]}...",
-                    {
-                        "action": "stake",
+    if action_decision.action == "stake":
+        stake_amount = min(action_decision.cp_amount, current_balance)
+        if stake_amount > 0:
+            current_action_queue().submit(
+                Action(
+                    type="stake",
+                    agent_id=agent.agent_id,
+                    payload={
                         "proposal_id": action_decision.proposal_id,
-                        "amount": stake_amount,
-                        "llm_reasoning": action_decision.reasoning,
+                        "stake_amount": stake_amount,
+                        "round_number": round_number,
+                        "tick": tick,
+                        "issue_id": issue_id,
+                        "choice_reason": "llm_decision",
                     },
                 )
+            )
 
-                logger.info(
-                    f"[STAKE-LLM] {agent.agent_id} LLM staked {stake_amount} CP on P{action_decision.proposal_id} | Round {round_number}"
-                )
-
-        elif action_decision.action == "switch_stake":
-            if action_decision.source_proposal_id is not None:
-                switch_amount = min(action_decision.cp_amount, current_balance)
-                if switch_amount > 0:
-                    ACTION_QUEUE.submit(
-                        Action(
-                            type="switch_stake",
-                            agent_id=agent.agent_id,
-                            payload={
-                                "source_proposal_id": action_decision.source_proposal_id,
-                                "target_proposal_id": action_decision.proposal_id,
-                                "cp_amount": switch_amount,
-                                "tick": tick,
-                                "issue_id": issue_id,
-                                "reason": "llm_decision",
-                            },
-                        )
-                    )
-
-                    add_memory_action(
-                        agent,
-                        "stake",
-                        tick,
-                        f"LLM switched {switch_amount} CP from P{action_decision.source_proposal_id} to P{action_decision.proposal_id}: {action_decision.reasoning[:50]}...",
-                        {
-                            "action": "switch_stake",
-                            "source_proposal_id": action_decision.source_proposal_id,
-                            "target_proposal_id": action_decision.proposal_id,
-                            "amount": switch_amount,
-                            "llm_reasoning": action_decision.reasoning,
-                        },
-                    )
+            add_memory_action(
+                agent,
+                "stake",
+                tick,
+                f"LLM staked {stake_amount} CP on proposal {action_decision.proposal_id}: {action_decision.reasoning[:50]}...",
+                {
+                    "action": "stake",
+                    "proposal_id": action_decision.proposal_id,
+                    "amount": stake_amount,
+                    "llm_reasoning": action_decision.reasoning,
+                },
+            )
 
-                    logger.info(
-                        f"[STAKE-LLM] {agent.agent_id} LLM switched {switch_amount} CP from P{action_decision.source_proposal_id} to P{action_decision.proposal_id} | Round {round_number}"
-                    )
+            logger.info(
+                f"[STAKE-LLM] {agent.agent_id} LLM staked {stake_amount} CP on P{action_decision.proposal_id} | Round {round_number}"
+            )
 
-        elif action_decision.action == "unstake":
-            unstake_amount = min(action_decision.cp_amount, current_balance)
-            if unstake_amount > 0:
-                ACTION_QUEUE.submit(
+    elif action_decision.action == "switch_stake":
+        if action_decision.source_proposal_id is not None:
+            switch_amount = min(action_decision.cp_amount, current_balance)
+            if switch_amount > 0:
+                current_action_queue().submit(
                     Action(
-                        type="unstake",
+                        type="switch_stake",
                         agent_id=agent.agent_id,
                         payload={
-                            "proposal_id": action_decision.proposal_id,
-                            "cp_amount": unstake_amount,
+                            "source_proposal_id": action_decision.source_proposal_id,
+                            "target_proposal_id": action_decision.proposal_id,
+                            "cp_amount": switch_amount,
                             "tick": tick,
                             "issue_id": issue_id,
                             "reason": "llm_decision",
@@ -846,49 +850,169 @@ def handle_stake_llm(agent: AgentActor, payload: dict):
                     agent,
                     "stake",
                     tick,
-                    f"LLM unstaked {unstake_amount} CP from proposal {action_decision.proposal_id}: {action_decision.reasoning[:50]}...",
+                    f"LLM switched {switch_amount} CP from P{action_decision.source_proposal_id} to P{action_decision.proposal_id}: {action_decision.reasoning[:50]}...",
                     {
-                        "action": "unstake",
-                        "proposal_id": action_decision.proposal_id,
-                        "amount": unstake_amount,
+                        "action": "switch_stake",
+                        "source_proposal_id": action_decision.source_proposal_id,
+                        "target_proposal_id": action_decision.proposal_id,
+                        "amount": switch_amount,
                         "llm_reasoning": action_decision.reasoning,
                     },
                 )
 
                 logger.info(
-                    f"[STAKE-LLM] {agent.agent_id} LLM unstaked {unstake_amount} CP from P{action_decision.proposal_id} | Round {round_number}"
+                    f"[STAKE-LLM] {agent.agent_id} LLM switched {switch_amount} CP from P{action_decision.source_proposal_id} to P{action_decision.proposal_id} | Round {round_number}"
+                )
+
+    elif action_decision.action == "unstake":
+        unstake_amount = min(action_decision.cp_amount, current_balance)
+        if unstake_amount > 0:
+            current_action_queue().submit(
+                Action(
+                    type="unstake",
+                    agent_id=agent.agent_id,
+                    payload={
+                        "proposal_id": action_decision.proposal_id,
+                        "cp_amount": unstake_amount,
+                        "tick": tick,
+                        "issue_id": issue_id,
+                        "reason": "llm_decision",
+                    },
                 )
+            )
 
-        elif action_decision.action == "wait":
             add_memory_action(
                 agent,
                 "stake",
                 tick,
-                f"LLM decided to wait: {action_decision.reasoning[:50]}...",
+                f"LLM unstaked {unstake_amount} CP from proposal {action_decision.proposal_id}: {action_decision.reasoning[:50]}...",
                 {
-                    "action": "wait",
+                    "action": "unstake",
+                    "proposal_id": action_decision.proposal_id,
+                    "amount": unstake_amount,
                     "llm_reasoning": action_decision.reasoning,
                 },
             )
+
             logger.info(
-                f"[STAKE-LLM] {agent.agent_id} LLM decided to wait. (tick {tick})"
+                f"[STAKE-LLM] {agent.agent_id} LLM unstaked {unstake_amount} CP from P{action_decision.proposal_id} | Round {round_number}"
             )
 
-    except Exception as exc:
-        logger.error(
-            f"[STAKE-LLM] {agent.agent_id} LLM stake decision failed: {exc}. "
-            "Aborting stake phase. Please check LLM configuration, model availability, and input context."
+    elif action_decision.action == "wait":
+        add_memory_action(
+            agent,
+            "stake",
+            tick,
+            f"LLM decided to wait: {action_decision.reasoning[:50]}...",
+            {
+                "action": "wait",
+                "llm_reasoning": action_decision.reasoning,
+            },
         )
-        raise RuntimeError(
-            f"LLM stake decision failed for agent {agent.agent_id}: {exc}. "
-            "Stake phase aborted. Check LLM setup and logs for details."
+        logger.info(
+            f"[STAKE-LLM] {agent.agent_id} LLM decided to wait. (tick {tick})"
         )
 
+
+def _stake_failure(agent: AgentActor, exc: Exception):
+    logger.error(
+        f"[STAKE-LLM] {agent.agent_id} LLM stake decision failed: {exc}. "
+        "Aborting stake phase. Please check LLM configuration, model availability, and input context."
+    )
+    raise RuntimeError(
+        f"LLM stake decision failed for agent {agent.agent_id}: {exc}. "
+        "Stake phase aborted. Check LLM setup and logs for details."
+    )
+
+
+def handle_stake_llm(agent: AgentActor, payload: dict):
+    """Handle STAKE phase using LLM decision making with two-prompt system."""
+    issue_id = payload.get("config").issue_id
+
+    try:
+        # Phase 1: Get proposal preferences (once per stake phase)
+        request = _stake_preferences_request(agent, payload)
+        if request is not None:
+            _record_stake_preferences(agent, payload, one_shot_json(**request))
+
+        # Phase 2: Get tactical stake action based on preferences + current state
+        request = _stake_action_request(agent, payload)
+        if request is None:
+            signal_ready_action(agent.agent_id, issue_id)
+            return {"ack": True}
+        _apply_stake_action(agent, payload, one_shot_json(**request))
+    except Exception as exc:
+        _stake_failure(agent, exc)
+
     signal_ready_action(agent.agent_id, issue_id)
 
     return {"ack": True}
 
 
+def handle_signal_batch(signals: List[Tuple[AgentActor, dict]]) -> bool:
+    """Handle one phase fan-out for all agents at once (stake phases only).
+
+    Every agent's preference prompt is issued concurrently, then every action
+    prompt, through the async LLM calls; decisions are applied in signal order
+    so actions queue exactly as in a serial run.
+
+    Returns:
+        False (nothing handled) for phases without a batched handler
+    """
+    if any(payload.get("type") != "Stake" for _, payload in signals):
+        return False
+
+    for agent, payload in signals:
+        agent_proposal_id = payload.get("agent_proposal_id")
+        if agent_proposal_id is not None:
+            agent.latest_proposal_id = agent_proposal_id
+
+    asyncio.run(_handle_stake_batch(signals))
+    return True
+
+
+async def _handle_stake_batch(signals: List[Tuple[AgentActor, dict]]):
+    """Two concurrent rounds of LLM calls (preferences, then actions)."""
+
+    async def decide(agent: AgentActor, request: dict):
+        try:
+            return await one_shot_json_async(**request)
+        except Exception as exc:
+            _stake_failure(agent, exc)
+
+    async def decide_all(build_request) -> list:
+        requests = []
+        for agent, payload in signals:
+            try:
+                requests.append(build_request(agent, payload))
+            except Exception as exc:
+                _stake_failure(agent, exc)
+        decisions = iter(
+            await asyncio.gather(
+                *(
+                    decide(agent, request)
+                    for (agent, _), request in zip(signals, requests)
+                    if request is not None
+                )
+            )
+        )
+        return [None if request is None else next(decisions) for request in requests]
+
+    rankings = await decide_all(_stake_preferences_request)
+    for (agent, payload), ranking in zip(signals, rankings):
+        if ranking is not None:
+            _record_stake_preferences(agent, payload, ranking)
+
+    decisions = await decide_all(_stake_action_request)
+    for (agent, payload), decision in zip(signals, decisions):
+        if decision is not None:
+            try:
+                _apply_stake_action(agent, payload, decision)
+            except Exception as exc:
+                _stake_failure(agent, exc)
+        signal_ready_action(agent.agent_id, payload.get("config").issue_id)
+
+
 # ---------------------------------------------------------------------------
 # Content Generators (LLM-powered)
 # ---------------------------------------------------------------------------
@@ -901,6 +1025,8 @@ def _generate_content(
     model: str = None,
     context_window: int = None,
     seed_salt: int = 0,
+    call_type: str = None,
+    tick: int = None,
 ) -> str:
     """Shared LLM content generation. Seed is agent_seed + salt for variation."""
     seed = agent_seed(agent) + seed_salt
@@ -911,6 +1037,9 @@ def _generate_content(
         model=model,
         seed=seed,
         context_window=context_window,
+        call_type=call_type,
+        agent_id=agent.agent_id,
+        tick=tick,
     )
 
 
@@ -919,10 +1048,12 @@ def generate_proposal_content(
     problem_statement: str,
     model: str = None,
     context_window: int = None,
+    tick: int = None,
 ) -> str:
     """Generate proposal content using LLM."""
     return _generate_content(
-        agent, problem_statement, load_prompt("proposal"), model, context_window
+        agent, problem_statement, load_prompt("proposal"), model, context_window,
+        call_type="propose_content", tick=tick,
     )
 
 
@@ -932,12 +1063,14 @@ def generate_feedback_content(
     proposal_content: str,
     model: str = None,
     context_window: int = None,
+    tick: int = None,
 ) -> str:
     """Generate feedback content using LLM for a specific proposal."""
     user_prompt = f"{load_prompt('feedback')}\n\nSpecific proposal to review:\n{proposal_content}"
     return _generate_content(
         agent, context, user_prompt, model, context_window,
-        seed_salt=hash(proposal_content) % 1000,
+        seed_salt=_stable_hash(proposal_content) % 1000,
+        call_type="feedback_content", tick=tick,
     )
 
 
@@ -947,10 +1080,12 @@ def generate_revision_content(
     original_content: str,
     model: str = None,
     context_window: int = None,
+    tick: int = None,
 ) -> str:
     """Generate revised proposal content using LLM."""
     user_prompt = f"{load_prompt('revise')}\n\nOriginal proposal to revise:\n{original_content}"
     return _generate_content(
         agent, context, user_prompt, model, context_window,
-        seed_salt=hash(original_content) % 1000,
+        seed_salt=_stable_hash(original_content) % 1000,
+        call_type="revise_content", tick=tick,
     )
@@ -0,0 +1,464 @@
+#!/usr/bin/env python3
+"""
+Simulator micro-benchmarks.
+
+Usage:
+    python3 benchmarks.py stakes [--count 100000]
+    python3 benchmarks.py sink [--events 20000] [--events-per-tick 50] [--disk-delay 0]
+    python3 benchmarks.py events [--count 100000]
+    python3 benchmarks.py protocol [--agents 1000] [--stake-ticks 50] [--log]
+    python3 benchmarks.py sessions [--sessions 32] [--threads 8] [--agents 20]
+    python3 benchmarks.py llm [--runs 5] [--agents 10] [--latency-ms 0] [--failure-rate 0] [--concurrency 1]
+"""
+
+import argparse
+import gc
+import random
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from controller import Controller
+from llm_provider import _get_model
+from models import (
+    ACTION_QUEUE,
+    AgentActor,
+    AgentPool,
+    GlobalConfig,
+    Issue,
+    RoundtableState,
+    RunConfig,
+    StakeRecord,
+    StakeRecordModel,
+)
+from simlog import (
+    AsyncSQLiteSink,
+    EventType,
+    LogEntry,
+    SQLiteSink,
+    configure_events,
+    event_enabled,
+    log_event,
+    logger,
+)
+
+
+def _measure(build):
+    """Run build() and return (result, bytes allocated and still live, seconds)."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, elapsed
+
+
+def _stake_fields(count: int, agents: int = 500, proposals: int = 50):
+    return [
+        {
+            "agent_id": f"Agent_{i % agents}",
+            "proposal_id": i % proposals,
+            "cp": 1 + i % 9,
+            "initial_tick": 1 + i % 40,
+            "issue_id": "ISSUE_1",
+        }
+        for i in range(count)
+    ]
+
+
+def bench_stakes(count: int):
+    """Compare memory and build time of slotted StakeRecords vs pydantic models."""
+    fields = _stake_fields(count)
+
+    def build_models():
+        return [StakeRecordModel(stake_id=i, **f) for i, f in enumerate(fields)]
+
+    def build_records():
+        return [StakeRecord(**f) for f in fields]
+
+    def build_ledger():
+        state = RoundtableState()
+        for f in fields:
+            state.add_stake(StakeRecord(**f))
+        return state
+
+    print(f"Stake records: {count:,}")
+    print(f"{'Representation':38} {'Memory':>10} {'Per stake':>10} {'Build':>9}")
+    print("-" * 70)
+    for label, build in (
+        ("pydantic StakeRecordModel", build_models),
+        ("slotted StakeRecord", build_records),
+        ("RoundtableState ledger + indexes", build_ledger),
+    ):
+        result, size, elapsed = _measure(build)
+        print(
+            f"{label:38} {size / 1e6:8.1f}MB {size / count:9.0f}B {elapsed:8.2f}s"
+        )
+        del result
+
+
+def bench_sink(events: int, events_per_tick: int, disk_delay: float):
+    """Events/sec through the forensic sinks, as seen by the simulation thread.
+
+    disk_delay adds a sleep (seconds) to every flush to emulate a slow disk; the
+    synchronous sinks pay it on the simulation thread, the background writer does not.
+    """
+    payload = {"agent_id": "Agent_1", "proposal_id": 3, "amount": 5, "issue_id": "ISSUE_1"}
+    variants = (
+        ("per-event commit (batch_size=1, no WAL)", SQLiteSink, {"batch_size": 1, "wal": False}),
+        ("batched per tick (WAL)", SQLiteSink, {}),
+        ("background writer (block)", AsyncSQLiteSink, {}),
+        ("background writer (spill, queue=1000)", AsyncSQLiteSink, {"queue_size": 1000, "backpressure": "spill"}),
+    )
+
+    print(f"Events: {events:,} ({events_per_tick} per tick), disk delay {disk_delay * 1000:.1f}ms")
+    print(f"{'Sink':42} {'Enqueue':>8} {'Total':>8} {'Events/sec':>12}")
+    print("-" * 73)
+    with tempfile.TemporaryDirectory() as tmp:
+        for i, (label, sink_class, options) in enumerate(variants):
+            sink = sink_class(Path(tmp) / f"bench_{i}.sqlite3", **options)
+            base = sink.sink if isinstance(sink, AsyncSQLiteSink) else sink
+            if disk_delay:
+                flush_locked = base._flush_locked
+
+                def slow_flush(flush_locked=flush_locked):
+                    time.sleep(disk_delay)
+                    flush_locked()
+
+                base._flush_locked = slow_flush
+
+            start = time.perf_counter()
+            for n in range(events):
+                sink.write_event(
+                    {
+                        "tick": n // events_per_tick,
+                        "phase": "STAKE",
+                        "agent_id": "Agent_1",
+                        "event_type": "stake_recorded",
+                        "payload": payload,
+                    },
+                    "Voluntary stake recorded",
+                )
+            enqueued = time.perf_counter() - start
+            sink.close()
+            elapsed = time.perf_counter() - start
+            print(f"{label:42} {enqueued:7.2f}s {elapsed:7.2f}s {events / enqueued:12,.0f}")
+
+
+def bench_events(count: int):
+    """Per-call cost of log_event for disabled and enabled event types."""
+    agent_id, amount, reason = "Agent_1", 5, "Stake"
+
+    def build_and_log():
+        log_event(
+            LogEntry(
+                tick=1,
+                event_type=EventType.CREDIT_BURN,
+                agent_id=agent_id,
+                payload={"amount": amount, "reason": reason, "issue_id": "ISSUE_1"},
+                message=f"Credit burned: {agent_id} -{amount} CP ({reason})",
+            )
+        )
+
+    def guarded():
+        if event_enabled(EventType.CREDIT_BURN):
+            build_and_log()
+
+    def run(call):
+        start = time.perf_counter()
+        for _ in range(count):
+            call()
+        return (time.perf_counter() - start) / count
+
+    print(f"Calls: {count:,}")
+    print(f"{'Path':46} {'Per event':>10}")
+    print("-" * 57)
+    with tempfile.TemporaryDirectory() as tmp:
+        logger.remove()
+        sink = SQLiteSink(Path(tmp) / "bench_events.sqlite3")
+        logger.add(
+            sink.write,
+            level="DEBUG",
+            format="{message}",
+            filter=lambda record: "event_dict" in record["extra"],
+        )
+        try:
+            configure_events(disabled=[EventType.CREDIT_BURN])
+            print(f"{'disabled, guarded by event_enabled()':46} {run(guarded) * 1e9:8.0f}ns")
+            print(f"{'disabled, LogEntry built then dropped':46} {run(build_and_log) * 1e9:8.0f}ns")
+            configure_events()
+            print(f"{'enabled, written to SQLiteSink':46} {run(guarded) * 1e9:8.0f}ns")
+        finally:
+            logger.remove()
+            sink.close()
+            configure_events()
+
+
+def _bench_controller(
+    agents: int,
+    stake_ticks: int,
+    seed: int = 42,
+    issue_id: str = "BENCH",
+    max_concurrent_agents: int = 1,
+    agent_policy: str = "rules",
+    llm_config: dict = None,
+) -> Controller:
+    """Controller configured for a benchmark run (agents with random OCEAN profiles)."""
+    rng = random.Random(seed)
+    traits = ("openness", "conscientiousness", "extraversion", "agreeableness", "neuroticism")
+    actors = {
+        f"Agent_{i}": AgentActor(
+            agent_id=f"Agent_{i}",
+            initial_balance=rng.randint(100, 300),
+            seed=seed + i,
+            rng=random.Random(seed + i),
+            metadata={"ocean_profile": {t: rng.random() for t in traits}},
+        )
+        for i in range(agents)
+    }
+    agent_ids = list(actors)
+    pool = AgentPool(agents=actors)
+    global_config = GlobalConfig(
+        assignment_award=100,
+        max_feedback_per_agent=3,
+        feedback_stake=5,
+        proposal_self_stake=50,
+        revision_cycles=1,
+        conviction_params={"MaxMultiplier": 2.0, "TargetFraction": 0.98},
+        agent_pool=pool,
+        stake_phase_ticks=stake_ticks,
+        fast_forward_idle_ticks=True,
+        max_concurrent_agents=max_concurrent_agents,
+        agent_policy=agent_policy,
+        llm_config=llm_config or {},
+    )
+    run_config = RunConfig(
+        seed=seed,
+        issue_id=issue_id,
+        agent_ids=agent_ids,
+        selected_agents=actors,
+        initial_proposals={},
+    )
+    controller = Controller(pool)
+    controller.register_issue(
+        Issue(
+            issue_id=issue_id,
+            problem_statement="Benchmark issue",
+            background="Rule-based protocol run",
+            agent_ids=agent_ids,
+        )
+    )
+    controller.configure_consensus(global_config, run_config)
+    return controller
+
+
+def bench_protocol(agents: int, stake_ticks: int, log: bool, seed: int = 42):
+    """Controller.run throughput with rule-based agents (no LLM calls)."""
+    with tempfile.TemporaryDirectory() as tmp:
+        logger.remove()
+        sink = None
+        if log:
+            sink = AsyncSQLiteSink(Path(tmp) / "bench_protocol.sqlite3")
+            logger.add(
+                sink.write,
+                level="DEBUG",
+                format="{message}",
+                filter=lambda record: "event_dict" in record["extra"],
+            )
+        try:
+            controller = _bench_controller(agents, stake_ticks, seed)
+            start = time.perf_counter()
+            state = controller.run()["final_state"]
+            elapsed = time.perf_counter() - start
+        finally:
+            logger.remove()
+            if sink:
+                sink.close()
+
+    proposals = len(state.current_issue.proposals)
+    stakes = len(state.stake_ledger)
+    print(f"Agents: {agents:,}  stake ticks/round: {stake_ticks}  event log: {'on' if log else 'off'}")
+    print(f"Ticks: {state.tick:,}  proposals: {proposals:,}  stakes: {stakes:,}")
+    print(f"Wall time: {elapsed:.2f}s  ({state.tick / elapsed:,.1f} ticks/s, "
+          f"{agents * state.tick / elapsed:,.0f} agent-ticks/s)")
+
+
+def _session_fingerprint(controller: Controller) -> tuple:
+    state = controller.state
+    return (
+        state.tick,
+        tuple(sorted(state.agent_balances.items())),
+        tuple(
+            (s.agent_id, s.proposal_id, s.cp, s.initial_tick, s.status)
+            for s in state.stake_ledger
+        ),
+    )
+
+
+def bench_sessions(sessions: int, threads: int, agents: int, stake_ticks: int):
+    """Stress test: step many controllers concurrently, as the engine ticks sessions.
+
+    Each round submits one step() per unfinished session to a shared thread
+    pool (agents also dispatched concurrently within each session). Every
+    session must end exactly as it does when run alone; exits 1 otherwise.
+    """
+
+    def build():
+        return [
+            _bench_controller(
+                agents,
+                stake_ticks,
+                seed=1000 + i,
+                issue_id=f"STRESS_{i}",
+                max_concurrent_agents=4,
+            )
+            for i in range(sessions)
+        ]
+
+    logger.remove()
+    start = time.perf_counter()
+    expected = []
+    for controller in build():
+        controller.run()
+        expected.append(_session_fingerprint(controller))
+    serial = time.perf_counter() - start
+
+    controllers = build()
+    # Sessions that stall (e.g. readiness leaking between them) count as diverged
+    max_rounds = 2 * max(fingerprint[0] for fingerprint in expected)
+    steps = 0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads, thread_name_prefix="session") as pool:
+        for _ in range(max_rounds):
+            active = [c for c in controllers if not c.current_consensus._is_complete()]
+            if not active:
+                break
+            for future in [pool.submit(c.step) for c in active]:
+                future.result()
+            steps += len(active)
+    concurrent = time.perf_counter() - start
+
+    mismatched = [
+        i
+        for i, controller in enumerate(controllers)
+        if _session_fingerprint(controller) != expected[i]
+    ]
+    stray = len(ACTION_QUEUE.queue)
+    print(f"Sessions: {sessions}  threads: {threads}  agents/session: {agents}  steps: {steps:,}")
+    print(f"Serial: {serial:.2f}s  concurrent: {concurrent:.2f}s")
+    print(f"Sessions matching their solo run: {sessions - len(mismatched)}/{sessions}")
+    print(f"Actions left on the default queue: {stray}")
+    if mismatched or stray:
+        print(f"FAILED: sessions {mismatched} diverged" if mismatched else "FAILED: stray actions")
+        raise SystemExit(1)
+
+
+def bench_llm(
+    runs: int,
+    agents: int,
+    stake_ticks: int,
+    latency_ms: float,
+    failure_rate: float,
+    concurrency: int,
+):
+    """Load test: LLM-driven Controller.run against the offline stub model.
+
+    Exercises context building, JSON parsing and agent memory updates with no
+    network. An injected failure aborts its run, as a real LLM error does.
+    """
+    model_name = f"stub:latency_ms={latency_ms},failure_rate={failure_rate}"
+    model = _get_model(model_name)
+    logger.remove()
+
+    completed = aborted = ticks = 0
+    start = time.perf_counter()
+    for run in range(runs):
+        controller = _bench_controller(
+            agents,
+            stake_ticks,
+            seed=2000 + run,
+            issue_id=f"LLM_{run}",
+            max_concurrent_agents=concurrency,
+            agent_policy="llm",
+            llm_config={"model": model_name},
+        )
+        try:
+            ticks += controller.run()["final_state"].tick
+            completed += 1
+        except RuntimeError:
+            ticks += controller.state.tick
+            aborted += 1
+    elapsed = time.perf_counter() - start
+
+    print(f"Runs: {runs}  agents: {agents}  stake ticks/round: {stake_ticks}  concurrency: {concurrency}")
+    print(f"Stub latency: {latency_ms:g}ms  failure rate: {failure_rate:g}")
+    print(f"Completed: {completed}  aborted by injected failures: {aborted}")
+    print(f"LLM calls: {model.calls:,}  failures: {model.failures:,}  ticks: {ticks:,}")
+    print(f"Wall time: {elapsed:.2f}s  ({model.calls / elapsed:,.1f} calls/s, "
+          f"{ticks / elapsed:,.1f} ticks/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulator micro-benchmarks")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    stakes = subparsers.add_parser("stakes", help="StakeRecord memory footprint")
+    stakes.add_argument("--count", type=int, default=100_000)
+
+    sink = subparsers.add_parser("sink", help="SQLiteSink event throughput")
+    sink.add_argument("--events", type=int, default=20_000)
+    sink.add_argument("--events-per-tick", type=int, default=50)
+    sink.add_argument("--disk-delay", type=float, default=0.0)
+
+    events = subparsers.add_parser("events", help="log_event per-call cost")
+    events.add_argument("--count", type=int, default=100_000)
+
+    protocol = subparsers.add_parser("protocol", help="Rule-based Controller.run throughput")
+    protocol.add_argument("--agents", type=int, default=1000)
+    protocol.add_argument("--stake-ticks", type=int, default=50)
+    protocol.add_argument("--log", action="store_true", help="Write events to SQLite")
+
+    sessions = subparsers.add_parser(
+        "sessions", help="Stress test: concurrent sessions vs their solo runs"
+    )
+    sessions.add_argument("--sessions", type=int, default=32)
+    sessions.add_argument("--threads", type=int, default=8)
+    sessions.add_argument("--agents", type=int, default=20)
+    sessions.add_argument("--stake-ticks", type=int, default=10)
+
+    llm = subparsers.add_parser("llm", help="Load test: LLM agents on the stub model")
+    llm.add_argument("--runs", type=int, default=5)
+    llm.add_argument("--agents", type=int, default=10)
+    llm.add_argument("--stake-ticks", type=int, default=5)
+    llm.add_argument("--latency-ms", type=float, default=0.0)
+    llm.add_argument("--failure-rate", type=float, default=0.0)
+    llm.add_argument("--concurrency", type=int, default=1, help="max_concurrent_agents")
+
+    args = parser.parse_args()
+    if args.benchmark == "stakes":
+        bench_stakes(args.count)
+    elif args.benchmark == "sink":
+        bench_sink(args.events, args.events_per_tick, args.disk_delay)
+    elif args.benchmark == "events":
+        bench_events(args.count)
+    elif args.benchmark == "protocol":
+        bench_protocol(args.agents, args.stake_ticks, args.log)
+    elif args.benchmark == "sessions":
+        bench_sessions(args.sessions, args.threads, args.agents, args.stake_ticks)
+    elif args.benchmark == "llm":
+        bench_llm(
+            args.runs,
+            args.agents,
+            args.stake_ticks,
+            args.latency_ms,
+            args.failure_rate,
+            args.concurrency,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -60,6 +60,18 @@ def merge_cli_args(config: Dict[str, Any], args: argparse.Namespace) -> Dict[str
     if hasattr(args, "num_agents") and args.num_agents is not None:
         config["simulation"]["num_agents"] = args.num_agents
 
+    if hasattr(args, "agent_policy") and args.agent_policy is not None:
+        config["simulation"]["agent_policy"] = args.agent_policy
+
+    if hasattr(args, "workers") and args.workers is not None:
+        config["simulation"]["workers"] = args.workers
+
+    if hasattr(args, "llm_cache") and args.llm_cache:
+        config.setdefault("llm", {}).setdefault("cache", {})["enabled"] = True
+
+    if hasattr(args, "no_llm_cache") and args.no_llm_cache:
+        config.setdefault("llm", {}).setdefault("cache", {})["enabled"] = False
+
     return config
 
 
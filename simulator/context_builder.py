@@ -4,9 +4,91 @@ Provides lean markdown context optimized for token efficiency.
 """
 
 import json
+import threading
+from collections import OrderedDict
+
 from simlog import EventType, LogEntry, LogLevel, PhaseType, log_event, logger
 
 
+class ContextCache:
+    """Rendered context fragments shared across agents and ticks.
+
+    Fragments are keyed by what they render from - a proposal revision and its
+    content, an agent's trait values, a tick's stake ledger - so every agent's
+    context is assembled from text rendered once per change rather than once
+    per agent per tick. Entries tied to a per-tick object (feedback log length,
+    atomic stake list, conviction leaderboard) keep a reference to it and are
+    only reused for that same object. Safe to share between dispatch threads.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def fragment(self, key, render, source=None):
+        """Cached render() for key; source (if given) must be the same object."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is source:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        value = render()
+        with self._lock:
+            self._entries[key] = (source, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_context_cache = ContextCache()
+
+
+def _numeric_traits(profile):
+    return tuple(
+        (name, value) for name, value in profile.items() if isinstance(value, (int, float))
+    )
+
+
+def _trait_table(agent):
+    """OCEAN markdown table lines for an agent (rendered once per trait values)."""
+    traits = _numeric_traits(agent.metadata["ocean_profile"])
+    return _context_cache.fragment(
+        ("trait_table", traits),
+        lambda: tuple(f"| {name:<13} | {value:<5.1f} |" for name, value in traits),
+    )
+
+
+def _feedback_by_proposal(feedback_log):
+    """feedback_log grouped by target proposal, rebuilt only when entries are added."""
+
+    def render():
+        grouped = {}
+        for fb in feedback_log:
+            grouped.setdefault(fb.get("to"), []).append(fb)
+        return grouped
+
+    return _context_cache.fragment(
+        ("feedback_index", id(feedback_log), len(feedback_log)), render, feedback_log
+    )
+
+
+def _feedback_summary(proposal_feedback):
+    if not proposal_feedback:
+        return ("No feedback yet",)
+    # Last 3 feedback items
+    return tuple(f'Feedback - {fb["from"]}: "{fb["comment"]}"' for fb in proposal_feedback[-3:])
 
 
 def build_feedback_context(state, all_proposal_contents, current_tick, agent_pool=None):
@@ -34,45 +116,42 @@ def build_feedback_context(state, all_proposal_contents, current_tick, agent_poo
     proposals = state.current_issue.proposals
     feedback_log = state.current_issue.feedback_log
 
+    feedback_by_proposal = _feedback_by_proposal(feedback_log)
+
     for proposal in proposals:
         if not proposal.active:
             continue
 
-        # Add proposal header with agent traits
+        # Proposal header with agent traits and body, rendered once per revision
         author_traits = ""
         if agent_pool and proposal.author in agent_pool.agents:
-            agent = agent_pool.agents[proposal.author]
-            profile = agent.metadata["ocean_profile"]
-
-            # Get first letter of each trait with value
-            trait_parts = []
-            for trait_name, value in profile.items():
-                if isinstance(value, (int, float)):
-                    first_letter = trait_name[0].upper()
-                    trait_parts.append(f"{first_letter}{value:.2f}")
-
-            if trait_parts:
-                author_traits = f" [{' '.join(trait_parts)}]"
+            traits = _numeric_traits(agent_pool.agents[proposal.author].metadata["ocean_profile"])
+            if traits:
+                author_traits = _context_cache.fragment(
+                    ("trait_letters", traits),
+                    lambda: f" [{' '.join(f'{name[0].upper()}{value:.2f}' for name, value in traits)}]",
+                )
 
-        context_lines.append(
-            f"Proposal:{proposal.proposal_id}, Agent:{proposal.author} OCEAN:{author_traits}"
+        context_lines.extend(
+            _context_cache.fragment(
+                ("feedback_proposal", proposal.proposal_id, proposal.revision_number,
+                 proposal.author, author_traits, proposal.content),
+                lambda: (
+                    f"Proposal:{proposal.proposal_id}, Agent:{proposal.author} OCEAN:{author_traits}",
+                    f'"{proposal.content}"',
+                    "",
+                ),
+            )
         )
 
-        # Add full proposal content
-        context_lines.append(f'"{proposal.content}"')
-        context_lines.append("")
-
-        # Add feedback for this proposal
-        proposal_feedback = [
-            fb for fb in feedback_log if fb.get("to") == proposal.proposal_id
-        ]
-
-        if proposal_feedback:
-            for fb in proposal_feedback[-3:]:  # Last 3 feedback items
-                context_lines.append(f'Feedback - {fb["from"]}: "{fb["comment"]}"')
-        else:
-            context_lines.append("No feedback yet")
-
+        # Feedback summary, rendered once per feedback count
+        context_lines.extend(
+            _context_cache.fragment(
+                ("feedback_summary", proposal.proposal_id, id(feedback_log), len(feedback_log)),
+                lambda: _feedback_summary(feedback_by_proposal.get(proposal.proposal_id)),
+                feedback_log,
+            )
+        )
         context_lines.append("-----")
 
     return "\n".join(context_lines)
@@ -180,19 +259,19 @@ def build_base_context(agent, issue):
     
     Returns markdown with agent traits and issue problem statement.
     """
-    # Extract traits from agent metadata
-    profile = agent.metadata["ocean_profile"]
-    
-    context_lines = [f"# Agent: {agent.agent_id}", "", "## OCEAN Profile"]
-    
-    # Add traits in a clean markdown list format
-    for trait_name, value in profile.items():
-        if isinstance(value, (int, float)):
-            context_lines.append(f"- {trait_name}: {value:.2f}")
-    
-    context_lines.extend(["", f"## Issue {issue.issue_id}", issue.problem_statement])
-    
-    return "\n".join(context_lines)
+    traits = _numeric_traits(agent.metadata["ocean_profile"])
+
+    def render():
+        context_lines = [f"# Agent: {agent.agent_id}", "", "## OCEAN Profile"]
+        # Add traits in a clean markdown list format
+        context_lines.extend(f"- {name}: {value:.2f}" for name, value in traits)
+        context_lines.extend(["", f"## Issue {issue.issue_id}", issue.problem_statement])
+        return "\n".join(context_lines)
+
+    # Rendered once per agent and issue
+    return _context_cache.fragment(
+        ("base", agent.agent_id, traits, issue.issue_id, issue.problem_statement), render
+    )
 
 
 def build_context_propose(agent, issue):
@@ -250,10 +329,9 @@ def build_context_revise(agent, issue):
     # Find feedback received on agent's proposal
     feedback_received = []
     if hasattr(issue, 'feedback_log') and agent_proposal:
-        feedback_received = [
-            fb for fb in issue.feedback_log 
-            if fb.get("to") == agent_proposal.proposal_id
-        ]
+        feedback_received = _feedback_by_proposal(issue.feedback_log).get(
+            agent_proposal.proposal_id, []
+        )
     
     if feedback_received:
         context += "\n"
@@ -276,9 +354,6 @@ def build_context_stake(agent, issue, payload):
     max_ticks = payload.get("max_ticks", 15)  # Default fallback
     current_conviction = payload.get("current_conviction", {})
     
-    # Extract traits from agent metadata
-    profile = agent.metadata["ocean_profile"]
-    
     # Start building context with agent information
     context_lines = [
         "# 🧠 Agent Context",
@@ -292,13 +367,33 @@ def build_context_stake(agent, issue, payload):
     ]
     
     # Add traits table
-    for trait_name, value in profile.items():
-        if isinstance(value, (int, float)):
-            context_lines.append(f"| {trait_name:<13} | {value:<5.1f} |")
+    context_lines.extend(_trait_table(agent))
     
     return "\n".join(context_lines)
 
 
+def _stake_proposal_block(proposal, is_own):
+    """Stake preference lines for one proposal revision (rendered once per revision)."""
+
+    def render():
+        proposal_title = f"## Proposal {proposal.proposal_id}"
+        if is_own:
+            proposal_title += " (Your Proposal)"
+        return (
+            "",
+            proposal_title,
+            f"- **Author**: {proposal.author}",
+            "- **Content**:",
+            f"> {proposal.content}",
+        )
+
+    return _context_cache.fragment(
+        ("stake_proposal", proposal.proposal_id, proposal.revision_number,
+         proposal.author, is_own, proposal.content),
+        render,
+    )
+
+
 def build_context_stake_preferences(agent, issue, payload):
     """
     Build context for stake preferences (Phase 1) - simpler format with proposals.
@@ -311,9 +406,6 @@ def build_context_stake_preferences(agent, issue, payload):
     tick = payload["tick"]  # Will KeyError if missing  
     max_ticks = payload.get("max_ticks", 15)  # This one can have a default
     
-    # Extract traits from agent metadata
-    profile = agent.metadata["ocean_profile"]
-    
     # Start building context with agent information
     context_lines = [
         "# 🧠 Agent Context",
@@ -327,9 +419,7 @@ def build_context_stake_preferences(agent, issue, payload):
     ]
     
     # Add traits table
-    for trait_name, value in profile.items():
-        if isinstance(value, (int, float)):
-            context_lines.append(f"| {trait_name:<13} | {value:<5.1f} |")
+    context_lines.extend(_trait_table(agent))
     
     context_lines.extend([
         "",
@@ -351,17 +441,7 @@ def build_context_stake_preferences(agent, issue, payload):
         for proposal in active_proposals:
             # Check if this is the agent's own proposal
             is_own = proposal.author == agent.agent_id
-            proposal_title = f"## Proposal {proposal.proposal_id}"
-            if is_own:
-                proposal_title += " (Your Proposal)"
-            
-            context_lines.extend([
-                "",
-                proposal_title,
-                f"- **Author**: {proposal.author}",
-                "- **Content**:",
-                f"> {proposal.content}"
-            ])
+            context_lines.extend(_stake_proposal_block(proposal, is_own))
     else:
         context_lines.extend([
             "",
@@ -373,6 +453,60 @@ def build_context_stake_preferences(agent, issue, payload):
     return "\n".join(context_lines)
 
 
+def _ledger_row(stake, agent_display):
+    return f"| {stake['stake_tick']:<4} | {agent_display:<8} | {stake['proposal_id']:<11} | {stake['staked_cp']:<2} | {stake['age']:<11} | {stake['conviction_multiplier']:<10.2f} | {stake['total_cp']:<15.1f} |"
+
+
+def _ledger_rows(atomic_stakes):
+    """(stake, unmarked row) pairs for a tick's stake ledger, rendered once per tick."""
+    return _context_cache.fragment(
+        ("ledger", id(atomic_stakes), len(atomic_stakes)),
+        lambda: tuple((stake, _ledger_row(stake, stake["agent_id"])) for stake in atomic_stakes),
+        atomic_stakes,
+    )
+
+
+def _leaderboard_row(proposal_id, total_cp, effective_conviction, marker=""):
+    return f"| {proposal_id:<11}{marker:<6} | {total_cp:<16} | {effective_conviction:<27.1f} |"
+
+
+def _leaderboard_rows(active_proposals, atomic_stakes, proposal_convictions):
+    """Sorted (proposal_id, total_cp, effective, unmarked row) tuples, once per tick."""
+
+    def render():
+        leaderboard_data = []
+        for proposal in active_proposals:
+            proposal_id = proposal.proposal_id
+            total_cp = 0
+            effective_conviction = 0.0
+
+            if proposal_convictions is not None:
+                # Use the per-proposal totals maintained by the stake phase
+                totals = proposal_convictions.get(proposal_id)
+                if totals:
+                    total_cp = totals["total_raw_weight"]
+                    effective_conviction = totals["total_effective_weight"]
+            else:
+                # Calculate totals from atomic stakes
+                for stake in atomic_stakes:
+                    if stake["proposal_id"] == proposal_id:
+                        total_cp += stake["staked_cp"]
+                        effective_conviction += stake["total_cp"]
+
+            leaderboard_data.append((proposal_id, total_cp, effective_conviction))
+
+        # Sort by effective conviction value (descending)
+        leaderboard_data.sort(key=lambda x: x[2], reverse=True)
+        return tuple(
+            (proposal_id, total_cp, effective, _leaderboard_row(proposal_id, total_cp, effective))
+            for proposal_id, total_cp, effective in leaderboard_data
+        )
+
+    source = proposal_convictions if proposal_convictions is not None else atomic_stakes
+    active_ids = tuple(p.proposal_id for p in active_proposals)
+    return _context_cache.fragment(("leaderboard", id(source), active_ids), render, source)
+
+
 def build_context_stake_action(agent, issue, payload, stored_preferences):
     """
     Build context for stake action decisions (Phase 2) with preferences, ledger, and leaderboard.
@@ -381,9 +515,7 @@ def build_context_stake_action(agent, issue, payload, stored_preferences):
     tick = payload["tick"]
     max_ticks = payload.get("max_ticks", 15)  # This one can have a default
     atomic_stakes = payload.get("atomic_stakes", [])  # List of atomic stake records
-    
-    # Extract traits from agent metadata
-    profile = agent.metadata["ocean_profile"]
+    proposal_convictions = payload.get("proposal_convictions")  # proposal_id -> running totals
     
     # Start building context with agent information
     context_lines = [
@@ -398,9 +530,7 @@ def build_context_stake_action(agent, issue, payload, stored_preferences):
     ]
     
     # Add traits table
-    for trait_name, value in profile.items():
-        if isinstance(value, (int, float)):
-            context_lines.append(f"| {trait_name:<13} | {value:<5.1f} |")
+    context_lines.extend(_trait_table(agent))
     
     # Add declared preferences table
     context_lines.extend([
@@ -448,11 +578,11 @@ def build_context_stake_action(agent, issue, payload, stored_preferences):
     self_proposal_id = stored_preferences.get('self_proposal_id')
     has_stakes = len(atomic_stakes) > 0
     
-    for stake in atomic_stakes:
-        # Mark if this stake is by the current agent
-        agent_marker = " (you)" if stake["agent_id"] == agent.agent_id else ""
-        agent_display = f"{stake['agent_id']}{agent_marker}"
-        context_lines.append(f"| {stake['stake_tick']:<4} | {agent_display:<8} | {stake['proposal_id']:<11} | {stake['staked_cp']:<2} | {stake['age']:<11} | {stake['conviction_multiplier']:<10.2f} | {stake['total_cp']:<15.1f} |")
+    for stake, row in _ledger_rows(atomic_stakes):
+        if stake["agent_id"] == agent.agent_id:
+            # Mark stakes by the current agent
+            row = _ledger_row(stake, f"{stake['agent_id']} (you)")
+        context_lines.append(row)
     
     if not has_stakes:
         context_lines.append("| --   | --       | --          | -- | --          | --         | --              |")
@@ -473,31 +603,16 @@ def build_context_stake_action(agent, issue, payload, stored_preferences):
         "|-------------|------------------|-----------------------------|"
     ])
     
-    # Calculate totals and effective values for leaderboard
+    # Leaderboard rows, sorted by effective conviction value (descending)
     if hasattr(issue, 'proposals') and issue.proposals:
         active_proposals = [p for p in issue.proposals if getattr(p, "active", True)]
-        leaderboard_data = []
-        
-        for proposal in active_proposals:
-            proposal_id = proposal.proposal_id
-            total_cp = 0
-            effective_conviction = 0.0
-            
-            # Calculate totals from atomic stakes
-            proposal_stakes = [stake for stake in atomic_stakes if stake["proposal_id"] == proposal_id]
-            for stake in proposal_stakes:
-                total_cp += stake["staked_cp"]
-                effective_conviction += stake["total_cp"]
-            
-            leaderboard_data.append((proposal_id, total_cp, effective_conviction))
-        
-        # Sort by effective conviction value (descending)
-        leaderboard_data.sort(key=lambda x: x[2], reverse=True)
-        
-        for proposal_id, total_cp, effective_conviction in leaderboard_data:
-            # Mark if it's the agent's own proposal
-            marker = " (you)" if proposal_id == self_proposal_id else ""
-            context_lines.append(f"| {proposal_id:<11}{marker:<6} | {total_cp:<16} | {effective_conviction:<27.1f} |")
+        for proposal_id, total_cp, effective_conviction, row in _leaderboard_rows(
+            active_proposals, atomic_stakes, proposal_convictions
+        ):
+            if proposal_id == self_proposal_id:
+                # Mark the agent's own proposal
+                row = _leaderboard_row(proposal_id, total_cp, effective_conviction, " (you)")
+            context_lines.append(row)
     
     context_lines.extend([
         "",
@@ -6,7 +6,7 @@ from typing import Optional
 from creditmanager import CreditManager
 from text_delta import sentence_sequence_delta
 from models import (
-    ACTION_QUEUE,
+    ActionQueue,
     AgentPool,
     GlobalConfig,
     Issue,
@@ -17,7 +17,15 @@ from models import (
     UnifiedConfig,
 )
 from roundtable import Consensus
-from simlog import EventType, LogEntry, LogLevel, PhaseType, log_event, logger
+from simlog import (
+    EventType,
+    LogEntry,
+    LogLevel,
+    PhaseType,
+    event_enabled,
+    log_event,
+    logger,
+)
 
 
 class Controller:
@@ -28,6 +36,8 @@ class Controller:
         self.state: Optional[RoundtableState] = None
         self.creditmgr: Optional[CreditManager] = None
         self.current_consensus: Optional[Consensus] = None
+        # Actions submitted by this controller's agents (and engine routes)
+        self.action_queue = ActionQueue()
 
     def register_issue(self, issue: Issue):
         """Register an issue to be solved by the roundtable."""
@@ -78,6 +88,7 @@ class Controller:
             agent_readiness={aid: False for aid in self.config.agent_ids},
             agent_proposal_ids={aid: None for aid in self.config.agent_ids},
             current_issue=current_issue,
+            conviction_backend=self.config.conviction_backend,
         )
 
         # Assign agents to current issue
@@ -115,12 +126,22 @@ class Controller:
         consensus = self.current_consensus
 
         while not consensus._is_complete():
-            tick = self.state.tick
-            phase = (
-                self.state.current_phase if self.state.current_phase else PhaseType.INIT
-            )
-            # Log phase transitions BEFORE processing actions
-            if self.state.phase_tick == 1:
+            self.step()
+
+        return consensus._summarize_results()
+
+    def step(self):
+        """Advance one tick: apply queued actions, then tick the consensus.
+
+        Agents signalled during the tick submit to this controller's action
+        queue, so separate controllers can be stepped concurrently.
+        """
+        consensus = self.current_consensus
+        tick = self.state.tick
+        phase = self.state.current_phase if self.state.current_phase else PhaseType.INIT
+        # Log phase transitions BEFORE processing actions
+        if self.state.phase_tick == 1:
+            if event_enabled(EventType.PHASE_TRANSITION):
                 log_event(
                     LogEntry(
                         tick=tick,
@@ -133,8 +154,9 @@ class Controller:
                         message=f"Transitioned to new phase: {consensus.get_current_phase().phase_number}",
                     )
                 )
-                logger.debug(f"Phase Tick: {self.state.phase_tick}")
+            logger.debug(f"Phase Tick: {self.state.phase_tick}")
 
+        with self.action_queue.activate():
             self._process_pending_actions()
 
             # Update consensus state with current agent proposal mappings
@@ -143,19 +165,18 @@ class Controller:
                     self.state.current_issue.agent_to_proposal_id
                 )
 
-            log_event(
-                LogEntry(
-                    tick=tick,
-                    phase=PhaseType(phase),
-                    event_type=EventType.CONSENSUS_TICK,
-                    message="Ticking consensus...",
-                    level=LogLevel.DEBUG,
+            if event_enabled(EventType.CONSENSUS_TICK):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        phase=PhaseType(phase),
+                        event_type=EventType.CONSENSUS_TICK,
+                        message="Ticking consensus...",
+                        level=LogLevel.DEBUG,
+                    )
                 )
-            )
             consensus.tick()
 
-        return consensus._summarize_results()
-
     def _validate_basic_requirements(self, action, agent_id: str) -> tuple[bool, str]:
         """Validate basic requirements common to most actions."""
         tick = self.state.tick if self.state else 0
@@ -256,6 +277,10 @@ class Controller:
             "unstake": EventType.UNSTAKE_REJECTED,
         }
 
+        event_type = event_type_map.get(action_type, EventType.PROPOSAL_REJECTED)
+        if not event_enabled(event_type):
+            return
+
         payload = {"reason": reason}
         if extra_payload:
             payload.update(extra_payload)
@@ -264,7 +289,7 @@ class Controller:
             LogEntry(
                 tick=tick,
                 phase=PhaseType(phase) if phase else None,
-                event_type=event_type_map.get(action_type, EventType.PROPOSAL_REJECTED),
+                event_type=event_type,
                 agent_id=agent_id,
                 payload=payload,
                 message=f"Rejected {action_type} from {agent_id}: {reason}",
@@ -273,7 +298,7 @@ class Controller:
         )
 
     def _process_pending_actions(self):
-        for action in ACTION_QUEUE.drain():
+        for action in self.action_queue.drain():
             # Skip validation for signal_ready as it doesn't require issue validation
             if action.type == "signal_ready":
                 self.signal_ready(
@@ -311,71 +336,75 @@ class Controller:
         # Assign sequential proposal ID
         new_proposal_id = self.get_next_proposal_id()
 
-        log_event(
-            LogEntry(
-                tick=tick,
-                phase=PhaseType(phase),
-                event_type=EventType.PROPOSAL_RECEIVED,
-                agent_id=agent_id,
-                payload={
-                    "proposal_id": new_proposal_id,
-                    "issue_id": proposal.issue_id,
-                },
-                message=f"Received proposal from {agent_id}: #{new_proposal_id} for issue {proposal.issue_id}",
-            )
-        )
-
-        # Validation 3: Check if agent already submitted in current PROPOSE phase
-        if agent_id in self.state.proposals_this_phase:
+        if event_enabled(EventType.PROPOSAL_RECEIVED):
             log_event(
                 LogEntry(
                     tick=tick,
                     phase=PhaseType(phase),
-                    event_type=EventType.PROPOSAL_REJECTED,
+                    event_type=EventType.PROPOSAL_RECEIVED,
                     agent_id=agent_id,
                     payload={
-                        "reason": "already_submitted",
+                        "proposal_id": new_proposal_id,
+                        "issue_id": proposal.issue_id,
                     },
-                    message=f"Rejected proposal from {agent_id}: Already submitted in current PROPOSE phase",
-                    level=LogLevel.WARNING,
+                    message=f"Received proposal from {agent_id}: #{new_proposal_id} for issue {proposal.issue_id}",
                 )
             )
+
+        # Validation 3: Check if agent already submitted in current PROPOSE phase
+        if agent_id in self.state.proposals_this_phase:
+            if event_enabled(EventType.PROPOSAL_REJECTED):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        phase=PhaseType(phase),
+                        event_type=EventType.PROPOSAL_REJECTED,
+                        agent_id=agent_id,
+                        payload={
+                            "reason": "already_submitted",
+                        },
+                        message=f"Rejected proposal from {agent_id}: Already submitted in current PROPOSE phase",
+                        level=LogLevel.WARNING,
+                    )
+                )
             return
 
         # Validation 4: Check if proposal is for current issue
         if proposal.issue_id != self.state.current_issue.issue_id:
-            log_event(
-                LogEntry(
-                    tick=tick,
-                    phase=PhaseType(phase),
-                    event_type=EventType.PROPOSAL_REJECTED,
-                    agent_id=agent_id,
-                    payload={
-                        "reason": "wrong_issue_id",
-                        "received_issue_id": proposal.issue_id,
-                        "expected_issue_id": issue_id,
-                    },
-                    message=f"Rejected proposal from {agent_id}: Wrong issue ID (got {proposal.issue_id}, expected {issue_id})",
-                    level=LogLevel.WARNING,
+            if event_enabled(EventType.PROPOSAL_REJECTED):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        phase=PhaseType(phase),
+                        event_type=EventType.PROPOSAL_REJECTED,
+                        agent_id=agent_id,
+                        payload={
+                            "reason": "wrong_issue_id",
+                            "received_issue_id": proposal.issue_id,
+                            "expected_issue_id": issue_id,
+                        },
+                        message=f"Rejected proposal from {agent_id}: Wrong issue ID (got {proposal.issue_id}, expected {issue_id})",
+                        level=LogLevel.WARNING,
+                    )
                 )
-            )
             return
 
         # check the agent has enough CP to stake
         if not self.creditmgr.get_balance(agent_id) >= self.config.proposal_self_stake:
-            log_event(
-                LogEntry(
-                    tick=tick,
-                    phase=PhaseType(phase),
-                    event_type=EventType.PROPOSAL_REJECTED,
-                    agent_id=agent_id,
-                    payload={
-                        "reason": "insufficient_cp_for_stake",
-                    },
-                    message=f"Rejected proposal from {agent_id}: Not enough CP to stake",
-                    level=LogLevel.WARNING,
+            if event_enabled(EventType.PROPOSAL_REJECTED):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        phase=PhaseType(phase),
+                        event_type=EventType.PROPOSAL_REJECTED,
+                        agent_id=agent_id,
+                        payload={
+                            "reason": "insufficient_cp_for_stake",
+                        },
+                        message=f"Rejected proposal from {agent_id}: Not enough CP to stake",
+                        level=LogLevel.WARNING,
+                    )
                 )
-            )
             return
 
         # If all validations pass, proceed with proposal acceptance
@@ -406,19 +435,20 @@ class Controller:
         self.signal_ready(agent_id, payload={"reason": "proposal_accepted"})
         self.state.proposals_this_phase.add(agent_id)
 
-        log_event(
-            LogEntry(
-                tick=tick,
-                phase=PhaseType(phase),
-                event_type=EventType.PROPOSAL_ACCEPTED,
-                agent_id=agent_id,
-                payload={
-                    "proposal_id": proposal.proposal_id,
-                    "issue_id": issue_id,
-                },
-                message=f"Proposal accepted from {agent_id}: #{proposal.proposal_id} for issue {issue_id} at tick {tick}",
+        if event_enabled(EventType.PROPOSAL_ACCEPTED):
+            log_event(
+                LogEntry(
+                    tick=tick,
+                    phase=PhaseType(phase),
+                    event_type=EventType.PROPOSAL_ACCEPTED,
+                    agent_id=agent_id,
+                    payload={
+                        "proposal_id": proposal.proposal_id,
+                        "issue_id": issue_id,
+                    },
+                    message=f"Proposal accepted from {agent_id}: #{proposal.proposal_id} for issue {issue_id} at tick {tick}",
+                )
             )
-        )
 
     def create_no_action_proposal(
         self, tick: int, agent_id: str, issue_id: str
@@ -439,16 +469,17 @@ class Controller:
 
     def signal_ready(self, agent_id: str, payload: Optional[dict] = None):
         """Process agent ready signal for phase completion."""
-        log_event(
-            LogEntry(
-                tick=(self.state.tick if self.current_consensus else 0),
-                phase=(self.state.current_phase if self.current_consensus else None),
-                event_type=EventType.AGENT_READY,
-                agent_id=agent_id,
-                payload=payload or {},
-                message=f"Agent {agent_id} marked as Ready",
+        if event_enabled(EventType.AGENT_READY):
+            log_event(
+                LogEntry(
+                    tick=(self.state.tick if self.current_consensus else 0),
+                    phase=(self.state.current_phase if self.current_consensus else None),
+                    event_type=EventType.AGENT_READY,
+                    agent_id=agent_id,
+                    payload=payload or {},
+                    message=f"Agent {agent_id} marked as Ready",
+                )
             )
-        )
         self.current_consensus.set_agent_ready(agent_id)
 
     def receive_feedback(self, agent_id: str, payload: dict):
@@ -478,20 +509,21 @@ class Controller:
 
         # Check agent has enough CP to stake
         if not self.creditmgr.get_balance(agent_id) >= self.config.feedback_stake:
-            log_event(
-                LogEntry(
-                    tick=tick,
-                    phase=PhaseType(phase),
-                    event_type=EventType.FEEDBACK_REJECTED,
-                    agent_id=agent_id,
-                    payload={
-                        "reason": "insufficient_cp_for_stake",
-                        "target_proposal_id": target_pid,
-                    },
-                    message=f"Rejected feedback from {agent_id}: Not enough CP to stake",
-                    level=LogLevel.WARNING,
+            if event_enabled(EventType.FEEDBACK_REJECTED):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        phase=PhaseType(phase),
+                        event_type=EventType.FEEDBACK_REJECTED,
+                        agent_id=agent_id,
+                        payload={
+                            "reason": "insufficient_cp_for_stake",
+                            "target_proposal_id": target_pid,
+                        },
+                        message=f"Rejected feedback from {agent_id}: Not enough CP to stake",
+                        level=LogLevel.WARNING,
+                    )
                 )
-            )
             return
 
         # Deduct stake
@@ -522,56 +554,59 @@ class Controller:
             else None
         )
 
-        log_event(
-            LogEntry(
-                tick=tick,
-                phase=(self.state.current_phase if self.current_consensus else None),
-                event_type=EventType.REVISION_RECEIVED,
-                agent_id=agent_id,
-                payload={
-                    "proposal_id": proposal_id,
-                    "issue_id": issue_id,
-                },
-                message=f"Received revision from {agent_id}: #{proposal_id}",
-            )
-        )
-
-        # Validation 1: Check if agent has a proposal to revise
-        if not proposal_id:
+        if event_enabled(EventType.REVISION_RECEIVED):
             log_event(
                 LogEntry(
                     tick=tick,
-                    phase=(
-                        self.state.current_phase if self.current_consensus else None
-                    ),
-                    event_type=EventType.REVISION_REJECTED,
+                    phase=(self.state.current_phase if self.current_consensus else None),
+                    event_type=EventType.REVISION_RECEIVED,
                     agent_id=agent_id,
                     payload={
-                        "reason": "no_proposal_to_revise",
+                        "proposal_id": proposal_id,
+                        "issue_id": issue_id,
                     },
-                    message=f"Rejected revision from {agent_id}: Agent has no proposal to revise",
-                    level=LogLevel.WARNING,
+                    message=f"Received revision from {agent_id}: #{proposal_id}",
                 )
             )
+
+        # Validation 1: Check if agent has a proposal to revise
+        if not proposal_id:
+            if event_enabled(EventType.REVISION_REJECTED):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        phase=(
+                            self.state.current_phase if self.current_consensus else None
+                        ),
+                        event_type=EventType.REVISION_REJECTED,
+                        agent_id=agent_id,
+                        payload={
+                            "reason": "no_proposal_to_revise",
+                        },
+                        message=f"Rejected revision from {agent_id}: Agent has no proposal to revise",
+                        level=LogLevel.WARNING,
+                    )
+                )
             return
 
         # Validation 3: Check new content is present
         if not new_content:
-            log_event(
-                LogEntry(
-                    tick=tick,
-                    phase=(
-                        self.state.current_phase if self.current_consensus else None
-                    ),
-                    event_type=EventType.REVISION_REJECTED,
-                    agent_id=agent_id,
-                    payload={
-                        "reason": "invalid_revision_data",
-                    },
-                    message=f"Rejected revision from {agent_id}: Invalid revision data",
-                    level=LogLevel.WARNING,
+            if event_enabled(EventType.REVISION_REJECTED):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        phase=(
+                            self.state.current_phase if self.current_consensus else None
+                        ),
+                        event_type=EventType.REVISION_REJECTED,
+                        agent_id=agent_id,
+                        payload={
+                            "reason": "invalid_revision_data",
+                        },
+                        message=f"Rejected revision from {agent_id}: Invalid revision data",
+                        level=LogLevel.WARNING,
+                    )
                 )
-            )
             return
 
         # Find the current active proposal to revise
@@ -582,43 +617,45 @@ class Controller:
                 break
 
         if not old_proposal:
-            log_event(
-                LogEntry(
-                    tick=tick,
-                    phase=(
-                        self.state.current_phase if self.current_consensus else None
-                    ),
-                    event_type=EventType.REVISION_REJECTED,
-                    agent_id=agent_id,
-                    payload={
-                        "reason": "active_proposal_not_found",
-                    },
-                    message=f"Rejected revision from {agent_id}: Active proposal #{proposal_id} not found",
-                    level=LogLevel.WARNING,
+            if event_enabled(EventType.REVISION_REJECTED):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        phase=(
+                            self.state.current_phase if self.current_consensus else None
+                        ),
+                        event_type=EventType.REVISION_REJECTED,
+                        agent_id=agent_id,
+                        payload={
+                            "reason": "active_proposal_not_found",
+                        },
+                        message=f"Rejected revision from {agent_id}: Active proposal #{proposal_id} not found",
+                        level=LogLevel.WARNING,
+                    )
                 )
-            )
             return
 
         # Validation: Check if agent is the author of the proposal
         if old_proposal.author != agent_id:
-            log_event(
-                LogEntry(
-                    tick=tick,
-                    phase=(
-                        self.state.current_phase if self.current_consensus else None
-                    ),
-                    event_type=EventType.REVISION_REJECTED,
-                    agent_id=agent_id,
-                    payload={
-                        "reason": "not_proposal_author",
-                        "proposal_id": proposal_id,
-                        "actual_author": old_proposal.author,
-                        "author_type": old_proposal.author_type,
-                    },
-                    message=f"Rejected revision from {agent_id}: Not author of proposal #{proposal_id} (author: {old_proposal.author}, type: {old_proposal.author_type})",
-                    level=LogLevel.WARNING,
+            if event_enabled(EventType.REVISION_REJECTED):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        phase=(
+                            self.state.current_phase if self.current_consensus else None
+                        ),
+                        event_type=EventType.REVISION_REJECTED,
+                        agent_id=agent_id,
+                        payload={
+                            "reason": "not_proposal_author",
+                            "proposal_id": proposal_id,
+                            "actual_author": old_proposal.author,
+                            "author_type": old_proposal.author_type,
+                        },
+                        message=f"Rejected revision from {agent_id}: Not author of proposal #{proposal_id} (author: {old_proposal.author}, type: {old_proposal.author_type})",
+                        level=LogLevel.WARNING,
+                    )
                 )
-            )
             return
 
         # Calculate official delta using text comparison
@@ -627,22 +664,23 @@ class Controller:
 
         # Validate delta is in acceptable range
         if official_delta < 0.1 or official_delta > 1.0:
-            log_event(
-                LogEntry(
-                    tick=tick,
-                    phase=(
-                        self.state.current_phase if self.current_consensus else None
-                    ),
-                    event_type=EventType.REVISION_REJECTED,
-                    agent_id=agent_id,
-                    payload={
-                        "reason": "invalid_calculated_delta",
-                        "calculated_delta": official_delta,
-                    },
-                    message=f"Rejected revision from {agent_id}: Calculated delta {official_delta:.3f} outside valid range [0.1, 1.0]",
-                    level=LogLevel.WARNING,
+            if event_enabled(EventType.REVISION_REJECTED):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        phase=(
+                            self.state.current_phase if self.current_consensus else None
+                        ),
+                        event_type=EventType.REVISION_REJECTED,
+                        agent_id=agent_id,
+                        payload={
+                            "reason": "invalid_calculated_delta",
+                            "calculated_delta": official_delta,
+                        },
+                        message=f"Rejected revision from {agent_id}: Calculated delta {official_delta:.3f} outside valid range [0.1, 1.0]",
+                        level=LogLevel.WARNING,
+                    )
                 )
-            )
             return
 
         # Calculate CP cost: cost = proposal_self_stake * official_delta
@@ -658,22 +696,23 @@ class Controller:
         )
 
         if not deduct_success:
-            log_event(
-                LogEntry(
-                    tick=tick,
-                    phase=(
-                        self.state.current_phase if self.current_consensus else None
-                    ),
-                    event_type=EventType.REVISION_REJECTED,
-                    agent_id=agent_id,
-                    payload={
-                        "reason": "insufficient_cp",
-                        "cost": cost,
-                    },
-                    message=f"Rejected revision from {agent_id}: Insufficient CP for cost {cost}",
-                    level=LogLevel.WARNING,
+            if event_enabled(EventType.REVISION_REJECTED):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        phase=(
+                            self.state.current_phase if self.current_consensus else None
+                        ),
+                        event_type=EventType.REVISION_REJECTED,
+                        agent_id=agent_id,
+                        payload={
+                            "reason": "insufficient_cp",
+                            "cost": cost,
+                        },
+                        message=f"Rejected revision from {agent_id}: Insufficient CP for cost {cost}",
+                        level=LogLevel.WARNING,
+                    )
                 )
-            )
             return
 
         # Get next proposal ID for the revision
@@ -721,23 +760,24 @@ class Controller:
         )
 
         if not stake_transferred:
-            log_event(
-                LogEntry(
-                    tick=tick,
-                    phase=(
-                        self.state.current_phase if self.current_consensus else None
-                    ),
-                    event_type=EventType.REVISION_WARNING,
-                    agent_id=agent_id,
-                    payload={
-                        "reason": "no_stake_to_transfer",
-                        "proposal_id": proposal_id,
-                        "new_proposal_id": new_proposal_id,
-                    },
-                    message=f"No stake found to transfer from #{proposal_id} to #{new_proposal_id}",
-                    level=LogLevel.WARNING,
+            if event_enabled(EventType.REVISION_WARNING):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        phase=(
+                            self.state.current_phase if self.current_consensus else None
+                        ),
+                        event_type=EventType.REVISION_WARNING,
+                        agent_id=agent_id,
+                        payload={
+                            "reason": "no_stake_to_transfer",
+                            "proposal_id": proposal_id,
+                            "new_proposal_id": new_proposal_id,
+                        },
+                        message=f"No stake found to transfer from #{proposal_id} to #{new_proposal_id}",
+                        level=LogLevel.WARNING,
+                    )
                 )
-            )
 
         # Log a Revision event to the ledger with version lineage
         revision_event = {
@@ -758,23 +798,24 @@ class Controller:
         # Mark agent as ready
         self.signal_ready(agent_id, payload={"reason": "revision_accepted"})
 
-        log_event(
-            LogEntry(
-                tick=tick,
-                phase=(self.state.current_phase if self.current_consensus else None),
-                event_type=EventType.REVISION_ACCEPTED,
-                agent_id=agent_id,
-                payload={
-                    "parent_id": proposal_id,
-                    "new_proposal_id": new_proposal_id,
-                    "delta": official_delta,
-                    "cost": cost,
-                    "revision_number": new_revision_number,
-                    "issue_id": issue_id,
-                },
-                message=f"Revision accepted from {agent_id}: #{proposal_id} → #{new_proposal_id} (Δ={official_delta:.3f}, cost={cost}CP, rev{new_revision_number})",
+        if event_enabled(EventType.REVISION_ACCEPTED):
+            log_event(
+                LogEntry(
+                    tick=tick,
+                    phase=(self.state.current_phase if self.current_consensus else None),
+                    event_type=EventType.REVISION_ACCEPTED,
+                    agent_id=agent_id,
+                    payload={
+                        "parent_id": proposal_id,
+                        "new_proposal_id": new_proposal_id,
+                        "delta": official_delta,
+                        "cost": cost,
+                        "revision_number": new_revision_number,
+                        "issue_id": issue_id,
+                    },
+                    message=f"Revision accepted from {agent_id}: #{proposal_id} → #{new_proposal_id} (Δ={official_delta:.3f}, cost={cost}CP, rev{new_revision_number})",
+                )
             )
-        )
 
     def receive_stake(self, agent_id: str, payload: dict):
         """Process a stake action from an agent - deduct CP and record stake with conviction tracking."""
@@ -787,40 +828,42 @@ class Controller:
 
         # Validation: Check stake amount is valid
         if not stake_amount or stake_amount <= 0:
+            if event_enabled(EventType.STAKE_REJECTED):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        phase=(
+                            self.state.current_phase if self.current_consensus else None
+                        ),
+                        event_type=EventType.STAKE_REJECTED,
+                        agent_id=agent_id,
+                        payload={
+                            "reason": "invalid_stake_amount",
+                            "stake_amount": stake_amount,
+                            "proposal_id": proposal_id,
+                        },
+                        message=f"Rejected stake from {agent_id}: Invalid stake amount {stake_amount}",
+                        level=LogLevel.WARNING,
+                    )
+                )
+            return
+
+        if event_enabled(EventType.STAKE_RECEIVED):
             log_event(
                 LogEntry(
                     tick=tick,
-                    phase=(
-                        self.state.current_phase if self.current_consensus else None
-                    ),
-                    event_type=EventType.STAKE_REJECTED,
+                    phase=(self.state.current_phase if self.current_consensus else None),
+                    event_type=EventType.STAKE_RECEIVED,
                     agent_id=agent_id,
                     payload={
-                        "reason": "invalid_stake_amount",
-                        "stake_amount": stake_amount,
                         "proposal_id": proposal_id,
+                        "stake_amount": stake_amount,
+                        "round_number": round_number,
+                        "issue_id": issue_id,
                     },
-                    message=f"Rejected stake from {agent_id}: Invalid stake amount {stake_amount}",
-                    level=LogLevel.WARNING,
+                    message=f"Received stake from {agent_id}: {stake_amount} CP → {proposal_id} (Round {round_number})",
                 )
             )
-            return
-
-        log_event(
-            LogEntry(
-                tick=tick,
-                phase=(self.state.current_phase if self.current_consensus else None),
-                event_type=EventType.STAKE_RECEIVED,
-                agent_id=agent_id,
-                payload={
-                    "proposal_id": proposal_id,
-                    "stake_amount": stake_amount,
-                    "round_number": round_number,
-                    "issue_id": issue_id,
-                },
-                message=f"Received stake from {agent_id}: {stake_amount} CP → {proposal_id} (Round {round_number})",
-            )
-        )
 
         # Validation 5: Check if agent is self-staking on their latest proposal
         agent_current_proposal = self.state.current_issue.agent_to_proposal_id.get(
@@ -833,23 +876,24 @@ class Controller:
             and selected_agent
             and selected_agent.latest_proposal_id != proposal_id
         ):
-            log_event(
-                LogEntry(
-                    tick=tick,
-                    phase=(
-                        self.state.current_phase if self.current_consensus else None
-                    ),
-                    event_type=EventType.STAKE_REJECTED,
-                    agent_id=agent_id,
-                    payload={
-                        "reason": "not_latest_proposal",
-                        "proposal_id": proposal_id,
-                        "latest_proposal_id": selected_agent.latest_proposal_id,
-                    },
-                    message=f"Rejected stake from {agent_id}: Can only self-stake on latest proposal (staking on #{proposal_id}, latest is #{selected_agent.latest_proposal_id})",
-                    level=LogLevel.WARNING,
+            if event_enabled(EventType.STAKE_REJECTED):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        phase=(
+                            self.state.current_phase if self.current_consensus else None
+                        ),
+                        event_type=EventType.STAKE_REJECTED,
+                        agent_id=agent_id,
+                        payload={
+                            "reason": "not_latest_proposal",
+                            "proposal_id": proposal_id,
+                            "latest_proposal_id": selected_agent.latest_proposal_id,
+                        },
+                        message=f"Rejected stake from {agent_id}: Can only self-stake on latest proposal (staking on #{proposal_id}, latest is #{selected_agent.latest_proposal_id})",
+                        level=LogLevel.WARNING,
+                    )
                 )
-            )
             return
 
         # Attempt to stake CP (not burn - recoverable until finalize)
@@ -872,7 +916,7 @@ class Controller:
                 issue_id=issue_id,
                 mandatory=False,  # Voluntary stakes are not mandatory
             )
-            self.state.stake_ledger.append(stake_record)
+            self.state.add_stake(stake_record)
 
             # Get conviction parameters from current consensus
             conviction_params = {}
@@ -892,56 +936,58 @@ class Controller:
             )
 
             # Emit comprehensive stake_recorded event with conviction details
-            log_event(
-                LogEntry(
-                    tick=tick,
-                    phase=(
-                        self.state.current_phase if self.current_consensus else None
-                    ),
-                    event_type=EventType.STAKE_RECORDED,
-                    agent_id=agent_id,
-                    payload={
-                        "proposal_id": proposal_id,
-                        "stake_amount": stake_amount,
-                        "round_number": round_number,
-                        "choice_reason": choice_reason,
-                        "conviction_multiplier": conviction_details["multiplier"],
-                        "effective_weight": conviction_details["effective_weight"],
-                        "total_conviction": conviction_details["total_conviction"],
-                        "consecutive_rounds": conviction_details["consecutive_rounds"],
-                        "switched_from": conviction_details["switched_from"],
-                        "issue_id": issue_id,
-                    },
-                    message=(
-                        f"Voluntary stake recorded: {agent_id} staked {stake_amount} CP on {proposal_id} "
-                        f"(Round {round_number}, {choice_reason}, recoverable until finalize) - Effective weight: "
-                        f"{conviction_details['effective_weight']} (×{conviction_details['multiplier']})"
-                    ),
+            if event_enabled(EventType.STAKE_RECORDED):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        phase=(
+                            self.state.current_phase if self.current_consensus else None
+                        ),
+                        event_type=EventType.STAKE_RECORDED,
+                        agent_id=agent_id,
+                        payload={
+                            "proposal_id": proposal_id,
+                            "stake_amount": stake_amount,
+                            "round_number": round_number,
+                            "choice_reason": choice_reason,
+                            "conviction_multiplier": conviction_details["multiplier"],
+                            "effective_weight": conviction_details["effective_weight"],
+                            "total_conviction": conviction_details["total_conviction"],
+                            "consecutive_rounds": conviction_details["consecutive_rounds"],
+                            "switched_from": conviction_details["switched_from"],
+                            "issue_id": issue_id,
+                        },
+                        message=(
+                            f"Voluntary stake recorded: {agent_id} staked {stake_amount} CP on {proposal_id} "
+                            f"(Round {round_number}, {choice_reason}, recoverable until finalize) - Effective weight: "
+                            f"{conviction_details['effective_weight']} (×{conviction_details['multiplier']})"
+                        ),
+                    )
                 )
-            )
 
         else:
             # Emit insufficient_credit event (already handled by attempt_deduct)
-            log_event(
-                LogEntry(
-                    tick=tick,
-                    phase=(
-                        self.state.current_phase if self.current_consensus else None
-                    ),
-                    event_type=EventType.STAKE_REJECTED,
-                    agent_id=agent_id,
-                    payload={
-                        "reason": "insufficient_credit",
-                        "stake_amount": stake_amount,
-                        "current_balance": self.creditmgr.get_balance(agent_id),
-                    },
-                    message=(
-                        f"Rejected stake from {agent_id}: Insufficient CP "
-                        f"(has {self.creditmgr.get_balance(agent_id)}, needs {stake_amount})"
-                    ),
-                    level=LogLevel.WARNING,
+            if event_enabled(EventType.STAKE_REJECTED):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        phase=(
+                            self.state.current_phase if self.current_consensus else None
+                        ),
+                        event_type=EventType.STAKE_REJECTED,
+                        agent_id=agent_id,
+                        payload={
+                            "reason": "insufficient_credit",
+                            "stake_amount": stake_amount,
+                            "current_balance": self.creditmgr.get_balance(agent_id),
+                        },
+                        message=(
+                            f"Rejected stake from {agent_id}: Insufficient CP "
+                            f"(has {self.creditmgr.get_balance(agent_id)}, needs {stake_amount})"
+                        ),
+                        level=LogLevel.WARNING,
+                    )
                 )
-            )
 
         # Mark agent as ready (regardless of success/failure)
         self.signal_ready(agent_id, payload={"reason": "stake_received"})
@@ -955,81 +1001,89 @@ class Controller:
         issue_id = payload.get("issue_id")
         reason = payload.get("reason", "strategic_switch")
 
-        log_event(
-            LogEntry(
-                tick=tick,
-                phase=(self.state.current_phase if self.current_consensus else None),
-                event_type=EventType.SWITCH_RECEIVED,
-                agent_id=agent_id,
-                payload={
-                    "source_proposal_id": source_proposal_id,
-                    "target_proposal_id": target_proposal_id,
-                    "cp_amount": cp_amount,
-                    "issue_id": issue_id,
-                    "reason": reason,
-                },
-                message=f"Received switch from {agent_id}: {cp_amount} CP from #{source_proposal_id} → #{target_proposal_id} ({reason})",
-            )
-        )
-
-        # Validation 4: Check proposal IDs are provided and different
-        if not source_proposal_id or not target_proposal_id:
+        if event_enabled(EventType.SWITCH_RECEIVED):
             log_event(
                 LogEntry(
                     tick=tick,
-                    phase=(
-                        self.state.current_phase if self.current_consensus else None
-                    ),
-                    event_type=EventType.SWITCH_REJECTED,
+                    phase=(self.state.current_phase if self.current_consensus else None),
+                    event_type=EventType.SWITCH_RECEIVED,
                     agent_id=agent_id,
                     payload={
-                        "reason": "missing_proposal_ids",
+                        "source_proposal_id": source_proposal_id,
+                        "target_proposal_id": target_proposal_id,
+                        "cp_amount": cp_amount,
+                        "issue_id": issue_id,
+                        "reason": reason,
                     },
-                    message=f"Rejected switch from {agent_id}: Missing proposal IDs",
-                    level=LogLevel.WARNING,
+                    message=f"Received switch from {agent_id}: {cp_amount} CP from #{source_proposal_id} → #{target_proposal_id} ({reason})",
                 )
             )
+
+        # Validation 4: Check proposal IDs are provided and different
+        if not source_proposal_id or not target_proposal_id:
+            if event_enabled(EventType.SWITCH_REJECTED):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        phase=(
+                            self.state.current_phase if self.current_consensus else None
+                        ),
+                        event_type=EventType.SWITCH_REJECTED,
+                        agent_id=agent_id,
+                        payload={
+                            "reason": "missing_proposal_ids",
+                        },
+                        message=f"Rejected switch from {agent_id}: Missing proposal IDs",
+                        level=LogLevel.WARNING,
+                    )
+                )
             return
 
         if source_proposal_id == target_proposal_id:
-            log_event(
-                LogEntry(
-                    tick=tick,
-                    phase=(
-                        self.state.current_phase if self.current_consensus else None
-                    ),
-                    event_type=EventType.SWITCH_REJECTED,
-                    agent_id=agent_id,
-                    payload={
-                        "reason": "same_proposal",
-                    },
-                    message=f"Rejected switch from {agent_id}: Source and target proposals are the same",
-                    level=LogLevel.WARNING,
+            if event_enabled(EventType.SWITCH_REJECTED):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        phase=(
+                            self.state.current_phase if self.current_consensus else None
+                        ),
+                        event_type=EventType.SWITCH_REJECTED,
+                        agent_id=agent_id,
+                        payload={
+                            "reason": "same_proposal",
+                        },
+                        message=f"Rejected switch from {agent_id}: Source and target proposals are the same",
+                        level=LogLevel.WARNING,
+                    )
                 )
-            )
             return
 
         # Validation 5: Check agent has sufficient conviction on source proposal
+        conviction_params = {}
+        if self.current_consensus:
+            conviction_params = self.config.conviction_params.copy()
+            conviction_params["TargetRounds"] = self.config.stake_phase_ticks
         if not self.creditmgr.has_sufficient_conviction(
-            agent_id, source_proposal_id, cp_amount
+            agent_id, source_proposal_id, cp_amount, tick, conviction_params
         ):
-            log_event(
-                LogEntry(
-                    tick=tick,
-                    phase=(
-                        self.state.current_phase if self.current_consensus else None
-                    ),
-                    event_type=EventType.SWITCH_REJECTED,
-                    agent_id=agent_id,
-                    payload={
-                        "reason": "insufficient_conviction",
-                        "source_proposal_id": source_proposal_id,
-                        "requested_amount": cp_amount,
-                    },
-                    message=f"Rejected switch from {agent_id}: Insufficient conviction on #{source_proposal_id}",
-                    level=LogLevel.WARNING,
+            if event_enabled(EventType.SWITCH_REJECTED):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        phase=(
+                            self.state.current_phase if self.current_consensus else None
+                        ),
+                        event_type=EventType.SWITCH_REJECTED,
+                        agent_id=agent_id,
+                        payload={
+                            "reason": "insufficient_conviction",
+                            "source_proposal_id": source_proposal_id,
+                            "requested_amount": cp_amount,
+                        },
+                        message=f"Rejected switch from {agent_id}: Insufficient conviction on #{source_proposal_id}",
+                        level=LogLevel.WARNING,
+                    )
                 )
-            )
             return
 
         # Execute the switch via CreditManager
@@ -1044,43 +1098,45 @@ class Controller:
         )
 
         if switch_success:
-            log_event(
-                LogEntry(
-                    tick=tick,
-                    phase=(
-                        self.state.current_phase if self.current_consensus else None
-                    ),
-                    event_type=EventType.SWITCH_RECORDED,
-                    agent_id=agent_id,
-                    payload={
-                        "source_proposal_id": source_proposal_id,
-                        "target_proposal_id": target_proposal_id,
-                        "cp_amount": cp_amount,
-                        "reason": reason,
-                        "issue_id": issue_id,
-                    },
-                    message=f"Switch recorded: {agent_id} moved {cp_amount} CP from #{source_proposal_id} → #{target_proposal_id} ({reason})",
+            if event_enabled(EventType.SWITCH_RECORDED):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        phase=(
+                            self.state.current_phase if self.current_consensus else None
+                        ),
+                        event_type=EventType.SWITCH_RECORDED,
+                        agent_id=agent_id,
+                        payload={
+                            "source_proposal_id": source_proposal_id,
+                            "target_proposal_id": target_proposal_id,
+                            "cp_amount": cp_amount,
+                            "reason": reason,
+                            "issue_id": issue_id,
+                        },
+                        message=f"Switch recorded: {agent_id} moved {cp_amount} CP from #{source_proposal_id} → #{target_proposal_id} ({reason})",
+                    )
                 )
-            )
         else:
-            log_event(
-                LogEntry(
-                    tick=tick,
-                    phase=(
-                        self.state.current_phase if self.current_consensus else None
-                    ),
-                    event_type=EventType.SWITCH_REJECTED,
-                    agent_id=agent_id,
-                    payload={
-                        "reason": "switch_failed",
-                        "source_proposal_id": source_proposal_id,
-                        "target_proposal_id": target_proposal_id,
-                        "cp_amount": cp_amount,
-                    },
-                    message=f"Rejected switch from {agent_id}: Switch operation failed",
-                    level=LogLevel.WARNING,
+            if event_enabled(EventType.SWITCH_REJECTED):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        phase=(
+                            self.state.current_phase if self.current_consensus else None
+                        ),
+                        event_type=EventType.SWITCH_REJECTED,
+                        agent_id=agent_id,
+                        payload={
+                            "reason": "switch_failed",
+                            "source_proposal_id": source_proposal_id,
+                            "target_proposal_id": target_proposal_id,
+                            "cp_amount": cp_amount,
+                        },
+                        message=f"Rejected switch from {agent_id}: Switch operation failed",
+                        level=LogLevel.WARNING,
+                    )
                 )
-            )
 
         # Mark agent as ready (regardless of success/failure)
         self.signal_ready(agent_id, payload={"reason": "switch_processed"})
@@ -1093,21 +1149,22 @@ class Controller:
         issue_id = payload.get("issue_id")
         reason = payload.get("reason", "unstake")
 
-        log_event(
-            LogEntry(
-                tick=tick,
-                phase=(self.state.current_phase if self.current_consensus else None),
-                event_type=EventType.UNSTAKE_RECEIVED,
-                agent_id=agent_id,
-                payload={
-                    "proposal_id": proposal_id,
-                    "cp_amount": cp_amount,
-                    "issue_id": issue_id,
-                    "reason": reason,
-                },
-                message=f"Received unstake from {agent_id}: {cp_amount} CP from #{proposal_id} ({reason})",
+        if event_enabled(EventType.UNSTAKE_RECEIVED):
+            log_event(
+                LogEntry(
+                    tick=tick,
+                    phase=(self.state.current_phase if self.current_consensus else None),
+                    event_type=EventType.UNSTAKE_RECEIVED,
+                    agent_id=agent_id,
+                    payload={
+                        "proposal_id": proposal_id,
+                        "cp_amount": cp_amount,
+                        "issue_id": issue_id,
+                        "reason": reason,
+                    },
+                    message=f"Received unstake from {agent_id}: {cp_amount} CP from #{proposal_id} ({reason})",
+                )
             )
-        )
 
         # Execute the unstake via CreditManager
         unstake_success = self.creditmgr.unstake_from_proposal(
@@ -1120,41 +1177,43 @@ class Controller:
         )
 
         if unstake_success:
-            log_event(
-                LogEntry(
-                    tick=tick,
-                    phase=(
-                        self.state.current_phase if self.current_consensus else None
-                    ),
-                    event_type=EventType.UNSTAKE_RECORDED,
-                    agent_id=agent_id,
-                    payload={
-                        "proposal_id": proposal_id,
-                        "cp_amount": cp_amount,
-                        "reason": reason,
-                        "issue_id": issue_id,
-                    },
-                    message=f"Unstake recorded: {agent_id} withdrew {cp_amount} CP from #{proposal_id} ({reason})",
+            if event_enabled(EventType.UNSTAKE_RECORDED):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        phase=(
+                            self.state.current_phase if self.current_consensus else None
+                        ),
+                        event_type=EventType.UNSTAKE_RECORDED,
+                        agent_id=agent_id,
+                        payload={
+                            "proposal_id": proposal_id,
+                            "cp_amount": cp_amount,
+                            "reason": reason,
+                            "issue_id": issue_id,
+                        },
+                        message=f"Unstake recorded: {agent_id} withdrew {cp_amount} CP from #{proposal_id} ({reason})",
+                    )
                 )
-            )
         else:
-            log_event(
-                LogEntry(
-                    tick=tick,
-                    phase=(
-                        self.state.current_phase if self.current_consensus else None
-                    ),
-                    event_type=EventType.UNSTAKE_REJECTED,
-                    agent_id=agent_id,
-                    payload={
-                        "reason": "unstake_failed",
-                        "proposal_id": proposal_id,
-                        "cp_amount": cp_amount,
-                    },
-                    message=f"Rejected unstake from {agent_id}: Unstake operation failed",
-                    level=LogLevel.WARNING,
+            if event_enabled(EventType.UNSTAKE_REJECTED):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        phase=(
+                            self.state.current_phase if self.current_consensus else None
+                        ),
+                        event_type=EventType.UNSTAKE_REJECTED,
+                        agent_id=agent_id,
+                        payload={
+                            "reason": "unstake_failed",
+                            "proposal_id": proposal_id,
+                            "cp_amount": cp_amount,
+                        },
+                        message=f"Rejected unstake from {agent_id}: Unstake operation failed",
+                        level=LogLevel.WARNING,
+                    )
                 )
-            )
 
         # Mark agent as ready (regardless of success/failure)
         self.signal_ready(agent_id, payload={"reason": "unstake_processed"})
@@ -0,0 +1,427 @@
+"""Per-proposal conviction totals over the active stake ledger.
+
+ConvictionAggregates keeps running sums in pure Python; ColumnarStakeLedger is an
+optional NumPy column store for sweeps with very large stake counts.
+
+Both backends add up cp * growth_curve(age) in integer thousandths of a CP
+(growth_curve is rounded to 3 decimals) and round the total to 2 decimals
+once, so their leaderboards are exactly equal and ties break the same way.
+"""
+import heapq
+import math
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, ConfigDict
+
+try:  # Optional: only needed for the columnar backend and batched growth curves
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    np = None
+
+
+class ConvictionParams(BaseModel):
+    """Frozen, hashable form of a conviction_params dict.
+
+    Exponential growth applies when both MaxMultiplier and TargetFraction are set;
+    otherwise the linear base + growth * t fallback is used.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    MaxMultiplier: Optional[float] = None
+    TargetFraction: Optional[float] = None
+    TargetRounds: float = 5
+    base: float = 1.0
+    growth: float = 0.2
+
+    @property
+    def exponential(self) -> bool:
+        return self.MaxMultiplier is not None and self.TargetFraction is not None
+
+    @property
+    def rate(self) -> Optional[float]:
+        """k = -ln(1 - T) / R for exponential params, None for the linear fallback."""
+        if not self.exponential:
+            return None
+        return -math.log(1 - self.TargetFraction) / self.TargetRounds
+
+    def growth_curve(self, time_held) -> float:
+        """growth_curve(t) as specified, rounded to 3 decimals."""
+        if self.exponential:
+            if time_held == 0:
+                return 1.0
+            # growth_curve(t) = 1 + (MaxMultiplier - 1) × (1 - exp(-k × t))
+            growth_value = 1 + (self.MaxMultiplier - 1) * (
+                1 - math.exp(-self.rate * time_held)
+            )
+        else:
+            growth_value = self.base + self.growth * time_held
+        return round(growth_value, 3)
+
+    @classmethod
+    def from_dict(cls, conviction_params: dict) -> "ConvictionParams":
+        """Convert (and memoize) a conviction_params dict."""
+        key = tuple(sorted(conviction_params.items()))
+        params = _PARAMS_CACHE.get(key)
+        if params is None:
+            params = _PARAMS_CACHE.setdefault(key, cls(**conviction_params))
+        return params
+
+
+_PARAMS_CACHE: Dict[tuple, ConvictionParams] = {}
+
+
+class GrowthCurveTable:
+    """Precomputed growth_curve(t) for integer ages, extended lazily as ticks advance.
+
+    Tables are shared across controllers and threads: an extension builds a
+    new list under the lock and publishes it with a single assignment, so a
+    reader always indexes a complete list without locking.
+    """
+
+    def __init__(self, params: ConvictionParams):
+        self.params = params
+        self._values: List[float] = []
+        self._milli_array = None
+        self._lock = threading.Lock()
+
+    def multiplier(self, time_held) -> float:
+        """growth_curve(time_held), served from the table for non-negative integer ages."""
+        if time_held.__class__ is int and time_held >= 0:
+            values = self._values
+            if time_held >= len(values):
+                values = self._extend(time_held)
+            return values[time_held]
+        return self.params.growth_curve(time_held)
+
+    def milli(self, time_held: int) -> int:
+        """multiplier(time_held) in thousandths, as an exact integer."""
+        return round(self.multiplier(time_held) * 1000)
+
+    def multipliers(self, ages) -> List[float]:
+        """Batched multiplier() over a sequence of ages."""
+        if ages:
+            self._extend(max(ages))
+        multiplier = self.multiplier
+        return [multiplier(age) for age in ages]
+
+    def milli_array(self, ages):
+        """Vectorised milli() over a NumPy array of integer ages."""
+        if ages.size == 0 or ages.min() < 0:
+            return np.array([self.milli(int(age)) for age in ages], dtype=np.int64)
+        array = self._milli_array
+        max_age = int(ages.max())
+        if array is None or max_age >= len(array):
+            values = np.asarray(self._extend(max_age), dtype=np.float64)
+            array = np.rint(values * 1000).astype(np.int64)
+            self._milli_array = array
+        return array[ages]
+
+    def _extend(self, time_held: int) -> List[float]:
+        """Publish a table covering time_held and return it."""
+        with self._lock:
+            values = self._values
+            if time_held < len(values):
+                return values
+            # Grow geometrically so long runs do not extend one tick at a time
+            target = max(time_held + 1, 2 * len(values), 32)
+            growth_curve = self.params.growth_curve
+            extended = values + [growth_curve(t) for t in range(len(values), target)]
+            self._values = extended
+            return extended
+
+
+_GROWTH_TABLES: Dict[ConvictionParams, GrowthCurveTable] = {}
+
+
+def growth_table(conviction_params) -> GrowthCurveTable:
+    """Shared GrowthCurveTable for a conviction_params dict or ConvictionParams."""
+    if not isinstance(conviction_params, ConvictionParams):
+        conviction_params = ConvictionParams.from_dict(conviction_params)
+    table = _GROWTH_TABLES.get(conviction_params)
+    if table is None:
+        # setdefault keeps one table per params when threads race to create it
+        table = _GROWTH_TABLES.setdefault(conviction_params, GrowthCurveTable(conviction_params))
+    return table
+
+
+class _StakeGroup:
+    """Stake totals for one group of stakes (voluntary or mandatory) on a proposal.
+
+    cp is summed per initial tick, so the group's conviction at tick t costs
+    O(distinct initial ticks): ``sum(cp_t0 * growth_curve(t - t0))``.
+    """
+
+    __slots__ = ("cp", "count", "ticks", "cp_by_tick")
+
+    def __init__(self):
+        self.cp = 0
+        self.count = 0
+        self.ticks: Counter = Counter()  # t0 -> number of stakes
+        self.cp_by_tick: Counter = Counter()  # t0 -> sum(cp)
+
+    def add(self, cp: int, t0: int, sign: int = 1):
+        self.cp += sign * cp
+        self.count += sign
+        self.ticks[t0] += sign
+        self.cp_by_tick[t0] += sign * cp
+        if self.ticks[t0] <= 0:
+            del self.ticks[t0]
+            del self.cp_by_tick[t0]
+
+    def conviction(self, tick: int, growth: "GrowthCurveTable") -> int:
+        """Total cp * growth_curve(tick - t0) in thousandths, each stake aged from its own t0."""
+        milli = growth.milli
+        return sum(cp * milli(tick - t0) for t0, cp in self.cp_by_tick.items())
+
+    def anchored_conviction(self, tick: int, anchor_tick: int, growth: "GrowthCurveTable") -> int:
+        """Total conviction in thousandths when every stake is aged from anchor_tick."""
+        return self.cp * growth.milli(tick - anchor_tick)
+
+
+class ConvictionAggregates:
+    """Per-(issue, proposal) running totals over active stakes.
+
+    Updated on every stake create/switch/close/transfer through RoundtableState,
+    so a leaderboard costs O(proposals x distinct stake ticks) instead of O(stakes).
+    Leaderboards list proposals in ledger order of their first active stake,
+    like a ledger scan, so tie-breaking on iteration order is unchanged.
+    """
+
+    def __init__(self):
+        # (issue_id, proposal_id) -> {mandatory: _StakeGroup}
+        self._groups: Dict[Tuple[str, int], Dict[bool, _StakeGroup]] = {}
+        # stake_id -> (issue_id, proposal_id, mandatory, cp, t0) as currently counted
+        self._members: Dict[str, Tuple[str, int, bool, int, int]] = {}
+        # stake_id -> ledger position (order of first add, as in ColumnarStakeLedger)
+        self._positions: Dict[str, int] = {}
+        # (issue_id, proposal_id) -> min-heap of (position, stake_id); entries for
+        # stakes that left the group are discarded lazily when they reach the top
+        self._first: Dict[Tuple[str, int], list] = {}
+        self._queued: set = set()  # (group key, stake_id) pairs present in _first
+
+    def add(self, stake):
+        """Count an active stake; non-active records are ignored."""
+        position = self._positions.setdefault(stake.stake_id, len(self._positions))
+        if stake.status != "active":
+            return
+        member = (stake.issue_id, stake.proposal_id, stake.mandatory, stake.cp, stake.initial_tick)
+        self._members[stake.stake_id] = member
+        self._group(*member[:3]).add(member[3], member[4])
+        key = (stake.issue_id, stake.proposal_id)
+        if (key, stake.stake_id) not in self._queued:
+            self._queued.add((key, stake.stake_id))
+            heapq.heappush(self._first.setdefault(key, []), (position, stake.stake_id))
+
+    def remove(self, stake):
+        """Stop counting a stake, using the values it was counted with."""
+        member = self._members.pop(stake.stake_id, None)
+        if member is None:
+            return
+        issue_id, proposal_id, mandatory, cp, t0 = member
+        groups = self._groups[(issue_id, proposal_id)]
+        groups[mandatory].add(cp, t0, sign=-1)
+        if all(group.count == 0 for group in groups.values()):
+            del self._groups[(issue_id, proposal_id)]
+            for _, stake_id in self._first.pop((issue_id, proposal_id)):
+                self._queued.discard(((issue_id, proposal_id), stake_id))
+
+    def rebuild(self, stakes):
+        """Recount from scratch, e.g. after the ledger was replaced wholesale."""
+        self._groups.clear()
+        self._members.clear()
+        self._positions.clear()
+        self._first.clear()
+        self._queued.clear()
+        for stake in stakes:
+            self.add(stake)
+
+    def leaderboard(
+        self,
+        issue_id: str,
+        tick: int,
+        conviction_params: dict,
+        mandatory_anchor_tick: Optional[int] = None,
+    ) -> Dict[int, dict]:
+        """Return proposal_id -> totals for an issue at the given tick.
+
+        Voluntary stakes age from their initial_tick. Mandatory stakes do too unless
+        mandatory_anchor_tick is given, in which case they age from that tick
+        (finalization measures them from the first stake phase).
+        """
+        growth = growth_table(conviction_params)
+        totals = {}
+        for key in sorted(
+            (key for key in self._groups if key[0] == issue_id), key=self._first_position
+        ):
+            proposal_id = key[1]
+            groups = self._groups[key]
+            voluntary = groups[False]
+            mandatory = groups[True]
+            effective = voluntary.conviction(tick, growth)
+            first_ticks = list(voluntary.ticks)
+            if mandatory_anchor_tick is None:
+                effective += mandatory.conviction(tick, growth)
+                first_ticks.extend(mandatory.ticks)
+            elif mandatory.count:
+                effective += mandatory.anchored_conviction(tick, mandatory_anchor_tick, growth)
+                first_ticks.append(mandatory_anchor_tick)
+
+            totals[proposal_id] = {
+                "total_effective_weight": round(effective / 1000, 2),
+                "total_raw_weight": voluntary.cp + mandatory.cp,
+                "contributor_count": voluntary.count + mandatory.count,
+                "first_stake_tick": min(first_ticks),
+            }
+        return totals
+
+    def _first_position(self, key: Tuple[str, int]) -> int:
+        """Ledger position of the group's earliest stake that is still counted in it."""
+        heap = self._first[key]
+        while True:
+            position, stake_id = heap[0]
+            member = self._members.get(stake_id)
+            if member is not None and member[:2] == key:
+                return position
+            heapq.heappop(heap)
+            self._queued.discard((key, stake_id))
+
+    def _group(self, issue_id: str, proposal_id: int, mandatory: bool) -> _StakeGroup:
+        groups = self._groups.get((issue_id, proposal_id))
+        if groups is None:
+            groups = {False: _StakeGroup(), True: _StakeGroup()}
+            self._groups[(issue_id, proposal_id)] = groups
+        return groups[mandatory]
+
+
+class ColumnarStakeLedger:
+    """NumPy column store mirroring the stake ledger, for very large stake counts.
+
+    Parallel arrays hold cp, initial_tick, proposal/agent/issue index, status and
+    the mandatory flag; ids are interned to small integers. Leaderboards score
+    every stake in one array expression and group with bincount. Exposes the same
+    add/remove/rebuild/leaderboard interface as ConvictionAggregates so
+    RoundtableState can use either.
+    """
+
+    _STATUS_CODES = {"active": 0, "closed": 1, "burned": 2}
+    _INITIAL_CAPACITY = 1024
+
+    def __init__(self):
+        if np is None:
+            raise ImportError(
+                "conviction_backend 'numpy' requires numpy; install it or use 'incremental'"
+            )
+        self._size = 0
+        self._rows: Dict[str, int] = {}  # stake_id -> row
+        self._proposal_ids: list = []
+        self._proposal_index: Dict[int, int] = {}
+        self._agent_ids: list = []
+        self._agent_index: Dict[str, int] = {}
+        self._issue_index: Dict[str, int] = {}
+        self._allocate(self._INITIAL_CAPACITY)
+
+    def _allocate(self, capacity: int):
+        old = getattr(self, "_cp", None)
+        columns = {
+            "_cp": np.int64,
+            "_initial_tick": np.int64,
+            "_proposal": np.int32,
+            "_agent": np.int32,
+            "_issue": np.int32,
+            "_status": np.int8,
+            "_mandatory": np.bool_,
+        }
+        for name, dtype in columns.items():
+            column = np.zeros(capacity, dtype=dtype)
+            if old is not None:
+                column[: self._size] = getattr(self, name)[: self._size]
+            setattr(self, name, column)
+
+    @staticmethod
+    def _intern(value, index: Dict, values: Optional[list] = None) -> int:
+        position = index.get(value)
+        if position is None:
+            position = index[value] = len(index)
+            if values is not None:
+                values.append(value)
+        return position
+
+    def add(self, stake):
+        """Write a record's current fields into its row, appending a row if new."""
+        row = self._rows.get(stake.stake_id)
+        if row is None:
+            if self._size == len(self._cp):
+                self._allocate(len(self._cp) * 2)
+            row = self._rows[stake.stake_id] = self._size
+            self._size += 1
+        self._cp[row] = stake.cp
+        self._initial_tick[row] = stake.initial_tick
+        self._proposal[row] = self._intern(
+            stake.proposal_id, self._proposal_index, self._proposal_ids
+        )
+        self._agent[row] = self._intern(stake.agent_id, self._agent_index, self._agent_ids)
+        self._issue[row] = self._intern(stake.issue_id, self._issue_index)
+        self._status[row] = self._STATUS_CODES[stake.status]
+        self._mandatory[row] = stake.mandatory
+
+    def remove(self, stake):
+        """Stop counting a stake until it is added again."""
+        row = self._rows.get(stake.stake_id)
+        if row is not None:
+            self._status[row] = self._STATUS_CODES["closed"]
+
+    def rebuild(self, stakes):
+        """Reload every column from the ledger."""
+        self._size = 0
+        self._rows.clear()
+        for stake in stakes:
+            self.add(stake)
+
+    def leaderboard(
+        self,
+        issue_id: str,
+        tick: int,
+        conviction_params: dict,
+        mandatory_anchor_tick: Optional[int] = None,
+    ) -> Dict[int, dict]:
+        """Same result as ConvictionAggregates.leaderboard, computed with grouped sums."""
+        issue = self._issue_index.get(issue_id)
+        if issue is None:
+            return {}
+        size = self._size
+        rows = np.flatnonzero(
+            (self._status[:size] == self._STATUS_CODES["active"])
+            & (self._issue[:size] == issue)
+        )
+        if rows.size == 0:
+            return {}
+
+        proposals = self._proposal[rows]
+        cp = self._cp[rows]
+        start_ticks = self._initial_tick[rows].copy()
+        if mandatory_anchor_tick is not None:
+            start_ticks[self._mandatory[rows]] = mandatory_anchor_tick
+
+        millis = growth_table(conviction_params).milli_array(tick - start_ticks)
+        slots = len(self._proposal_ids)
+        # Integer products below 2**53 sum exactly in float64
+        effective = np.bincount(proposals, weights=cp * millis, minlength=slots)
+        raw = np.bincount(proposals, weights=cp, minlength=slots)
+        counts = np.bincount(proposals, minlength=slots)
+        first_ticks = np.full(slots, np.iinfo(np.int64).max, dtype=np.int64)
+        np.minimum.at(first_ticks, proposals, start_ticks)
+
+        # Report proposals in ledger order of their first active stake
+        present, first_rows = np.unique(proposals, return_index=True)
+        totals = {}
+        for slot in present[np.argsort(first_rows)]:
+            totals[self._proposal_ids[slot]] = {
+                "total_effective_weight": round(int(effective[slot]) / 1000, 2),
+                "total_raw_weight": int(raw[slot]),
+                "contributor_count": int(counts[slot]),
+                "first_stake_tick": int(first_ticks[slot]),
+            }
+        return totals
@@ -1,6 +1,8 @@
-from simlog import log_event, logger, LogEntry, EventType, LogLevel
+from simlog import event_enabled, log_event, logger, LogEntry, EventType, LogLevel
 from collections import defaultdict
-import math
+from typing import List
+
+from conviction import growth_table
 
 
 class CreditManager:
@@ -10,18 +12,19 @@ class CreditManager:
         self.state = state
 
         # Log credit manager initialization
-        log_event(
-            LogEntry(
-                event_type=EventType.CREDIT_MANAGER_INIT,
-                payload={
-                    "initial_balances": state.agent_balances,
-                    "total_agents": len(state.agent_balances),
-                    "total_credits": sum(state.agent_balances.values()),
-                },
-                message=f"CreditManager initialized with {len(state.agent_balances)} agents and {sum(state.agent_balances.values())} total credits",
-                level=LogLevel.DEBUG,
+        if event_enabled(EventType.CREDIT_MANAGER_INIT):
+            log_event(
+                LogEntry(
+                    event_type=EventType.CREDIT_MANAGER_INIT,
+                    payload={
+                        "initial_balances": state.agent_balances,
+                        "total_agents": len(state.agent_balances),
+                        "total_credits": sum(state.agent_balances.values()),
+                    },
+                    message=f"CreditManager initialized with {len(state.agent_balances)} agents and {sum(state.agent_balances.values())} total credits",
+                    level=LogLevel.DEBUG,
+                )
             )
-        )
 
     def get_balance(self, agent_id: str) -> int:
         return self.state.agent_balances.get(agent_id, 0)
@@ -42,20 +45,21 @@ class CreditManager:
             self.state.credit_events.append(event_data)
 
             # Log the credit burn event
-            log_event(
-                LogEntry(
-                    tick=tick,
-                    event_type=EventType.CREDIT_BURN,
-                    agent_id=agent_id,
-                    payload={
-                        "amount": amount,
-                        "reason": reason,
-                        "issue_id": issue_id,
-                        "new_balance": self.state.agent_balances[agent_id],
-                    },
-                    message=f"Credit burned: {agent_id} -{amount} CP ({reason})",
+            if event_enabled(EventType.CREDIT_BURN):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        event_type=EventType.CREDIT_BURN,
+                        agent_id=agent_id,
+                        payload={
+                            "amount": amount,
+                            "reason": reason,
+                            "issue_id": issue_id,
+                            "new_balance": self.state.agent_balances[agent_id],
+                        },
+                        message=f"Credit burned: {agent_id} -{amount} CP ({reason})",
+                    )
                 )
-            )
 
             return True
         else:
@@ -70,21 +74,22 @@ class CreditManager:
             self.state.credit_events.append(event_data)
 
             # Log the insufficient credit event
-            log_event(
-                LogEntry(
-                    tick=tick,
-                    event_type=EventType.INSUFFICIENT_CREDIT,
-                    agent_id=agent_id,
-                    payload={
-                        "amount": amount,
-                        "reason": reason,
-                        "issue_id": issue_id,
-                        "current_balance": self.get_balance(agent_id),
-                    },
-                    message=f"Insufficient credit: {agent_id} attempted {amount} CP but has {self.get_balance(agent_id)} CP",
-                    level=LogLevel.WARNING,
+            if event_enabled(EventType.INSUFFICIENT_CREDIT):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        event_type=EventType.INSUFFICIENT_CREDIT,
+                        agent_id=agent_id,
+                        payload={
+                            "amount": amount,
+                            "reason": reason,
+                            "issue_id": issue_id,
+                            "current_balance": self.get_balance(agent_id),
+                        },
+                        message=f"Insufficient credit: {agent_id} attempted {amount} CP but has {self.get_balance(agent_id)} CP",
+                        level=LogLevel.WARNING,
+                    )
                 )
-            )
 
             return False
 
@@ -103,21 +108,22 @@ class CreditManager:
         self.state.credit_events.append(event_data)
 
         # Log the credit award event
-        log_event(
-            LogEntry(
-                tick=tick,
-                event_type=EventType.CREDIT_AWARD,
-                agent_id=agent_id,
-                payload={
-                    "amount": amount,
-                    "reason": reason,
-                    "issue_id": issue_id,
-                    "old_balance": old_balance,
-                    "new_balance": self.state.agent_balances[agent_id],
-                },
-                message=f"Credit awarded: {agent_id} +{amount} CP ({reason})",
+        if event_enabled(EventType.CREDIT_AWARD):
+            log_event(
+                LogEntry(
+                    tick=tick,
+                    event_type=EventType.CREDIT_AWARD,
+                    agent_id=agent_id,
+                    payload={
+                        "amount": amount,
+                        "reason": reason,
+                        "issue_id": issue_id,
+                        "old_balance": old_balance,
+                        "new_balance": self.state.agent_balances[agent_id],
+                    },
+                    message=f"Credit awarded: {agent_id} +{amount} CP ({reason})",
+                )
             )
-        )
 
     def get_all_balances(self) -> dict:
         return dict(self.state.agent_balances)
@@ -133,40 +139,42 @@ class CreditManager:
             self.state.agent_balances[agent_id] -= amount
 
             # Log the staking event (different from burning)
-            log_event(
-                LogEntry(
-                    tick=tick,
-                    event_type=EventType.CREDIT_BURN,  # Using same event type but different reason
-                    agent_id=agent_id,
-                    payload={
-                        "amount": amount,
-                        "reason": reason,
-                        "issue_id": issue_id,
-                        "new_balance": self.state.agent_balances[agent_id],
-                        "staked": True,  # Flag to indicate this is staking, not burning
-                    },
-                    message=f"Credits staked: {agent_id} -{amount} CP ({reason})",
+            if event_enabled(EventType.CREDIT_BURN):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        event_type=EventType.CREDIT_BURN,  # Using same event type but different reason
+                        agent_id=agent_id,
+                        payload={
+                            "amount": amount,
+                            "reason": reason,
+                            "issue_id": issue_id,
+                            "new_balance": self.state.agent_balances[agent_id],
+                            "staked": True,  # Flag to indicate this is staking, not burning
+                        },
+                        message=f"Credits staked: {agent_id} -{amount} CP ({reason})",
+                    )
                 )
-            )
 
             return True
         else:
             # Log insufficient credit event
-            log_event(
-                LogEntry(
-                    tick=tick,
-                    event_type=EventType.INSUFFICIENT_CREDIT,
-                    agent_id=agent_id,
-                    payload={
-                        "amount": amount,
-                        "reason": reason,
-                        "issue_id": issue_id,
-                        "current_balance": self.get_balance(agent_id),
-                    },
-                    message=f"Insufficient credit for staking: {agent_id} attempted {amount} CP but has {self.get_balance(agent_id)} CP",
-                    level=LogLevel.WARNING,
+            if event_enabled(EventType.INSUFFICIENT_CREDIT):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        event_type=EventType.INSUFFICIENT_CREDIT,
+                        agent_id=agent_id,
+                        payload={
+                            "amount": amount,
+                            "reason": reason,
+                            "issue_id": issue_id,
+                            "current_balance": self.get_balance(agent_id),
+                        },
+                        message=f"Insufficient credit for staking: {agent_id} attempted {amount} CP but has {self.get_balance(agent_id)} CP",
+                        level=LogLevel.WARNING,
+                    )
                 )
-            )
 
             return False
 
@@ -187,24 +195,25 @@ class CreditManager:
                 issue_id=issue_id,
                 mandatory=True,  # Self-stakes are mandatory
             )
-            self.state.stake_ledger.append(stake_record)
+            self.state.add_stake(stake_record)
 
-            log_event(
-                LogEntry(
-                    tick=tick,
-                    event_type=EventType.STAKE_RECORDED,
-                    agent_id=agent_id,
-                    payload={
-                        "proposal_id": proposal_id,
-                        "amount": amount,
-                        "issue_id": issue_id,
-                        "stake_type": "mandatory",
-                        "stake_id": stake_record.stake_id,
-                        "initial_tick": tick,
-                    },
-                    message=f"Mandatory stake recorded: {agent_id} staked {amount} CP on P{proposal_id} (tick={tick}, recoverable until finalize)",
+            if event_enabled(EventType.STAKE_RECORDED):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        event_type=EventType.STAKE_RECORDED,
+                        agent_id=agent_id,
+                        payload={
+                            "proposal_id": proposal_id,
+                            "amount": amount,
+                            "issue_id": issue_id,
+                            "stake_type": "mandatory",
+                            "stake_id": stake_record.stake_id,
+                            "initial_tick": tick,
+                        },
+                        message=f"Mandatory stake recorded: {agent_id} staked {amount} CP on P{proposal_id} (tick={tick}, recoverable until finalize)",
+                    )
                 )
-            )
             return True
         return False
 
@@ -225,24 +234,25 @@ class CreditManager:
                 issue_id=issue_id,
                 mandatory=False,  # Voluntary stakes are not mandatory
             )
-            self.state.stake_ledger.append(stake_record)
+            self.state.add_stake(stake_record)
 
-            log_event(
-                LogEntry(
-                    tick=tick,
-                    event_type=EventType.STAKE_RECORDED,
-                    agent_id=agent_id,
-                    payload={
-                        "proposal_id": proposal_id,
-                        "amount": amount,
-                        "issue_id": issue_id,
-                        "stake_type": "voluntary",
-                        "stake_id": stake_record.stake_id,
-                        "initial_tick": tick,
-                    },
-                    message=f"Voluntary stake recorded: {agent_id} staked {amount} CP on P{proposal_id} (tick={tick}, switchable, recoverable until finalize)",
+            if event_enabled(EventType.STAKE_RECORDED):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        event_type=EventType.STAKE_RECORDED,
+                        agent_id=agent_id,
+                        payload={
+                            "proposal_id": proposal_id,
+                            "amount": amount,
+                            "issue_id": issue_id,
+                            "stake_type": "voluntary",
+                            "stake_id": stake_record.stake_id,
+                            "initial_tick": tick,
+                        },
+                        message=f"Voluntary stake recorded: {agent_id} staked {amount} CP on P{proposal_id} (tick={tick}, switchable, recoverable until finalize)",
+                    )
                 )
-            )
             return True
         return False
 
@@ -251,52 +261,46 @@ class CreditManager:
     ) -> bool:
         """Transfer stake from old proposal to new proposal (for versioned revisions)."""
         # Find all stakes for the old proposal
-        old_stakes = [
-            record
-            for record in self.state.stake_ledger
-            if record.proposal_id == old_proposal_id
-        ]
+        old_stakes = self.state.get_stakes_for_proposal(old_proposal_id)
 
         if old_stakes:
             # Update each stake record to point to new proposal
             for record in old_stakes:
-                record.proposal_id = new_proposal_id
-                record.initial_tick = tick  # Update to current tick
+                self.state.update_stake(
+                    record,
+                    proposal_id=new_proposal_id,
+                    initial_tick=tick,  # Update to current tick
+                )
 
-                log_event(
-                    LogEntry(
-                        tick=tick,
-                        event_type=EventType.STAKE_TRANSFERRED,
-                        agent_id=record.agent_id,
-                        payload={
-                            "old_proposal_id": old_proposal_id,
-                            "new_proposal_id": new_proposal_id,
-                            "amount": record.cp,
-                            "issue_id": issue_id,
-                        },
-                        message=f"Transferred stake of {record.cp} CP from {old_proposal_id} to {new_proposal_id} (agent: {record.agent_id})",
+                if event_enabled(EventType.STAKE_TRANSFERRED):
+                    log_event(
+                        LogEntry(
+                            tick=tick,
+                            event_type=EventType.STAKE_TRANSFERRED,
+                            agent_id=record.agent_id,
+                            payload={
+                                "old_proposal_id": old_proposal_id,
+                                "new_proposal_id": new_proposal_id,
+                                "amount": record.cp,
+                                "issue_id": issue_id,
+                            },
+                            message=f"Transferred stake of {record.cp} CP from {old_proposal_id} to {new_proposal_id} (agent: {record.agent_id})",
+                        )
                     )
-                )
 
             return True
         return False
 
     def get_agent_stakes(self, agent_id: str, issue_id: str = None) -> list:
         """Get all stakes by a specific agent."""
-        stakes = [
-            record for record in self.state.stake_ledger if record.agent_id == agent_id
-        ]
+        stakes = self.state.get_stakes_by_agent(agent_id)
         if issue_id:
             stakes = [record for record in stakes if record.issue_id == issue_id]
         return stakes
 
     def get_proposal_stakes(self, proposal_id: str, issue_id: str = None) -> list:
         """Get all stakes to a specific proposal."""
-        stakes = [
-            record
-            for record in self.state.stake_ledger
-            if record.proposal_id == proposal_id
-        ]
+        stakes = self.state.get_stakes_for_proposal(proposal_id)
         if issue_id:
             stakes = [record for record in stakes if record.issue_id == issue_id]
         return stakes
@@ -312,42 +316,25 @@ class CreditManager:
         self, agent_id: str, proposal_id: str, issue_id: str = None
     ) -> int:
         """Get the total amount a specific agent has staked on a specific proposal."""
-        stakes = [
-            record
-            for record in self.state.stake_ledger
-            if record.agent_id == agent_id and record.proposal_id == proposal_id
-        ]
+        stakes = self.state.get_stakes_by_agent_on_proposal(agent_id, proposal_id)
         if issue_id:
             stakes = [record for record in stakes if record.issue_id == issue_id]
         return sum(record.cp for record in stakes)
 
     def calculate_growth_curve(self, time_held: int, conviction_params: dict) -> float:
-        """Calculate growth curve value based on time held according to spec."""
-        if (
-            "MaxMultiplier" in conviction_params
-            and "TargetFraction" in conviction_params
-        ):
-            # Exponential formula: growth_curve(t) = 1 + (MaxMultiplier - 1) × (1 - exp(-k × t))
-            max_multiplier = conviction_params["MaxMultiplier"]
-            target_fraction = conviction_params.get("TargetFraction", 0.98)
-            target_rounds = conviction_params.get("TargetRounds", 5)
-
-            if time_held == 0:
-                return 1.0
+        """Calculate growth curve value based on time held according to spec.
 
-            # Calculate k = -ln(1 - T) / R
-            k = -math.log(1 - target_fraction) / target_rounds
+        Exponential: growth_curve(t) = 1 + (MaxMultiplier - 1) × (1 - exp(-k × t)),
+        k = -ln(1 - TargetFraction) / TargetRounds; linear fallback: base + growth × t.
+        Values come from the shared per-params table, so no math runs per stake.
+        """
+        return growth_table(conviction_params).multiplier(time_held)
 
-            # Calculate growth curve: 1 + (MaxMultiplier - 1) × (1 - exp(-k × t))
-            growth_value = 1 + (max_multiplier - 1) * (1 - math.exp(-k * time_held))
-
-        else:
-            # Linear fallback: base + growth * time_held
-            base = conviction_params.get("base", 1.0)
-            growth = conviction_params.get("growth", 0.2)
-            growth_value = base + growth * time_held
-
-        return round(growth_value, 3)
+    def calculate_growth_curves(
+        self, time_held: List[int], conviction_params: dict
+    ) -> List[float]:
+        """Batched calculate_growth_curve over a list of ages."""
+        return growth_table(conviction_params).multipliers(time_held)
 
     def calculate_stake_conviction(
         self, stake: "StakeRecord", current_tick: int, conviction_params: dict
@@ -440,24 +427,25 @@ class CreditManager:
         consecutive_rounds = len(agent_stakes)
 
         # Log conviction update event with structured payload
-        log_event(
-            LogEntry(
-                tick=tick,
-                event_type=EventType.CONVICTION_UPDATED,
-                agent_id=agent_id,
-                payload={
-                    "proposal_id": proposal_id,
-                    "raw_stake": stake_amount,
-                    "multiplier": growth_multiplier,
-                    "effective_weight": effective_weight,
-                    "total_conviction": total_conviction,
-                    "time_held": time_held,
-                    "issue_id": issue_id,
-                    "stake_based": True,
-                },
-                message=f"Stake conviction calculated: {agent_id} → P{proposal_id}: {stake_amount}CP × {growth_multiplier} = {effective_weight} effective weight (time_held={time_held})",
+        if event_enabled(EventType.CONVICTION_UPDATED):
+            log_event(
+                LogEntry(
+                    tick=tick,
+                    event_type=EventType.CONVICTION_UPDATED,
+                    agent_id=agent_id,
+                    payload={
+                        "proposal_id": proposal_id,
+                        "raw_stake": stake_amount,
+                        "multiplier": growth_multiplier,
+                        "effective_weight": effective_weight,
+                        "total_conviction": total_conviction,
+                        "time_held": time_held,
+                        "issue_id": issue_id,
+                        "stake_based": True,
+                    },
+                    message=f"Stake conviction calculated: {agent_id} → P{proposal_id}: {stake_amount}CP × {growth_multiplier} = {effective_weight} effective weight (time_held={time_held})",
+                )
             )
-        )
 
         return {
             "raw_stake": stake_amount,
@@ -552,10 +540,10 @@ class CreditManager:
             if stake.cp <= remaining_to_switch:
                 # Close this stake completely
                 remaining_to_switch -= stake.cp
-                stake.status = "closed"
+                self.state.update_stake(stake, status="closed")
             else:
                 # Partially reduce this stake
-                stake.cp -= remaining_to_switch
+                self.state.update_stake(stake, cp=stake.cp - remaining_to_switch)
                 remaining_to_switch = 0
 
         # Create new stake on target proposal at current tick
@@ -568,25 +556,26 @@ class CreditManager:
             issue_id=issue_id,
             mandatory=False,  # Switched stakes are never mandatory
         )
-        self.state.stake_ledger.append(new_stake)
+        self.state.add_stake(new_stake)
 
         # Log the switching event
-        log_event(
-            LogEntry(
-                tick=tick,
-                event_type=EventType.CONVICTION_SWITCHED,
-                agent_id=agent_id,
-                payload={
-                    "source_proposal_id": source_proposal_id,
-                    "target_proposal_id": target_proposal_id,
-                    "cp_amount": cp_amount,
-                    "reason": reason,
-                    "issue_id": issue_id,
-                    "new_stake_id": new_stake.stake_id,
-                },
-                message=f"Stake switched: {agent_id} moved {cp_amount} CP from P{source_proposal_id} → P{target_proposal_id} ({reason})",
+        if event_enabled(EventType.CONVICTION_SWITCHED):
+            log_event(
+                LogEntry(
+                    tick=tick,
+                    event_type=EventType.CONVICTION_SWITCHED,
+                    agent_id=agent_id,
+                    payload={
+                        "source_proposal_id": source_proposal_id,
+                        "target_proposal_id": target_proposal_id,
+                        "cp_amount": cp_amount,
+                        "reason": reason,
+                        "issue_id": issue_id,
+                        "new_stake_id": new_stake.stake_id,
+                    },
+                    message=f"Stake switched: {agent_id} moved {cp_amount} CP from P{source_proposal_id} → P{target_proposal_id} ({reason})",
+                )
             )
-        )
 
         # Record in credit events for audit trail
         switch_event = {
@@ -641,31 +630,32 @@ class CreditManager:
             if stake.cp <= remaining_to_unstake:
                 # Close this stake completely
                 remaining_to_unstake -= stake.cp
-                stake.status = "closed"
+                self.state.update_stake(stake, status="closed")
             else:
                 # Partially reduce this stake
-                stake.cp -= remaining_to_unstake
+                self.state.update_stake(stake, cp=stake.cp - remaining_to_unstake)
                 remaining_to_unstake = 0
 
         # Restore CP to agent's balance
         self.state.agent_balances[agent_id] += cp_amount
 
         # Log the unstaking event
-        log_event(
-            LogEntry(
-                tick=tick,
-                event_type=EventType.CREDIT_AWARD,  # CP returned to balance
-                agent_id=agent_id,
-                payload={
-                    "proposal_id": proposal_id,
-                    "cp_amount": cp_amount,
-                    "reason": reason,
-                    "issue_id": issue_id,
-                    "unstake": True,
-                },
-                message=f"Unstaked: {agent_id} withdrew {cp_amount} CP from P{proposal_id} → balance",
+        if event_enabled(EventType.CREDIT_AWARD):
+            log_event(
+                LogEntry(
+                    tick=tick,
+                    event_type=EventType.CREDIT_AWARD,  # CP returned to balance
+                    agent_id=agent_id,
+                    payload={
+                        "proposal_id": proposal_id,
+                        "cp_amount": cp_amount,
+                        "reason": reason,
+                        "issue_id": issue_id,
+                        "unstake": True,
+                    },
+                    message=f"Unstaked: {agent_id} withdrew {cp_amount} CP from P{proposal_id} → balance",
+                )
             )
-        )
 
         # Record in credit events for audit trail
         unstake_event = {
@@ -18,6 +18,8 @@ import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from simlog import migrate_event_schema
+
 
 def find_latest_db() -> Optional[Path]:
     """Find the most recent simulation database."""
@@ -46,6 +48,7 @@ def analyze_feedback_stage(db_path: Path) -> bool:
 
     try:
         conn = sqlite3.connect(db_path)
+        migrate_event_schema(conn)
         cursor = conn.cursor()
 
         # Get simulation metadata
@@ -174,7 +177,7 @@ def check_feedback_stakes(cursor) -> bool:
     # Get credit burn events for feedback stakes
     cursor.execute(
         """
-        SELECT tick, agent_id, event_type, message, payload
+        SELECT tick, agent_id, amount, json_extract(payload, '$.reason')
         FROM events 
         WHERE event_type = 'credit_burn'
         AND message LIKE '%Feedback Stake%'
@@ -213,29 +216,21 @@ def check_feedback_stakes(cursor) -> bool:
     agents_with_stakes = set()
     correct_stakes = 0
 
-    for tick, agent_id, event_type, message, payload in feedback_burns:
+    for tick, agent_id, amount, reason in feedback_burns:
         if agent_id:
             agents_with_stakes.add(agent_id)
 
-        # Parse payload to check burn amount
-        if payload:
-            try:
-                payload_data = json.loads(payload)
-                amount = payload_data.get("amount", 0)
-                reason = payload_data.get("reason", "")
-
-                print(f"  T{tick} ({agent_id}) Burned {amount} CP: {reason}")
-
-                if amount == FEEDBACK_STAKE:
-                    print(f"    ✅ Correct feedback stake deduction")
-                    correct_stakes += 1
-                else:
-                    print(
-                        f"    ❌ Unexpected stake amount: {amount} (expected {FEEDBACK_STAKE})"
-                    )
-
-            except json.JSONDecodeError:
-                print(f"    ⚠️  Could not parse payload: {payload}")
+        # Check burn amount (promoted column)
+        if amount is not None:
+            print(f"  T{tick} ({agent_id}) Burned {amount:g} CP: {reason or ''}")
+
+            if amount == FEEDBACK_STAKE:
+                print(f"    ✅ Correct feedback stake deduction")
+                correct_stakes += 1
+            else:
+                print(
+                    f"    ❌ Unexpected stake amount: {amount:g} (expected {FEEDBACK_STAKE})"
+                )
 
     print(f"📊 Agents with feedback stakes: {len(agents_with_stakes)}")
     print(f"📊 Correct stake amounts: {correct_stakes}/{len(feedback_burns)}")
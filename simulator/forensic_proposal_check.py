@@ -17,6 +17,8 @@ import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from simlog import migrate_event_schema
+
 
 def find_latest_db() -> Optional[Path]:
     """Find the most recent simulation database."""
@@ -45,6 +47,7 @@ def analyze_proposal_stage(db_path: Path) -> bool:
 
     try:
         conn = sqlite3.connect(db_path)
+        migrate_event_schema(conn)
         cursor = conn.cursor()
 
         # Get simulation metadata
@@ -241,7 +244,7 @@ def check_stake_deductions(cursor) -> bool:
     # Get credit burn events
     cursor.execute(
         """
-        SELECT tick, agent_id, event_type, message, payload
+        SELECT tick, agent_id, amount, json_extract(payload, '$.reason')
         FROM events 
         WHERE event_type = 'credit_burn'
         ORDER BY tick, id
@@ -259,26 +262,19 @@ def check_stake_deductions(cursor) -> bool:
     PROPOSAL_SELF_STAKE = 50
     agents_with_burns = set()
 
-    for tick, agent_id, event_type, message, payload in burn_events:
+    for tick, agent_id, amount, reason in burn_events:
         if agent_id:
             agents_with_burns.add(agent_id)
 
-        # Parse payload to check burn amount
-        if payload:
-            try:
-                payload_data = json.loads(payload)
-                amount = payload_data.get("amount", 0)
-                reason = payload_data.get("reason", "")
-
-                print(f"  T{tick} ({agent_id}) Burned {amount} CP: {reason}")
-
-                if amount == PROPOSAL_SELF_STAKE and "proposal" in reason.lower():
-                    print(f"    ✅ Correct proposal self-stake deduction")
-                elif amount != PROPOSAL_SELF_STAKE:
-                    print(f"    ⚠️  Unexpected burn amount: {amount}")
+        # Check burn amount (promoted column)
+        if amount is not None:
+            reason = reason or ""
+            print(f"  T{tick} ({agent_id}) Burned {amount:g} CP: {reason}")
 
-            except json.JSONDecodeError:
-                print(f"    ⚠️  Could not parse payload: {payload}")
+            if amount == PROPOSAL_SELF_STAKE and "proposal" in reason.lower():
+                print(f"    ✅ Correct proposal self-stake deduction")
+            elif amount != PROPOSAL_SELF_STAKE:
+                print(f"    ⚠️  Unexpected burn amount: {amount:g}")
 
     print(f"📊 Agents with burn events: {len(agents_with_burns)}")
 
@@ -5,13 +5,22 @@ providing access to any registered model (OpenAI, Anthropic, Ollama, etc.)
 through a unified interface.
 """
 
+import asyncio
+import hashlib
 import json
-from functools import lru_cache
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, Literal, Tuple, Type, TypeVar
+from typing import Any, Dict, Literal, Optional, Tuple, Type, TypeVar
 
 import llm as llm_lib
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
+
+from llm_stub import StubModel, is_stub_model
+from simlog import save_llm_call
 
 # Cache for loaded prompts to avoid repeated file I/O
 _prompt_cache: Dict[str, str] = {}
@@ -19,6 +28,26 @@ _prompt_cache: Dict[str, str] = {}
 # Default model - matches the previously hardcoded Ollama model
 DEFAULT_MODEL = "gemma3n:e4b"
 
+# Response cache defaults (see configure_response_cache)
+DEFAULT_CACHE_PATH = Path(__file__).parent / "db" / "llm_cache.sqlite3"
+DEFAULT_CACHE_MAX_MB = 256
+
+# Phase recorded in llm_calls telemetry for each call_type
+CALL_TYPE_PHASES = {
+    "issue": "INIT",
+    "propose": "PROPOSE",
+    "propose_content": "PROPOSE",
+    "feedback": "FEEDBACK",
+    "feedback_content": "FEEDBACK",
+    "revise": "REVISE",
+    "revise_content": "REVISE",
+    "stake_prefs": "STAKE",
+    "stake_action": "STAKE",
+}
+
+# Model calls in flight at once, shared by sync and async callers (see configure_llm_limits)
+DEFAULT_MAX_CONCURRENT_CALLS = 8
+
 
 # Pydantic models for structured LLM responses
 class ProposeDecision(BaseModel):
@@ -77,10 +106,320 @@ T = TypeVar("T", bound=BaseModel)
 
 @lru_cache(maxsize=16)
 def _get_model(model: str | None = None) -> llm_lib.Model:
-    """Get a cached llm model instance by name."""
+    """Get a cached llm model instance by name ("stub[:options]" for the offline stub)."""
+    if is_stub_model(model):
+        return StubModel.from_name(model)
     return llm_lib.get_model(model or DEFAULT_MODEL)
 
 
+class LLMResponseCache:
+    """Persistent SQLite cache of raw LLM response text.
+
+    Entries are keyed by request_key() over everything that determines a
+    response, so a re-run with the same seeds, model and context replays
+    stored responses instead of calling the model. Once the stored text
+    exceeds max_bytes the least recently used entries are evicted.
+    Safe to share between threads (concurrent agent dispatch) and, via
+    SQLite locking, between batch worker processes.
+
+    The stored size is tracked as a running total (read once on open) so a
+    put does not scan the table; the real total is only summed when the
+    running one crosses max_bytes. Other processes' writes are not counted
+    until then, so a shared cache can briefly exceed the bound.
+    """
+
+    def __init__(self, path: Path, max_bytes: int):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(
+            str(self.path), timeout=30, check_same_thread=False
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        with self.connection:
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    model TEXT,
+                    response TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            """
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses (last_used)"
+            )
+        self._bytes = self._stored_bytes()
+
+    @staticmethod
+    def request_key(
+        model: str,
+        system: str,
+        context: str,
+        prompt: str,
+        schema: Optional[dict],
+        seed: Optional[int],
+        options: dict,
+    ) -> str:
+        """SHA-256 over the full request (model, prompts, schema, seed, options)."""
+        material = json.dumps(
+            [model, system, context, prompt, schema, seed, options],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Stored response for key (refreshing its LRU position), or None."""
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            with self.connection:
+                self.connection.execute(
+                    "UPDATE responses SET last_used = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+            return row[0]
+
+    def put(self, key: str, model: str, response: str):
+        """Store a response, then evict LRU entries beyond max_bytes."""
+        size = len(response.encode("utf-8"))
+        now = time.time()
+        with self._lock, self.connection:
+            replaced = self.connection.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self.connection.execute(
+                """
+                INSERT OR REPLACE INTO responses (key, model, response, size, created_at, last_used)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """,
+                (key, model, response, size, now, now),
+            )
+            self._bytes += size - (replaced[0] if replaced else 0)
+            if self._bytes > self.max_bytes:
+                self._evict_locked()
+
+    def _stored_bytes(self) -> int:
+        return self.connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+    def _evict_locked(self):
+        # Resync first: other processes sharing the file may have added or evicted rows
+        total = self._stored_bytes()
+        for key, size in self.connection.execute(
+            "SELECT key, size FROM responses ORDER BY last_used"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            self.connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            self.evictions += 1
+        self._bytes = total
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters for this process plus current cache size."""
+        with self._lock:
+            entries, total = self.connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": entries,
+            "bytes": total,
+        }
+
+    def clear(self):
+        """Remove every stored response."""
+        with self._lock, self.connection:
+            self.connection.execute("DELETE FROM responses")
+            self._bytes = 0
+
+    def close(self):
+        with self._lock:
+            self.connection.close()
+
+
+# Process-wide response cache; None (the default) disables caching
+_response_cache: Optional[LLMResponseCache] = None
+
+
+def configure_response_cache(
+    settings: Optional[Dict[str, Any]],
+) -> Optional[LLMResponseCache]:
+    """
+    Enable, reconfigure or disable the response cache from llm.cache settings.
+
+    Args:
+        settings: Dict with enabled (default False), path (default
+            db/llm_cache.sqlite3, relative paths resolve against this
+            directory) and max_mb (default 256); None or enabled: false
+            disables caching
+
+    Returns:
+        The active cache, or None when caching is disabled
+    """
+    global _response_cache
+    if not settings or not settings.get("enabled", False):
+        if _response_cache is not None:
+            _response_cache.close()
+        _response_cache = None
+        return None
+
+    path = Path(settings.get("path") or DEFAULT_CACHE_PATH)
+    if not path.is_absolute():
+        path = Path(__file__).parent / path
+    max_bytes = int(float(settings.get("max_mb", DEFAULT_CACHE_MAX_MB)) * 1024 * 1024)
+
+    if _response_cache is not None and _response_cache.path == path:
+        _response_cache.max_bytes = max_bytes
+    else:
+        if _response_cache is not None:
+            _response_cache.close()
+        _response_cache = LLMResponseCache(path, max_bytes)
+    return _response_cache
+
+
+def response_cache_stats() -> Optional[Dict[str, Any]]:
+    """Stats of the active response cache, or None if caching is disabled."""
+    return _response_cache.stats() if _response_cache is not None else None
+
+
+def _cache_key(
+    m: llm_lib.Model,
+    system: str,
+    context: str,
+    prompt: str,
+    schema: Optional[dict],
+    seed: Optional[int],
+    options: dict,
+) -> Optional[str]:
+    if _response_cache is None:
+        return None
+    return LLMResponseCache.request_key(
+        m.model_id, system, context, prompt, schema, seed, options
+    )
+
+
+class _RateLimiter:
+    """Spaces calls at least 1 / requests_per_second apart, across threads."""
+
+    def __init__(self, requests_per_second: float):
+        self.interval = 1.0 / requests_per_second
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+_call_slots = threading.BoundedSemaphore(DEFAULT_MAX_CONCURRENT_CALLS)
+_max_concurrent_calls = DEFAULT_MAX_CONCURRENT_CALLS
+_rate_limiter: Optional[_RateLimiter] = None
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def configure_llm_limits(
+    max_concurrent_calls: int = DEFAULT_MAX_CONCURRENT_CALLS,
+    requests_per_second: Optional[float] = None,
+):
+    """
+    Set the process-wide limits applied to every model call.
+
+    Args:
+        max_concurrent_calls: Model calls in flight at once (sync and async)
+        requests_per_second: Maximum call start rate; None for no rate limit
+    """
+    global _call_slots, _max_concurrent_calls, _rate_limiter, _executor
+    _max_concurrent_calls = max(1, int(max_concurrent_calls))
+    _call_slots = threading.BoundedSemaphore(_max_concurrent_calls)
+    _rate_limiter = _RateLimiter(requests_per_second) if requests_per_second else None
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
+
+
+def _prompt_model(m: llm_lib.Model, content: str, **kwargs) -> Tuple[str, float]:
+    """Run one model call within the shared concurrency and rate limits.
+
+    Returns:
+        (response_text, ms spent waiting for a call slot / the rate limiter)
+    """
+    queued = time.perf_counter()
+    with _call_slots:
+        if _rate_limiter is not None:
+            _rate_limiter.wait()
+        wait_ms = (time.perf_counter() - queued) * 1000
+        return m.prompt(content, stream=False, **kwargs).text(), wait_ms
+
+
+def _new_call(
+    m: llm_lib.Model,
+    call_type: Optional[str],
+    agent_id: Optional[str],
+    tick: Optional[int],
+    system: str,
+    user_content: str,
+) -> Dict[str, Any]:
+    """Start an llm_calls telemetry row."""
+    return {
+        "tick": tick,
+        "phase": CALL_TYPE_PHASES.get(call_type),
+        "agent_id": agent_id,
+        "call_type": call_type,
+        "model": m.model_id,
+        "prompt_chars": len(system or "") + len(user_content),
+        "response_chars": None,
+        "wait_ms": 0.0,
+        "schema_fallback": False,
+        "validation_failed": False,
+        "cache_hit": False,
+        "error": None,
+        "started": time.perf_counter(),
+    }
+
+
+def _finish_call(call: Dict[str, Any]):
+    """Record a telemetry row; latency_ms excludes the wait for call slots."""
+    elapsed_ms = (time.perf_counter() - call.pop("started")) * 1000
+    call["latency_ms"] = round(elapsed_ms - call["wait_ms"], 3)
+    call["wait_ms"] = round(call["wait_ms"], 3)
+    save_llm_call(call)
+
+
+def _llm_executor() -> ThreadPoolExecutor:
+    """Worker threads for the async API, one per concurrent call slot."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=_max_concurrent_calls, thread_name_prefix="llm-call"
+        )
+    return _executor
+
+
 def _prepare(
     system: str,
     context: str,
@@ -117,6 +456,9 @@ def one_shot(
     model: str = None,
     seed: int = None,
     context_window: int = None,
+    call_type: str = None,
+    agent_id: str = None,
+    tick: int = None,
 ) -> str:
     """
     Generates structured prose using an LLM model via the llm package.
@@ -128,20 +470,36 @@ def one_shot(
         model: Model name as registered in llm (default: gemma3n:e4b)
         seed: Random seed for deterministic generation (optional, provider-dependent)
         context_window: Context window size (optional, Ollama-only)
+        call_type, agent_id, tick: Caller details for the llm_calls telemetry row
+
+    Non-empty responses are served from / stored in the response cache when
+    one is configured (configure_response_cache).
     """
     m, user_content, options = _prepare(system, context, prompt, model, seed, context_window)
-
+    call = _new_call(m, call_type, agent_id, tick, system, user_content)
     try:
-        response = m.prompt(
-            user_content,
-            system=system or None,
-            stream=False,
-            **options,
-        )
-        return response.text()
-    except Exception as exc:
-        print(f"Error during one_shot: {exc}")
-        return ""
+        key = _cache_key(m, system, context, prompt, None, seed, options)
+        if key is not None:
+            cached = _response_cache.get(key)
+            if cached is not None:
+                call["cache_hit"] = True
+                call["response_chars"] = len(cached)
+                return cached
+
+        try:
+            text, call["wait_ms"] = _prompt_model(
+                m, user_content, system=system or None, **options
+            )
+            call["response_chars"] = len(text)
+            if key is not None and text:
+                _response_cache.put(key, m.model_id, text)
+            return text
+        except Exception as exc:
+            call["error"] = str(exc)
+            print(f"Error during one_shot: {exc}")
+            return ""
+    finally:
+        _finish_call(call)
 
 
 def one_shot_json(
@@ -152,6 +510,9 @@ def one_shot_json(
     model: str = None,
     seed: int = None,
     context_window: int = None,
+    call_type: str = None,
+    agent_id: str = None,
+    tick: int = None,
 ) -> T:
     """
     Generates structured JSON response using an LLM model with Pydantic validation.
@@ -164,42 +525,125 @@ def one_shot_json(
         model: Model name as registered in llm (default: gemma3n:e4b)
         seed: Random seed for deterministic generation (optional, provider-dependent)
         context_window: Context window size (optional, Ollama-only)
+        call_type, agent_id, tick: Caller details for the llm_calls telemetry row
 
     Returns:
-        Validated Pydantic model instance
+        Validated Pydantic model instance (from the response cache when one
+        is configured and holds this request; only validated responses are stored)
 
     Raises:
         Exception: If LLM call fails or response validation fails
     """
     m, user_content, options = _prepare(system, context, prompt, model, seed, context_window)
-
+    call = _new_call(m, call_type, agent_id, tick, system, user_content)
     try:
+        schema = response_model.model_json_schema()
+        key = _cache_key(m, system, context, prompt, schema, seed, options)
+        if key is not None:
+            cached = _response_cache.get(key)
+            if cached is not None:
+                call["cache_hit"] = True
+                call["response_chars"] = len(cached)
+                return response_model.model_validate_json(cached)
+
         if m.supports_schema:
-            response = m.prompt(
+            text, call["wait_ms"] = _prompt_model(
+                m,
                 user_content,
                 system=system or None,
                 schema=response_model,
-                stream=False,
                 **options,
             )
-            return response_model.model_validate_json(response.text())
         else:
             # Fallback: ask for JSON in the prompt and parse manually
             json_prompt = (
                 f"{user_content}\n\n"
                 f"Respond with ONLY valid JSON matching this schema:\n"
-                f"{json.dumps(response_model.model_json_schema(), indent=2)}"
+                f"{json.dumps(schema, indent=2)}"
             )
-            response = m.prompt(
-                json_prompt,
-                system=system or None,
-                stream=False,
-                **options,
+            call["schema_fallback"] = True
+            call["prompt_chars"] = len(system or "") + len(json_prompt)
+            text, call["wait_ms"] = _prompt_model(
+                m, json_prompt, system=system or None, **options
             )
-            return response_model.model_validate_json(response.text())
+        call["response_chars"] = len(text)
+        try:
+            decision = response_model.model_validate_json(text)
+        except ValidationError:
+            call["validation_failed"] = True
+            raise
+        if key is not None:
+            _response_cache.put(key, m.model_id, text)
+        return decision
     except Exception as exc:
+        call["error"] = str(exc)
         print(f"Error during one_shot_json: {exc}")
         raise
+    finally:
+        _finish_call(call)
+
+
+async def one_shot_async(
+    system: str,
+    context: str,
+    prompt: str,
+    model: str = None,
+    seed: int = None,
+    context_window: int = None,
+    call_type: str = None,
+    agent_id: str = None,
+    tick: int = None,
+) -> str:
+    """Async one_shot: runs on the LLM worker threads, so many agents' calls
+    can be awaited together (asyncio.gather) within the shared limits."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _llm_executor(),
+        partial(
+            one_shot,
+            system,
+            context,
+            prompt,
+            model,
+            seed,
+            context_window,
+            call_type=call_type,
+            agent_id=agent_id,
+            tick=tick,
+        ),
+    )
+
+
+async def one_shot_json_async(
+    system: str,
+    context: str,
+    prompt: str,
+    response_model: Type[T],
+    model: str = None,
+    seed: int = None,
+    context_window: int = None,
+    call_type: str = None,
+    agent_id: str = None,
+    tick: int = None,
+) -> T:
+    """Async one_shot_json (same cache, limits and errors as the sync call)."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _llm_executor(),
+        partial(
+            one_shot_json,
+            system,
+            context,
+            prompt,
+            response_model,
+            model,
+            seed,
+            context_window,
+            call_type=call_type,
+            agent_id=agent_id,
+            tick=tick,
+        ),
+    )
 
 
 def load_prompt(prompt_name: str) -> str:
@@ -0,0 +1,211 @@
+"""Deterministic offline stand-in for an llm model.
+
+Selected with the model name "stub", optionally followed by options, e.g.
+--model stub or llm.model: "stub:latency_ms=200,failure_rate=0.05". The stub
+returns schema-valid ProposeDecision, FeedbackDecision, ReviseDecision,
+PreferenceRanking and StakeAction JSON (and lorem prose for free-text calls)
+derived from the request seed and a hash of the prompt, so the full LLM code
+path - context building, JSON parsing, memory updates - runs without Ollama
+or any network, and identical requests always get identical responses.
+"""
+
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+from utils import generate_lorem_content
+
+STUB_MODEL_NAME = "stub"
+
+_PROPOSAL_MENTION = re.compile(r"Proposal[ :](\d+)")
+_OWN_PROPOSAL = re.compile(r"Proposal (\d+) \(Your Proposal\)")
+_AGENT_ID = re.compile(r"^# Agent: (\S+)", re.M)
+_BALANCE = re.compile(r"(?:Remaining CP:\*\*|## Credit Balance\n)\s*(\d+)")
+_OWN_STAKE_ROW = re.compile(r"^\|\s*\d+\s*\|\s*\S+ \(you\)\s*\|\s*(\d+)\s*\|\s*(\d+)\s*\|", re.M)
+_LEADERBOARD_ROW = re.compile(r"^\|\s*(\d+)\s*(\(you\))?\s*\|\s*\d+\s*\|", re.M)
+
+
+class StubModelError(RuntimeError):
+    """Injected failure (failure_rate) from the stub model."""
+
+
+def is_stub_model(name: Optional[str]) -> bool:
+    return bool(name) and name.split(":", 1)[0] == STUB_MODEL_NAME
+
+
+class StubResponse:
+    """Minimal llm.Response stand-in."""
+
+    def __init__(self, text: str):
+        self._text = text
+
+    def text(self) -> str:
+        return self._text
+
+
+class StubModel:
+    """Duck-typed llm.Model with configurable latency and failure rate."""
+
+    supports_schema = True
+
+    class Options(BaseModel):
+        seed: Optional[int] = None
+        num_ctx: Optional[int] = None
+
+    def __init__(self, latency_ms: float = 0.0, failure_rate: float = 0.0):
+        self.latency_ms = latency_ms
+        self.failure_rate = failure_rate
+        self.model_id = STUB_MODEL_NAME
+        self.calls = 0
+        self.failures = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_name(cls, name: str) -> "StubModel":
+        """Parse "stub[:latency_ms=N,failure_rate=F]"."""
+        options = {}
+        _, _, spec = name.partition(":")
+        for item in filter(None, spec.split(",")):
+            key, _, value = item.partition("=")
+            if key not in ("latency_ms", "failure_rate"):
+                raise ValueError(f"Unknown stub model option: {key!r}")
+            options[key] = float(value)
+        return cls(**options)
+
+    def prompt(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        schema=None,
+        stream: bool = False,
+        seed: Optional[int] = None,
+        **options,
+    ) -> StubResponse:
+        digest = hashlib.sha256(f"{seed}\0{system}\0{prompt}".encode("utf-8")).digest()
+        rng = random.Random(int.from_bytes(digest[:8], "big"))
+        # Separate stream, so latency and failure settings never change responses
+        fault_rng = random.Random(int.from_bytes(digest[8:16], "big"))
+
+        if self.latency_ms:
+            # +-50% jitter so concurrent calls do not complete in lockstep
+            time.sleep(self.latency_ms * fault_rng.uniform(0.5, 1.5) / 1000)
+        failed = fault_rng.random() < self.failure_rate
+        with self._lock:
+            self.calls += 1
+            self.failures += failed
+        if failed:
+            raise StubModelError("stub model: injected failure")
+
+        if schema is None:
+            return StubResponse(generate_lorem_content(rng, rng.randint(40, 80)))
+        title = (
+            schema.get("title")
+            if isinstance(schema, dict)
+            else schema.model_json_schema().get("title")
+        )
+        generator = _GENERATORS.get(title)
+        if generator is None:
+            raise StubModelError(f"stub model: no generator for schema {title!r}")
+        return StubResponse(json.dumps(generator(rng, prompt)))
+
+
+def _proposal_ids(prompt: str) -> List[int]:
+    return sorted({int(pid) for pid in _PROPOSAL_MENTION.findall(prompt)} - {0})
+
+
+def _own_proposal(prompt: str) -> Optional[int]:
+    match = _OWN_PROPOSAL.search(prompt)
+    if match:
+        return int(match.group(1))
+    agent = _AGENT_ID.search(prompt)
+    if agent:
+        authored = re.search(rf"Proposal (\d+) by {re.escape(agent.group(1))}\b", prompt)
+        if authored:
+            return int(authored.group(1))
+    return None
+
+
+def _propose(rng: random.Random, prompt: str) -> Dict:
+    action = rng.choices(["propose", "signal_ready", "wait"], weights=[6, 3, 1])[0]
+    return {"action": action, "reasoning": generate_lorem_content(rng, 12)}
+
+
+def _feedback(rng: random.Random, prompt: str) -> Dict:
+    own = _own_proposal(prompt)
+    targets = [pid for pid in _proposal_ids(prompt) if pid != own]
+    if not targets or rng.random() < 0.2:
+        return {"action": "wait", "target_proposals": [], "reasoning": "stub: waiting"}
+    chosen = rng.sample(targets, rng.randint(1, min(3, len(targets))))
+    return {
+        "action": "provide_feedback",
+        "target_proposals": chosen,
+        "reasoning": generate_lorem_content(rng, 12),
+    }
+
+
+def _revise(rng: random.Random, prompt: str) -> Dict:
+    action = "revise" if rng.random() < 0.4 else "signal_ready"
+    return {"action": action, "reasoning": generate_lorem_content(rng, 12)}
+
+
+def _preferences(rng: random.Random, prompt: str) -> Dict:
+    proposal_ids = _proposal_ids(prompt)
+    rng.shuffle(proposal_ids)
+    count = len(proposal_ids)
+    return {
+        "preferences": [
+            {
+                "proposal_id": pid,
+                "preference_score": round(1 - rank / (count + 1), 2),
+                "rank": rank,
+                "reasoning": generate_lorem_content(rng, 8),
+            }
+            for rank, pid in enumerate(proposal_ids, start=1)
+        ],
+        "self_proposal_id": _own_proposal(prompt),
+        "strategy_summary": generate_lorem_content(rng, 10),
+    }
+
+
+def _stake_action(rng: random.Random, prompt: str) -> Dict:
+    balance_match = _BALANCE.search(prompt)
+    balance = int(balance_match.group(1)) if balance_match else 0
+    leaderboard = [int(pid) for pid, _ in _LEADERBOARD_ROW.findall(prompt)]
+    own_stakes = [(int(pid), int(cp)) for pid, cp in _OWN_STAKE_ROW.findall(prompt)]
+    reasoning = generate_lorem_content(rng, 12)
+
+    roll = rng.random()
+    if leaderboard and balance > 0 and roll < 0.6:
+        return {
+            "action": "stake",
+            "proposal_id": rng.choice(leaderboard),
+            "cp_amount": max(1, int(balance * rng.uniform(0.1, 0.5))),
+            "reasoning": reasoning,
+        }
+    if leaderboard and own_stakes and roll < 0.8:
+        source_id, cp = rng.choice(own_stakes)
+        targets = [pid for pid in leaderboard if pid != source_id]
+        if targets:
+            return {
+                "action": "switch_stake",
+                "proposal_id": rng.choice(targets),
+                "cp_amount": cp,
+                "source_proposal_id": source_id,
+                "reasoning": reasoning,
+            }
+    return {"action": "wait", "proposal_id": 0, "cp_amount": 0, "reasoning": reasoning}
+
+
+_GENERATORS = {
+    "ProposeDecision": _propose,
+    "FeedbackDecision": _feedback,
+    "ReviseDecision": _revise,
+    "PreferenceRanking": _preferences,
+    "StakeAction": _stake_action,
+}
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+LLM Call Telemetry Summary
+
+Summarizes the llm_calls table written by llm_provider for every one_shot /
+one_shot_json call: call counts, p50/p95/max model latency, time spent
+waiting for call slots, cache hits, schema fallbacks, validation failures and
+errors, grouped per phase (or per call type / agent).
+
+Latency percentiles cover model calls only; cache hits are counted separately.
+Batch runs are read from every shard (db/<sim_id>-s<N>.sqlite3) as well.
+
+Usage:
+    python3 llm_telemetry.py <simulation_id> [--by phase|call_type|agent_id]
+"""
+
+import argparse
+import math
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+DB_DIR = Path(__file__).parent / "db"
+GROUPINGS = ("phase", "call_type", "agent_id")
+
+
+def database_paths(sim_id: str) -> List[Path]:
+    """The run's database plus any batch shards."""
+    paths = [DB_DIR / f"{sim_id}.sqlite3"]
+    paths.extend(sorted(DB_DIR.glob(f"{sim_id}-s*.sqlite3")))
+    return [path for path in paths if path.exists()]
+
+
+def load_calls(paths: List[Path]) -> List[Dict]:
+    """All llm_calls rows from the given databases."""
+    calls = []
+    for path in paths:
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        conn.row_factory = sqlite3.Row
+        try:
+            has_table = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'llm_calls'"
+            ).fetchone()
+            if has_table:
+                calls.extend(dict(row) for row in conn.execute("SELECT * FROM llm_calls"))
+        finally:
+            conn.close()
+    return calls
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an unsorted list (0.0 for no values)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(fraction * len(ordered))) - 1]
+
+
+def summarize(calls: List[Dict], by: str) -> List[Dict]:
+    """Per-group call counts and latency statistics."""
+    groups: Dict[str, List[Dict]] = {}
+    for call in calls:
+        groups.setdefault(call[by] or "-", []).append(call)
+
+    rows = []
+    for group, group_calls in groups.items():
+        latencies = [c["latency_ms"] for c in group_calls if not c["cache_hit"]]
+        rows.append(
+            {
+                "group": group,
+                "calls": len(group_calls),
+                "cache_hits": sum(1 for c in group_calls if c["cache_hit"]),
+                "p50_ms": percentile(latencies, 0.50),
+                "p95_ms": percentile(latencies, 0.95),
+                "max_ms": max(latencies, default=0.0),
+                "model_s": sum(latencies) / 1000,
+                "wait_s": sum(c["wait_ms"] or 0 for c in group_calls) / 1000,
+                "fallbacks": sum(1 for c in group_calls if c["schema_fallback"]),
+                "invalid": sum(1 for c in group_calls if c["validation_failed"]),
+                "errors": sum(1 for c in group_calls if c["error"]),
+            }
+        )
+    return sorted(rows, key=lambda row: row["model_s"], reverse=True)
+
+
+def print_summary(rows: List[Dict], by: str):
+    header = (
+        f"{by:<18} {'calls':>7} {'cached':>7} {'p50 ms':>9} {'p95 ms':>9} "
+        f"{'max ms':>9} {'model s':>9} {'wait s':>8} {'fallbk':>6} {'invalid':>7} {'errors':>6}"
+    )
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        print(
+            f"{row['group']:<18} {row['calls']:>7} {row['cache_hits']:>7} "
+            f"{row['p50_ms']:>9.1f} {row['p95_ms']:>9.1f} {row['max_ms']:>9.1f} "
+            f"{row['model_s']:>9.2f} {row['wait_s']:>8.2f} {row['fallbacks']:>6} "
+            f"{row['invalid']:>7} {row['errors']:>6}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize LLM call telemetry")
+    parser.add_argument("sim_id", help="Simulation ID (db/<sim_id>.sqlite3)")
+    parser.add_argument(
+        "--by", choices=GROUPINGS, default="phase", help="Grouping (default: phase)"
+    )
+    args = parser.parse_args()
+
+    paths = database_paths(args.sim_id)
+    if not paths:
+        print(f"❌ No database found for simulation {args.sim_id} in {DB_DIR}")
+        sys.exit(1)
+
+    calls = load_calls(paths)
+    print(f"LLM CALL TELEMETRY - Simulation: {args.sim_id} ({len(paths)} database(s))")
+    print("=" * 80)
+    if not calls:
+        print("❌ No llm_calls rows recorded (rule-based run, or a pre-telemetry database)")
+        return
+
+    print_summary(summarize(calls, args.by), args.by)
+    model_s = sum(c["latency_ms"] for c in calls if not c["cache_hit"]) / 1000
+    hits = sum(1 for c in calls if c["cache_hit"])
+    print(f"\nTotal: {len(calls)} calls, {hits} cache hits, {model_s:.2f}s in model calls")
+
+
+if __name__ == "__main__":
+    main()
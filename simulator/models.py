@@ -1,26 +1,228 @@
 """Core data models for the roundtable consensus simulation."""
+import importlib
 import random
-import uuid
-from typing import Any, Dict, List, Literal, Optional
+import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, ClassVar, Dict, Iterator, List, Literal, Optional, Tuple
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
+from conviction import ColumnarStakeLedger, ConvictionAggregates
 # Delayed import to avoid circular dependency
 from simlog import log_event, logger
 
 
-class StakeRecord(BaseModel):
-    """Record of a staking transaction in the consensus system."""
-    """Atomic stake ledger entry as defined in staking-and-conviction-notes.md"""
+STAKE_STATUSES = ("active", "closed", "burned")
 
-    stake_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+# Module providing handle_signal(agent, payload) for each agent_policy; its
+# QUIESCENT_WHEN_READY says whether agents stop acting once they signal ready
+AGENT_POLICY_MODULES = {"llm": "automoton", "rules": "rule_agent"}
+
+
+def agent_policy_module(policy: str):
+    """Handler module for an agent policy (imported here to avoid circular imports)."""
+    return importlib.import_module(AGENT_POLICY_MODULES[policy])
+
+
+class StakeRecordModel(BaseModel):
+    """Pydantic view of a StakeRecord for the API/serialization edge."""
+
+    stake_id: Optional[int] = None
     agent_id: str
     proposal_id: int
     cp: int = Field(ge=1)
     initial_tick: int = Field(ge=1)
     status: Literal["active", "closed", "burned"] = "active"
     issue_id: str
-    mandatory: bool = False  # True for self-stakes when submitting proposals
+    mandatory: bool = False
+
+
+class StakeRecord:
+    """Atomic stake ledger entry as defined in staking-and-conviction-notes.md
+
+    A slotted record rather than a pydantic model: stake-heavy ticks create and
+    scan many of these. stake_id is an integer assigned by RoundtableState.add_stake
+    from a per-state counter; agent and issue ids are interned. Use
+    StakeRecordModel (via model_validate/model_dump) where validation or a
+    schema is needed.
+    """
+
+    __slots__ = (
+        "stake_id",
+        "agent_id",
+        "proposal_id",
+        "cp",
+        "initial_tick",
+        "status",
+        "issue_id",
+        "mandatory",
+    )
+
+    def __init__(
+        self,
+        agent_id: str,
+        proposal_id: int,
+        cp: int,
+        initial_tick: int,
+        issue_id: str,
+        status: str = "active",
+        mandatory: bool = False,  # True for self-stakes when submitting proposals
+        stake_id: Optional[int] = None,
+    ):
+        if cp < 1:
+            raise ValueError(f"Stake cp must be >= 1, got {cp}")
+        if initial_tick < 1:
+            raise ValueError(f"Stake initial_tick must be >= 1, got {initial_tick}")
+        if status not in STAKE_STATUSES:
+            raise ValueError(f"Invalid stake status {status!r}")
+        self.stake_id = stake_id
+        self.agent_id = sys.intern(agent_id)
+        self.proposal_id = int(proposal_id)
+        self.cp = cp
+        self.initial_tick = initial_tick
+        self.status = status
+        self.issue_id = sys.intern(issue_id)
+        self.mandatory = mandatory
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"StakeRecord({fields})"
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+        self.agent_id = sys.intern(self.agent_id)
+        self.issue_id = sys.intern(self.issue_id)
+
+    def model_dump(self) -> Dict[str, Any]:
+        """Plain dict of the record's fields (same shape as StakeRecordModel)."""
+        return {
+            "stake_id": self.stake_id,
+            "agent_id": self.agent_id,
+            "proposal_id": self.proposal_id,
+            "cp": self.cp,
+            "initial_tick": self.initial_tick,
+            "status": self.status,
+            "issue_id": self.issue_id,
+            "mandatory": self.mandatory,
+        }
+
+    @classmethod
+    def model_validate(cls, data: Any) -> "StakeRecord":
+        """Validate external data through StakeRecordModel and build a record."""
+        if isinstance(data, cls):
+            return data
+        return cls(**StakeRecordModel.model_validate(data).model_dump())
+
+
+class StakeLedgerIndex:
+    """Secondary indexes over the stake ledger so lookups cost O(result size).
+
+    Each named index maps a key derived from a StakeRecord to a bucket of
+    stake_id -> StakeRecord. Buckets are dicts, so membership updates are O(1);
+    get() returns records in ledger order, re-sorting a bucket only after an
+    update moved an older record into it. A key function returning None leaves
+    the record out of that index (used for the active-only views).
+    """
+
+    _KEY_FUNCS = {
+        "agent": lambda s: s.agent_id,
+        "proposal": lambda s: s.proposal_id,
+        "agent_proposal": lambda s: (s.agent_id, s.proposal_id),
+        "status": lambda s: s.status,
+        "issue": lambda s: s.issue_id,
+        "active_agent": lambda s: s.agent_id if s.status == "active" else None,
+        "active_proposal": lambda s: s.proposal_id if s.status == "active" else None,
+        "active_agent_proposal": lambda s: (
+            (s.agent_id, s.proposal_id) if s.status == "active" else None
+        ),
+        "active_issue": lambda s: s.issue_id if s.status == "active" else None,
+        "active_mandatory": lambda s: (
+            True if s.status == "active" and s.mandatory else None
+        ),
+    }
+
+    def __init__(self):
+        self._buckets: Dict[str, Dict[Any, Dict[str, StakeRecord]]] = {
+            name: {} for name in self._KEY_FUNCS
+        }
+        self._positions: Dict[int, int] = {}  # stake_id -> ledger position
+        self._unsorted: set = set()  # (index name, key) of buckets out of ledger order
+
+    def _keys(self, stake: StakeRecord) -> Dict[str, Any]:
+        return {name: key_func(stake) for name, key_func in self._KEY_FUNCS.items()}
+
+    def add(self, stake: StakeRecord):
+        """Index a new ledger record."""
+        self._positions.setdefault(stake.stake_id, len(self._positions))
+        self._insert(stake, self._keys(stake))
+
+    def remove(self, stake: StakeRecord):
+        """Drop a record from every index."""
+        self._discard(stake, self._keys(stake))
+
+    def update(self, stake: StakeRecord, **changes):
+        """Apply field changes to a record and move it between affected buckets only."""
+        old_keys = self._keys(stake)
+        for field, value in changes.items():
+            setattr(stake, field, value)
+        new_keys = self._keys(stake)
+
+        moved = [name for name in old_keys if old_keys[name] != new_keys[name]]
+        self._discard(stake, {name: old_keys[name] for name in moved})
+        self._insert(stake, {name: new_keys[name] for name in moved})
+
+    def position(self, stake_id: int) -> Optional[int]:
+        """Ledger position of an indexed stake, or None."""
+        return self._positions.get(stake_id)
+
+    def get(self, index_name: str, key: Any) -> List[StakeRecord]:
+        """Return the records filed under key in the named index."""
+        bucket = self._buckets[index_name].get(key)
+        if not bucket:
+            return []
+        if (index_name, key) in self._unsorted:
+            self._unsorted.discard((index_name, key))
+            position = self._positions.__getitem__
+            bucket = self._buckets[index_name][key] = dict(
+                sorted(bucket.items(), key=lambda item: position(item[0]))
+            )
+        return list(bucket.values())
+
+    def rebuild(self, stakes: List[StakeRecord]):
+        """Re-index from scratch, e.g. after the ledger was replaced wholesale."""
+        for buckets in self._buckets.values():
+            buckets.clear()
+        self._positions.clear()
+        self._unsorted.clear()
+        for stake in stakes:
+            self.add(stake)
+
+    def _insert(self, stake: StakeRecord, keys: Dict[str, Any]):
+        for name, key in keys.items():
+            if key is None:
+                continue
+            bucket = self._buckets[name].setdefault(key, {})
+            position = self._positions[stake.stake_id]
+            if bucket and self._positions[next(reversed(bucket))] > position:
+                self._unsorted.add((name, key))
+            bucket[stake.stake_id] = stake
+
+    def _discard(self, stake: StakeRecord, keys: Dict[str, Any]):
+        for name, key in keys.items():
+            if key is None:
+                continue
+            bucket = self._buckets[name].get(key)
+            if bucket is not None:
+                bucket.pop(stake.stake_id, None)
+                if not bucket:
+                    del self._buckets[name][key]
+                    self._unsorted.discard((name, key))
 
 
 class Proposal(BaseModel):
@@ -57,13 +259,13 @@ class AgentActor(BaseModel):
     rng: Optional[random.Random] = None
     memory: Dict[str, Any] = {}
     latest_proposal_id: Optional[int] = None  # Track agent's current proposal
+    # on_signal waits on I/O (e.g. an HTTP runner): always fanned out per tick
+    io_bound_signals: ClassVar[bool] = False
 
     def on_signal(self, payload: Dict[str, Any]) -> Optional[dict]:
-        """Handle signals sent to the agent."""
-        # Import here to avoid circular dependency
-        from automoton import handle_signal
-
-        return handle_signal(self, payload)
+        """Handle signals sent to the agent using the configured agent policy."""
+        policy = getattr(payload.get("config"), "agent_policy", "llm")
+        return agent_policy_module(policy).handle_signal(self, payload)
 
     def clone(self) -> "AgentActor":
         new_rng = random.Random(self.seed) if self.seed is not None else None
@@ -115,24 +317,81 @@ class Action(BaseModel):
 
 
 class ActionQueue(BaseModel):
-    """Queue for managing agent actions during consensus phases."""
+    """Queue for managing agent actions during consensus phases.
+
+    Each Controller owns one; submit and drain are safe to call from any thread.
+    """
     queue: List[Action] = []
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _local: threading.local = PrivateAttr(default_factory=threading.local)
 
     def submit(self, action: Action):
-        """Add an action to the queue."""
-        self.queue.append(action)
+        """Add an action to the queue (or to this thread's capture buffer)."""
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is not None:
+            buffer.append(action)
+            return
+        with self._lock:
+            self.queue.append(action)
         logger.debug(f"Action submitted: {action.type} by {action.agent_id}")
 
+    @contextmanager
+    def activate(self):
+        """Make this the queue returned by current_action_queue() in this context."""
+        token = _active_action_queue.set(self)
+        try:
+            yield self
+        finally:
+            _active_action_queue.reset(token)
+
+    @contextmanager
+    def capture(self):
+        """Collect actions submitted on this thread instead of queueing them.
+
+        Used by concurrent agent dispatch so each agent's actions can be
+        submitted afterwards in a stable agent order.
+        """
+        previous = getattr(self._local, "buffer", None)
+        self._local.buffer = captured = []
+        try:
+            yield captured
+        finally:
+            self._local.buffer = previous
+
+    def pending_agents(self, action_type: str) -> set:
+        """IDs of agents with an action of this type waiting in the queue."""
+        with self._lock:
+            return {action.agent_id for action in self.queue if action.type == action_type}
+
     def drain(self) -> List[Action]:
         """Remove and return all actions from the queue."""
-        drained = self.queue.copy()
-        self.queue.clear()
+        with self._lock:
+            drained = self.queue.copy()
+            self.queue.clear()
         return drained
 
+    def __getstate__(self):
+        # Locks and thread-local buffers are not picklable; fresh ones on load
+        state = super().__getstate__()
+        state["__pydantic_private__"] = None
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._lock = threading.Lock()
+        self._local = threading.local()
 
-# Global ACTION_QUEUE instance
+
+# Default queue for agents signalled outside any controller
 ACTION_QUEUE = ActionQueue()
 
+_active_action_queue: ContextVar[ActionQueue] = ContextVar("active_action_queue")
+
+
+def current_action_queue() -> ActionQueue:
+    """Queue of the controller ticking in this context (ACTION_QUEUE if none)."""
+    return _active_action_queue.get(ACTION_QUEUE)
+
 
 class GlobalConfig(BaseModel):
     """Global configuration parameters for consensus simulation."""
@@ -145,6 +404,7 @@ class GlobalConfig(BaseModel):
     revision_cycles: int = Field(ge=1, lt=5)
     conviction_params: Dict[str, float]
     agent_pool: AgentPool
+    conviction_backend: Literal["incremental", "numpy"] = "incremental"
 
     # Phase timeout configurations
     propose_phase_ticks: int = Field(default=3, ge=1)
@@ -152,6 +412,13 @@ class GlobalConfig(BaseModel):
     revise_phase_ticks: int = Field(default=3, ge=1)
     stake_phase_ticks: int = Field(default=5, ge=1)
     finalize_phase_ticks: int = Field(default=3, ge=1)
+    # Skip the remaining ticks of a phase once every agent is ready (only for
+    # policies whose agents then stop acting, i.e. "rules")
+    fast_forward_idle_ticks: bool = False
+    # Agents signalled at once per phase tick (1 = one after another)
+    max_concurrent_agents: int = Field(default=1, ge=1)
+    # Agent decision policy: "llm" (automoton) or "rules" (rule_agent)
+    agent_policy: Literal["llm", "rules"] = "llm"
 
     # LLM configuration
     llm_config: Dict[str, Any] = Field(default_factory=dict)
@@ -159,6 +426,9 @@ class GlobalConfig(BaseModel):
     # Debug configuration
     debug_config: Dict[str, Any] = Field(default_factory=dict)
 
+    # State snapshot configuration (mode: full|delta, keyframe_interval)
+    snapshot_config: Dict[str, Any] = Field(default_factory=dict)
+
 
 class RunConfig(BaseModel):
     """Configuration for a specific consensus simulation run."""
@@ -190,6 +460,7 @@ class UnifiedConfig(BaseModel):
     revision_cycles: int = Field(ge=1, lt=5)
     conviction_params: Dict[str, float]
     agent_pool: AgentPool
+    conviction_backend: Literal["incremental", "numpy"] = "incremental"
 
     # Phase timeout configurations
     propose_phase_ticks: int = Field(default=3, ge=1)
@@ -197,10 +468,20 @@ class UnifiedConfig(BaseModel):
     revise_phase_ticks: int = Field(default=3, ge=1)
     stake_phase_ticks: int = Field(default=5, ge=1)
     finalize_phase_ticks: int = Field(default=3, ge=1)
+    # Skip the remaining ticks of a phase once every agent is ready (only for
+    # policies whose agents then stop acting, i.e. "rules")
+    fast_forward_idle_ticks: bool = False
+    # Agents signalled at once per phase tick (1 = one after another)
+    max_concurrent_agents: int = Field(default=1, ge=1)
+    # Agent decision policy: "llm" (automoton) or "rules" (rule_agent)
+    agent_policy: Literal["llm", "rules"] = "llm"
 
     # LLM configuration
     llm_config: Dict[str, Any] = Field(default_factory=dict)
 
+    # State snapshot configuration (mode: full|delta, keyframe_interval)
+    snapshot_config: Dict[str, Any] = Field(default_factory=dict)
+
     # From RunConfig - Simulation-specific settings
     seed: int
     issue_id: str
@@ -228,13 +509,18 @@ class UnifiedConfig(BaseModel):
             revision_cycles=global_config.revision_cycles,
             conviction_params=global_config.conviction_params,
             agent_pool=global_config.agent_pool,
+            conviction_backend=global_config.conviction_backend,
             # Phase timeout configurations
             propose_phase_ticks=global_config.propose_phase_ticks,
             feedback_phase_ticks=global_config.feedback_phase_ticks,
             revise_phase_ticks=global_config.revise_phase_ticks,
             stake_phase_ticks=global_config.stake_phase_ticks,
             finalize_phase_ticks=global_config.finalize_phase_ticks,
+            fast_forward_idle_ticks=global_config.fast_forward_idle_ticks,
+            max_concurrent_agents=global_config.max_concurrent_agents,
+            agent_policy=global_config.agent_policy,
             llm_config=global_config.llm_config,
+            snapshot_config=global_config.snapshot_config,
             # RunConfig fields
             seed=run_config.seed,
             issue_id=run_config.issue_id,
@@ -266,6 +552,8 @@ class RoundtableState(BaseModel):
     stake_ledger: List[StakeRecord] = (
         []
     )  # Atomic stake records - all conviction calculated from this
+    stake_counter: int = 1  # Next available stake ID
+    conviction_backend: Literal["incremental", "numpy"] = "incremental"
 
     # Issue and proposal state
     current_issue: Optional["Issue"] = None
@@ -275,44 +563,201 @@ class RoundtableState(BaseModel):
     # Phase execution ledger
     execution_ledger: List[Dict] = []  # Record of all state changes
 
+    # Secondary indexes over stake_ledger, kept in sync by the mutators below
+    _stake_index: StakeLedgerIndex = PrivateAttr(default_factory=StakeLedgerIndex)
+    # Running per-proposal conviction totals (ConvictionAggregates or ColumnarStakeLedger)
+    _conviction: Any = PrivateAttr(default=None)
+    # Stakes added or modified since the last snapshot, for delta snapshots
+    _changed_stakes: Dict[int, StakeRecord] = PrivateAttr(default_factory=dict)
+    # stake_id of every stake added or modified, in order; change N (1-based)
+    # is entry N - 1 (see stake_changes_after)
+    _stake_changes: List[int] = PrivateAttr(default_factory=list)
+    # stake_id -> number of its latest change (derived from _stake_changes)
+    _latest_stake_change: Dict[int, int] = PrivateAttr(default_factory=dict)
+
     class Config:
         arbitrary_types_allowed = True
 
+    @field_validator("stake_ledger", mode="before")
+    @classmethod
+    def _coerce_stake_records(cls, value: Any) -> Any:
+        """Accept serialized stake dicts at the model boundary."""
+        if isinstance(value, list):
+            return [StakeRecord.model_validate(item) for item in value]
+        return value
+
+    def model_post_init(self, __context: Any) -> None:
+        """Index any stakes the state was constructed with."""
+        if self.conviction_backend == "numpy":
+            self._conviction = ColumnarStakeLedger()
+        else:
+            self._conviction = ConvictionAggregates()
+        for stake in self.stake_ledger:
+            if stake.stake_id is None:
+                stake.stake_id = self.stake_counter
+            self.stake_counter = max(self.stake_counter, stake.stake_id + 1)
+        self.rebuild_stake_index()
+        for stake in self.stake_ledger:
+            self._journal_stake(stake)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The stake index, conviction totals and latest changes are derived, so
+        # pickles leave them out
+        state = super().__getstate__()
+        private = dict(state["__pydantic_private__"])
+        del private["_stake_index"], private["_conviction"], private["_latest_stake_change"]
+        return {**state, "__pydantic_private__": private}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        super().__setstate__(state)
+        self._stake_index = StakeLedgerIndex()
+        if self.conviction_backend == "numpy":
+            self._conviction = ColumnarStakeLedger()
+        else:
+            self._conviction = ConvictionAggregates()
+        self.rebuild_stake_index()
+        self._latest_stake_change = {
+            stake_id: seq for seq, stake_id in enumerate(self._stake_changes, 1)
+        }
+
+    def add_stake(self, stake: StakeRecord):
+        """Assign the next stake ID, append the record to the ledger and index it."""
+        if stake.stake_id is None:
+            stake.stake_id = self.stake_counter
+            self.stake_counter += 1
+        self.stake_ledger.append(stake)
+        self._stake_index.add(stake)
+        self._conviction.add(stake)
+        self._changed_stakes[stake.stake_id] = stake
+        self._journal_stake(stake)
+
+    def update_stake(self, stake: StakeRecord, **changes):
+        """Change fields (status, proposal_id, cp, initial_tick, ...) on a ledger record."""
+        self._conviction.remove(stake)
+        self._stake_index.update(stake, **changes)
+        self._conviction.add(stake)
+        self._changed_stakes[stake.stake_id] = stake
+        self._journal_stake(stake)
+
+    def _journal_stake(self, stake: StakeRecord):
+        self._stake_changes.append(stake.stake_id)
+        self._latest_stake_change[stake.stake_id] = len(self._stake_changes)
+
+    def rebuild_stake_index(self):
+        """Re-index the ledger after it was modified without the mutators above."""
+        self._stake_index.rebuild(self.stake_ledger)
+        self._conviction.rebuild(self.stake_ledger)
+
+    def get_proposal_convictions(
+        self,
+        issue_id: str,
+        conviction_params: Dict[str, float],
+        mandatory_anchor_tick: Optional[int] = None,
+        tick: Optional[int] = None,
+    ) -> Dict[int, Dict[str, Any]]:
+        """Per-proposal conviction leaderboard for an issue, from running aggregates."""
+        return self._conviction.leaderboard(
+            issue_id,
+            self.tick if tick is None else tick,
+            conviction_params,
+            mandatory_anchor_tick,
+        )
+
+    def pop_changed_stakes(self) -> List[StakeRecord]:
+        """Return stakes added or modified since the last call, then reset the set."""
+        changed = list(self._changed_stakes.values())
+        self._changed_stakes.clear()
+        return changed
+
+    @property
+    def stake_changes(self) -> List[int]:
+        """stake_id of every stake added or modified, in order (append-only)."""
+        return self._stake_changes
+
+    @property
+    def stake_change_seq(self) -> int:
+        """Number of the latest stake change (0 before any); a cursor for stake_changes_after."""
+        return len(self._stake_changes)
+
+    def stake_changes_after(self, seq: int) -> Iterator[Tuple[int, StakeRecord]]:
+        """(change number, stake) for stakes whose latest change came after seq, oldest first.
+
+        Costs O(changes after seq): earlier changes of a stake changed again
+        later are skipped as they are reached.
+        """
+        changes = self._stake_changes
+        latest = self._latest_stake_change
+        for position in range(seq, len(changes)):
+            stake_id = changes[position]
+            if latest[stake_id] == position + 1:
+                yield position + 1, self.get_stake(stake_id)
+
+    def stakes_changed_since(self, seq: int) -> List[StakeRecord]:
+        """Stakes added or modified after change seq, in order of their latest change."""
+        return [stake for _, stake in self.stake_changes_after(seq)]
+
+    def get_stake(self, stake_id: int) -> Optional[StakeRecord]:
+        """The ledger record with this stake_id, or None."""
+        position = self.stake_position(stake_id)
+        return None if position is None else self.stake_ledger[position]
+
+    def stake_position(self, stake_id: int) -> Optional[int]:
+        """Position in stake_ledger of the record with this stake_id, or None."""
+        return self._stake_index.position(stake_id)
+
+    def get_stakes_by_agent(self, agent_id: str) -> List[StakeRecord]:
+        """Get all stakes (any status) placed by an agent."""
+        return self._stake_index.get("agent", agent_id)
+
+    def get_stakes_for_proposal(self, proposal_id: int) -> List[StakeRecord]:
+        """Get all stakes (any status) placed on a proposal."""
+        return self._stake_index.get("proposal", proposal_id)
+
+    def get_stakes_by_agent_on_proposal(
+        self, agent_id: str, proposal_id: int
+    ) -> List[StakeRecord]:
+        """Get all stakes (any status) an agent placed on a proposal."""
+        return self._stake_index.get("agent_proposal", (agent_id, proposal_id))
+
+    def get_stakes_by_status(self, status: str) -> List[StakeRecord]:
+        """Get all stakes with the given status."""
+        return self._stake_index.get("status", status)
+
+    def get_active_stakes_for_issue(self, issue_id: str) -> List[StakeRecord]:
+        """Get all active stakes for an issue."""
+        return self._stake_index.get("active_issue", issue_id)
+
     def get_active_stakes_by_agent(self, agent_id: str) -> List[StakeRecord]:
         """Get all active stakes for an agent."""
-        return [
-            stake
-            for stake in self.stake_ledger
-            if stake.agent_id == agent_id and stake.status == "active"
-        ]
+        return self._stake_index.get("active_agent", agent_id)
 
     def get_active_stakes_for_proposal(self, proposal_id: int) -> List[StakeRecord]:
         """Get all active stakes for a proposal."""
-        return [
-            stake
-            for stake in self.stake_ledger
-            if stake.proposal_id == proposal_id and stake.status == "active"
-        ]
+        return self._stake_index.get("active_proposal", proposal_id)
 
     def get_agent_stake_on_proposal(
         self, agent_id: str, proposal_id: int
     ) -> List[StakeRecord]:
         """Get agent's active stakes on a specific proposal."""
-        return [
-            stake
-            for stake in self.stake_ledger
-            if stake.agent_id == agent_id
-            and stake.proposal_id == proposal_id
-            and stake.status == "active"
-        ]
+        return self._stake_index.get("active_agent_proposal", (agent_id, proposal_id))
 
     def get_mandatory_stakes(self) -> List[StakeRecord]:
         """Get all mandatory stakes."""
-        return [
-            stake
-            for stake in self.stake_ledger
-            if stake.mandatory and stake.status == "active"
-        ]
+        return self._stake_index.get("active_mandatory", True)
+
+    def serialize_proposals(self) -> str:
+        """JSON of the active proposals, as stored in snapshots."""
+        import json
+
+        return json.dumps(
+            [
+                proposal.model_dump()
+                for proposal in self.current_issue.proposals
+                if proposal.active
+            ]
+            if self.current_issue
+            else []
+        )
 
     def serialize_for_snapshot(self) -> dict:
         """Serialize state for database snapshot storage."""
@@ -325,15 +770,7 @@ class RoundtableState(BaseModel):
             "agent_balances": json.dumps(self.agent_balances),
             "agent_readiness": json.dumps(self.agent_readiness),
             "agent_proposal_ids": json.dumps(self.agent_proposal_ids),
-            "proposals": json.dumps(
-                [
-                    proposal.model_dump()
-                    for proposal in self.current_issue.proposals
-                    if proposal.active
-                ]
-                if self.current_issue
-                else []
-            ),
+            "proposals": self.serialize_proposals(),
             "stake_ledger": json.dumps(
                 [stake.model_dump() for stake in self.stake_ledger]
             ),
@@ -342,6 +779,7 @@ class RoundtableState(BaseModel):
             "proposal_counter": self.proposal_counter,
             "issue_finalized": self.issue_finalized,
             "finalization_tick": self.finalization_tick,
+            "issue_id": self.current_issue.issue_id if self.current_issue else None,
         }
 
 
@@ -4,13 +4,14 @@ import os
 import sqlite3
 import json
 from typing import Dict, List, Tuple
-from simlog import logger
+from simlog import logger, migrate_event_schema
 
 
 def load_state_from_db(db_path: str = "roundtable_state.db") -> Dict:
     """Load the final state snapshot from the database."""
     try:
         conn = sqlite3.connect(db_path)
+        migrate_event_schema(conn)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -40,20 +41,19 @@ def load_state_from_db(db_path: str = "roundtable_state.db") -> Dict:
             ),
         }
 
-        # Get stake ledger from stake events
+        # Get stake ledger from stake events (promoted columns, no payload parsing)
         cursor.execute(
             """
-            SELECT payload FROM events 
-            WHERE event_type = 'stake_recorded' 
+            SELECT proposal_id, amount, issue_id,
+                   COALESCE(json_extract(payload, '$.initial_tick'), tick) AS initial_tick,
+                   json_extract(payload, '$.stake_type') AS stake_type
+            FROM events
+            WHERE event_type = 'stake_recorded'
             ORDER BY tick
         """
         )
 
-        stakes = []
-        stake_rows = cursor.fetchall()
-        for row in stake_rows:
-            payload = json.loads(row["payload"])
-            stakes.append(payload)
+        stakes = [dict(row) for row in cursor.fetchall()]
 
         state_data["stake_ledger"] = stakes
 
@@ -1,24 +1,46 @@
 """Round Table Consensus phase management and execution system."""
 
 import os
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Any, Dict, List, Optional, Tuple
 
+from conviction import growth_table
+from snapshots import DEFAULT_KEYFRAME_INTERVAL, SnapshotEncoder
 from models import (
+    Action,
     UnifiedConfig,
     RoundtableState,
     AgentActor,
     Proposal,
+    agent_policy_module,
+    current_action_queue,
 )
 from simlog import (
+    event_enabled,
     log_event,
     LogEntry,
     EventType,
     PhaseType,
     LogLevel,
     save_state_snapshot,
+    save_state_delta,
 )
 
 
+# Upper bound on concurrent signals to io_bound_signals agents in one tick
+MAX_IO_SIGNAL_WORKERS = 64
+
+
+def _deliver_captured(
+    action_queue, agent: AgentActor, payload: Dict[str, Any]
+) -> List[Action]:
+    """Signal an agent, returning the actions it submitted instead of queueing them."""
+    with action_queue.capture() as actions:
+        agent.on_signal(payload=payload)
+    return actions
+
+
 class Phase:
     """Base class for consensus phases with lifecycle management."""
 
@@ -48,39 +70,41 @@ class Phase:
         self, state: RoundtableState, config: UnifiedConfig, creditmgr=None
     ) -> None:
         """Initialize phase when it starts."""
-        log_event(
-            LogEntry(
-                tick=state.tick,
-                phase=PhaseType(self.phase_type),
-                event_type=EventType.PHASE_BEGIN,
-                payload={
-                    "phase_number": self.phase_number,
-                    "phase_type": self.phase_type,
-                    "max_phase_ticks": self.max_phase_ticks,
-                    "issue_id": config.issue_id,
-                },
-                message=f"{self.phase_type} Phase [{self.phase_number}] beginning",
+        if event_enabled(EventType.PHASE_BEGIN):
+            log_event(
+                LogEntry(
+                    tick=state.tick,
+                    phase=PhaseType(self.phase_type),
+                    event_type=EventType.PHASE_BEGIN,
+                    payload={
+                        "phase_number": self.phase_number,
+                        "phase_type": self.phase_type,
+                        "max_phase_ticks": self.max_phase_ticks,
+                        "issue_id": config.issue_id,
+                    },
+                    message=f"{self.phase_type} Phase [{self.phase_number}] beginning",
+                )
             )
-        )
 
     def _finish(
         self, state: RoundtableState, config: UnifiedConfig, creditmgr=None
     ) -> None:
         """Clean up phase when it ends."""
-        log_event(
-            LogEntry(
-                tick=state.tick,
-                phase=PhaseType(self.phase_type),
-                event_type=EventType.PHASE_FINISH,
-                payload={
-                    "phase_number": self.phase_number,
-                    "phase_type": self.phase_type,
-                    "phase_tick": state.phase_tick,
-                    "issue_id": config.issue_id,
-                },
-                message=f"{self.phase_type} Phase [{self.phase_number}] finishing at tick {state.phase_tick}",
+        if event_enabled(EventType.PHASE_FINISH):
+            log_event(
+                LogEntry(
+                    tick=state.tick,
+                    phase=PhaseType(self.phase_type),
+                    event_type=EventType.PHASE_FINISH,
+                    payload={
+                        "phase_number": self.phase_number,
+                        "phase_type": self.phase_type,
+                        "phase_tick": state.phase_tick,
+                        "issue_id": config.issue_id,
+                    },
+                    message=f"{self.phase_type} Phase [{self.phase_number}] finishing at tick {state.phase_tick}",
+                )
             )
-        )
 
     def _do(
         self,
@@ -92,6 +116,85 @@ class Phase:
         """Execute main phase logic."""
         raise NotImplementedError("Subclasses must implement _do")
 
+    def _dispatch_signals(
+        self, signals: List[Tuple[AgentActor, Dict[str, Any]]], config: UnifiedConfig
+    ) -> None:
+        """Deliver each (agent, payload) signal, concurrently if configured.
+
+        Agents with io_bound_signals (remote runners) are always signalled at
+        once on their own pool while local agents are handled, so a tick waits
+        for the slowest runner rather than the sum of all of them. Local and
+        remote actions are captured and queued per agent in signal order, as
+        in a serial run.
+        """
+        io_bound = [signal for signal in signals if signal[0].io_bound_signals]
+        if not io_bound:
+            self._dispatch_local_signals(signals, config)
+            return
+
+        local = [signal for signal in signals if not signal[0].io_bound_signals]
+        action_queue = current_action_queue()
+        with ThreadPoolExecutor(
+            max_workers=min(len(io_bound), MAX_IO_SIGNAL_WORKERS),
+            thread_name_prefix=f"{self.phase_type.lower()}-remote",
+        ) as pool:
+            futures = iter(
+                [
+                    pool.submit(copy_context().run, _deliver_captured, action_queue, agent, payload)
+                    for agent, payload in io_bound
+                ]
+            )
+            with action_queue.capture() as local_actions:
+                self._dispatch_local_signals(local, config)
+            by_agent: Dict[str, List[Action]] = {}
+            for action in local_actions:
+                by_agent.setdefault(action.agent_id, []).append(action)
+            for agent, _ in signals:
+                if agent.io_bound_signals:
+                    actions = next(futures).result()
+                else:
+                    actions = by_agent.pop(agent.agent_id, [])
+                for action in actions:
+                    action_queue.submit(action)
+            # Actions a local agent submitted under another agent's id
+            for actions in by_agent.values():
+                for action in actions:
+                    action_queue.submit(action)
+
+    def _dispatch_local_signals(
+        self, signals: List[Tuple[AgentActor, Dict[str, Any]]], config: UnifiedConfig
+    ) -> None:
+        """Deliver in-process signals, on a thread pool if max_concurrent_agents > 1.
+
+        With max_concurrent_agents > 1 the agent policy may handle the whole
+        fan-out itself (handle_signal_batch); otherwise agents run on a thread
+        pool and each agent's submitted actions are captured, then queued in
+        signal order so the action queue matches a serial run.
+        """
+        workers = min(config.max_concurrent_agents, len(signals))
+        if workers <= 1:
+            for agent, payload in signals:
+                agent.on_signal(payload=payload)
+            return
+
+        batch = getattr(agent_policy_module(config.agent_policy), "handle_signal_batch", None)
+        if batch is not None and batch(signals):
+            return
+
+        action_queue = current_action_queue()
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=f"{self.phase_type.lower()}-signal"
+        ) as pool:
+            # Each call runs in a copy of this context so agents resolve the
+            # same current_action_queue() as the ticking controller
+            futures = [
+                pool.submit(copy_context().run, _deliver_captured, action_queue, agent, payload)
+                for agent, payload in signals
+            ]
+            for future in futures:
+                for action in future.result():
+                    action_queue.submit(action)
+
     def signal_ready(self, agent_id: str, state: RoundtableState) -> None:
         """Mark agent as ready."""
         if agent_id in state.agent_readiness:
@@ -132,20 +235,21 @@ class ProposePhase(Phase):
                     revision_number=1,
                 )
                 state.current_issue.add_proposal(noaction_proposal)
-                log_event(
-                    LogEntry(
-                        tick=state.tick,
-                        phase=PhaseType.PROPOSE,
-                        event_type=EventType.PROPOSAL_RECEIVED,
-                        payload={
-                            "proposal_id": noaction_proposal.proposal_id,
-                            "agent_id": "system",
-                            "issue_id": state.current_issue.issue_id,
-                            "proposal_type": "noaction",
-                        },
-                        message=f"NoAction proposal #0 created for issue {state.current_issue.issue_id}",
+                if event_enabled(EventType.PROPOSAL_RECEIVED):
+                    log_event(
+                        LogEntry(
+                            tick=state.tick,
+                            phase=PhaseType.PROPOSE,
+                            event_type=EventType.PROPOSAL_RECEIVED,
+                            payload={
+                                "proposal_id": noaction_proposal.proposal_id,
+                                "agent_id": "system",
+                                "issue_id": state.current_issue.issue_id,
+                                "proposal_type": "noaction",
+                            },
+                            message=f"NoAction proposal #0 created for issue {state.current_issue.issue_id}",
+                        )
                     )
-                )
 
     def _finish(
         self, state: RoundtableState, config: UnifiedConfig, creditmgr=None
@@ -156,7 +260,8 @@ class ProposePhase(Phase):
             return
 
         # Find unready agents and ready agents without proposal links
-        all_agent_ids = set(creditmgr.get_all_balances().keys())
+        # (in balance order, not set order, so NoAction stakes replay identically)
+        all_agent_ids = list(creditmgr.get_all_balances().keys())
         unready_agents = [
             aid for aid, ready in state.agent_readiness.items() if not ready
         ]
@@ -190,16 +295,17 @@ class ProposePhase(Phase):
                     )
                     self.signal_ready(agent_id, state)
 
-                    log_event(
-                        LogEntry(
-                            tick=state.tick,
-                            phase=PhaseType.PROPOSE,
-                            event_type=EventType.AGENT_READY,
-                            agent_id=agent_id,
-                            payload={"reason": "no_action_proposal"},
-                            message=f"Agent {agent_id} assigned to NoAction on timeout",
+                    if event_enabled(EventType.AGENT_READY):
+                        log_event(
+                            LogEntry(
+                                tick=state.tick,
+                                phase=PhaseType.PROPOSE,
+                                event_type=EventType.AGENT_READY,
+                                agent_id=agent_id,
+                                payload={"reason": "no_action_proposal"},
+                                message=f"Agent {agent_id} assigned to NoAction on timeout",
+                            )
                         )
-                    )
 
     def _do(
         self,
@@ -209,27 +315,32 @@ class ProposePhase(Phase):
         creditmgr=None,
     ) -> None:
         """Signal agents to make proposal decisions."""
-        log_event(
-            LogEntry(
-                tick=state.tick,
-                phase=PhaseType.PROPOSE,
-                event_type=EventType.PHASE_EXECUTION,
-                payload={
-                    "phase_number": self.phase_number,
-                    "max_phase_ticks": self.max_phase_ticks,
-                },
-                message=f"Executing Propose Phase [{self.phase_number}] with max think ticks {self.max_phase_ticks}",
+        if event_enabled(EventType.PHASE_EXECUTION):
+            log_event(
+                LogEntry(
+                    tick=state.tick,
+                    phase=PhaseType.PROPOSE,
+                    event_type=EventType.PHASE_EXECUTION,
+                    payload={
+                        "phase_number": self.phase_number,
+                        "max_phase_ticks": self.max_phase_ticks,
+                    },
+                    message=f"Executing Propose Phase [{self.phase_number}] with max think ticks {self.max_phase_ticks}",
+                )
             )
-        )
-        for agent in agents:
-            agent.on_signal(
-                payload={
+        signals = [
+            (
+                agent,
+                {
                     "type": "Propose",
                     "state": state,
                     "config": config,
                     "phase": self,
-                }
+                },
             )
+            for agent in agents
+        ]
+        self._dispatch_signals(signals, config)
 
     def is_complete(self, state: RoundtableState) -> bool:
         return True
@@ -263,20 +374,21 @@ class FeedbackPhase(Phase):
             "target_proposals": set(),
         }
 
-        log_event(
-            LogEntry(
-                tick=state.tick,
-                phase=PhaseType.FEEDBACK,
-                event_type=EventType.PHASE_TRANSITION,
-                payload={
-                    "phase_number": self.phase_number,
-                    "cycle_number": self.cycle_number,
-                    "max_feedback_per_agent": self.max_feedback_per_agent,
-                    "feedback_stake": self.feedback_stake,
-                },
-                message=f"Starting Feedback Phase [{self.phase_number}] for cycle {self.cycle_number}",
+        if event_enabled(EventType.PHASE_TRANSITION):
+            log_event(
+                LogEntry(
+                    tick=state.tick,
+                    phase=PhaseType.FEEDBACK,
+                    event_type=EventType.PHASE_TRANSITION,
+                    payload={
+                        "phase_number": self.phase_number,
+                        "cycle_number": self.cycle_number,
+                        "max_feedback_per_agent": self.max_feedback_per_agent,
+                        "feedback_stake": self.feedback_stake,
+                    },
+                    message=f"Starting Feedback Phase [{self.phase_number}] for cycle {self.cycle_number}",
+                )
             )
-        )
 
     def _do(
         self,
@@ -286,6 +398,7 @@ class FeedbackPhase(Phase):
         creditmgr=None,
     ) -> None:
         """Signal agents to provide feedback and check for completion."""
+        signals = []
         for agent in agents:
             # Get all available proposals for agent decision making
             all_proposals = list(state.agent_proposal_ids.values())
@@ -305,17 +418,21 @@ class FeedbackPhase(Phase):
                     if proposal.active:
                         all_proposal_contents[proposal.proposal_id] = proposal.content
 
-            agent.on_signal(
-                payload={
-                    "type": "Feedback",
-                    "state": state,
-                    "config": config,
-                    "phase": self,
-                    "agent_proposals": all_proposals,
-                    "agent_proposal_id": current_proposal_id,
-                    "proposal_contents": all_proposal_contents,
-                }
+            signals.append(
+                (
+                    agent,
+                    {
+                        "type": "Feedback",
+                        "state": state,
+                        "config": config,
+                        "phase": self,
+                        "agent_proposals": all_proposals,
+                        "agent_proposal_id": current_proposal_id,
+                        "proposal_contents": all_proposal_contents,
+                    },
+                )
             )
+        self._dispatch_signals(signals, config)
 
     def _finish(
         self, state: RoundtableState, config: UnifiedConfig, creditmgr=None
@@ -337,21 +454,22 @@ class FeedbackPhase(Phase):
         for agent_id in config.agent_ids:
             self.signal_ready(agent_id, state)
 
-        log_event(
-            LogEntry(
-                tick=state.tick,
-                phase=PhaseType.FEEDBACK,
-                event_type=EventType.PHASE_TRANSITION,
-                payload={
-                    "phase_number": self.phase_number,
-                    "cycle_number": self.cycle_number,
-                    "feedbacks_submitted": total_feedbacks,
-                    "agents_participated": len(agents_with_feedback),
-                    "target_proposals": len(target_proposals),
-                },
-                message=f"Completed Feedback Phase [{self.phase_number}]: {total_feedbacks} feedbacks from {len(agents_with_feedback)} agents (timeout)",
+        if event_enabled(EventType.PHASE_TRANSITION):
+            log_event(
+                LogEntry(
+                    tick=state.tick,
+                    phase=PhaseType.FEEDBACK,
+                    event_type=EventType.PHASE_TRANSITION,
+                    payload={
+                        "phase_number": self.phase_number,
+                        "cycle_number": self.cycle_number,
+                        "feedbacks_submitted": total_feedbacks,
+                        "agents_participated": len(agents_with_feedback),
+                        "target_proposals": len(target_proposals),
+                    },
+                    message=f"Completed Feedback Phase [{self.phase_number}]: {total_feedbacks} feedbacks from {len(agents_with_feedback)} agents (timeout)",
+                )
             )
-        )
 
     def is_complete(self, state: RoundtableState) -> bool:
         """Check if feedback phase is complete."""
@@ -379,20 +497,22 @@ class RevisePhase(Phase):
         config: UnifiedConfig,
         creditmgr=None,
     ) -> None:
-        log_event(
-            LogEntry(
-                tick=state.tick,
-                phase=PhaseType.REVISE,
-                event_type=EventType.PHASE_EXECUTION,
-                payload={
-                    "phase_number": self.phase_number,
-                    "cycle_number": self.cycle_number,
-                    "proposal_self_stake": self.proposal_self_stake,
-                },
-                message=f"Executing Revise Phase [{self.phase_number}] for cycle {self.cycle_number} with proposal self-stake {self.proposal_self_stake}",
+        if event_enabled(EventType.PHASE_EXECUTION):
+            log_event(
+                LogEntry(
+                    tick=state.tick,
+                    phase=PhaseType.REVISE,
+                    event_type=EventType.PHASE_EXECUTION,
+                    payload={
+                        "phase_number": self.phase_number,
+                        "cycle_number": self.cycle_number,
+                        "proposal_self_stake": self.proposal_self_stake,
+                    },
+                    message=f"Executing Revise Phase [{self.phase_number}] for cycle {self.cycle_number} with proposal self-stake {self.proposal_self_stake}",
+                )
             )
-        )
 
+        signals = []
         for agent in agents:
             # TODO: Get actual feedback received for this agent's proposal
             feedback_received = (
@@ -405,17 +525,21 @@ class RevisePhase(Phase):
             # Get all available proposals for agent decision making
             all_proposals = list(state.agent_proposal_ids.values())
 
-            agent.on_signal(
-                payload={
-                    "type": "Revise",
-                    "state": state,
-                    "config": config,
-                    "phase": self,
-                    "feedback_received": feedback_received,
-                    "agent_proposal_id": current_proposal_id,
-                    "agent_proposals": all_proposals,
-                }
+            signals.append(
+                (
+                    agent,
+                    {
+                        "type": "Revise",
+                        "state": state,
+                        "config": config,
+                        "phase": self,
+                        "feedback_received": feedback_received,
+                        "agent_proposal_id": current_proposal_id,
+                        "agent_proposals": all_proposals,
+                    },
+                )
             )
+        self._dispatch_signals(signals, config)
 
     def is_complete(self, state: RoundtableState) -> bool:
         return True
@@ -446,7 +570,7 @@ class StakePhase(Phase):
         mandatory_stakes = state.get_mandatory_stakes()
         for stake in mandatory_stakes:
             if stake.issue_id == config.issue_id and stake.status == "active":
-                stake.initial_tick = state.tick
+                state.update_stake(stake, initial_tick=state.tick)
 
         # # Transfer initial proposal stakes to conviction tracking on first STAKE round
         # if self.round_number == 1 and creditmgr:
@@ -483,34 +607,32 @@ class StakePhase(Phase):
         creditmgr=None,
     ) -> None:
         """Signal agents to make staking decisions and automatically build conviction."""
-        log_event(
-            LogEntry(
-                tick=state.tick,
-                phase=PhaseType.STAKE,
-                event_type=EventType.PHASE_EXECUTION,
-                payload={
-                    "phase_number": self.phase_number,
-                    "round_number": self.round_number,
-                    "conviction_params": self.conviction_params,
-                },
-                message=f"Executing Stake Phase [{self.phase_number}] for round {self.round_number} with conviction params {self.conviction_params}",
+        if event_enabled(EventType.PHASE_EXECUTION):
+            log_event(
+                LogEntry(
+                    tick=state.tick,
+                    phase=PhaseType.STAKE,
+                    event_type=EventType.PHASE_EXECUTION,
+                    payload={
+                        "phase_number": self.phase_number,
+                        "round_number": self.round_number,
+                        "conviction_params": self.conviction_params,
+                    },
+                    message=f"Executing Stake Phase [{self.phase_number}] for round {self.round_number} with conviction params {self.conviction_params}",
+                )
             )
-        )
 
         # NOTE: Removed auto_build_conviction - conviction now calculated directly from stake records
         # No artificial conviction building needed with atomic stake-based system
 
         # Get all active stakes for this issue to provide atomic stake data
-        active_stakes = [
-            stake for stake in state.stake_ledger 
-            if stake.status == "active" and stake.issue_id == config.issue_id
-        ]
+        active_stakes = state.get_active_stakes_for_issue(config.issue_id)
         
-        # Build atomic stake data with conviction calculations
+        # Build atomic stake data with conviction calculations (multipliers scored in one batch)
+        ages = [state.tick - stake.initial_tick for stake in active_stakes]
+        multipliers = creditmgr.calculate_growth_curves(ages, self.conviction_params)
         atomic_stakes = []
-        for stake in active_stakes:
-            age = state.tick - stake.initial_tick
-            conviction_multiplier = creditmgr.calculate_stake_conviction(stake, state.tick, self.conviction_params) / stake.cp
+        for stake, age, conviction_multiplier in zip(active_stakes, ages, multipliers):
             total_cp = stake.cp * conviction_multiplier
             
             atomic_stakes.append({
@@ -524,6 +646,12 @@ class StakePhase(Phase):
                 "total_cp": total_cp
             })
 
+        # Per-proposal totals from the running aggregates (same ageing as atomic_stakes)
+        proposal_convictions = state.get_proposal_convictions(
+            config.issue_id, self.conviction_params
+        )
+
+        signals = []
         for agent in agents:
             # Include current balance in the signal
             current_balance = state.agent_balances.get(agent.agent_id, 0)
@@ -533,18 +661,23 @@ class StakePhase(Phase):
             # Get all available proposals for agent decision making
             all_proposals = list(state.agent_proposal_ids.values())
 
-            agent.on_signal(
-                payload={
-                    "type": "Stake",
-                    "state": state,
-                    "config": config,
-                    "phase": self,
-                    "agent_proposal_id": current_proposal_id,
-                    "agent_proposals": all_proposals,
-                    "current_balance": current_balance,
-                    "atomic_stakes": atomic_stakes,
-                }
+            signals.append(
+                (
+                    agent,
+                    {
+                        "type": "Stake",
+                        "state": state,
+                        "config": config,
+                        "phase": self,
+                        "agent_proposal_id": current_proposal_id,
+                        "agent_proposals": all_proposals,
+                        "current_balance": current_balance,
+                        "atomic_stakes": atomic_stakes,
+                        "proposal_convictions": proposal_convictions,
+                    },
+                )
             )
+        self._dispatch_signals(signals, config)
 
     def is_complete(self, state: RoundtableState) -> bool:
         return True
@@ -572,15 +705,19 @@ class FinalizePhase(Phase):
     ) -> None:
         """Signal agents about finalization and mark them ready."""
         # Signal agents about finalization phase
-        for agent in agents:
-            agent.on_signal(
-                payload={
+        signals = [
+            (
+                agent,
+                {
                     "type": "Finalize",
                     "state": state,
                     "config": config,
                     "phase": self,
-                }
+                },
             )
+            for agent in agents
+        ]
+        self._dispatch_signals(signals, config)
 
         # Mark all agents as ready since finalization doesn't require agent input
         for agent in agents:
@@ -604,15 +741,16 @@ class FinalizePhase(Phase):
         issue_id = config.issue_id
         tick = state.tick
 
-        log_event(
-            LogEntry(
-                tick=tick,
-                phase=PhaseType.FINALIZE,
-                event_type=EventType.FINALIZATION_START,
-                payload={"issue_id": issue_id},
-                message=f"Starting finalization for issue {issue_id} at tick {tick}",
+        if event_enabled(EventType.FINALIZATION_START):
+            log_event(
+                LogEntry(
+                    tick=tick,
+                    phase=PhaseType.FINALIZE,
+                    event_type=EventType.FINALIZATION_START,
+                    payload={"issue_id": issue_id},
+                    message=f"Starting finalization for issue {issue_id} at tick {tick}",
+                )
             )
-        )
 
         # Aggregate conviction weights by proposal using latest stake records
         proposal_weights = self._aggregate_conviction_weights_inline(
@@ -620,15 +758,16 @@ class FinalizePhase(Phase):
         )
 
         if not proposal_weights:
-            log_event(
-                LogEntry(
-                    tick=tick,
-                    phase=PhaseType.FINALIZE,
-                    event_type=EventType.FINALIZATION_WARNING,
-                    payload={"issue_id": issue_id, "reason": "no_stakes_found"},
-                    message="No conviction stakes found for finalization",
+            if event_enabled(EventType.FINALIZATION_WARNING):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        phase=PhaseType.FINALIZE,
+                        event_type=EventType.FINALIZATION_WARNING,
+                        payload={"issue_id": issue_id, "reason": "no_stakes_found"},
+                        message="No conviction stakes found for finalization",
+                    )
                 )
-            )
             return
 
         # Determine winner with tie-breaking
@@ -646,24 +785,24 @@ class FinalizePhase(Phase):
             winner_proposal_id, issue_id, tick, state, config, creditmgr
         )
 
-        log_event(
-            LogEntry(
-                tick=tick,
-                phase=PhaseType.FINALIZE,
-                event_type=EventType.FINALIZATION_COMPLETE,
-                payload={
-                    "issue_id": issue_id,
-                    "winner_proposal_id": winner_proposal_id,
-                },
-                message=f"Finalization completed for issue {issue_id} - Winner: {winner_proposal_id}",
+        if event_enabled(EventType.FINALIZATION_COMPLETE):
+            log_event(
+                LogEntry(
+                    tick=tick,
+                    phase=PhaseType.FINALIZE,
+                    event_type=EventType.FINALIZATION_COMPLETE,
+                    payload={
+                        "issue_id": issue_id,
+                        "winner_proposal_id": winner_proposal_id,
+                    },
+                    message=f"Finalization completed for issue {issue_id} - Winner: {winner_proposal_id}",
+                )
             )
-        )
 
     def _aggregate_conviction_weights_inline(
         self, state: RoundtableState, config: UnifiedConfig, creditmgr=None
     ):
-        """Aggregate effective weights by proposal using latest stake records."""
-        proposal_weights = {}
+        """Aggregate effective weights by proposal from the running conviction totals."""
         conviction_params = config.conviction_params
         current_tick = state.tick
 
@@ -678,51 +817,10 @@ class FinalizePhase(Phase):
             # Fallback if no stake phase found in ledger
             first_stake_tick = current_tick
 
-        # Get all active stakes for this issue
-        active_stakes = [
-            stake
-            for stake in state.stake_ledger
-            if stake.status == "active" and stake.issue_id == config.issue_id
-        ]
-
-        # Group stakes by proposal and calculate conviction multipliers
-        for stake in active_stakes:
-            proposal_id = stake.proposal_id
-
-            # Calculate time held based on stake type
-            if stake.mandatory:
-                # Mandatory stakes use time from first stake phase tick
-                time_held = current_tick - first_stake_tick
-            else:
-                # Voluntary stakes use time from their initial tick (during stake phases)
-                time_held = current_tick - stake.initial_tick
-
-            # Calculate conviction multiplier for this stake
-            growth_multiplier = creditmgr.calculate_growth_curve(
-                time_held, conviction_params
-            )
-            effective_weight = round(stake.cp * growth_multiplier, 2)
-
-            if proposal_id not in proposal_weights:
-                proposal_weights[proposal_id] = {
-                    "total_effective_weight": 0,
-                    "total_raw_weight": 0,
-                    "contributor_count": 0,
-                    "first_stake_tick": (
-                        stake.initial_tick if not stake.mandatory else first_stake_tick
-                    ),
-                }
-
-            proposal_weights[proposal_id]["total_effective_weight"] += effective_weight
-            proposal_weights[proposal_id]["total_raw_weight"] += stake.cp
-            proposal_weights[proposal_id]["contributor_count"] += 1
-
-            # Track earliest stake tick for tie-breaking (use first stake tick for mandatory)
-            stake_tick = first_stake_tick if stake.mandatory else stake.initial_tick
-            if stake_tick < proposal_weights[proposal_id]["first_stake_tick"]:
-                proposal_weights[proposal_id]["first_stake_tick"] = stake_tick
-
-        return proposal_weights
+        # Running per-proposal aggregates; mandatory stakes age from the first stake phase
+        return state.get_proposal_convictions(
+            config.issue_id, conviction_params, mandatory_anchor_tick=first_stake_tick
+        )
 
     def _determine_winner_inline(self, proposal_weights):
         """Determine winning proposal with tie-breaking by earliest stake."""
@@ -779,29 +877,31 @@ class FinalizePhase(Phase):
 
         state.credit_events.append(finalization_event)
 
-        log_event(
-            LogEntry(
-                tick=tick,
-                phase=PhaseType.FINALIZE,
-                event_type=EventType.FINALIZATION_DECISION,
-                payload={
-                    "proposal_id": winner_proposal_id,
-                    "agent_id": agent_id,
-                    "effective_weight": winner_data["total_effective_weight"],
-                    "raw_weight": winner_data["total_raw_weight"],
-                    "contributor_count": winner_data["contributor_count"],
-                    "final_tick": tick,
-                    "issue_id": issue_id,
-                },
-                message=finalization_event["reason"],
+        if event_enabled(EventType.FINALIZATION_DECISION):
+            log_event(
+                LogEntry(
+                    tick=tick,
+                    phase=PhaseType.FINALIZE,
+                    event_type=EventType.FINALIZATION_DECISION,
+                    payload={
+                        "proposal_id": winner_proposal_id,
+                        "agent_id": agent_id,
+                        "effective_weight": winner_data["total_effective_weight"],
+                        "raw_weight": winner_data["total_raw_weight"],
+                        "contributor_count": winner_data["contributor_count"],
+                        "final_tick": tick,
+                        "issue_id": issue_id,
+                    },
+                    message=finalization_event["reason"],
+                )
             )
-        )
 
     def _emit_influence_events_inline(
         self, winner_proposal_id, issue_id, tick, state, config, creditmgr
     ):
         """Emit influence recorded events for each agent's contribution to winning proposal."""
         conviction_params = config.conviction_params
+        growth = growth_table(conviction_params)
         current_tick = state.tick
 
         # Find the first stake phase tick for mandatory stake time calculation
@@ -817,10 +917,8 @@ class FinalizePhase(Phase):
         # Get all active stakes for winning proposal
         winning_stakes = [
             stake
-            for stake in state.stake_ledger
-            if stake.status == "active"
-            and stake.issue_id == issue_id
-            and stake.proposal_id == winner_proposal_id
+            for stake in state.get_active_stakes_for_proposal(winner_proposal_id)
+            if stake.issue_id == issue_id
         ]
 
         # Group stakes by agent and calculate their contributions
@@ -835,9 +933,7 @@ class FinalizePhase(Phase):
                 time_held = current_tick - stake.initial_tick
 
             # Calculate conviction multiplier for this stake
-            growth_multiplier = creditmgr.calculate_growth_curve(
-                time_held, conviction_params
-            )
+            growth_multiplier = growth.multiplier(time_held)
             effective_weight = round(stake.cp * growth_multiplier, 2)
 
             if agent_id not in agent_contributions:
@@ -867,22 +963,23 @@ class FinalizePhase(Phase):
 
             state.credit_events.append(influence_event)
 
-            log_event(
-                LogEntry(
-                    tick=tick,
-                    phase=PhaseType.FINALIZE,
-                    event_type=EventType.INFLUENCE_RECORDED,
-                    payload={
-                        "winning_proposal_id": winner_proposal_id,
-                        "agent_id": agent_id,
-                        "contribution": contrib_data["effective_contribution"],
-                        "raw_stake": contrib_data["raw_stake"],
-                        "multiplier": contrib_data["multiplier"],
-                        "issue_id": issue_id,
-                    },
-                    message=influence_event["reason"],
+            if event_enabled(EventType.INFLUENCE_RECORDED):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        phase=PhaseType.FINALIZE,
+                        event_type=EventType.INFLUENCE_RECORDED,
+                        payload={
+                            "winning_proposal_id": winner_proposal_id,
+                            "agent_id": agent_id,
+                            "contribution": contrib_data["effective_contribution"],
+                            "raw_stake": contrib_data["raw_stake"],
+                            "multiplier": contrib_data["multiplier"],
+                            "issue_id": issue_id,
+                        },
+                        message=influence_event["reason"],
+                    )
                 )
-            )
 
     def is_complete(self, state: RoundtableState) -> bool:
         return True
@@ -961,6 +1058,10 @@ class Consensus:
         self.creditmgr = creditmgr
         self.phases = generate_phases(config)
         self.current_phase_index = 0
+        self.snapshot_encoder = SnapshotEncoder(
+            config.snapshot_config.get("mode", "full"),
+            config.snapshot_config.get("keyframe_interval", DEFAULT_KEYFRAME_INTERVAL),
+        )
 
     def run(self):
         """Run the consensus until completion to solve the issue."""
@@ -973,6 +1074,11 @@ class Consensus:
 
     def tick(self):
         """Execute one tick of consensus progression with phase management."""
+        if self.config.fast_forward_idle_ticks and getattr(
+            agent_policy_module(self.config.agent_policy), "QUIESCENT_WHEN_READY", False
+        ):
+            self._fast_forward_idle_ticks()
+
         self.state.tick += 1
         current_phase = self.get_current_phase()
 
@@ -988,27 +1094,7 @@ class Consensus:
         else:
             self.state.phase_tick += 1
 
-        log_event(
-            LogEntry(
-                tick=self.state.tick,
-                phase=(
-                    PhaseType(self.state.current_phase)
-                    if self.state.current_phase
-                    else None
-                ),
-                event_type=EventType.CONSENSUS_TICK,
-                payload={"phase_tick": self.state.phase_tick},
-                message=f"{self.state.tick}:{self.state.phase_tick} — Phase {self.state.current_phase}",
-            )
-        )
-
-        # Phase complete: skip execution, advance phase
-        current_phase = self.get_current_phase()
-        phase_ticks_expired = (
-            current_phase and self.state.phase_tick > current_phase.max_phase_ticks
-        )
-
-        if self.all_agents_ready and phase_ticks_expired:
+        if event_enabled(EventType.CONSENSUS_TICK):
             log_event(
                 LogEntry(
                     tick=self.state.tick,
@@ -1017,11 +1103,33 @@ class Consensus:
                         if self.state.current_phase
                         else None
                     ),
-                    event_type=EventType.PHASE_TRANSITION,
-                    payload={"current_phase_index": self.current_phase_index},
-                    message="All agents ready and think ticks expired — transitioning to next phase.",
+                    event_type=EventType.CONSENSUS_TICK,
+                    payload={"phase_tick": self.state.phase_tick},
+                    message=f"{self.state.tick}:{self.state.phase_tick} — Phase {self.state.current_phase}",
                 )
             )
+
+        # Phase complete: skip execution, advance phase
+        current_phase = self.get_current_phase()
+        phase_ticks_expired = (
+            current_phase and self.state.phase_tick > current_phase.max_phase_ticks
+        )
+
+        if self.all_agents_ready and phase_ticks_expired:
+            if event_enabled(EventType.PHASE_TRANSITION):
+                log_event(
+                    LogEntry(
+                        tick=self.state.tick,
+                        phase=(
+                            PhaseType(self.state.current_phase)
+                            if self.state.current_phase
+                            else None
+                        ),
+                        event_type=EventType.PHASE_TRANSITION,
+                        payload={"current_phase_index": self.current_phase_index},
+                        message="All agents ready and think ticks expired — transitioning to next phase.",
+                    )
+                )
             self.current_phase_index += 1
 
         else:
@@ -1030,40 +1138,90 @@ class Consensus:
                 agents = list(self.config.selected_agents.values())
                 current_phase.execute(self.state, agents, self.config, self.creditmgr)
 
-        # Record the state in the execution ledger
-        self.state.execution_ledger.append(
-            {
-                "tick": self.state.tick,
-                "phase": self.state.current_phase,
-                "phase_tick": self.state.phase_tick,
-                "agent_readiness": self.state.agent_readiness.copy(),
-            }
-        )
+        self._record_tick()
+
+    def _fast_forward_idle_ticks(self):
+        """Skip the idle ticks left in the current phase once every agent is ready.
 
-        # Save complete state snapshot to database
-        state_snapshot = self.state.serialize_for_snapshot()
-        save_state_snapshot(state_snapshot)
+        Only used for agent policies that declare QUIESCENT_WHEN_READY: ticks
+        between now and the phase's last tick would only re-signal agents that
+        have already signalled ready and stay idle, so they are collapsed into a single
+        execution ledger entry and snapshot. The phase's last tick (and its
+        _finish) still runs normally, and stake ages advance with state.tick.
+        """
+        current_phase = self.get_current_phase()
+        if (
+            current_phase is None
+            or current_phase.phase_type != self.state.current_phase
+            or not self.all_agents_ready
+        ):
+            return
+        skipped = current_phase.max_phase_ticks - 1 - self.state.phase_tick
+        if skipped < 1:
+            return
+
+        from_tick = self.state.tick + 1
+        self.state.tick += skipped
+        self.state.phase_tick += skipped
+        if event_enabled(EventType.FAST_FORWARD):
+            log_event(
+                LogEntry(
+                    tick=self.state.tick,
+                    phase=PhaseType(self.state.current_phase),
+                    event_type=EventType.FAST_FORWARD,
+                    payload={
+                        "from_tick": from_tick,
+                        "to_tick": self.state.tick,
+                        "skipped_ticks": skipped,
+                        "phase_tick": self.state.phase_tick,
+                    },
+                    message=f"Fast-forwarded idle ticks {from_tick}-{self.state.tick} of {self.state.current_phase} (all agents ready)",
+                )
+            )
+        self._record_tick(fast_forward_from=from_tick)
+
+    def _record_tick(self, fast_forward_from: Optional[int] = None):
+        """Append the execution ledger entry and save the tick's state snapshot."""
+        ledger_entry = {
+            "tick": self.state.tick,
+            "phase": self.state.current_phase,
+            "phase_tick": self.state.phase_tick,
+            "agent_readiness": self.state.agent_readiness.copy(),
+        }
+        if fast_forward_from is not None:
+            # One entry stands in for every tick from fast_forward_from to tick
+            ledger_entry["fast_forward_from"] = fast_forward_from
+        self.state.execution_ledger.append(ledger_entry)
+
+        # Save state snapshot to database (full keyframe or delta, per snapshot_config)
+        snapshot_kind, state_snapshot = self.snapshot_encoder.encode(self.state)
+        if snapshot_kind == "keyframe":
+            save_state_snapshot(state_snapshot)
+        else:
+            save_state_delta(state_snapshot)
 
         # Log state snapshot event
-        log_event(
-            LogEntry(
-                tick=self.state.tick,
-                phase=(
-                    PhaseType(self.state.current_phase)
-                    if self.state.current_phase
-                    else None
-                ),
-                event_type=EventType.STATE_SNAPSHOT,
-                payload={
-                    "phase_tick": self.state.phase_tick,
-                    "agent_count": len(self.state.agent_balances),
-                    "total_credits": sum(self.state.agent_balances.values()),
-                    "snapshot_size": len(str(state_snapshot)),
-                },
-                message=f"State snapshot saved for tick {self.state.tick}",
-                level=LogLevel.DEBUG,
+        if event_enabled(EventType.STATE_SNAPSHOT):
+            log_event(
+                LogEntry(
+                    tick=self.state.tick,
+                    phase=(
+                        PhaseType(self.state.current_phase)
+                        if self.state.current_phase
+                        else None
+                    ),
+                    event_type=EventType.STATE_SNAPSHOT,
+                    payload={
+                        "phase_tick": self.state.phase_tick,
+                        "agent_count": len(self.state.agent_balances),
+                        "total_credits": sum(self.state.agent_balances.values()),
+                        "snapshot_kind": snapshot_kind,
+                        "snapshot_size": len(str(state_snapshot)),
+                    },
+                    message=f"State snapshot saved for tick {self.state.tick}",
+                    level=LogLevel.DEBUG,
+                )
             )
-        )
 
     def get_current_phase(self) -> Phase:
         """Get the currently executing phase or None if complete."""
@@ -1118,29 +1276,31 @@ class Consensus:
         issue_id = self.config.issue_id
         tick = self.state.tick
 
-        log_event(
-            LogEntry(
-                tick=tick,
-                phase=PhaseType.FINALIZE,
-                event_type=EventType.FINALIZATION_START,
-                payload={"issue_id": issue_id},
-                message=f"Starting finalization for issue {issue_id} at tick {tick}",
+        if event_enabled(EventType.FINALIZATION_START):
+            log_event(
+                LogEntry(
+                    tick=tick,
+                    phase=PhaseType.FINALIZE,
+                    event_type=EventType.FINALIZATION_START,
+                    payload={"issue_id": issue_id},
+                    message=f"Starting finalization for issue {issue_id} at tick {tick}",
+                )
             )
-        )
 
         # Aggregate conviction weights by proposal
         proposal_weights = self._aggregate_conviction_weights()
 
         if not proposal_weights:
-            log_event(
-                LogEntry(
-                    tick=tick,
-                    phase=PhaseType.FINALIZE,
-                    event_type=EventType.FINALIZATION_WARNING,
-                    payload={"issue_id": issue_id, "reason": "no_stakes_found"},
-                    message="No conviction stakes found for finalization",
+            if event_enabled(EventType.FINALIZATION_WARNING):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        phase=PhaseType.FINALIZE,
+                        event_type=EventType.FINALIZATION_WARNING,
+                        payload={"issue_id": issue_id, "reason": "no_stakes_found"},
+                        message="No conviction stakes found for finalization",
+                    )
                 )
-            )
             self._emit_no_winner_event(issue_id, tick)
             self._print_finalization_summary(proposal_weights, None, issue_id, tick)
             return
@@ -1164,22 +1324,22 @@ class Consensus:
             proposal_weights, winner_proposal_id, issue_id, tick
         )
 
-        log_event(
-            LogEntry(
-                tick=tick,
-                phase=PhaseType.FINALIZE,
-                event_type=EventType.FINALIZATION_COMPLETE,
-                payload={
-                    "issue_id": issue_id,
-                    "winner_proposal_id": winner_proposal_id,
-                },
-                message=f"Finalization completed for issue {issue_id} - Winner: {winner_proposal_id}",
+        if event_enabled(EventType.FINALIZATION_COMPLETE):
+            log_event(
+                LogEntry(
+                    tick=tick,
+                    phase=PhaseType.FINALIZE,
+                    event_type=EventType.FINALIZATION_COMPLETE,
+                    payload={
+                        "issue_id": issue_id,
+                        "winner_proposal_id": winner_proposal_id,
+                    },
+                    message=f"Finalization completed for issue {issue_id} - Winner: {winner_proposal_id}",
+                )
             )
-        )
 
     def _aggregate_conviction_weights(self):
-        """Aggregate effective weights by proposal using latest stake records."""
-        proposal_weights = {}
+        """Aggregate effective weights by proposal from the running conviction totals."""
         conviction_params = self.config.conviction_params
         current_tick = self.state.tick
 
@@ -1194,51 +1354,10 @@ class Consensus:
             # Fallback if no stake phase found in ledger
             first_stake_tick = current_tick
 
-        # Get all active stakes for this issue
-        active_stakes = [
-            stake
-            for stake in self.state.stake_ledger
-            if stake.status == "active" and stake.issue_id == self.config.issue_id
-        ]
-
-        # Group stakes by proposal and calculate conviction multipliers
-        for stake in active_stakes:
-            proposal_id = stake.proposal_id
-
-            # Calculate time held based on stake type
-            if stake.mandatory:
-                # Mandatory stakes use time from first stake phase tick
-                time_held = current_tick - first_stake_tick
-            else:
-                # Voluntary stakes use time from their initial tick (during stake phases)
-                time_held = current_tick - stake.initial_tick
-
-            # Calculate conviction multiplier for this stake
-            growth_multiplier = self.creditmgr.calculate_growth_curve(
-                time_held, conviction_params
-            )
-            effective_weight = round(stake.cp * growth_multiplier, 2)
-
-            if proposal_id not in proposal_weights:
-                proposal_weights[proposal_id] = {
-                    "total_effective_weight": 0,
-                    "total_raw_weight": 0,
-                    "contributor_count": 0,
-                    "first_stake_tick": (
-                        stake.initial_tick if not stake.mandatory else first_stake_tick
-                    ),
-                }
-
-            proposal_weights[proposal_id]["total_effective_weight"] += effective_weight
-            proposal_weights[proposal_id]["total_raw_weight"] += stake.cp
-            proposal_weights[proposal_id]["contributor_count"] += 1
-
-            # Track earliest stake tick for tie-breaking (use first stake tick for mandatory)
-            stake_tick = first_stake_tick if stake.mandatory else stake.initial_tick
-            if stake_tick < proposal_weights[proposal_id]["first_stake_tick"]:
-                proposal_weights[proposal_id]["first_stake_tick"] = stake_tick
-
-        return proposal_weights
+        # Running per-proposal aggregates; mandatory stakes age from the first stake phase
+        return self.state.get_proposal_convictions(
+            self.config.issue_id, conviction_params, mandatory_anchor_tick=first_stake_tick
+        )
 
     def _determine_winner(self, proposal_weights):
         """Determine winning proposal with tie-breaking by earliest stake."""
@@ -1296,27 +1415,29 @@ class Consensus:
 
         self.creditmgr.events.append(finalization_event)
 
-        log_event(
-            LogEntry(
-                tick=tick,
-                phase=PhaseType.FINALIZE,
-                event_type=EventType.FINALIZATION_DECISION,
-                payload={
-                    "proposal_id": winner_proposal_id,
-                    "agent_id": agent_id,
-                    "effective_weight": winner_data["total_effective_weight"],
-                    "raw_weight": winner_data["total_raw_weight"],
-                    "contributor_count": winner_data["contributor_count"],
-                    "final_tick": tick,
-                    "issue_id": issue_id,
-                },
-                message=finalization_event["reason"],
+        if event_enabled(EventType.FINALIZATION_DECISION):
+            log_event(
+                LogEntry(
+                    tick=tick,
+                    phase=PhaseType.FINALIZE,
+                    event_type=EventType.FINALIZATION_DECISION,
+                    payload={
+                        "proposal_id": winner_proposal_id,
+                        "agent_id": agent_id,
+                        "effective_weight": winner_data["total_effective_weight"],
+                        "raw_weight": winner_data["total_raw_weight"],
+                        "contributor_count": winner_data["contributor_count"],
+                        "final_tick": tick,
+                        "issue_id": issue_id,
+                    },
+                    message=finalization_event["reason"],
+                )
             )
-        )
 
     def _emit_influence_events(self, winner_proposal_id, issue_id, tick):
         """Emit influence recorded events for each agent's contribution to winning proposal."""
         conviction_params = self.config.conviction_params
+        growth = growth_table(conviction_params)
         current_tick = self.state.tick
 
         # Find the first stake phase tick for mandatory stake time calculation
@@ -1332,10 +1453,8 @@ class Consensus:
         # Get all active stakes for winning proposal
         winning_stakes = [
             stake
-            for stake in self.state.stake_ledger
-            if stake.status == "active"
-            and stake.issue_id == issue_id
-            and stake.proposal_id == winner_proposal_id
+            for stake in self.state.get_active_stakes_for_proposal(winner_proposal_id)
+            if stake.issue_id == issue_id
         ]
 
         # Group stakes by agent and calculate their contributions
@@ -1350,9 +1469,7 @@ class Consensus:
                 time_held = current_tick - stake.initial_tick
 
             # Calculate conviction multiplier for this stake
-            growth_multiplier = self.creditmgr.calculate_growth_curve(
-                time_held, conviction_params
-            )
+            growth_multiplier = growth.multiplier(time_held)
             effective_weight = round(stake.cp * growth_multiplier, 2)
 
             if agent_id not in agent_contributions:
@@ -1382,22 +1499,23 @@ class Consensus:
 
             self.state.credit_events.append(influence_event)
 
-            log_event(
-                LogEntry(
-                    tick=tick,
-                    phase=PhaseType.FINALIZE,
-                    event_type=EventType.INFLUENCE_RECORDED,
-                    payload={
-                        "winning_proposal_id": winner_proposal_id,
-                        "agent_id": agent_id,
-                        "contribution": contrib_data["effective_contribution"],
-                        "raw_stake": contrib_data["raw_stake"],
-                        "multiplier": contrib_data["multiplier"],
-                        "issue_id": issue_id,
-                    },
-                    message=influence_event["reason"],
+            if event_enabled(EventType.INFLUENCE_RECORDED):
+                log_event(
+                    LogEntry(
+                        tick=tick,
+                        phase=PhaseType.FINALIZE,
+                        event_type=EventType.INFLUENCE_RECORDED,
+                        payload={
+                            "winning_proposal_id": winner_proposal_id,
+                            "agent_id": agent_id,
+                            "contribution": contrib_data["effective_contribution"],
+                            "raw_stake": contrib_data["raw_stake"],
+                            "multiplier": contrib_data["multiplier"],
+                            "issue_id": issue_id,
+                        },
+                        message=influence_event["reason"],
+                    )
                 )
-            )
 
     def _emit_no_winner_event(self, issue_id, tick):
         """Emit event when no winner can be determined."""
@@ -1416,21 +1534,22 @@ class Consensus:
 
         self.creditmgr.events.append(no_winner_event)
 
-        log_event(
-            LogEntry(
-                tick=tick,
-                phase=PhaseType.FINALIZE,
-                event_type=EventType.FINALIZATION_DECISION,
-                payload={
-                    "proposal_id": None,
-                    "agent_id": "system",
-                    "effective_weight": 0,
-                    "raw_weight": 0,
-                    "final_tick": tick,
-                },
-                message=no_winner_event["reason"],
+        if event_enabled(EventType.FINALIZATION_DECISION):
+            log_event(
+                LogEntry(
+                    tick=tick,
+                    phase=PhaseType.FINALIZE,
+                    event_type=EventType.FINALIZATION_DECISION,
+                    payload={
+                        "proposal_id": None,
+                        "agent_id": "system",
+                        "effective_weight": 0,
+                        "raw_weight": 0,
+                        "final_tick": tick,
+                    },
+                    message=no_winner_event["reason"],
+                )
             )
-        )
 
     def _perform_finalization_cleanup(self, issue_id, tick):
         """Perform final cleanup tasks."""
@@ -1453,15 +1572,16 @@ class Consensus:
 
         self.creditmgr.events.append(finalized_event)
 
-        log_event(
-            LogEntry(
-                tick=tick,
-                phase=PhaseType.FINALIZE,
-                event_type=EventType.ISSUE_FINALIZED,
-                payload={"issue_id": issue_id},
-                message=f"Issue {issue_id} finalized at tick {tick}",
+        if event_enabled(EventType.ISSUE_FINALIZED):
+            log_event(
+                LogEntry(
+                    tick=tick,
+                    phase=PhaseType.FINALIZE,
+                    event_type=EventType.ISSUE_FINALIZED,
+                    payload={"issue_id": issue_id},
+                    message=f"Issue {issue_id} finalized at tick {tick}",
+                )
             )
-        )
 
     def _format_proposal_display(self, proposal_id, issue_id):
         """Format proposal ID for display as #ID (author, revN)."""
@@ -1522,6 +1642,7 @@ class Consensus:
         print("-" * 70)
 
         conviction_params = self.config.conviction_params
+        growth = growth_table(conviction_params)
         current_tick = self.state.tick
 
         # Find the first stake phase tick for mandatory stake time calculation
@@ -1542,10 +1663,8 @@ class Consensus:
             # Find all stakes for this proposal
             proposal_stakes = [
                 stake
-                for stake in self.state.stake_ledger
-                if stake.status == "active"
-                and stake.issue_id == issue_id
-                and stake.proposal_id == proposal_id
+                for stake in self.state.get_active_stakes_for_proposal(proposal_id)
+                if stake.issue_id == issue_id
             ]
 
             # Group stakes by agent and calculate their contributions
@@ -1560,9 +1679,7 @@ class Consensus:
                     time_held = current_tick - stake.initial_tick
 
                 # Calculate conviction multiplier for this stake
-                growth_multiplier = self.creditmgr.calculate_growth_curve(
-                    time_held, conviction_params
-                )
+                growth_multiplier = growth.multiplier(time_held)
                 effective_weight = round(stake.cp * growth_multiplier, 2)
 
                 if agent_id not in agent_contributions:
@@ -1614,11 +1731,7 @@ class Consensus:
         participating_agents = set()
 
         # Get all active stakes for this issue
-        active_stakes = [
-            stake
-            for stake in self.state.stake_ledger
-            if stake.status == "active" and stake.issue_id == issue_id
-        ]
+        active_stakes = self.state.get_active_stakes_for_issue(issue_id)
 
         for stake in active_stakes:
             participating_agents.add(stake.agent_id)
@@ -1630,9 +1743,7 @@ class Consensus:
                 time_held = current_tick - stake.initial_tick
 
             # Calculate conviction multiplier for this stake
-            growth_multiplier = self.creditmgr.calculate_growth_curve(
-                time_held, conviction_params
-            )
+            growth_multiplier = growth.multiplier(time_held)
             all_multipliers.append(growth_multiplier)
 
         if all_multipliers:
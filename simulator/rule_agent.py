@@ -0,0 +1,317 @@
+"""Rule-based agent policy for protocol-only runs.
+
+Decisions are simple functions of the agent's protocol profile traits
+(initiative, compliance, risk_tolerance, persuasiveness, sociability,
+adaptability, self_interest, consistency), its seeded RNG and the signal
+payload. No LLM is involved, so each decision takes microseconds and
+Controller.run can be benchmarked and stress-tested with thousands of agents.
+
+Selected with agent_policy="rules" (GlobalConfig / SessionCreateRequest).
+"""
+
+import random
+from typing import Dict
+
+from models import Action, AgentActor, Proposal, current_action_queue
+from text_delta import sentence_sequence_delta
+from utils import generate_lorem_content
+
+# Agents take no further action in a phase once they signal ready, so the
+# phase's remaining idle ticks can be fast-forwarded (see Consensus.tick)
+QUIESCENT_WHEN_READY = True
+
+PROFILE_TRAITS = (
+    "initiative",
+    "compliance",
+    "risk_tolerance",
+    "persuasiveness",
+    "sociability",
+    "adaptability",
+    "self_interest",
+    "consistency",
+)
+
+
+def protocol_profile(agent: AgentActor) -> Dict[str, float]:
+    """Protocol traits for an agent, derived from its OCEAN profile if needed.
+
+    Engine agents carry a protocol_profile directly; simulator agents carry an
+    ocean_profile, mapped the same way as automoton.calculate_strategic_cp_reserve.
+    Missing traits default to 0.5. The result is cached in agent memory.
+    """
+    cached = agent.memory.get("protocol_profile")
+    if cached is not None:
+        return cached
+
+    metadata = agent.metadata or {}
+    if metadata.get("protocol_profile"):
+        source = metadata["protocol_profile"]
+        profile = {trait: float(source.get(trait, 0.5)) for trait in PROFILE_TRAITS}
+    elif metadata.get("ocean_profile"):
+        ocean = metadata["ocean_profile"]
+        openness = ocean.get("openness", 0.5)
+        conscientiousness = ocean.get("conscientiousness", 0.5)
+        extraversion = ocean.get("extraversion", 0.5)
+        agreeableness = ocean.get("agreeableness", 0.5)
+        neuroticism = ocean.get("neuroticism", 0.5)
+        profile = {
+            "initiative": (extraversion + conscientiousness) / 2,
+            "compliance": (agreeableness + conscientiousness) / 2,
+            "risk_tolerance": 1 - neuroticism,
+            "persuasiveness": extraversion,
+            "sociability": (extraversion + agreeableness) / 2,
+            "adaptability": openness,
+            "self_interest": 1 - agreeableness,
+            "consistency": conscientiousness,
+        }
+    else:
+        profile = dict.fromkeys(PROFILE_TRAITS, 0.5)
+
+    agent.memory["protocol_profile"] = profile
+    return profile
+
+
+def strategic_reserve(profile: Dict[str, float], balance: int) -> int:
+    """CP held back for staking (same weighting as the LLM agents' reserve)."""
+    strategic_factor = (
+        profile["self_interest"] * 0.4
+        + (1 - profile["risk_tolerance"]) * 0.4
+        + profile["consistency"] * 0.2
+    )
+    return int(balance * (0.2 + strategic_factor * 0.6))
+
+
+def handle_signal(agent: AgentActor, payload: dict):
+    """Route phase signals to the rule handlers."""
+    agent_proposal_id = payload.get("agent_proposal_id")
+    if agent_proposal_id is not None:
+        agent.latest_proposal_id = agent_proposal_id
+
+    handler = _HANDLERS.get(payload.get("type"))
+    if handler is not None:
+        handler(agent, payload, protocol_profile(agent))
+    return {"ack": True}
+
+
+def _submit(agent: AgentActor, action_type: str, payload: dict):
+    current_action_queue().submit(
+        Action(type=action_type, agent_id=agent.agent_id, payload=payload)
+    )
+
+
+def _signal_ready(agent: AgentActor, issue_id: str):
+    _submit(agent, "signal_ready", {"issue_id": issue_id})
+
+
+def _first_signal(agent: AgentActor, payload: dict) -> bool:
+    """True the first time an agent is signalled in this phase instance."""
+    decided = agent.memory.setdefault("rule_decided_phases", set())
+    phase_number = payload["phase"].phase_number
+    if phase_number in decided:
+        return False
+    decided.add(phase_number)
+    return True
+
+
+def _rng(agent: AgentActor) -> random.Random:
+    if agent.rng is None:
+        agent.rng = random.Random(agent.seed)
+    return agent.rng
+
+
+def handle_propose(agent: AgentActor, payload: dict, profile: Dict[str, float]):
+    """Propose once, with probability initiative, if the self-stake is affordable."""
+    state = payload["state"]
+    config = payload["config"]
+    if _first_signal(agent, payload):
+        rng = _rng(agent)
+        balance = state.agent_balances.get(agent.agent_id, 0)
+        if (
+            rng.random() < profile["initiative"]
+            and balance >= config.proposal_self_stake
+        ):
+            word_count = 40 + int(40 * profile["persuasiveness"])
+            proposal = Proposal(
+                proposal_id=0,
+                content=generate_lorem_content(rng, word_count),
+                agent_id=agent.agent_id,
+                issue_id=config.issue_id,
+                tick=state.tick,
+                metadata={"origin": "rules"},
+                author=agent.agent_id,
+                author_type="agent",
+            )
+            _submit(agent, "submit_proposal", proposal.model_dump())
+    _signal_ready(agent, config.issue_id)
+
+
+def handle_feedback(agent: AgentActor, payload: dict, profile: Dict[str, float]):
+    """Comment on round(sociability × quota) other proposals, within the CP reserve."""
+    state = payload["state"]
+    config = payload["config"]
+    phase = payload["phase"]
+    if _first_signal(agent, payload):
+        rng = _rng(agent)
+        own_id = payload.get("agent_proposal_id")
+        targets = sorted(
+            pid
+            for pid in payload.get("proposal_contents", {})
+            if pid != own_id and pid != 0
+        )
+        balance = state.agent_balances.get(agent.agent_id, 0)
+        affordable = (
+            balance - strategic_reserve(profile, balance)
+        ) // phase.feedback_stake
+        count = min(
+            round(profile["sociability"] * phase.max_feedback_per_agent),
+            len(targets),
+            max(affordable, 0),
+        )
+        for pid in rng.sample(targets, count):
+            _submit(
+                agent,
+                "feedback",
+                {
+                    "target_proposal_id": pid,
+                    "comment": generate_lorem_content(rng, 12),
+                    "tick": state.tick,
+                    "issue_id": config.issue_id,
+                },
+            )
+    _signal_ready(agent, config.issue_id)
+
+
+def handle_revise(agent: AgentActor, payload: dict, profile: Dict[str, float]):
+    """Revise own proposal with probability adaptability × (1 - consistency / 2)."""
+    state = payload["state"]
+    config = payload["config"]
+    phase = payload["phase"]
+    proposal_id = payload.get("agent_proposal_id")
+    if _first_signal(agent, payload) and proposal_id and state.current_issue:
+        rng = _rng(agent)
+        proposal = next(
+            (p for p in state.current_issue.proposals if p.proposal_id == proposal_id),
+            None,
+        )
+        if (
+            proposal is not None
+            and proposal.agent_id == agent.agent_id
+            and rng.random() < profile["adaptability"] * (1 - profile["consistency"] / 2)
+        ):
+            words = proposal.content.split()
+            keep = int(len(words) * (1 - profile["adaptability"] / 2))
+            new_content = " ".join(
+                words[:keep] + generate_lorem_content(rng, len(words) - keep).split()
+            )
+            balance = state.agent_balances.get(agent.agent_id, 0)
+            cost = int(
+                phase.proposal_self_stake
+                * sentence_sequence_delta(proposal.content, new_content)
+            )
+            if cost <= balance - strategic_reserve(profile, balance):
+                _submit(
+                    agent,
+                    "revise",
+                    {
+                        "proposal_id": proposal_id,
+                        "new_content": new_content,
+                        "tick": state.tick,
+                        "issue_id": config.issue_id,
+                    },
+                )
+    _signal_ready(agent, config.issue_id)
+
+
+def _stake_preference(agent: AgentActor, payload: dict, profile: Dict[str, float]):
+    """Preferred proposal for this stake phase: own proposal or a scored pick."""
+    memory = agent.memory.setdefault("rule_stake_preference", {})
+    phase_number = payload["phase"].phase_number
+    if phase_number not in memory:
+        rng = _rng(agent)
+        own_id = payload.get("agent_proposal_id")
+        candidates = sorted(payload.get("proposal_convictions", {}) or {0: None})
+        if own_id and own_id in candidates and rng.random() < profile["self_interest"]:
+            memory[phase_number] = own_id
+        else:
+            # Consistent agents settle on the same pick; others spread out
+            weights = [
+                1 + (1 - profile["consistency"]) * rng.random() for _ in candidates
+            ]
+            memory[phase_number] = candidates[weights.index(max(weights))]
+    return memory[phase_number]
+
+
+def _conviction_leader(convictions: dict) -> int:
+    """Proposal with the highest effective conviction (lowest id on ties)."""
+    return max(
+        convictions,
+        key=lambda pid: (convictions[pid]["total_effective_weight"], -pid),
+    )
+
+
+def handle_stake(agent: AgentActor, payload: dict, profile: Dict[str, float]):
+    """Stake on the preferred (or leading) proposal, or switch voluntary CP to it.
+
+    Signals ready once no CP is left above the reserve, or on the phase's last
+    tick (stake phases only advance when every agent is ready), so stake phases
+    are not fast-forwarded while agents still have CP to commit. Once ready, an
+    agent stays idle for the rest of the phase.
+    """
+    state = payload["state"]
+    config = payload["config"]
+    if state.agent_readiness.get(agent.agent_id):
+        return
+    rng = _rng(agent)
+    convictions = payload.get("proposal_convictions", {})
+    target = _stake_preference(agent, payload, profile)
+
+    # Sociable, adaptable agents follow the current conviction leader
+    if convictions and rng.random() < profile["sociability"] * profile["adaptability"]:
+        target = _conviction_leader(convictions)
+
+    # Switches to or from proposal 0 (no-action) are rejected by the controller
+    voluntary = [
+        stake
+        for stake in state.get_active_stakes_by_agent(agent.agent_id)
+        if not stake.mandatory and stake.proposal_id not in (0, target)
+    ]
+    balance = payload.get("current_balance", 0)
+    available = balance - strategic_reserve(profile, balance)
+
+    if voluntary and target and rng.random() < profile["adaptability"] * 0.5:
+        source = voluntary[0]
+        _submit(
+            agent,
+            "switch_stake",
+            {
+                "source_proposal_id": source.proposal_id,
+                "target_proposal_id": target,
+                "cp_amount": source.cp,
+                "tick": state.tick,
+                "issue_id": config.issue_id,
+                "reason": "rules",
+            },
+        )
+    elif available > 0 and rng.random() < profile["initiative"]:
+        amount = max(1, int(available * profile["risk_tolerance"] * 0.5))
+        _submit(
+            agent,
+            "stake",
+            {
+                "proposal_id": target,
+                "stake_amount": amount,
+                "tick": state.tick,
+                "issue_id": config.issue_id,
+                "choice_reason": "rules",
+            },
+        )
+    if available <= 0 or state.phase_tick >= payload["phase"].max_phase_ticks:
+        _signal_ready(agent, config.issue_id)
+
+
+_HANDLERS = {
+    "Propose": handle_propose,
+    "Feedback": handle_feedback,
+    "Revise": handle_revise,
+    "Stake": handle_stake,
+}
@@ -5,8 +5,12 @@ Provides structured logging with forensic SQLite capture and rich console output
 Designed as a pure observer with zero impact on simulation protocol logic.
 """
 
+import atexit
+import queue
 import sqlite3
 import json
+import threading
+import time
 from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime
@@ -45,6 +49,7 @@ class EventType(str, Enum):
     PHASE_BEGIN = "phase_begin"
     PHASE_FINISH = "phase_finish"
     CONSENSUS_TICK = "consensus_tick"
+    FAST_FORWARD = "fast_forward"
     PROPOSAL_STAKE_TRANSFERRED = "proposal_stake_transferred"
 
     # Finalization
@@ -129,17 +134,235 @@ class LogEntry(BaseModel):
     level: LogLevel = LogLevel.INFO
 
 
+# Payload fields copied into real, indexed events columns; the first key present wins
+PROMOTED_EVENT_FIELDS = {
+    "proposal_id": ("proposal_id",),
+    "amount": ("amount", "stake_amount", "cp_amount", "raw_stake"),
+    "issue_id": ("issue_id",),
+}
+
+EVENT_INDEXES = {
+    "idx_events_type_tick": "events (event_type, tick)",
+    "idx_events_agent_tick": "events (agent_id, tick)",
+    "idx_events_proposal": "events (proposal_id, tick)",
+    "idx_state_snapshots_tick": "state_snapshots (tick)",
+    "idx_state_snapshots_issue_tick": "state_snapshots (issue_id, tick)",
+    "idx_state_deltas_issue_base_tick": "state_deltas (issue_id, base_tick, tick)",
+}
+
+# Snapshot columns added after the tables were first shipped, by table
+SNAPSHOT_COLUMNS = {
+    "state_snapshots": {"issue_id": "TEXT"},
+    "state_deltas": {"issue_id": "TEXT"},
+}
+
+
+def _promoted_values(payload: Optional[Dict[str, Any]]) -> tuple:
+    """Values for the promoted events columns, in PROMOTED_EVENT_FIELDS order."""
+    if not payload:
+        return (None,) * len(PROMOTED_EVENT_FIELDS)
+    values = []
+    for keys in PROMOTED_EVENT_FIELDS.values():
+        value = None
+        for key in keys:
+            value = payload.get(key)
+            if value is not None:
+                break
+        values.append(value)
+    return tuple(values)
+
+
+SCENARIO_SUMMARY_COLUMNS = (
+    "scenario",
+    "scenario_seed",
+    "issue_id",
+    "shard",
+    "final_tick",
+    "phases_executed",
+    "proposals",
+    "stakes",
+    "winner_proposal_id",
+    "duration_ms",
+)
+
+# llm_calls columns, in insert order (see llm_provider telemetry)
+LLM_CALL_COLUMNS = (
+    "tick",
+    "phase",
+    "agent_id",
+    "call_type",
+    "model",
+    "prompt_chars",
+    "response_chars",
+    "latency_ms",
+    "wait_ms",
+    "schema_fallback",
+    "validation_failed",
+    "cache_hit",
+    "error",
+)
+
+
+def migrate_event_schema(connection: sqlite3.Connection):
+    """
+    Bring a forensic database up to the current events schema.
+
+    Adds the promoted payload columns to databases written before they existed,
+    backfills them from the JSON payload, adds the snapshot issue_id columns,
+    and creates the query indexes.
+    Safe to run repeatedly, and a no-op on databases without an events table.
+    """
+    tables = {
+        row[0]
+        for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    }
+    if "events" not in tables:
+        return
+    columns = {row[1] for row in connection.execute("PRAGMA table_info(events)")}
+    missing = [name for name in PROMOTED_EVENT_FIELDS if name not in columns]
+    column_types = {
+        "proposal_id": "INTEGER",
+        "amount": "REAL",
+        "issue_id": "TEXT",
+    }
+    with connection:
+        for name in missing:
+            connection.execute(
+                f"ALTER TABLE events ADD COLUMN {name} {column_types[name]}"
+            )
+        if missing:
+            assignments = ", ".join(
+                f"{name} = COALESCE("
+                + ", ".join(f"json_extract(payload, '$.{key}')" for key in keys)
+                + ", NULL)"
+                for name, keys in PROMOTED_EVENT_FIELDS.items()
+                if name in missing
+            )
+            connection.execute(
+                f"UPDATE events SET {assignments} "
+                "WHERE payload IS NOT NULL AND json_valid(payload)"
+            )
+        for table, added in SNAPSHOT_COLUMNS.items():
+            if table not in tables:
+                continue
+            existing = {
+                row[1] for row in connection.execute(f"PRAGMA table_info({table})")
+            }
+            for name, column_type in added.items():
+                if name not in existing:
+                    connection.execute(
+                        f"ALTER TABLE {table} ADD COLUMN {name} {column_type}"
+                    )
+        for index, target in EVENT_INDEXES.items():
+            if target.split(" ", 1)[0] in tables:
+                connection.execute(f"CREATE INDEX IF NOT EXISTS {index} ON {target}")
+
+
+def event_row(event_dict: dict, message: str) -> tuple:
+    """events row for a structured event, with the payload JSON-encoded now."""
+    payload = event_dict.get("payload")
+    return (
+        event_dict.get("tick"),
+        event_dict.get("phase"),
+        event_dict.get("agent_id"),
+        event_dict.get("event_type"),
+        message,
+        json.dumps(payload) if payload else None,
+        *_promoted_values(payload),
+    )
+
+
+def snapshot_row(state_data: dict) -> tuple:
+    """state_snapshots row (fields are already JSON-encoded by the state)."""
+    return (
+        state_data["tick"],
+        state_data["phase"],
+        state_data["phase_tick"],
+        state_data["agent_balances"],
+        state_data["agent_readiness"],
+        state_data["agent_proposal_ids"],
+        state_data["proposals"],
+        state_data["stake_ledger"],
+        state_data["credit_events"],
+        state_data["execution_ledger"],
+        state_data["proposal_counter"],
+        state_data["issue_finalized"],
+        state_data["finalization_tick"],
+        state_data.get("issue_id"),
+    )
+
+
+def delta_row(delta_data: dict) -> tuple:
+    """state_deltas row (changes since the keyframe at base_tick)."""
+    return (
+        delta_data["tick"],
+        delta_data["base_tick"],
+        delta_data["phase"],
+        delta_data["phase_tick"],
+        delta_data["agent_balances"],
+        delta_data["agent_readiness"],
+        delta_data["agent_proposal_ids"],
+        delta_data["proposals"],
+        delta_data["stake_changes"],
+        delta_data["credit_events"],
+        delta_data["execution_ledger"],
+        delta_data["proposal_counter"],
+        delta_data["issue_finalized"],
+        delta_data["finalization_tick"],
+        delta_data.get("issue_id"),
+    )
+
+
+def llm_call_row(call: dict) -> tuple:
+    return tuple(call.get(column) for column in LLM_CALL_COLUMNS)
+
+
+def summary_row(summary: dict) -> tuple:
+    return tuple(summary.get(column) for column in SCENARIO_SUMMARY_COLUMNS)
+
+
 class SQLiteSink:
-    """Custom loguru sink for SQLite event storage."""
+    """Custom loguru sink for SQLite event storage.
 
-    def __init__(self, db_path: Path):
+    Events and state snapshots/deltas are buffered and written with executemany in one
+    transaction per tick, or sooner when the buffer reaches batch_size rows or
+    flush_interval seconds have passed. The database runs in WAL mode so readers
+    (forensic tools, the engine) are not blocked by the writer. Buffered rows are
+    flushed on close() and, via atexit, when the process exits on an error.
+    """
+
+    BATCH_SIZE = 500
+    FLUSH_INTERVAL = 1.0  # seconds
+
+    def __init__(
+        self,
+        db_path: Path,
+        batch_size: int = BATCH_SIZE,
+        flush_interval: float = FLUSH_INTERVAL,
+        wal: bool = True,
+    ):
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.connection = sqlite3.connect(str(db_path))
+        self.connection = sqlite3.connect(str(db_path), check_same_thread=False)
+        if wal:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
         self._init_tables()
 
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending_events: list = []
+        self._pending_snapshots: list = []
+        self._pending_deltas: list = []
+        self._pending_llm_calls: list = []
+        self.rejected_rows = 0  # rows the database refused, dropped after a failed batch
+        self._batch_tick: Optional[int] = None
+        self._last_flush = time.monotonic()
+        self._lock = threading.RLock()
+        atexit.register(self.flush)
+
     def _init_tables(self):
-        """Initialize the events table with the required schema."""
+        """Initialize the events and snapshot tables, migrating older databases."""
         self.connection.execute(
             """
             CREATE TABLE IF NOT EXISTS events (
@@ -149,7 +372,10 @@ class SQLiteSink:
                 agent_id TEXT,
                 event_type TEXT,
                 message TEXT,
-                payload TEXT
+                payload TEXT,
+                proposal_id INTEGER,
+                amount REAL,
+                issue_id TEXT
             )
         """
         )
@@ -172,83 +398,498 @@ class SQLiteSink:
                 proposal_counter INTEGER,
                 issue_finalized BOOLEAN,
                 finalization_tick INTEGER,
+                issue_id TEXT,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """
+        )
+
+        # Per-tick changes since a keyframe in state_snapshots (delta snapshot mode)
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS state_deltas (
+                id INTEGER PRIMARY KEY,
+                tick INTEGER NOT NULL,
+                base_tick INTEGER NOT NULL,
+                phase TEXT,
+                phase_tick INTEGER,
+                agent_balances TEXT,
+                agent_readiness TEXT,
+                agent_proposal_ids TEXT,
+                proposals TEXT,
+                stake_changes TEXT,
+                credit_events TEXT,
+                execution_ledger TEXT,
+                proposal_counter INTEGER,
+                issue_finalized BOOLEAN,
+                finalization_tick INTEGER,
+                issue_id TEXT,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """
+        )
+
+        # One row per scenario of a run; batch runs point at each worker's shard
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS scenario_summary (
+                id INTEGER PRIMARY KEY,
+                scenario INTEGER NOT NULL,
+                scenario_seed INTEGER,
+                issue_id TEXT,
+                shard TEXT,
+                final_tick INTEGER,
+                phases_executed INTEGER,
+                proposals INTEGER,
+                stakes INTEGER,
+                winner_proposal_id INTEGER,
+                duration_ms REAL,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """
+        )
+
+        # One row per one_shot / one_shot_json call (LLM telemetry)
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_calls (
+                id INTEGER PRIMARY KEY,
+                tick INTEGER,
+                phase TEXT,
+                agent_id TEXT,
+                call_type TEXT,
+                model TEXT,
+                prompt_chars INTEGER,
+                response_chars INTEGER,
+                latency_ms REAL,
+                wait_ms REAL,
+                schema_fallback BOOLEAN,
+                validation_failed BOOLEAN,
+                cache_hit BOOLEAN,
+                error TEXT,
                 timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
             )
         """
         )
         self.connection.commit()
+        migrate_event_schema(self.connection)
 
     def write(self, message):
-        """Write a log record to SQLite."""
+        """Buffer a log record for SQLite."""
         record = message.record
 
         # Extract event data from the bound context or record extra
         event_dict = record.get("extra", {}).get("event_dict", {})
+        self.write_event(event_dict, record["message"])
 
-        # Insert into SQLite
-        self.connection.execute(
-            """
-            INSERT INTO events (tick, phase, agent_id, event_type, message, payload)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """,
-            (
-                event_dict.get("tick"),
-                event_dict.get("phase"),
-                event_dict.get("agent_id"),
-                event_dict.get("event_type"),
-                record["message"],
-                (
-                    json.dumps(event_dict.get("payload"))
-                    if event_dict.get("payload")
-                    else None
-                ),
-            ),
-        )
-        self.connection.commit()
+    def write_event(self, event_dict: dict, message: str):
+        """Buffer one structured event row, flushing at tick boundaries and thresholds."""
+        self.add_event_row(event_row(event_dict, message))
 
     def save_state_snapshot(self, state_data: dict):
-        """Save a complete state snapshot to the database."""
-        self.connection.execute(
-            """
-            INSERT INTO state_snapshots (
-                tick, phase, phase_tick, agent_balances, agent_readiness,
-                agent_proposal_ids, proposals, stake_ledger, credit_events,
-                execution_ledger, proposal_counter, issue_finalized,
-                finalization_tick
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
+        """Buffer a complete state snapshot; written with the current tick's events."""
+        self.add_snapshot_row(snapshot_row(state_data))
+
+    def save_state_delta(self, delta_data: dict):
+        """Buffer a delta snapshot row (changes since the keyframe at base_tick)."""
+        self.add_delta_row(delta_row(delta_data))
+
+    def save_llm_call(self, call: dict):
+        """Buffer one llm_calls telemetry row."""
+        self.add_llm_call_row(llm_call_row(call))
+
+    def save_scenario_summary(self, summary: dict):
+        """Write one scenario_summary row immediately (after any buffered rows)."""
+        self.add_summary_row(summary_row(summary))
+
+    # Pre-built rows (see event_row etc.); AsyncSQLiteSink encodes on the caller thread
+
+    def add_event_row(self, row):
+        tick = row[0]
+        with self._lock:
+            if (
+                tick is not None
+                and tick != self._batch_tick
+                and self._pending_count()
+            ):
+                self._flush_locked()
+            if tick is not None:
+                self._batch_tick = tick
+            self._pending_events.append(row)
+            self._maybe_flush_locked()
+
+    def add_snapshot_row(self, row):
+        with self._lock:
+            self._pending_snapshots.append(row)
+            self._maybe_flush_locked()
+
+    def add_delta_row(self, row):
+        with self._lock:
+            self._pending_deltas.append(row)
+            self._maybe_flush_locked()
+
+    def add_llm_call_row(self, row):
+        with self._lock:
+            self._pending_llm_calls.append(row)
+            self._maybe_flush_locked()
+
+    def add_summary_row(self, row):
+        with self._lock:
+            self._flush_locked()
+            with self.connection:
+                self.connection.execute(
+                    """
+                    INSERT INTO scenario_summary (
+                        scenario, scenario_seed, issue_id, shard, final_tick,
+                        phases_executed, proposals, stakes, winner_proposal_id,
+                        duration_ms
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                    row,
+                )
+
+    def flush(self):
+        """Write all buffered rows in a single transaction."""
+        with self._lock:
+            self._flush_locked()
+
+    def _pending_count(self) -> int:
+        return (
+            len(self._pending_events)
+            + len(self._pending_snapshots)
+            + len(self._pending_deltas)
+            + len(self._pending_llm_calls)
+        )
+
+    def _maybe_flush_locked(self):
+        if (
+            self._pending_count() >= self.batch_size
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self._flush_locked()
+
+    def _flush_locked(self):
+        self._last_flush = time.monotonic()
+        if not self._pending_count() or not self.connection:
+            return
+        batches = self._pending_batches()
+        try:
+            with self.connection:
+                for sql, rows in batches:
+                    if rows:
+                        self.connection.executemany(sql, rows)
+        except sqlite3.Error as e:
+            # The batch rolled back; write row by row so one bad row does not
+            # lose the rest
+            logger.error(f"Forensic batch insert failed, retrying row by row: {e!r}")
+            self._insert_rows_singly(batches)
+        # Buffered rows are only dropped once written (or rejected)
+        for _, rows in batches:
+            rows.clear()
+
+    def _pending_batches(self):
+        """(insert statement, pending rows) pairs, in write order."""
+        return [
+            (
+                """
+                INSERT INTO events (
+                    tick, phase, agent_id, event_type, message, payload,
+                    proposal_id, amount, issue_id
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                self._pending_events,
+            ),
             (
-                state_data["tick"],
-                state_data["phase"],
-                state_data["phase_tick"],
-                state_data["agent_balances"],
-                state_data["agent_readiness"],
-                state_data["agent_proposal_ids"],
-                state_data["proposals"],
-                state_data["stake_ledger"],
-                state_data["credit_events"],
-                state_data["execution_ledger"],
-                state_data["proposal_counter"],
-                state_data["issue_finalized"],
-                state_data["finalization_tick"],
+                """
+                INSERT INTO state_snapshots (
+                    tick, phase, phase_tick, agent_balances, agent_readiness,
+                    agent_proposal_ids, proposals, stake_ledger, credit_events,
+                    execution_ledger, proposal_counter, issue_finalized,
+                    finalization_tick, issue_id
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                self._pending_snapshots,
             ),
+            (
+                """
+                INSERT INTO state_deltas (
+                    tick, base_tick, phase, phase_tick, agent_balances,
+                    agent_readiness, agent_proposal_ids, proposals, stake_changes,
+                    credit_events, execution_ledger, proposal_counter,
+                    issue_finalized, finalization_tick, issue_id
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                self._pending_deltas,
+            ),
+            (
+                f"""
+                INSERT INTO llm_calls ({", ".join(LLM_CALL_COLUMNS)})
+                VALUES ({", ".join("?" * len(LLM_CALL_COLUMNS))})
+            """,
+                self._pending_llm_calls,
+            ),
+        ]
+
+    def _insert_rows_singly(self, batches):
+        """Fallback for a failed batch: commit each row on its own, rejecting bad rows.
+
+        A database-level error (locked, disk full) keeps the unwritten rows
+        buffered for the next flush and is re-raised.
+        """
+        for sql, rows in batches:
+            for index, row in enumerate(rows):
+                try:
+                    with self.connection:
+                        self.connection.execute(sql, row)
+                except sqlite3.OperationalError:
+                    del rows[:index]
+                    raise
+                except sqlite3.Error as e:
+                    self.rejected_rows += 1
+                    logger.error(f"Forensic row rejected: {e!r}")
+            rows.clear()
+
+    def close(self):
+        """Flush buffered rows and close the SQLite connection."""
+        with self._lock:
+            if self.connection:
+                self._flush_locked()
+                self.connection.close()
+                self.connection = None
+        atexit.unregister(self.flush)
+
+
+BACKPRESSURE_POLICIES = ("block", "drop-debug", "spill")
+
+
+class AsyncSQLiteSink:
+    """SQLiteSink driven by a background writer thread.
+
+    The simulation thread only enqueues rows onto a bounded queue; the writer
+    thread owns the SQLiteSink (and its connection) and does all disk I/O, so
+    tick latency no longer depends on disk speed. When the queue is full the
+    backpressure policy decides what happens:
+
+    - "block": wait for the writer (no data loss, the default)
+    - "drop-debug": discard DEBUG-level events, block for everything else
+    - "spill": append the row to a JSONL spill file. Once spilling, every
+      row goes to the file until the writer has emptied the queue and
+      replayed it, so rows still reach the database in log order
+
+    queue_depth, max_queue_depth, dropped_events and spilled_events are exposed
+    as counters (see stats()).
+    """
+
+    QUEUE_SIZE = 10_000
+    _STOP = object()
+
+    def __init__(
+        self,
+        db_path: Path,
+        queue_size: int = QUEUE_SIZE,
+        backpressure: str = "block",
+        spill_path: Optional[Path] = None,
+        **sink_options,
+    ):
+        if backpressure not in BACKPRESSURE_POLICIES:
+            raise ValueError(
+                f"Unknown backpressure policy {backpressure!r}, "
+                f"expected one of {BACKPRESSURE_POLICIES}"
+            )
+        self.db_path = db_path
+        self.backpressure = backpressure
+        self.spill_path = spill_path or db_path.with_suffix(".spill.jsonl")
+        self.sink = SQLiteSink(db_path, **sink_options)
+        self.flush_interval = self.sink.flush_interval
+
+        self.max_queue_depth = 0
+        self.dropped_events = 0
+        self.spilled_events = 0
+        self.write_errors = 0
+        self._spill_file = None
+        self._spill_lock = threading.Lock()
+        self._closed = False
+
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._writer = threading.Thread(
+            target=self._run, name=f"sqlite-writer-{db_path.stem}", daemon=True
         )
-        self.connection.commit()
+        self._writer.start()
+        atexit.register(self.close)
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def stats(self) -> Dict[str, Any]:
+        """Writer counters for monitoring."""
+        return {
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "dropped_events": self.dropped_events,
+            "spilled_events": self.spilled_events,
+            "write_errors": self.write_errors,
+            "backpressure": self.backpressure,
+        }
+
+    def write(self, message):
+        """Loguru sink entry point; enqueue a log record for the writer thread."""
+        record = message.record
+        event_dict = record.get("extra", {}).get("event_dict", {})
+        self.write_event(event_dict, record["message"])
+
+    # Rows are built (and payloads JSON-encoded) here on the caller's thread, so
+    # later changes to a logged dict never reach the database and encoding
+    # errors surface at the log call rather than on the writer thread.
+
+    def write_event(self, event_dict: dict, message: str):
+        debug = event_dict.get("level") == LogLevel.DEBUG.value
+        self._enqueue(("event", event_row(event_dict, message), debug))
+
+    def save_state_snapshot(self, state_data: dict):
+        self._enqueue(("snapshot", snapshot_row(state_data)))
+
+    def save_state_delta(self, delta_data: dict):
+        self._enqueue(("delta", delta_row(delta_data)))
+
+    def save_llm_call(self, call: dict):
+        self._enqueue(("llm_call", llm_call_row(call)))
+
+    def save_scenario_summary(self, summary: dict):
+        self._enqueue(("summary", summary_row(summary)))
+
+    def flush(self):
+        """Block until everything enqueued so far has been written."""
+        if self._closed or not self._writer.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put(("flush", done))
+        done.wait()
 
     def close(self):
-        """Close the SQLite connection."""
-        if self.connection:
-            self.connection.close()
+        """Drain the queue, replay any spill file and close the database."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._writer.is_alive():
+            self._queue.put(self._STOP)
+            self._writer.join()
+        atexit.unregister(self.close)
+
+    def _enqueue(self, item: tuple):
+        if self._closed:
+            return
+        if not self._writer.is_alive():
+            # A blocking put would never return; fail at the log call instead
+            raise RuntimeError(f"Forensic writer for {self.db_path} is not running")
+        if self._spill_file is not None and self._spill(item, only_if_spilling=True):
+            return
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            if self.backpressure == "spill":
+                self._spill(item)
+                return
+            if self.backpressure == "drop-debug" and _is_debug_event(item):
+                self.dropped_events += 1
+                return
+            self._queue.put(item)
+        depth = self._queue.qsize()
+        if depth > self.max_queue_depth:
+            self.max_queue_depth = depth
+
+    def _spill(self, item: tuple, only_if_spilling: bool = False) -> bool:
+        """Append item to the spill file; with only_if_spilling, only if one is open."""
+        with self._spill_lock:
+            if self._spill_file is None:
+                if only_if_spilling:
+                    return False
+                self._spill_file = open(self.spill_path, "a", encoding="utf-8")
+            self._spill_file.write(json.dumps(item, default=str) + "\n")
+            self.spilled_events += 1
+            return True
+
+    def _run(self):
+        """Writer thread: apply queued rows, flushing the batch when idle."""
+        while True:
+            # Spilled rows are newer than anything queued before spilling began
+            # and older than anything queued after the replay starts
+            if self._spill_file is not None and self._queue.empty():
+                self._replay_spill()
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                self._apply(("flush", None))
+                continue
+            if item is self._STOP:
+                break
+            if item[0] == "flush":
+                # Rows spilled before the flush request must be written by it
+                self._replay_spill()
+            self._apply(item)
+
+        self._replay_spill()
+        self.sink.close()
+
+    def _apply(self, item: tuple):
+        kind = item[0]
+        try:
+            if kind == "event":
+                self.sink.add_event_row(item[1])
+            elif kind == "snapshot":
+                self.sink.add_snapshot_row(item[1])
+            elif kind == "delta":
+                self.sink.add_delta_row(item[1])
+            elif kind == "llm_call":
+                self.sink.add_llm_call_row(item[1])
+            elif kind == "summary":
+                self.sink.add_summary_row(item[1])
+            elif kind == "flush":
+                self.sink.flush()
+        except Exception as e:
+            # Never let one bad row kill the writer (block policy would then hang)
+            self.write_errors += 1
+            logger.error(f"Forensic writer failed on {kind} row: {e!r}")
+        finally:
+            if kind == "flush" and item[1] is not None:
+                item[1].set()
+
+    def _replay_spill(self):
+        """Writer thread: apply the spill file's rows, while new rows queue again."""
+        replay_path = self.spill_path.with_name(self.spill_path.name + ".replay")
+        with self._spill_lock:
+            if self._spill_file is None:
+                return
+            self._spill_file.close()
+            self._spill_file = None
+            self.spill_path.replace(replay_path)
+        with open(replay_path, encoding="utf-8") as spill:
+            for line in spill:
+                self._apply(tuple(json.loads(line)))
+        self.sink.flush()
+        replay_path.unlink()
+
+
+def _is_debug_event(item: tuple) -> bool:
+    return item[0] == "event" and item[2]
 
 
 class SimulationLogger:
     """Main logging coordinator for simulations."""
 
-    def __init__(self, sim_id: str, verbosity: int):
+    def __init__(
+        self, sim_id: str, verbosity: int, logging_config: Optional[Dict[str, Any]] = None
+    ):
         self.sim_id = sim_id
         self.verbosity = verbosity
+        self.logging_config = logging_config or {}
         self.db_path = Path(__file__).parent / "db" / f"{sim_id}.sqlite3"
         self.sqlite_sink: Optional[SQLiteSink] = None
+
+        configure_events(
+            self.logging_config.get("enabled_events"),
+            self.logging_config.get("disabled_events"),
+        )
         self.console = Console()
 
         self._setup_logging()
@@ -275,7 +916,7 @@ class SimulationLogger:
         )
 
         # Add SQLite sink for forensic capture
-        self.sqlite_sink = SQLiteSink(self.db_path)
+        self.sqlite_sink = self._create_sqlite_sink()
         logger.add(
             self.sqlite_sink.write,
             level="DEBUG",  # Capture everything to SQLite
@@ -288,6 +929,25 @@ class SimulationLogger:
         logger.info(f"Database: {self.db_path}")
         logger.info(f"Console verbosity: {log_level}")
 
+    def _create_sqlite_sink(self):
+        """Build the forensic sink; a background writer unless async_writer is off."""
+        sink_options = {
+            key: self.logging_config[key]
+            for key in ("batch_size", "flush_interval")
+            if key in self.logging_config
+        }
+        if not self.logging_config.get("async_writer", True):
+            return SQLiteSink(self.db_path, **sink_options)
+
+        spill_path = self.logging_config.get("spill_path")
+        return AsyncSQLiteSink(
+            self.db_path,
+            queue_size=self.logging_config.get("queue_size", AsyncSQLiteSink.QUEUE_SIZE),
+            backpressure=self.logging_config.get("backpressure", "block"),
+            spill_path=Path(spill_path) if spill_path else None,
+            **sink_options,
+        )
+
     def _get_log_level(self) -> str:
         """Map verbosity level to loguru level."""
         level_map = {
@@ -305,22 +965,29 @@ class SimulationLogger:
         """Clean shutdown of logging infrastructure."""
         if self.sqlite_sink:
             self.sqlite_sink.close()
+            if isinstance(self.sqlite_sink, AsyncSQLiteSink):
+                logger.info(f"Forensic writer stats: {self.sqlite_sink.stats()}")
         logger.info(f"Simulation logging closed: {self.sim_id}")
 
 
-def setup_logging(sim_id: str, verbosity: int) -> SimulationLogger:
+def setup_logging(
+    sim_id: str, verbosity: int, logging_config: Optional[Dict[str, Any]] = None
+) -> SimulationLogger:
     """
     Initialize structured logging for a simulation run.
 
     Args:
         sim_id: Unique simulation identifier
         verbosity: Console verbosity level (0-5)
+        logging_config: Optional forensic writer settings (async_writer,
+            queue_size, backpressure, spill_path, batch_size, flush_interval)
+            and event selection (enabled_events, disabled_events)
 
     Returns:
         SimulationLogger instance for cleanup
     """
     global _current_sim_logger
-    _current_sim_logger = SimulationLogger(sim_id, verbosity)
+    _current_sim_logger = SimulationLogger(sim_id, verbosity, logging_config)
     return _current_sim_logger
 
 
@@ -361,6 +1028,31 @@ def generate_sim_id() -> str:
 _current_sim_logger: Optional[SimulationLogger] = None
 
 
+# Event types that log_event discards (see configure_events)
+_disabled_events: frozenset = frozenset()
+
+
+def configure_events(enabled=None, disabled=None):
+    """
+    Select which event types are logged.
+
+    Args:
+        enabled: If given, only these event types are logged
+        disabled: Event types that are never logged
+    """
+    global _disabled_events
+    off = set(disabled or ())
+    if enabled is not None:
+        on = {EventType(event_type) for event_type in enabled}
+        off.update(event_type for event_type in EventType if event_type not in on)
+    _disabled_events = frozenset(EventType(event_type) for event_type in off)
+
+
+def event_enabled(event_type: EventType) -> bool:
+    """Guard for call sites that build payloads or messages only when logged."""
+    return event_type not in _disabled_events
+
+
 def log_event(entry: LogEntry, forensic: bool = True):
     """
     Log a structured event with type safety and forensic capture.
@@ -369,19 +1061,8 @@ def log_event(entry: LogEntry, forensic: bool = True):
         entry: LogEntry with structured event data
         forensic: If True, captures to SQLite database (default: True)
     """
-    import inspect
-
-    # Get the caller's frame info to preserve original file/line
-    frame = inspect.currentframe()
-    try:
-        caller_frame = frame.f_back
-        caller_info = {
-            "name": caller_frame.f_code.co_filename.split("/")[-1],  # Just filename
-            "function": caller_frame.f_code.co_name,
-            "line": caller_frame.f_lineno,
-        }
-    finally:
-        del frame  # Prevent reference cycles
+    if entry.event_type in _disabled_events:
+        return
 
     if forensic:
         # Use existing logger.bind() format for backward compatibility
@@ -393,6 +1074,7 @@ def log_event(entry: LogEntry, forensic: bool = True):
                 "event_type": entry.event_type.value,
                 "agent_id": entry.agent_id,
                 "payload": entry.payload,
+                "level": entry.level.value,
             }
         ).info(entry.message)
     else:
@@ -412,3 +1094,24 @@ def save_state_snapshot(state_data: dict):
     global _current_sim_logger
     if _current_sim_logger and _current_sim_logger.sqlite_sink:
         _current_sim_logger.sqlite_sink.save_state_snapshot(state_data)
+
+
+def save_state_delta(delta_data: dict):
+    """Save a delta snapshot row using the current simulation logger."""
+    global _current_sim_logger
+    if _current_sim_logger and _current_sim_logger.sqlite_sink:
+        _current_sim_logger.sqlite_sink.save_state_delta(delta_data)
+
+
+def save_scenario_summary(summary: dict):
+    """Save a scenario_summary row using the current simulation logger."""
+    global _current_sim_logger
+    if _current_sim_logger and _current_sim_logger.sqlite_sink:
+        _current_sim_logger.sqlite_sink.save_scenario_summary(summary)
+
+
+def save_llm_call(call: dict):
+    """Save an llm_calls telemetry row using the current simulation logger."""
+    global _current_sim_logger
+    if _current_sim_logger and _current_sim_logger.sqlite_sink:
+        _current_sim_logger.sqlite_sink.save_llm_call(call)
@@ -2,9 +2,12 @@
 
 import random
 import argparse
+import multiprocessing
+import sqlite3
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Optional
 
 import yaml
 
@@ -20,6 +23,7 @@ from config import get_config_with_args
 from simlog import (
     setup_logging,
     generate_sim_id,
+    save_scenario_summary,
     log_event,
     logger,
     LogEntry,
@@ -27,7 +31,15 @@ from simlog import (
     PhaseType,
     LogLevel,
 )
-from llm_provider import one_shot, load_prompt, DEFAULT_MODEL
+from llm_provider import (
+    one_shot,
+    load_prompt,
+    configure_llm_limits,
+    configure_response_cache,
+    response_cache_stats,
+    DEFAULT_MAX_CONCURRENT_CALLS,
+    DEFAULT_MODEL,
+)
 from proposal_debug import generate_proposal_debug_files
 
 
@@ -97,7 +109,7 @@ def parse_arguments():
     parser.add_argument(
         "--model",
         type=str,
-        help="LLM model name as registered in llm (e.g. 'gpt-4o', 'anthropic/claude-sonnet-4-6', 'gemma3n:e4b')",
+        help="LLM model name as registered in llm (e.g. 'gpt-4o', 'anthropic/claude-sonnet-4-6', 'gemma3n:e4b'), or 'stub' for the offline stub model",
     )
 
     parser.add_argument(
@@ -106,6 +118,32 @@ def parse_arguments():
         help="Path to markdown file containing issue content to override issue generation",
     )
 
+    parser.add_argument(
+        "--agent-policy",
+        choices=["llm", "rules"],
+        default=None,
+        help="Agent decision policy: 'llm' (default) or 'rules' (no LLM calls, for protocol-only runs)",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Run scenarios across this many worker processes, one database shard each (default: 1, in-process)",
+    )
+
+    parser.add_argument(
+        "--llm-cache",
+        action="store_true",
+        help="Replay cached LLM responses for identical requests (default: from config file, off)",
+    )
+
+    parser.add_argument(
+        "--no-llm-cache",
+        action="store_true",
+        help="Always call the model instead of replaying cached LLM responses",
+    )
+
     return parser.parse_args()
 
 
@@ -144,12 +182,348 @@ def generate_issue_content(seed: int, model: str = DEFAULT_MODEL) -> str:
     """
     try:
         prompt = load_prompt("issue")
-        return one_shot("", "", prompt, model=model, seed=seed)
+        return one_shot("", "", prompt, model=model, seed=seed, call_type="issue", tick=0)
     except Exception as exc:
         logger.warning(f"LLM issue generation failed: {exc}, falling back to default")
         return "A critical system issue requires team consensus to resolve."
 
 
+def build_agent_pool(config: dict) -> AgentPool:
+    """
+    Generate the agent pool from configuration.
+
+    Reseeds the global RNG with pool_seed; the scenario settings drawn by
+    build_global_config continue from the same sequence.
+
+    Args:
+        config: Simulation configuration
+
+    Returns:
+        AgentPool with pool_size agents cycling through the archetypes
+    """
+    pool_seed = config["simulation"]["pool_seed"]
+    num_agents = config["simulation"]["num_agents"]
+
+    random.seed(pool_seed)
+    # Pool size from configuration
+    pool_size = max(
+        config["agent_pool"]["min_size"],
+        num_agents * config["agent_pool"]["size_multiplier"],
+    )
+
+    # Use imported archetypes
+    archetype_names = list(ARCHETYPES.keys())
+
+    agents = {}
+    for i in range(pool_size):
+        # Cycle through archetypes to ensure balanced distribution
+        archetype = archetype_names[i % len(archetype_names)]
+        archetype_index = (i // len(archetype_names)) + 1  # Count within each archetype
+
+        agent_id = f"Agent_{archetype}_{archetype_index}"
+        agents[agent_id] = AgentActor(
+            agent_id=agent_id,
+            initial_balance=random.randint(
+                config["agent_pool"]["balance_range"]["min"],
+                config["agent_pool"]["balance_range"]["max"],
+            ),
+            metadata={"base_archetype": archetype},  # Store the intended archetype
+            seed=pool_seed + i,  # Ensure unique seed for each agent
+        )
+    return AgentPool(agents=agents)
+
+
+def build_global_config(config: dict, agent_pool: AgentPool) -> GlobalConfig:
+    """Build the next scenario's GlobalConfig, drawing its revision cycles and stake ticks."""
+    return GlobalConfig(
+        assignment_award=config["consensus"]["assignment_award"],
+        max_feedback_per_agent=config["consensus"]["max_feedback_per_agent"],
+        feedback_stake=config["consensus"]["feedback_stake"],
+        proposal_self_stake=config["consensus"]["proposal_self_stake"],
+        revision_cycles=random.randint(
+            config["consensus"]["revision_cycles"]["min"],
+            config["consensus"]["revision_cycles"]["max"],
+        ),
+        conviction_params=config["consensus"]["conviction_params"],
+        agent_pool=agent_pool,
+        conviction_backend=config["consensus"].get(
+            "conviction_backend", "incremental"
+        ),
+        # Phase timeout configurations
+        propose_phase_ticks=config["consensus"]["propose_phase_ticks"],
+        feedback_phase_ticks=config["consensus"]["feedback_phase_ticks"],
+        revise_phase_ticks=config["consensus"]["revise_phase_ticks"],
+        stake_phase_ticks=random.randint(
+            config["consensus"]["stake_phase_ticks"]["min"],
+            config["consensus"]["stake_phase_ticks"]["max"],
+        ),
+        finalize_phase_ticks=config["consensus"]["finalize_phase_ticks"],
+        fast_forward_idle_ticks=config["consensus"].get(
+            "fast_forward_idle_ticks", False
+        ),
+        max_concurrent_agents=config["consensus"].get("max_concurrent_agents", 1),
+        agent_policy=config["simulation"].get("agent_policy", "llm"),
+        llm_config=config.get("llm", {}),
+        debug_config=config.get("debug", {}),
+        snapshot_config=config.get("snapshots", {}),
+    )
+
+
+def configure_llm(config: dict):
+    """Apply the llm section's response cache and call limits to this process."""
+    llm_config = config.get("llm", {})
+    configure_response_cache(llm_config.get("cache"))
+    configure_llm_limits(
+        llm_config.get("max_concurrent_calls", DEFAULT_MAX_CONCURRENT_CALLS),
+        llm_config.get("requests_per_second"),
+    )
+
+
+def run_scenario(
+    controller: Controller,
+    config: dict,
+    global_config: GlobalConfig,
+    sim_id: str,
+    scenario: int,
+    issue_file: Optional[str] = None,
+    quiet: bool = False,
+) -> Dict[str, Any]:
+    """
+    Run one scenario on the controller.
+
+    Args:
+        controller: Controller owning the agent pool
+        config: Simulation configuration
+        global_config: GlobalConfig from build_global_config
+        sim_id: Simulation ID whose database receives the scenario's events
+        scenario: 1-based scenario number (seed is run_seed + scenario - 1)
+        issue_file: Optional markdown file overriding issue generation
+        quiet: Suppress progress logging
+
+    Returns:
+        scenario_summary row for the scenario (without winner_proposal_id)
+    """
+    run_seed = config["simulation"]["run_seed"]
+    max_scenarios = config["simulation"]["max_scenarios"]
+    scenario_seed = run_seed + scenario - 1
+
+    log_event(
+        LogEntry(
+            tick=0,
+            phase=PhaseType.INIT,
+            event_type=EventType.SCENARIO_START,
+            payload={
+                "scenario": scenario,
+                "total_scenarios": max_scenarios,
+                "scenario_seed": scenario_seed,
+            },
+            message=f"Starting scenario {scenario}",
+        )
+    )
+
+    # Agents, profiles and the run's issue_id all follow the scenario seed
+    primer = Primer(global_config)
+    run_config = primer.generate_run_config(
+        seed=scenario_seed,
+        num_agents=config["simulation"]["num_agents"],
+        trait_config=config["traits"],
+    )
+
+    # Create a sample issue for the simulation
+    # Use issue file if provided, otherwise use LLM generation or config
+    if issue_file:
+        problem_statement = load_issue_from_file(issue_file)
+        if not quiet:
+            logger.info(f"Using issue from file: {issue_file}")
+    elif config.get("llm", {}).get("issue", False):
+        model = config.get("llm", {}).get("model", "gemma3n:e4b")
+        problem_statement = generate_issue_content(scenario_seed, model)
+        if not quiet:
+            logger.info(f"Generated LLM issue: {problem_statement[:50]}...")
+    else:
+        problem_statement = config["issue"]["problem_statement"]
+
+    issue = Issue(
+        issue_id=f"Issue_{scenario_seed}",
+        problem_statement=problem_statement,
+        background=config["issue"]["background"],
+        metadata=config["issue"]["metadata"],
+    )
+
+    # Register the issue in Controller
+    controller.register_issue(issue)
+    logger.info(f"Registered issue: {issue.issue_id}")
+
+    controller.configure_consensus(global_config=global_config, run_config=run_config)
+
+    # Time the consensus round
+    cache_before = response_cache_stats() or {"hits": 0, "misses": 0}
+    round_start = time.time()
+    result = controller.run()
+    round_duration = time.time() - round_start
+    cache_after = response_cache_stats() or {"hits": 0, "misses": 0}
+    llm_cache_hits = cache_after["hits"] - cache_before["hits"]
+    llm_cache_misses = cache_after["misses"] - cache_before["misses"]
+
+    if not quiet:
+        logger.info("Phase execution:")
+        for phase in result["phases_executed"]:
+            logger.info(f"  {phase}")
+        logger.info("Summary:")
+        logger.info(f"  {result['summary']}")
+
+    # Generate proposal debug files after scenario completion
+    try:
+        generate_proposal_debug_files(sim_id, issue.issue_id)
+        if not quiet:
+            logger.info(f"Generated proposal debug files for scenario {scenario}")
+    except Exception as exc:
+        logger.warning(
+            f"Failed to generate proposal debug files for scenario {scenario}: {exc}"
+        )
+
+    final_state = result.get("final_state")
+    final_tick = final_state.tick if final_state else 0
+    log_event(
+        LogEntry(
+            tick=0,
+            phase=PhaseType.INIT,
+            event_type=EventType.SCENARIO_COMPLETE,
+            payload={
+                "scenario": scenario,
+                "issue_id": issue.issue_id,
+                "phases_executed": len(result["phases_executed"]),
+                "final_tick": final_tick,
+                "round_duration_ms": round(round_duration * 1000, 2),
+                "llm_cache_hits": llm_cache_hits,
+                "llm_cache_misses": llm_cache_misses,
+            },
+            message=f"Scenario {scenario} completed in {round_duration:.3f}s",
+        )
+    )
+
+    return {
+        "scenario": scenario,
+        "scenario_seed": scenario_seed,
+        "issue_id": issue.issue_id,
+        "shard": sim_id,
+        "final_tick": final_tick,
+        "phases_executed": len(result["phases_executed"]),
+        "proposals": len(final_state.current_issue.proposals) if final_state else 0,
+        "stakes": len(final_state.stake_ledger) if final_state else 0,
+        "duration_ms": round(round_duration * 1000, 2),
+        "llm_cache_hits": llm_cache_hits,
+        "llm_cache_misses": llm_cache_misses,
+    }
+
+
+def _run_scenario_shard(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Batch worker: run one scenario with its own Controller, action queue and database shard."""
+    shard_id = f"{task['sim_id']}-s{task['scenario']}"
+    sim_logger = setup_logging(
+        shard_id, task["verbosity"], task["config"].get("logging", {})
+    )
+    try:
+        configure_llm(task["config"])
+        controller = Controller(agent_pool=task["global_config"].agent_pool)
+        return run_scenario(
+            controller,
+            task["config"],
+            task["global_config"],
+            shard_id,
+            task["scenario"],
+            issue_file=task["issue_file"],
+            quiet=True,
+        )
+    finally:
+        sim_logger.close()
+
+
+def run_batch(
+    config: dict,
+    agent_pool: AgentPool,
+    sim_id: str,
+    workers: int,
+    issue_file: Optional[str] = None,
+    verbosity: int = -1,
+) -> List[Dict[str, Any]]:
+    """
+    Run all scenarios across a process pool, one database shard per scenario.
+
+    Scenario settings are drawn here in scenario order, so a batch run uses the
+    same configurations as a serial run with the same seeds. Shards are written
+    to db/<sim_id>-s<scenario>.sqlite3.
+
+    Returns:
+        Worker summaries in scenario order
+    """
+    max_scenarios = config["simulation"]["max_scenarios"]
+    tasks = [
+        {
+            "sim_id": sim_id,
+            "scenario": i + 1,
+            "config": config,
+            "global_config": build_global_config(config, agent_pool),
+            "issue_file": issue_file,
+            "verbosity": verbosity,
+        }
+        for i in range(max_scenarios)
+    ]
+
+    # spawn, not fork: the parent holds a live SQLite writer thread and loguru sinks
+    context = multiprocessing.get_context("spawn")
+    summaries = []
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        futures = [executor.submit(_run_scenario_shard, task) for task in tasks]
+        for future in as_completed(futures):
+            summary = future.result()
+            summaries.append(summary)
+            print(
+                f"Scenario {summary['scenario']}/{max_scenarios} ✓ "
+                f"({summary['duration_ms'] / 1000:.2f}s, shard {summary['shard']})",
+                flush=True,
+            )
+    return sorted(summaries, key=lambda summary: summary["scenario"])
+
+
+def _shard_winner(db_path: Path, issue_id: str) -> Optional[int]:
+    """Winning proposal recorded in a scenario's database, if it finalized."""
+    if not db_path.exists():
+        return None
+    connection = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        row = connection.execute(
+            """
+            SELECT json_extract(payload, '$.winner_proposal_id') FROM events
+            WHERE event_type = ? AND issue_id = ?
+            ORDER BY id DESC LIMIT 1
+        """,
+            (EventType.FINALIZATION_COMPLETE.value, issue_id),
+        ).fetchone()
+    finally:
+        connection.close()
+    return row[0] if row else None
+
+
+def merge_scenario_summaries(summaries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Merge per-scenario results into the current run's scenario_summary table.
+
+    Each summary's winner is read back from the database it was logged to, so
+    the shards (or the serial run's own database) must be flushed first.
+    """
+    db_dir = Path(__file__).parent / "db"
+    rows = []
+    for summary in summaries:
+        row = dict(summary)
+        row["winner_proposal_id"] = _shard_winner(
+            db_dir / f"{summary['shard']}.sqlite3", summary["issue_id"]
+        )
+        save_scenario_summary(row)
+        rows.append(row)
+    return rows
+
+
 def main():
     """Main simulation runner."""
     args = parse_arguments()
@@ -167,9 +541,19 @@ def main():
 
     # Initialize logging - adjust verbosity for quiet mode
     effective_verbosity = -1 if args.quiet else args.verbose  # -1 suppresses most logs
-    sim_logger = setup_logging(sim_id, effective_verbosity)
+    sim_logger = setup_logging(
+        sim_id, effective_verbosity, config.get("logging", {})
+    )
 
     try:
+        # Override LLM model if specified
+        if args.model:
+            if "llm" not in config:
+                config["llm"] = {}
+            config["llm"]["model"] = args.model
+
+        configure_llm(config)
+
         # Create session output folder and snapshot config
         session_dir = Path(__file__).parent / "sessions" / sim_id
         session_dir.mkdir(parents=True, exist_ok=True)
@@ -181,6 +565,7 @@ def main():
         run_seed = config["simulation"]["run_seed"]
         num_agents = config["simulation"]["num_agents"]
         max_scenarios = config["simulation"]["max_scenarios"]
+        workers = max(1, config["simulation"].get("workers", 1))
 
         # Log simulation parameters
         logger.info("Starting Round Table Consensus Simulation")
@@ -195,6 +580,7 @@ def main():
                     "run_seed": run_seed,
                     "max_scenarios": max_scenarios,
                     "num_agents": num_agents,
+                    "workers": workers,
                     "verbosity": args.verbose,
                     "config_file": args.config,
                 },
@@ -204,36 +590,8 @@ def main():
 
         # Generate agent pool with configurable settings
         logger.info(f"Using pool seed: {pool_seed}, run seed: {run_seed}")
-
-        random.seed(pool_seed)
-        # Pool size from configuration
-        pool_size = max(
-            config["agent_pool"]["min_size"],
-            num_agents * config["agent_pool"]["size_multiplier"],
-        )
-
-        # Use imported archetypes
-        archetype_names = list(ARCHETYPES.keys())
-
-        agents = {}
-        for i in range(pool_size):
-            # Cycle through archetypes to ensure balanced distribution
-            archetype = archetype_names[i % len(archetype_names)]
-            archetype_index = (
-                i // len(archetype_names)
-            ) + 1  # Count within each archetype
-
-            agent_id = f"Agent_{archetype}_{archetype_index}"
-            agents[agent_id] = AgentActor(
-                agent_id=agent_id,
-                initial_balance=random.randint(
-                    config["agent_pool"]["balance_range"]["min"],
-                    config["agent_pool"]["balance_range"]["max"],
-                ),
-                metadata={"base_archetype": archetype},  # Store the intended archetype
-                seed=pool_seed + i,  # Ensure unique seed for each agent
-            )
-        agent_pool = AgentPool(agents=agents)
+        agent_pool = build_agent_pool(config)
+        pool_size = len(agent_pool.agents)
         pool_factor = round(pool_size / num_agents, 1)
         logger.info(
             f"Generated agent pool with {pool_size} agents ({pool_factor}x factor for {num_agents} selected, seed: {pool_seed})"
@@ -248,146 +606,55 @@ def main():
         # Note: initial_balances could be used for future balance tracking
         # initial_balances = {aid: agent.initial_balance for aid, agent in agents.items()}
 
-        controller = Controller(agent_pool=agent_pool)
-
-        # Track simulation round timings
-        round_durations: List[float] = []
-
-        for i in range(max_scenarios):
-            scenario_seed = run_seed + i
-            if not args.quiet:
-                logger.info(
-                    f"Running simulation {i + 1} of {max_scenarios} with seed {scenario_seed}"
-                )
-            else:
-                # Show minimal progress in quiet mode
-                print(
-                    f"Running scenario {i + 1}/{max_scenarios}...", end=" ", flush=True
-                )
-
-            log_event(
-                LogEntry(
-                    tick=0,
-                    phase=PhaseType.INIT,
-                    event_type=EventType.SCENARIO_START,
-                    payload={
-                        "scenario": i + 1,
-                        "total_scenarios": max_scenarios,
-                        "scenario_seed": scenario_seed,
-                    },
-                    message=f"Starting scenario {i + 1}",
-                )
-            )
-
-            # Override LLM model if specified
-            if args.model:
-                if "llm" not in config:
-                    config["llm"] = {}
-                config["llm"]["model"] = args.model
-
-            global_config = GlobalConfig(
-                assignment_award=config["consensus"]["assignment_award"],
-                max_feedback_per_agent=config["consensus"]["max_feedback_per_agent"],
-                feedback_stake=config["consensus"]["feedback_stake"],
-                proposal_self_stake=config["consensus"]["proposal_self_stake"],
-                revision_cycles=random.randint(
-                    config["consensus"]["revision_cycles"]["min"],
-                    config["consensus"]["revision_cycles"]["max"],
-                ),
-                conviction_params=config["consensus"]["conviction_params"],
-                agent_pool=agent_pool,
-                # Phase timeout configurations
-                propose_phase_ticks=config["consensus"]["propose_phase_ticks"],
-                feedback_phase_ticks=config["consensus"]["feedback_phase_ticks"],
-                revise_phase_ticks=config["consensus"]["revise_phase_ticks"],
-                stake_phase_ticks=random.randint(
-                    config["consensus"]["stake_phase_ticks"]["min"],
-                    config["consensus"]["stake_phase_ticks"]["max"],
-                ),
-                finalize_phase_ticks=config["consensus"]["finalize_phase_ticks"],
-                llm_config=config.get("llm", {}),
-                debug_config=config.get("debug", {}),
-            )
-
-            primer = Primer(global_config)
-            run_config = primer.generate_run_config(
-                seed=run_seed, num_agents=num_agents, trait_config=config["traits"]
+        batch_start = time.time()
+        if workers > 1:
+            logger.info(f"Running {max_scenarios} scenarios across {workers} worker processes")
+            summaries = run_batch(
+                config,
+                agent_pool,
+                sim_id,
+                workers,
+                issue_file=args.issue,
+                verbosity=effective_verbosity,
             )
+        else:
+            controller = Controller(agent_pool=agent_pool)
+            summaries = []
 
-            # Create a sample issue for the simulation
-            # Use issue file if provided, otherwise use LLM generation or config
-            if args.issue:
-                problem_statement = load_issue_from_file(args.issue)
-                if not args.quiet:
-                    logger.info(f"Using issue from file: {args.issue}")
-            elif config.get("llm", {}).get("issue", False):
-                model = config.get("llm", {}).get("model", "gemma3n:e4b")
-                problem_statement = generate_issue_content(scenario_seed, model)
+            for i in range(max_scenarios):
+                scenario_seed = run_seed + i
                 if not args.quiet:
-                    logger.info(f"Generated LLM issue: {problem_statement[:50]}...")
-            else:
-                problem_statement = config["issue"]["problem_statement"]
-
-            issue = Issue(
-                issue_id=f"Issue_{scenario_seed}",
-                problem_statement=problem_statement,
-                background=config["issue"]["background"],
-                metadata=config["issue"]["metadata"],
-            )
-
-            # Register the issue in Controller
-            controller.register_issue(issue)
-            logger.info(f"Registered issue: {issue.issue_id}")
-
-            controller.configure_consensus(
-                global_config=global_config, run_config=run_config
-            )
-
-            # Time the consensus round
-            round_start = time.time()
-            result = controller.run()
-            round_end = time.time()
-            round_duration = round_end - round_start
-            round_durations.append(round_duration)
-
-            if not args.quiet:
-                logger.info("Phase execution:")
-                for phase in result["phases_executed"]:
-                    logger.info(f"  {phase}")
-                logger.info("Summary:")
-                logger.info(f"  {result['summary']}")
-            else:
-                print(f"✓ ({round_duration:.2f}s)")
-
-            # Generate proposal debug files after scenario completion
-            try:
-                generate_proposal_debug_files(sim_id, issue.issue_id)
-                if not args.quiet:
-                    logger.info(f"Generated proposal debug files for scenario {i + 1}")
-            except Exception as exc:
-                logger.warning(
-                    f"Failed to generate proposal debug files for scenario {i + 1}: {exc}"
+                    logger.info(
+                        f"Running simulation {i + 1} of {max_scenarios} with seed {scenario_seed}"
+                    )
+                else:
+                    # Show minimal progress in quiet mode
+                    print(
+                        f"Running scenario {i + 1}/{max_scenarios}...", end=" ", flush=True
+                    )
+
+                global_config = build_global_config(config, agent_pool)
+                summary = run_scenario(
+                    controller,
+                    config,
+                    global_config,
+                    sim_id,
+                    i + 1,
+                    issue_file=args.issue,
+                    quiet=args.quiet,
                 )
+                summaries.append(summary)
+                if args.quiet:
+                    print(f"✓ ({summary['duration_ms'] / 1000:.2f}s)")
 
-            log_event(
-                LogEntry(
-                    tick=0,
-                    phase=PhaseType.INIT,
-                    event_type=EventType.SCENARIO_COMPLETE,
-                    payload={
-                        "scenario": i + 1,
-                        "issue_id": issue.issue_id,
-                        "phases_executed": len(result["phases_executed"]),
-                        "final_tick": (
-                            result.get("final_state").tick
-                            if result.get("final_state")
-                            else 0
-                        ),
-                        "round_duration_ms": round(round_duration * 1000, 2),
-                    },
-                    message=f"Scenario {i + 1} completed in {round_duration:.3f}s",
-                )
-            )
+            # Make this run's own events readable before merging its summary
+            sim_logger.sqlite_sink.flush()
+        wall_time = time.time() - batch_start
+
+        merge_scenario_summaries(summaries)
+        llm_cache_hits = sum(summary["llm_cache_hits"] for summary in summaries)
+        llm_cache_misses = sum(summary["llm_cache_misses"] for summary in summaries)
+        round_durations = [summary["duration_ms"] / 1000 for summary in summaries]
 
         # Calculate timing statistics
         if round_durations:
@@ -411,6 +678,10 @@ def main():
                     payload={
                         "sim_id": sim_id,
                         "total_rounds": len(round_durations),
+                        "workers": workers,
+                        "wall_time_ms": round(wall_time * 1000, 2),
+                        "llm_cache_hits": llm_cache_hits,
+                        "llm_cache_misses": llm_cache_misses,
                         "min_duration_ms": round(min_duration * 1000, 2),
                         "max_duration_ms": round(max_duration * 1000, 2),
                         "avg_duration_ms": round(avg_duration * 1000, 2),
@@ -423,7 +694,7 @@ def main():
             )
 
         # Always show simulation summary (even in quiet mode)
-        if args.quiet:
+        if args.quiet and workers == 1:
             print()  # New line after progress dots
         print("=== Simulation Summary ===")
         print(f"Simulation ID: {sim_id}")
@@ -431,8 +702,12 @@ def main():
         print(f"Scenarios Completed: {max_scenarios}")
         print(f"Agents per Scenario: {num_agents}")
         print(f"Seeds Used: Pool={pool_seed}, Run={run_seed}")
+        if workers > 1:
+            print(f"Workers: {workers} (shards: db/{sim_id}-s<N>.sqlite3)")
+        if llm_cache_hits or llm_cache_misses:
+            print(f"LLM Cache: {llm_cache_hits} hits / {llm_cache_misses} misses")
         if round_durations:
-            print(f"Total Runtime: {total_time:.3f}s")
+            print(f"Total Runtime: {total_time:.3f}s (wall {wall_time:.3f}s)")
             print(
                 f"Performance: {min_duration:.3f}s / {avg_duration:.3f}s / {max_duration:.3f}s (min/avg/max)"
             )
@@ -444,8 +719,14 @@ def main():
             logger.info(f"Scenarios Completed: {max_scenarios}")
             logger.info(f"Agents per Scenario: {num_agents}")
             logger.info(f"Seeds Used: Pool={pool_seed}, Run={run_seed}")
+            if workers > 1:
+                logger.info(f"Workers: {workers}")
+            if llm_cache_hits or llm_cache_misses:
+                logger.info(
+                    f"LLM Cache: {llm_cache_hits} hits / {llm_cache_misses} misses"
+                )
             if round_durations:
-                logger.info(f"Total Runtime: {total_time:.3f}s")
+                logger.info(f"Total Runtime: {total_time:.3f}s (wall {wall_time:.3f}s)")
                 logger.info(
                     f"Performance: {min_duration:.3f}s / {avg_duration:.3f}s / {max_duration:.3f}s (min/avg/max)"
                 )
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Delta-encoded state snapshots.
+
+In "full" mode every tick stores a complete state_snapshots row (the original
+behaviour). In "delta" mode a full keyframe is stored every keyframe_interval
+ticks and the ticks in between store only what changed in state_deltas: new or
+modified stake records, appended credit/execution ledger rows, changed
+balances/readiness/proposal assignments, and the proposal list when it changed.
+
+Keyframes and deltas carry the issue_id of the scenario that wrote them, so
+databases shared by several scenarios never mix one scenario's keyframe with
+another's deltas. SnapshotReader rebuilds the state at any tick from either
+layout.
+
+Usage:
+    python3 snapshots.py <simulation_id> <tick> [issue_id]
+"""
+
+import json
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+SNAPSHOT_MODES = ("full", "delta")
+DEFAULT_KEYFRAME_INTERVAL = 10
+
+
+class SnapshotEncoder:
+    """Turns successive RoundtableState ticks into keyframe or delta rows."""
+
+    def __init__(self, mode: str = "full", keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL):
+        if mode not in SNAPSHOT_MODES:
+            raise ValueError(f"Unknown snapshot mode {mode!r}, expected one of {SNAPSHOT_MODES}")
+        self.mode = mode
+        self.keyframe_interval = max(1, keyframe_interval)
+        self._keyframe_tick: Optional[int] = None
+        self._issue_id: Optional[str] = None
+        self._balances: Dict[str, int] = {}
+        self._readiness: Dict[str, bool] = {}
+        self._proposal_ids: Dict[str, Any] = {}
+        self._proposals_json: Optional[str] = None
+        self._credit_events_len = 0
+        self._execution_ledger_len = 0
+
+    def encode(self, state) -> Tuple[str, Dict[str, Any]]:
+        """Return ("keyframe", state_snapshots row) or ("delta", state_deltas row)."""
+        if self._needs_keyframe(state.tick, _issue_id(state)):
+            return "keyframe", self._keyframe(state)
+        return "delta", self._delta(state)
+
+    def _needs_keyframe(self, tick: int, issue_id: Optional[str]) -> bool:
+        if self.mode == "full" or self._keyframe_tick is None or issue_id != self._issue_id:
+            return True
+        return tick != self._keyframe_tick and tick - self._keyframe_tick >= self.keyframe_interval
+
+    def _keyframe(self, state) -> Dict[str, Any]:
+        row = state.serialize_for_snapshot()
+        state.pop_changed_stakes()
+        self._keyframe_tick = state.tick
+        self._issue_id = row["issue_id"]
+        self._balances = dict(state.agent_balances)
+        self._readiness = dict(state.agent_readiness)
+        self._proposal_ids = dict(state.agent_proposal_ids)
+        self._proposals_json = row["proposals"]
+        self._credit_events_len = len(state.credit_events)
+        self._execution_ledger_len = len(state.execution_ledger)
+        return row
+
+    def _delta(self, state) -> Dict[str, Any]:
+        proposals_json = state.serialize_proposals()
+        row = {
+            "tick": state.tick,
+            "base_tick": self._keyframe_tick,
+            "issue_id": self._issue_id,
+            "phase": state.current_phase,
+            "phase_tick": state.phase_tick,
+            "agent_balances": json.dumps(_changed(self._balances, state.agent_balances)),
+            "agent_readiness": json.dumps(_changed(self._readiness, state.agent_readiness)),
+            "agent_proposal_ids": json.dumps(
+                _changed(self._proposal_ids, state.agent_proposal_ids)
+            ),
+            "proposals": proposals_json if proposals_json != self._proposals_json else None,
+            "stake_changes": json.dumps(
+                [stake.model_dump() for stake in state.pop_changed_stakes()]
+            ),
+            "credit_events": json.dumps(state.credit_events[self._credit_events_len :]),
+            "execution_ledger": json.dumps(
+                state.execution_ledger[self._execution_ledger_len :]
+            ),
+            "proposal_counter": state.proposal_counter,
+            "issue_finalized": state.issue_finalized,
+            "finalization_tick": state.finalization_tick,
+        }
+        self._proposals_json = proposals_json
+        self._credit_events_len = len(state.credit_events)
+        self._execution_ledger_len = len(state.execution_ledger)
+        return row
+
+
+def _issue_id(state) -> Optional[str]:
+    return state.current_issue.issue_id if state.current_issue else None
+
+
+def _changed(previous: Dict, current: Dict) -> Dict:
+    """Entries of current that differ from previous; previous is updated in place."""
+    changed = {key: value for key, value in current.items() if previous.get(key, _MISSING) != value}
+    previous.update(changed)
+    return changed
+
+
+_MISSING = object()
+
+
+class SnapshotReader:
+    """Rebuilds per-tick state from state_snapshots keyframes and state_deltas rows."""
+
+    _KEYFRAME_COLUMNS = (
+        "tick",
+        "phase",
+        "phase_tick",
+        "agent_balances",
+        "agent_readiness",
+        "agent_proposal_ids",
+        "proposals",
+        "stake_ledger",
+        "credit_events",
+        "execution_ledger",
+        "proposal_counter",
+        "issue_finalized",
+        "finalization_tick",
+    )
+    _DELTA_COLUMNS = (
+        "tick",
+        "phase",
+        "phase_tick",
+        "agent_balances",
+        "agent_readiness",
+        "agent_proposal_ids",
+        "proposals",
+        "stake_changes",
+        "credit_events",
+        "execution_ledger",
+        "proposal_counter",
+        "issue_finalized",
+        "finalization_tick",
+    )
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        # Databases written before snapshots were scoped by issue have no issue_id
+        self._scoped = "issue_id" in {
+            row[1] for row in conn.execute("PRAGMA table_info(state_snapshots)")
+        }
+
+    def state_at(self, tick: int, issue_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        State as of the last snapshot taken at or before tick, with JSON fields decoded.
+
+        Pass issue_id when the database holds several scenarios; without it the
+        most recent keyframe at or before tick is used, and only deltas written
+        against that keyframe's issue are applied.
+        """
+        columns = self._KEYFRAME_COLUMNS + (("issue_id",) if self._scoped else ())
+        where, params = "tick <= ?", [tick]
+        if issue_id is not None and self._scoped:
+            where, params = where + " AND issue_id = ?", params + [issue_id]
+        cursor = self.conn.execute(
+            f"""
+            SELECT {", ".join(columns)} FROM state_snapshots
+            WHERE {where} ORDER BY tick DESC, id DESC LIMIT 1
+        """,
+            params,
+        )
+        keyframe = cursor.fetchone()
+        if keyframe is None:
+            return None
+
+        row = dict(zip(columns, keyframe))
+        state = {
+            "tick": row["tick"],
+            "phase": row["phase"],
+            "phase_tick": row["phase_tick"],
+            "agent_balances": _loads(row["agent_balances"], {}),
+            "agent_readiness": _loads(row["agent_readiness"], {}),
+            "agent_proposal_ids": _loads(row["agent_proposal_ids"], {}),
+            "proposals": _loads(row["proposals"], []),
+            "credit_events": _loads(row["credit_events"], []),
+            "execution_ledger": _loads(row["execution_ledger"], []),
+            "proposal_counter": row["proposal_counter"],
+            "issue_finalized": bool(row["issue_finalized"]),
+            "finalization_tick": row["finalization_tick"],
+            "issue_id": row.get("issue_id"),
+        }
+        stakes = {
+            stake.get("stake_id", position): stake
+            for position, stake in enumerate(_loads(row["stake_ledger"], []))
+        }
+
+        for delta in self._deltas(row.get("issue_id"), row["tick"], tick):
+            delta = dict(zip(self._DELTA_COLUMNS, delta))
+            for key in ("tick", "phase", "phase_tick", "proposal_counter", "finalization_tick"):
+                state[key] = delta[key]
+            state["issue_finalized"] = bool(delta["issue_finalized"])
+            for key in ("agent_balances", "agent_readiness", "agent_proposal_ids"):
+                state[key].update(_loads(delta[key], {}))
+            if delta["proposals"] is not None:
+                state["proposals"] = _loads(delta["proposals"], [])
+            for stake in _loads(delta["stake_changes"], []):
+                stakes[stake["stake_id"]] = stake
+            state["credit_events"].extend(_loads(delta["credit_events"], []))
+            state["execution_ledger"].extend(_loads(delta["execution_ledger"], []))
+
+        state["stake_ledger"] = list(stakes.values())
+        return state
+
+    def _deltas(self, issue_id: Optional[str], base_tick: int, tick: int):
+        where = "base_tick = ? AND tick <= ?"
+        params = [base_tick, tick]
+        if self._scoped:
+            where, params = "issue_id IS ? AND " + where, [issue_id] + params
+        try:
+            cursor = self.conn.execute(
+                f"""
+                SELECT {", ".join(self._DELTA_COLUMNS)} FROM state_deltas
+                WHERE {where} ORDER BY id
+            """,
+                params,
+            )
+        except sqlite3.OperationalError:
+            # Databases written before delta snapshots existed have no state_deltas table
+            return []
+        return cursor.fetchall()
+
+
+def _loads(value: Optional[str], default):
+    return json.loads(value) if value else default
+
+
+def main():
+    if len(sys.argv) not in (3, 4):
+        print("Usage: python3 snapshots.py <simulation_id> <tick> [issue_id]")
+        sys.exit(1)
+
+    sim_id, tick = sys.argv[1], int(sys.argv[2])
+    issue_id = sys.argv[3] if len(sys.argv) == 4 else None
+    db_path = Path(__file__).parent / "db" / f"{sim_id}.sqlite3"
+    if not db_path.exists():
+        print(f"Database not found: {db_path}")
+        sys.exit(1)
+
+    conn = sqlite3.connect(str(db_path))
+    try:
+        state = SnapshotReader(conn).state_at(tick, issue_id)
+    finally:
+        conn.close()
+
+    if state is None:
+        print(f"No snapshot at or before tick {tick}")
+        sys.exit(1)
+    print(json.dumps(state, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -15,12 +15,19 @@ import sys
 from collections import defaultdict
 from typing import Dict, List, Tuple
 
+from conviction import growth_table
+from simlog import migrate_event_schema
+
+# Matches consensus.conviction_params in config.yaml
+DEFAULT_CONVICTION_PARAMS = {"MaxMultiplier": 2.0, "TargetFraction": 0.98}
+
 
 def connect_db(sim_id: str) -> sqlite3.Connection:
     """Connect to simulation database."""
     db_path = f"db/{sim_id}.sqlite3"
     try:
         conn = sqlite3.connect(db_path)
+        migrate_event_schema(conn)
         return conn
     except sqlite3.Error as e:
         print(f"Error connecting to database {db_path}: {e}")
@@ -53,25 +60,58 @@ def get_all_relevant_ticks(conn: sqlite3.Connection) -> List[int]:
     return [row[0] for row in cursor.fetchall()]
 
 
+def get_stake_conviction_params(conn: sqlite3.Connection) -> Dict[str, float]:
+    """Get the conviction params the STAKE phase ran with (logged on phase execution)."""
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        SELECT payload FROM events 
+        WHERE event_type = 'phase_execution' AND phase = 'STAKE' 
+        ORDER BY tick LIMIT 1
+    """
+    )
+    result = cursor.fetchone()
+    if result and result[0]:
+        params = json.loads(result[0]).get("conviction_params")
+        if params:
+            return params
+    return DEFAULT_CONVICTION_PARAMS
+
+
 def get_conviction_progression(
     conn: sqlite3.Connection, stake_ticks: List[int]
-) -> Dict[int, Dict[str, Dict[str, int]]]:
-    """Get conviction ledger progression during STAKE phase."""
+) -> Dict[int, Dict[str, Dict[str, float]]]:
+    """Get conviction progression during STAKE phase.
+
+    Conviction is derived from each tick's stake ledger snapshot as
+    cp × growth_curve(age), using the simulator's shared growth-curve table.
+    """
     cursor = conn.cursor()
+    growth = growth_table(get_stake_conviction_params(conn))
     progression = {}
 
     for tick in stake_ticks:
         cursor.execute(
             """
-            SELECT conviction_ledger FROM state_snapshots 
+            SELECT stake_ledger FROM state_snapshots 
             WHERE tick = ? LIMIT 1
         """,
             (tick,),
         )
         result = cursor.fetchone()
-        if result:
-            conviction_data = json.loads(result[0])
-            progression[tick] = conviction_data
+        if result and result[0]:
+            conviction_data = defaultdict(lambda: defaultdict(float))
+            for stake in json.loads(result[0]):
+                if stake.get("status") != "active":
+                    continue
+                multiplier = growth.multiplier(tick - stake["initial_tick"])
+                conviction_data[stake["agent_id"]][str(stake["proposal_id"])] += (
+                    stake["cp"] * multiplier
+                )
+            progression[tick] = {
+                agent_id: {pid: round(value, 2) for pid, value in proposals.items()}
+                for agent_id, proposals in conviction_data.items()
+            }
 
     return progression
 
@@ -145,7 +185,7 @@ def analyze_initial_stake_transfer(conn: sqlite3.Connection, first_stake_tick: i
     cursor = conn.cursor()
     cursor.execute(
         """
-        SELECT tick, event_type, agent_id, payload 
+        SELECT agent_id, proposal_id, amount
         FROM events 
         WHERE tick = ? AND event_type = 'proposal_stake_transferred'
         ORDER BY agent_id
@@ -161,11 +201,10 @@ def analyze_initial_stake_transfer(conn: sqlite3.Connection, first_stake_tick: i
         )
         print("Agent                 Proposal  Amount")
         print("-" * 45)
-        for tick, event_type, agent_id, payload_json in transfer_events:
-            payload = json.loads(payload_json)
+        for agent_id, proposal_id, amount in transfer_events:
             agent_name = (agent_id or "Unknown").replace("Agent_", "")
-            proposal_id = payload.get("proposal_id", "?")
-            amount = payload.get("stake_amount", "?")
+            proposal_id = "?" if proposal_id is None else proposal_id
+            amount = "?" if amount is None else f"{amount:g}"
             print(f"{agent_name:18} P{proposal_id:8} {amount:6} CP")
     else:
         print(f"\n❌ No initial stake transfers found at tick {first_stake_tick}")
@@ -587,16 +626,19 @@ def analyze_stake_ledger_progression(conn: sqlite3.Connection):
                             )
 
             # Show new stakes added this tick
-            tick_events = get_stake_events(conn, tick, tick)
-            new_stakes = [e for e in tick_events if e[1] == "stake_recorded"]
+            new_stakes = conn.execute(
+                """
+                SELECT agent_id, proposal_id, amount FROM events
+                WHERE event_type = 'stake_recorded' AND tick = ?
+                ORDER BY id
+            """,
+                (tick,),
+            ).fetchall()
             if new_stakes:
                 print("      New stakes this tick:")
-                for event in new_stakes:
-                    payload = json.loads(event[3])
-                    agent_name = event[2].replace("Agent_", "")
-                    amount = payload["stake_amount"]
-                    proposal = payload["proposal_id"]
-                    print(f"        {agent_name} staked {amount} CP on P{proposal}")
+                for agent_id, proposal, amount in new_stakes:
+                    agent_name = agent_id.replace("Agent_", "")
+                    print(f"        {agent_name} staked {amount:g} CP on P{proposal}")
 
 
 def create_detailed_conviction_matrix(conn: sqlite3.Connection, stake_ticks: List[int]):
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The simulator modules use flat imports (run from simulator/)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,90 @@
+import random
+import threading
+import time
+from types import SimpleNamespace
+
+from models import Action, ActionQueue, current_action_queue
+from roundtable import Phase
+
+
+class _Agent:
+    """Submits a few actions through current_action_queue() after a random delay."""
+
+    def __init__(self, agent_id, io_bound=False, seed=0):
+        self.agent_id = agent_id
+        self.io_bound_signals = io_bound
+        self._rng = random.Random(seed)
+
+    def on_signal(self, payload):
+        for n in range(3):
+            time.sleep(self._rng.random() * 0.005)
+            current_action_queue().submit(
+                Action(type="signal_ready", agent_id=self.agent_id, payload={"n": n})
+            )
+
+
+def _order(actions):
+    return [(action.agent_id, action.payload["n"]) for action in actions]
+
+
+def _dispatch(signals, workers):
+    queue = ActionQueue()
+    config = SimpleNamespace(max_concurrent_agents=workers, agent_policy="rules")
+    with queue.activate():
+        Phase("PROPOSE", 0)._dispatch_signals(signals, config)
+    return _order(queue.drain())
+
+
+def test_capture_is_per_thread():
+    queue = ActionQueue()
+    captured = {}
+    start = threading.Barrier(5)
+
+    def capture(agent_id):
+        with queue.capture() as actions:
+            start.wait()
+            for n in range(50):
+                queue.submit(Action(type="stake", agent_id=agent_id, payload={"n": n}))
+        captured[agent_id] = actions
+
+    threads = [threading.Thread(target=capture, args=(f"A{i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    start.wait()
+    for n in range(50):
+        queue.submit(Action(type="stake", agent_id="main", payload={"n": n}))
+    for thread in threads:
+        thread.join()
+
+    assert _order(queue.drain()) == [("main", n) for n in range(50)]
+    for agent_id, actions in captured.items():
+        assert _order(actions) == [(agent_id, n) for n in range(50)]
+
+
+def test_nested_capture_restores_outer_buffer():
+    queue = ActionQueue()
+    with queue.capture() as outer:
+        queue.submit(Action(type="stake", agent_id="outer", payload={"n": 0}))
+        with queue.capture() as inner:
+            queue.submit(Action(type="stake", agent_id="inner", payload={"n": 0}))
+        queue.submit(Action(type="stake", agent_id="outer", payload={"n": 1}))
+    assert _order(outer) == [("outer", 0), ("outer", 1)]
+    assert _order(inner) == [("inner", 0)]
+    assert queue.drain() == []
+
+
+def test_concurrent_dispatch_matches_serial_order():
+    signals = [(_Agent(f"Agent_{i}", seed=i), {}) for i in range(12)]
+    serial = _dispatch(signals, workers=1)
+    assert serial == [(f"Agent_{i}", n) for i in range(12) for n in range(3)]
+    for _ in range(3):
+        assert _dispatch(signals, workers=8) == serial
+
+
+def test_io_bound_and_local_actions_merge_in_signal_order():
+    signals = [
+        (_Agent(f"Agent_{i}", io_bound=i % 3 == 0, seed=i), {}) for i in range(9)
+    ]
+    expected = [(f"Agent_{i}", n) for i in range(9) for n in range(3)]
+    for workers in (1, 4):
+        assert _dispatch(signals, workers) == expected
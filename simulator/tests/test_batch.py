@@ -0,0 +1,103 @@
+import uuid
+from pathlib import Path
+
+import pytest
+
+import llm_provider
+from config import load_config
+from simlog import setup_logging
+from simulator import (
+    build_agent_pool,
+    build_global_config,
+    configure_llm,
+    run_batch,
+    run_scenario,
+    _shard_winner,
+)
+from controller import Controller
+
+SIMULATOR_DIR = Path(__file__).resolve().parent.parent
+DETERMINISTIC_FIELDS = (
+    "scenario",
+    "scenario_seed",
+    "issue_id",
+    "final_tick",
+    "phases_executed",
+    "proposals",
+    "stakes",
+)
+
+
+@pytest.fixture
+def stub_config(tmp_path, monkeypatch):
+    # proposal debug files are written relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    config = load_config(SIMULATOR_DIR / "config.yaml")
+    config["simulation"]["max_scenarios"] = 2
+    config["simulation"]["num_agents"] = 3
+    config["simulation"]["agent_policy"] = "llm"
+    config["llm"]["model"] = "stub"
+    config["llm"]["cache"] = {"enabled": True, "path": str(tmp_path / "cache.sqlite3")}
+    yield config
+    llm_provider.configure_response_cache(None)
+
+
+@pytest.fixture
+def sim_id():
+    sim_id = f"test-batch-{uuid.uuid4().hex[:8]}"
+    yield sim_id
+    for path in (SIMULATOR_DIR / "db").glob(f"{sim_id}*"):
+        path.unlink()
+
+
+def _run_serial(config, sim_id):
+    sim_logger = setup_logging(sim_id, -1, config["logging"])
+    try:
+        configure_llm(config)
+        agent_pool = build_agent_pool(config)
+        controller = Controller(agent_pool=agent_pool)
+        summaries = [
+            run_scenario(
+                controller,
+                config,
+                build_global_config(config, agent_pool),
+                sim_id,
+                scenario,
+                quiet=True,
+            )
+            for scenario in range(1, config["simulation"]["max_scenarios"] + 1)
+        ]
+    finally:
+        sim_logger.close()
+    return summaries
+
+
+def _winners(summaries):
+    db_dir = SIMULATOR_DIR / "db"
+    return [
+        _shard_winner(db_dir / f"{summary['shard']}.sqlite3", summary["issue_id"])
+        for summary in summaries
+    ]
+
+
+def test_worker_shards_match_serial_run_and_hit_the_cache(stub_config, sim_id):
+    serial = _run_serial(stub_config, sim_id)
+    assert sum(summary["llm_cache_misses"] for summary in serial) > 0
+    llm_provider.configure_response_cache(None)
+
+    batch = run_batch(
+        stub_config,
+        build_agent_pool(stub_config),
+        f"{sim_id}-batch",
+        workers=2,
+        verbosity=-1,
+    )
+
+    assert [{key: s[key] for key in DETERMINISTIC_FIELDS} for s in batch] == [
+        {key: s[key] for key in DETERMINISTIC_FIELDS} for s in serial
+    ]
+    assert _winners(batch) == _winners(serial)
+    # Each shard replays the serial run's model calls from the shared cache
+    for summary in batch:
+        assert summary["llm_cache_hits"] > 0
+        assert summary["llm_cache_misses"] == 0
@@ -0,0 +1,256 @@
+import random
+import threading
+
+import pytest
+
+import automoton
+import context_builder
+import controller as controller_module
+import creditmanager
+import roundtable
+import simlog
+from context_builder import ContextCache
+from controller import Controller
+from models import AgentActor, AgentPool, GlobalConfig, Issue, Proposal, RoundtableState, RunConfig
+from simlog import EventType
+
+ISSUE_ID = "Issue_test"
+OCEAN_TRAITS = ("openness", "conscientiousness", "extraversion", "agreeableness", "neuroticism")
+
+
+def _controller(agents=4, seed=7, stake_ticks=6, **settings) -> Controller:
+    """Controller for a seeded run; settings override GlobalConfig fields."""
+    rng = random.Random(seed)
+    actors = {
+        f"Agent_{i}": AgentActor(
+            agent_id=f"Agent_{i}",
+            initial_balance=rng.randint(100, 300),
+            seed=seed + i,
+            rng=random.Random(seed + i),
+            metadata={"ocean_profile": {trait: rng.random() for trait in OCEAN_TRAITS}},
+        )
+        for i in range(agents)
+    }
+    pool = AgentPool(agents=actors)
+    global_config = GlobalConfig(
+        **{
+            "assignment_award": 100,
+            "max_feedback_per_agent": 2,
+            "feedback_stake": 5,
+            "proposal_self_stake": 50,
+            "revision_cycles": 1,
+            "conviction_params": {"MaxMultiplier": 2.0, "TargetFraction": 0.98},
+            "agent_pool": pool,
+            "stake_phase_ticks": stake_ticks,
+            **settings,
+        }
+    )
+    controller = Controller(pool)
+    controller.register_issue(
+        Issue(
+            issue_id=ISSUE_ID,
+            problem_statement="Test issue",
+            background="Seeded test run",
+            agent_ids=list(actors),
+        )
+    )
+    controller.configure_consensus(
+        global_config,
+        RunConfig(
+            seed=seed,
+            issue_id=ISSUE_ID,
+            agent_ids=list(actors),
+            selected_agents=actors,
+            initial_proposals={},
+        ),
+    )
+    return controller
+
+
+def _stakes(state):
+    return [
+        (stake.agent_id, stake.proposal_id, stake.cp, stake.initial_tick, stake.status)
+        for stake in state.stake_ledger
+    ]
+
+
+def test_fast_forward_leaves_llm_stake_results_unchanged():
+    results = []
+    for fast_forward in (False, True):
+        controller = _controller(
+            agent_policy="llm",
+            llm_config={"model": "stub"},
+            fast_forward_idle_ticks=fast_forward,
+        )
+        state = controller.run()["final_state"]
+        results.append((_stakes(state), state.agent_balances, state.tick))
+    assert results[0] == results[1]
+    assert any(stake[-1] == "active" for stake in results[0][0])
+
+
+def test_fast_forward_collapses_idle_rule_ticks():
+    runs = []
+    for fast_forward in (False, True):
+        controller = _controller(
+            agents=6, stake_ticks=12, agent_policy="rules", fast_forward_idle_ticks=fast_forward
+        )
+        state = controller.run()["final_state"]
+        runs.append(state)
+    slow, fast = runs
+    assert _stakes(fast) == _stakes(slow)
+    assert fast.agent_balances == slow.agent_balances
+    assert any("fast_forward_from" in entry for entry in fast.execution_ledger)
+    assert len(fast.execution_ledger) < len(slow.execution_ledger)
+
+
+def test_async_stake_fan_out_matches_serial_llm_run():
+    runs = []
+    for workers in (1, 4):
+        controller = _controller(
+            agents=5,
+            agent_policy="llm",
+            # Jittered latency makes the concurrent calls complete out of order
+            llm_config={"model": "stub:latency_ms=2"},
+            max_concurrent_agents=workers,
+        )
+        state = controller.run()["final_state"]
+        runs.append((_stakes(state), state.agent_balances, state.credit_events, state.tick))
+    assert runs[0] == runs[1]
+    assert runs[0][0]
+
+
+def test_rule_runs_are_reproducible_with_concurrent_agents():
+    runs = []
+    for workers in (1, 4, 4):
+        state = _controller(
+            agents=6, seed=3, agent_policy="rules", max_concurrent_agents=workers
+        ).run()["final_state"]
+        runs.append((_stakes(state), state.agent_balances, state.tick))
+    assert runs[0] == runs[1] == runs[2]
+    assert runs[0][0]
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        {"agent_policy": "rules", "max_concurrent_agents": 2},
+        {"agent_policy": "llm", "llm_config": {"model": "stub"}},
+    ],
+)
+def test_controllers_on_separate_threads_do_not_interfere(settings):
+    seeds = range(1, 7)
+
+    def result(controller):
+        state = controller.run()["final_state"]
+        return _stakes(state), state.agent_balances, state.credit_events, state.tick
+
+    serial = {seed: result(_controller(seed=seed, **settings)) for seed in seeds}
+
+    controllers = {seed: _controller(seed=seed, **settings) for seed in seeds}
+    threaded, errors = {}, []
+    start = threading.Barrier(len(controllers))
+
+    def run(seed):
+        try:
+            start.wait()
+            threaded[seed] = result(controllers[seed])
+        except Exception as exc:  # surfaced below; a thread cannot fail the test
+            errors.append(exc)
+
+    threads = [threading.Thread(target=run, args=(seed,)) for seed in seeds]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert threaded == serial
+    # Seeds differ, so identical results would mean the runs were not independent
+    assert len({repr(outcome[0]) for outcome in serial.values()}) > 1
+
+
+def test_disabled_events_build_no_log_entries(monkeypatch):
+    logged = _controller(agent_policy="rules").run()["final_state"]
+    monkeypatch.setattr(simlog, "_disabled_events", frozenset(EventType))
+
+    def unexpected(**fields):
+        raise AssertionError(f"LogEntry built for disabled {fields['event_type']}")
+
+    for module in (controller_module, creditmanager, roundtable):
+        monkeypatch.setattr(module, "LogEntry", unexpected)
+    silent = _controller(agent_policy="rules").run()["final_state"]
+    assert _stakes(silent) == _stakes(logged)
+    assert silent.credit_events == logged.credit_events
+
+
+def _uncached(build, *args):
+    """build(*args) rendered against an empty context cache."""
+    shared = context_builder._context_cache
+    context_builder._context_cache = ContextCache()
+    try:
+        return build(*args)
+    finally:
+        context_builder._context_cache = shared
+
+
+def test_cached_contexts_match_fresh_renders(monkeypatch):
+    cache = ContextCache()
+    monkeypatch.setattr(context_builder, "_context_cache", cache)
+    controller = _controller(
+        agents=5, agent_policy="llm", llm_config={"model": "stub"}, max_concurrent_agents=1
+    )
+    build = context_builder.enhance_context_for_call
+    call_types = set()
+
+    def checked(agent, payload, call_type):
+        context = build(agent, payload, call_type)
+        # Compared at call time: proposals, feedback and stakes change every tick
+        assert context == _uncached(build, agent, payload, call_type)
+        assert build(agent, payload, call_type) == context
+        state = payload.get("state")
+        if state is not None and state.current_issue is not None:
+            args = (state, {}, state.tick, controller.agent_pool)
+            assert context_builder.build_feedback_context(*args) == _uncached(
+                context_builder.build_feedback_context, *args
+            )
+        call_types.add(call_type)
+        return context
+
+    monkeypatch.setattr(automoton, "enhance_context_for_call", checked)
+    controller.run()
+
+    assert {"propose_decision", "stake_preferences", "stake_action"} <= call_types
+    assert cache.hits > cache.misses
+
+
+def test_context_fragments_follow_in_place_edits(monkeypatch):
+    monkeypatch.setattr(context_builder, "_context_cache", ContextCache())
+    pool = _controller(agents=3).agent_pool
+    author, reader = pool.agents["Agent_0"], pool.agents["Agent_1"]
+    issue = Issue(issue_id=ISSUE_ID, problem_statement="Test issue", background="")
+    issue.add_proposal(
+        Proposal(tick=1, proposal_id=1, content="first", agent_id="Agent_0",
+                 issue_id=ISSUE_ID, author="Agent_0")
+    )
+    state = RoundtableState(current_issue=issue, tick=2)
+    payload = {"state": state, "current_balance": 100, "tick": 2}
+
+    def contexts():
+        return (
+            context_builder.build_feedback_context(state, {}, state.tick, pool),
+            context_builder.build_context_revise(author, issue),
+            context_builder.build_context_stake_preferences(reader, issue, payload),
+        )
+
+    def assert_fresh():
+        cached = contexts()
+        assert cached == _uncached(contexts)
+        return cached
+
+    before = assert_fresh()
+    issue.feedback_log.append({"from": "Agent_1", "to": 1, "comment": "more detail", "tick": 2})
+    with_feedback = assert_fresh()
+    issue.proposals[0].content = "second"
+    issue.proposals[0].revision_number = 2
+    revised = assert_fresh()
+    assert before != with_feedback != revised
@@ -0,0 +1,52 @@
+import llm_provider
+from llm_provider import LLMResponseCache, configure_response_cache
+
+
+def test_cache_is_disabled_by_default():
+    assert configure_response_cache({}) is None
+    assert configure_response_cache({"path": "unused.sqlite3"}) is None
+
+
+def test_cache_evicts_least_recently_used_beyond_max_bytes(tmp_path):
+    cache = LLMResponseCache(tmp_path / "cache.sqlite3", max_bytes=30)
+    for key in ("a", "b", "c"):
+        cache.put(key, "m", "x" * 10)
+    assert cache.get("a") == "x" * 10  # a is now more recent than b
+
+    cache.put("d", "m", "y" * 10)
+    assert cache.get("b") is None
+    assert [cache.get(key) is not None for key in ("a", "c", "d")] == [True, True, True]
+    assert cache.stats()["bytes"] == 30
+    assert cache.evictions == 1
+    cache.close()
+
+
+def test_replacing_an_entry_does_not_double_count(tmp_path):
+    cache = LLMResponseCache(tmp_path / "cache.sqlite3", max_bytes=25)
+    cache.put("a", "m", "x" * 10)
+    for _ in range(5):
+        cache.put("b", "m", "y" * 10)
+    assert cache.evictions == 0
+    assert cache._bytes == cache.stats()["bytes"] == 20
+    cache.close()
+
+
+def test_running_total_survives_reopen(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    cache = LLMResponseCache(path, max_bytes=100)
+    cache.put("a", "m", "x" * 40)
+    cache.close()
+
+    reopened = LLMResponseCache(path, max_bytes=100)
+    assert reopened._bytes == 40
+    reopened.put("b", "m", "y" * 70)
+    assert reopened.get("a") is None
+    assert reopened._bytes == 70
+    reopened.clear()
+    assert reopened._bytes == 0
+    reopened.close()
+
+
+def teardown_module():
+    configure_response_cache(None)
+    assert llm_provider._response_cache is None
@@ -0,0 +1,54 @@
+import pytest
+
+from llm_provider import (
+    FeedbackDecision,
+    PreferenceRanking,
+    ProposeDecision,
+    ReviseDecision,
+    StakeAction,
+)
+from llm_stub import StubModel, StubModelError
+
+SCHEMAS = (ProposeDecision, FeedbackDecision, ReviseDecision, PreferenceRanking, StakeAction)
+PROMPT = """# Agent: Agent_2
+## Credit Balance
+120
+Proposal 1 by Agent_1: lower fees
+Proposal 2 (Your Proposal): more audits
+Proposal 3 by Agent_3: do nothing
+"""
+
+
+def _responses(model, seed=7):
+    texts = [model.prompt(PROMPT, system="s", seed=seed).text()]
+    for schema in SCHEMAS:
+        texts.append(model.prompt(PROMPT, system="s", schema=schema, seed=seed).text())
+    return texts
+
+
+def test_identical_requests_get_identical_schema_valid_responses():
+    first, second = _responses(StubModel()), _responses(StubModel())
+    assert first == second
+    for schema, text in zip(SCHEMAS, first[1:]):
+        schema.model_validate_json(text)
+    assert _responses(StubModel(), seed=8) != first
+
+
+def test_latency_and_failures_leave_responses_unchanged():
+    plain, flaky = StubModel(), StubModel(latency_ms=0.1, failure_rate=0.5)
+    for seed in range(20):
+        for schema in SCHEMAS:
+            expected = plain.prompt(PROMPT, schema=schema, seed=seed).text()
+            try:
+                assert flaky.prompt(PROMPT, schema=schema, seed=seed).text() == expected
+            except StubModelError:
+                pass
+    # Failures come from their own random stream, so successful calls still match
+    assert 0 < flaky.failures < flaky.calls
+
+
+def test_options_are_parsed_from_the_model_name():
+    model = StubModel.from_name("stub:latency_ms=200,failure_rate=0.05")
+    assert (model.latency_ms, model.failure_rate) == (200.0, 0.05)
+    with pytest.raises(ValueError):
+        StubModel.from_name("stub:temperature=1")
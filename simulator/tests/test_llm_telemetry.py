@@ -0,0 +1,77 @@
+import pytest
+
+from llm_telemetry import load_calls, percentile, summarize
+from simlog import SQLiteSink, llm_call_row
+
+
+def _call(phase, latency_ms, cache_hit=False, **fields):
+    return {
+        "tick": 1,
+        "phase": phase,
+        "agent_id": "Agent_1",
+        "call_type": "one_shot_json",
+        "model": "stub",
+        "latency_ms": latency_ms,
+        "wait_ms": 10,
+        "schema_fallback": 0,
+        "validation_failed": 0,
+        "cache_hit": int(cache_hit),
+        "error": None,
+        **fields,
+    }
+
+
+@pytest.mark.parametrize(
+    "values, fraction, expected",
+    [
+        ([], 0.5, 0.0),
+        ([7.0], 0.95, 7.0),
+        ([4.0, 1.0, 3.0, 2.0], 0.5, 2.0),
+        ([4.0, 1.0, 3.0, 2.0], 0.95, 4.0),
+        (list(range(1, 101)), 0.95, 95),
+        (list(range(1, 101)), 0.0, 1),
+    ],
+)
+def test_percentile_is_nearest_rank(values, fraction, expected):
+    assert percentile(values, fraction) == expected
+
+
+def test_summarize_groups_calls_and_leaves_cache_hits_out_of_latency():
+    calls = [
+        _call("STAKE", 100),
+        _call("STAKE", 300, error="timeout"),
+        _call("STAKE", 0.5, cache_hit=True),
+        _call("PROPOSE", 50, schema_fallback=1, validation_failed=1),
+        _call(None, 20),
+    ]
+    rows = {row["group"]: row for row in summarize(calls, "phase")}
+
+    assert rows["STAKE"] == {
+        "group": "STAKE",
+        "calls": 3,
+        "cache_hits": 1,
+        "p50_ms": 100,
+        "p95_ms": 300,
+        "max_ms": 300,
+        "model_s": 0.4,
+        "wait_s": 0.03,
+        "fallbacks": 0,
+        "invalid": 0,
+        "errors": 1,
+    }
+    assert (rows["PROPOSE"]["fallbacks"], rows["PROPOSE"]["invalid"]) == (1, 1)
+    assert rows["-"]["calls"] == 1
+    # Groups with the most model time come first
+    assert [row["group"] for row in summarize(calls, "phase")] == ["STAKE", "PROPOSE", "-"]
+
+
+def test_load_calls_reads_rows_written_by_the_sink(tmp_path):
+    sink = SQLiteSink(tmp_path / "run.sqlite3")
+    calls = [_call("STAKE", 100), _call("FEEDBACK", 40, cache_hit=True)]
+    for call in calls:
+        sink.add_llm_call_row(llm_call_row(call))
+    sink.close()
+
+    loaded = load_calls([tmp_path / "run.sqlite3"])
+    assert [{key: row[key] for key in calls[0]} for row in loaded] == calls
+    assert summarize(loaded, "agent_id")[0]["calls"] == 2
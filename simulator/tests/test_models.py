@@ -0,0 +1,123 @@
+import json
+import pickle
+import random
+import sys
+
+import pytest
+from pydantic import ValidationError
+
+from models import RoundtableState, StakeRecord, StakeRecordModel
+
+AGENTS = [f"Agent_{i}" for i in range(5)]
+PROPOSALS = range(1, 7)
+ISSUES = ("Issue_1", "Issue_2")
+
+
+def _random_ledger(state, rng, operations=300):
+    for tick in range(1, operations + 1):
+        active = [s for s in state.stake_ledger if s.status == "active"]
+        roll = rng.random()
+        if roll < 0.5 or not active:
+            state.add_stake(
+                StakeRecord(
+                    agent_id=rng.choice(AGENTS),
+                    proposal_id=rng.choice(PROPOSALS),
+                    cp=rng.randint(1, 20),
+                    initial_tick=tick,
+                    issue_id=rng.choice(ISSUES),
+                    mandatory=rng.random() < 0.2,
+                )
+            )
+        elif roll < 0.75:
+            state.update_stake(rng.choice(active), proposal_id=rng.choice(PROPOSALS))
+        else:
+            state.update_stake(rng.choice(active), status=rng.choice(["closed", "burned"]))
+
+
+def _scan(state, predicate):
+    return [stake for stake in state.stake_ledger if predicate(stake)]
+
+
+def _assert_index_matches_scan(state):
+    for agent_id in AGENTS:
+        assert state.get_stakes_by_agent(agent_id) == _scan(
+            state, lambda s: s.agent_id == agent_id
+        )
+        assert state.get_active_stakes_by_agent(agent_id) == _scan(
+            state, lambda s: s.agent_id == agent_id and s.status == "active"
+        )
+        for proposal_id in PROPOSALS:
+            assert state.get_stakes_by_agent_on_proposal(agent_id, proposal_id) == _scan(
+                state, lambda s: (s.agent_id, s.proposal_id) == (agent_id, proposal_id)
+            )
+            assert state.get_agent_stake_on_proposal(agent_id, proposal_id) == _scan(
+                state,
+                lambda s: (s.agent_id, s.proposal_id, s.status)
+                == (agent_id, proposal_id, "active"),
+            )
+    for proposal_id in PROPOSALS:
+        assert state.get_stakes_for_proposal(proposal_id) == _scan(
+            state, lambda s: s.proposal_id == proposal_id
+        )
+        assert state.get_active_stakes_for_proposal(proposal_id) == _scan(
+            state, lambda s: s.proposal_id == proposal_id and s.status == "active"
+        )
+    for status in ("active", "closed", "burned"):
+        assert state.get_stakes_by_status(status) == _scan(state, lambda s: s.status == status)
+    for issue_id in ISSUES:
+        assert state.get_active_stakes_for_issue(issue_id) == _scan(
+            state, lambda s: s.issue_id == issue_id and s.status == "active"
+        )
+    assert state.get_mandatory_stakes() == _scan(
+        state, lambda s: s.mandatory and s.status == "active"
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_stake_index_matches_ledger_scan(seed):
+    state = RoundtableState()
+    _random_ledger(state, random.Random(seed))
+    _assert_index_matches_scan(state)
+
+
+def test_stake_index_after_rebuild_and_round_trip():
+    state = RoundtableState()
+    _random_ledger(state, random.Random(11))
+    state.rebuild_stake_index()
+    _assert_index_matches_scan(state)
+
+    restored = RoundtableState(
+        stake_ledger=[stake.model_dump() for stake in state.stake_ledger]
+    )
+    _assert_index_matches_scan(restored)
+    assert restored.stake_counter == state.stake_counter
+
+
+def test_stake_record_round_trips():
+    stake = StakeRecord(
+        agent_id="Agent_1", proposal_id=3, cp=12, initial_tick=4, issue_id="I", mandatory=True
+    )
+    stake.stake_id = 9
+    dumped = stake.model_dump()
+    assert dumped == StakeRecordModel.model_validate(dumped).model_dump()
+
+    for restored in (
+        StakeRecord.model_validate(dumped),
+        StakeRecord.model_validate(json.loads(json.dumps(dumped))),
+        pickle.loads(pickle.dumps(stake)),
+    ):
+        assert restored.model_dump() == dumped
+        assert restored.agent_id is sys.intern("Agent_1")
+        assert restored.issue_id is sys.intern("I")
+    assert StakeRecord.model_validate(stake) is stake
+
+
+@pytest.mark.parametrize(
+    "changes", [{"cp": 0}, {"initial_tick": 0}, {"status": "pending"}]
+)
+def test_stake_record_rejects_invalid_fields(changes):
+    fields = dict(agent_id="Agent_1", proposal_id=3, cp=12, initial_tick=4, issue_id="I")
+    with pytest.raises(ValueError):
+        StakeRecord(**{**fields, **changes})
+    with pytest.raises(ValidationError):
+        StakeRecord.model_validate({**fields, **changes})
@@ -0,0 +1,66 @@
+from types import SimpleNamespace
+
+import rule_agent
+from models import ActionQueue, AgentActor, RoundtableState
+
+AGENT_ID = "Agent_1"
+# Never stakes or switches, so only readiness decisions produce actions
+IDLE_PROFILE = {**dict.fromkeys(rule_agent.PROFILE_TRAITS, 0.5), "initiative": 0.0}
+
+
+def _agent():
+    return AgentActor(agent_id=AGENT_ID, initial_balance=100, seed=1, memory={})
+
+
+def _stake_payload(phase_tick, max_phase_ticks=4, balance=100):
+    state = RoundtableState(phase_tick=phase_tick, agent_readiness={AGENT_ID: False})
+    return {
+        "type": "Stake",
+        "state": state,
+        "config": SimpleNamespace(issue_id="I"),
+        "phase": SimpleNamespace(phase_number=5, max_phase_ticks=max_phase_ticks),
+        "current_balance": balance,
+        "proposal_convictions": {1: {"total_effective_weight": 10.0}},
+    }
+
+
+def _actions(agent, payload, profile=IDLE_PROFILE):
+    queue = ActionQueue()
+    with queue.activate():
+        rule_agent.handle_stake(agent, payload, profile)
+    return [action.type for action in queue.drain()]
+
+
+def test_conviction_leader_breaks_ties_on_lowest_id():
+    convictions = {
+        3: {"total_effective_weight": 5.0},
+        1: {"total_effective_weight": 5.0},
+        2: {"total_effective_weight": 4.0},
+    }
+    assert rule_agent._conviction_leader(convictions) == 1
+
+
+def test_conviction_leader_follows_a_dict_updated_in_place():
+    convictions = {1: {"total_effective_weight": 5.0}, 2: {"total_effective_weight": 4.0}}
+    assert rule_agent._conviction_leader(convictions) == 1
+    convictions[2]["total_effective_weight"] = 6.0
+    assert rule_agent._conviction_leader(convictions) == 2
+
+
+def test_agent_with_cp_left_signals_ready_on_the_last_stake_tick():
+    agent = _agent()
+    # Stake phases only advance once every agent is ready, so an agent that
+    # still holds CP above its reserve must not stall the phase
+    assert _actions(agent, _stake_payload(phase_tick=3)) == []
+    assert _actions(agent, _stake_payload(phase_tick=4)) == ["signal_ready"]
+
+
+def test_agent_without_cp_above_reserve_signals_ready_at_once():
+    assert _actions(_agent(), _stake_payload(phase_tick=1, balance=0)) == ["signal_ready"]
+
+
+def test_ready_agent_stays_idle_for_the_rest_of_the_phase():
+    payload = _stake_payload(phase_tick=2, balance=0)
+    payload["state"].agent_readiness[AGENT_ID] = True
+    active = {**IDLE_PROFILE, "initiative": 1.0, "adaptability": 1.0}
+    assert _actions(_agent(), payload, active) == []
@@ -0,0 +1,219 @@
+import sqlite3
+import threading
+
+import pytest
+
+from simlog import AsyncSQLiteSink, LogLevel, SQLiteSink, migrate_event_schema
+
+
+def _event(tick, level=LogLevel.INFO, **payload):
+    return {
+        "tick": tick,
+        "phase": "STAKE",
+        "agent_id": "Agent_1",
+        "event_type": "test_event",
+        "level": level.value,
+        "payload": payload or None,
+    }
+
+
+def _rows(db_path, sql="SELECT tick, message, payload FROM events ORDER BY id"):
+    with sqlite3.connect(db_path) as connection:
+        return connection.execute(sql).fetchall()
+
+
+def _hold_writer(sink):
+    """Make the writer thread block on its next event row until released."""
+    entered, release = threading.Event(), threading.Event()
+    add_event_row = sink.sink.add_event_row
+
+    def blocking_add(row):
+        entered.set()
+        release.wait(5)
+        add_event_row(row)
+
+    sink.sink.add_event_row = blocking_add
+    return entered, release
+
+
+def test_events_written_in_log_order(tmp_path):
+    db_path = tmp_path / "events.db"
+    sink = AsyncSQLiteSink(db_path, batch_size=7)
+    for i in range(200):
+        sink.write_event(_event(i // 10, n=i), f"event {i}")
+    sink.close()
+
+    rows = _rows(db_path)
+    assert [message for _, message, _ in rows] == [f"event {i}" for i in range(200)]
+    assert [tick for tick, _, _ in rows] == [i // 10 for i in range(200)]
+
+
+def test_payload_mutation_after_logging_is_not_stored(tmp_path):
+    db_path = tmp_path / "events.db"
+    sink = AsyncSQLiteSink(db_path)
+    entered, release = _hold_writer(sink)
+    sink.write_event(_event(0, n=0), "first")
+    entered.wait(5)
+
+    event = _event(1, amount=10)
+    sink.write_event(event, "second")
+    event["payload"]["amount"] = 99
+    event["tick"] = 42
+    release.set()
+    sink.close()
+
+    assert _rows(db_path)[1] == (1, "second", '{"amount": 10}')
+
+
+def test_drop_debug_discards_only_debug_events_when_full(tmp_path):
+    db_path = tmp_path / "events.db"
+    sink = AsyncSQLiteSink(db_path, queue_size=1, backpressure="drop-debug")
+    entered, release = _hold_writer(sink)
+    sink.write_event(_event(0), "taken by writer")
+    entered.wait(5)
+    sink.write_event(_event(0), "queued")
+    sink.write_event(_event(0, level=LogLevel.DEBUG), "dropped")
+    release.set()
+    sink.close()
+
+    assert sink.dropped_events == 1
+    assert [m for _, m, _ in _rows(db_path)] == ["taken by writer", "queued"]
+
+
+def test_spill_is_replayed_on_close(tmp_path):
+    db_path = tmp_path / "events.db"
+    sink = AsyncSQLiteSink(db_path, queue_size=1, backpressure="spill")
+    entered, release = _hold_writer(sink)
+    sink.write_event(_event(0), "taken by writer")
+    entered.wait(5)
+    sink.write_event(_event(0), "queued")
+    sink.write_event(_event(1, n=1), "spilled")
+    release.set()
+    sink.close()
+
+    assert sink.spilled_events == 1
+    assert _rows(db_path) == [
+        (0, "taken by writer", None),
+        (0, "queued", None),
+        (1, "spilled", '{"n": 1}'),
+    ]
+
+
+def test_rows_logged_while_spilling_keep_log_order(tmp_path):
+    db_path = tmp_path / "events.db"
+    sink = AsyncSQLiteSink(db_path, queue_size=1, backpressure="spill")
+    gates = {message: (threading.Event(), threading.Event()) for message in ("queued", "fills")}
+    add_event_row = sink.sink.add_event_row
+
+    def gated_add(row):
+        if row[4] in gates:
+            entered, release = gates[row[4]]
+            entered.set()
+            release.wait(5)
+        add_event_row(row)
+
+    sink.sink.add_event_row = gated_add
+    sink.write_event(_event(0), "queued")
+    gates["queued"][0].wait(5)
+    sink.write_event(_event(0), "fills")
+    sink.write_event(_event(0), "spilled")
+    gates["queued"][1].set()
+    gates["fills"][0].wait(5)
+    # The queue has room again, but the spill file has not been replayed yet
+    sink.write_event(_event(0), "late")
+    gates["fills"][1].set()
+    # Replayed by the running writer once its queue drains, not only on close
+    sink.flush()
+    assert not sink.spill_path.exists()
+    sink.close()
+
+    assert sink.spilled_events == 2
+    assert [m for _, m, _ in _rows(db_path)] == ["queued", "fills", "spilled", "late"]
+
+
+def test_writer_survives_a_failing_row(tmp_path):
+    db_path = tmp_path / "events.db"
+    sink = AsyncSQLiteSink(db_path)
+    add_event_row = sink.sink.add_event_row
+
+    def flaky_add(row):
+        if row[4] == "bad":
+            raise TypeError("boom")
+        add_event_row(row)
+
+    sink.sink.add_event_row = flaky_add
+    sink.write_event(_event(0), "bad")
+    sink.write_event(_event(0), "good")
+    sink.close()
+
+    assert sink.write_errors == 1
+    assert [m for _, m, _ in _rows(db_path)] == ["good"]
+
+
+def test_failed_batch_keeps_the_good_rows(tmp_path):
+    db_path = tmp_path / "events.db"
+    sink = SQLiteSink(db_path, batch_size=100)
+    good = (0, "STAKE", "Agent_1", "test_event", "good", None, None, None, None)
+    sink.add_event_row(good)
+    sink.add_event_row(good[:4])  # wrong column count fails the whole executemany
+    sink.add_event_row(good)
+    sink.close()
+
+    assert sink.rejected_rows == 1
+    assert [m for _, m, _ in _rows(db_path)] == ["good", "good"]
+
+
+def test_unencodable_payload_fails_at_the_log_call(tmp_path):
+    sink = AsyncSQLiteSink(tmp_path / "events.db")
+    with pytest.raises(TypeError):
+        sink.write_event(_event(0, bad=object()), "bad")
+    sink.close()
+
+
+def test_enqueue_fails_fast_when_writer_is_dead(tmp_path):
+    sink = AsyncSQLiteSink(tmp_path / "events.db")
+    sink._queue.put(sink._STOP)
+    sink._writer.join(5)
+    with pytest.raises(RuntimeError):
+        sink.write_event(_event(0), "lost")
+    sink.close()
+
+
+def test_migrate_skips_databases_without_events(tmp_path):
+    with sqlite3.connect(tmp_path / "state.db") as connection:
+        connection.execute("CREATE TABLE state_snapshots (id INTEGER PRIMARY KEY, tick INTEGER)")
+        migrate_event_schema(connection)
+        tables = connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        assert [row[0] for row in tables] == ["state_snapshots"]
+
+
+def test_migrate_backfills_promoted_columns(tmp_path):
+    with sqlite3.connect(tmp_path / "old.db") as connection:
+        connection.execute(
+            "CREATE TABLE events (id INTEGER PRIMARY KEY, tick INTEGER, phase TEXT,"
+            " agent_id TEXT, event_type TEXT, message TEXT, payload TEXT)"
+        )
+        connection.execute(
+            "INSERT INTO events (tick, payload) VALUES (1, '{\"proposal_id\": 7, \"amount\": 3.5}')"
+        )
+        migrate_event_schema(connection)
+        migrate_event_schema(connection)
+        row = connection.execute("SELECT proposal_id, amount FROM events").fetchone()
+        (amount_type,) = connection.execute(
+            "SELECT type FROM pragma_table_info('events') WHERE name = 'amount'"
+        ).fetchone()
+    assert row == (7, 3.5)
+    assert amount_type == "REAL"
+
+
+def test_fractional_amounts_are_stored_as_real(tmp_path):
+    db_path = tmp_path / "events.db"
+    sink = AsyncSQLiteSink(db_path)
+    sink.write_event(_event(0, amount=12.75), "weighted")
+    sink.write_event(_event(0, amount=5), "whole")
+    sink.close()
+
+    assert _rows(db_path, "SELECT amount, typeof(amount) FROM events ORDER BY id") == [
+        (12.75, "real"),
+        (5.0, "real"),
+    ]
@@ -0,0 +1,122 @@
+import random
+import sqlite3
+
+import pytest
+
+from models import Issue, Proposal, RoundtableState, StakeRecord
+from simlog import SQLiteSink
+from snapshots import SnapshotEncoder, SnapshotReader
+
+AGENTS = ["Agent_1", "Agent_2", "Agent_3"]
+TICKS = 25
+
+
+def _advance(state, rng):
+    """Apply one tick of random but plausible changes to the state."""
+    state.tick += 1
+    state.phase_tick += 1
+    issue = state.current_issue
+    agent = rng.choice(AGENTS)
+    state.agent_balances[agent] -= rng.randint(1, 5)
+    state.agent_readiness[agent] = rng.random() < 0.5
+    state.credit_events.append({"tick": state.tick, "agent_id": agent, "amount": 1})
+    state.execution_ledger.append({"tick": state.tick, "phase": state.current_phase})
+
+    if rng.random() < 0.3:
+        proposal_id = state.proposal_counter
+        state.proposal_counter += 1
+        issue.proposals.append(
+            Proposal(
+                tick=state.tick,
+                proposal_id=proposal_id,
+                content=f"proposal {proposal_id}",
+                agent_id=agent,
+                issue_id=issue.issue_id,
+                author=agent,
+            )
+        )
+        state.agent_proposal_ids[agent] = proposal_id
+    if rng.random() < 0.2 and len(issue.proposals) > 1:
+        issue.proposals[0].active = False
+
+    proposal_ids = [p.proposal_id for p in issue.proposals if p.active]
+    if proposal_ids:
+        state.add_stake(
+            StakeRecord(
+                agent_id=agent,
+                proposal_id=rng.choice(proposal_ids),
+                cp=rng.randint(1, 10),
+                initial_tick=state.tick,
+                issue_id=issue.issue_id,
+            )
+        )
+    active = [s for s in state.stake_ledger if s.status == "active"]
+    if active and rng.random() < 0.3:
+        state.update_stake(rng.choice(active), status="closed")
+    if state.tick == TICKS:
+        state.issue_finalized = True
+        state.finalization_tick = state.tick
+
+
+def _run_scenarios(db_path, mode, seeds):
+    sink = SQLiteSink(db_path)
+    for seed in seeds:
+        rng = random.Random(seed)
+        issue = Issue(issue_id=f"Issue_{seed}", problem_statement="p", background="b")
+        state = RoundtableState(
+            current_phase="STAKE",
+            current_issue=issue,
+            agent_balances={a: 100 for a in AGENTS},
+            agent_readiness={a: False for a in AGENTS},
+            agent_proposal_ids={a: None for a in AGENTS},
+        )
+        encoder = SnapshotEncoder(mode, keyframe_interval=4)
+        for _ in range(TICKS):
+            _advance(state, rng)
+            kind, row = encoder.encode(state)
+            if kind == "keyframe":
+                sink.save_state_snapshot(row)
+            else:
+                sink.save_state_delta(row)
+    sink.close()
+
+
+@pytest.fixture
+def readers(tmp_path):
+    seeds = [1, 2]
+    _run_scenarios(tmp_path / "full.db", "full", seeds)
+    _run_scenarios(tmp_path / "delta.db", "delta", seeds)
+    full = sqlite3.connect(tmp_path / "full.db")
+    delta = sqlite3.connect(tmp_path / "delta.db")
+    yield SnapshotReader(full), SnapshotReader(delta)
+    full.close()
+    delta.close()
+
+
+def test_delta_round_trip_matches_full_snapshots_per_scenario(readers):
+    full, delta = readers
+    for issue_id in ("Issue_1", "Issue_2"):
+        for tick in range(1, TICKS + 1):
+            expected = full.state_at(tick, issue_id)
+            assert expected["tick"] == tick
+            assert expected["issue_id"] == issue_id
+            assert delta.state_at(tick, issue_id) == expected
+
+
+def test_delta_round_trip_without_issue_stays_within_one_scenario(readers):
+    full, delta = readers
+    for tick in range(1, TICKS + 1):
+        assert delta.state_at(tick) == full.state_at(tick)
+
+
+def test_delta_mode_writes_fewer_keyframes(tmp_path):
+    _run_scenarios(tmp_path / "delta.db", "delta", [1, 2])
+    with sqlite3.connect(tmp_path / "delta.db") as conn:
+        keyframes = conn.execute(
+            "SELECT issue_id, COUNT(*) FROM state_snapshots GROUP BY issue_id"
+        ).fetchall()
+        unscoped = conn.execute(
+            "SELECT COUNT(*) FROM state_deltas WHERE issue_id IS NULL"
+        ).fetchone()[0]
+    assert keyframes == [("Issue_1", 7), ("Issue_2", 7)]
+    assert unscoped == 0